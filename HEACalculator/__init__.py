@@ -15,9 +15,10 @@
 # You should have received a copy of the GNU General Public License
 # along with this program.  If not, see <https://www.gnu.org/licenses/>.
 
+from HEACalculator.core.Batch import HEABatch
 from HEACalculator.core.HEA import HEACalculator
 
 __author__ = 'Doguhan Sariturk'
 __email__ = 'dogu.sariturk@gmail.com'
 
-__all__ = ['HEACalculator']
+__all__ = ['HEACalculator', 'HEABatch']
@@ -18,16 +18,17 @@
 import typer
 
 from HEACalculator.cli import app as cli_app
-from HEACalculator.gui import app as gui_app
+from HEACalculator.cli import cache_app
 
 app = typer.Typer(add_completion=False, no_args_is_help=True)
-app.add_typer(gui_app,
-              name='gui',
-              help='Starts the HEACalculator Graphical User Interface (GUI)')
 app.add_typer(cli_app,
               name='search',
               help='Parameter search commands',
               no_args_is_help=True)
+app.add_typer(cache_app,
+              name='cache',
+              help='Persistent result cache commands',
+              no_args_is_help=True)
 
 
 @app.callback(no_args_is_help=True,
@@ -36,5 +37,13 @@ def main():
     """A tool for calculating High-Entropy Alloy (HEA) specific parameters and solid-solution predictions"""
 
 
+@app.command(name='gui')
+def gui():
+    """Starts the HEACalculator Graphical User Interface (GUI)"""
+    # PyQt5 and the user interface modules are only loaded when the GUI is started
+    from HEACalculator.gui import run
+    run()
+
+
 if __name__ == '__main__':
     app()
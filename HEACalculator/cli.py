@@ -15,24 +15,40 @@
 # You should have received a copy of the GNU General Public License
 # along with this program.  If not, see <https://www.gnu.org/licenses/>.
 
-from itertools import combinations_with_replacement, permutations
+import contextlib
+import sys
+from typing import List
 
-import numpy as np
 import typer
 
 from HEACalculator import HEACalculator
+from HEACalculator.core.cache import ResultCache
+from HEACalculator.core.filters import Expression
 from HEACalculator.core.helpers import nested_formula_parser
+from HEACalculator.core.lattice import CompositionLattice
+from HEACalculator.core.properties import select_properties
+from HEACalculator.core.screening import DEFAULT_CHUNK_SIZE, read_formulas, screen, screen_formulas
+from HEACalculator.core.selection import ParetoSelection, TopSelection, parse_objective
+from HEACalculator.core.writers import CsvWriter, open_writer
+from HEACalculator.data import Database
 
 app = typer.Typer()
+cache_app = typer.Typer()
 
 
 @app.command(no_args_is_help=True, name='single')
-def single_search(alloy: str = typer.Argument(...)):
+def single_search(alloy: str = typer.Argument(...),
+                  cache: bool = typer.Option(False, '--cache',
+                                             help='Load and store the results in the persistent result cache'),
+                  database: List[str] = typer.Option(None,
+                                                     help='Database file replacing (.npz) or overriding (.csv) the built-in data, can be repeated')):
     """Calculates HEA parameters of the given alloy"""
-    try:
-        print(HEACalculator(alloy))
-    except Exception as e:
-        raise typer.BadParameter(e)
+    user_database = get_database(database)
+    with get_cache(cache) as result_cache:
+        try:
+            print(HEACalculator(alloy, cache=result_cache, database=user_database))
+        except Exception as e:
+            raise typer.BadParameter(e)
 
 
 @app.command(name='range')
@@ -45,55 +61,201 @@ def range_search(elements: str = typer.Option(...,
                  step: float = typer.Option(5, min=0,
                                             help='Composition screening step for each element'),
                  csv: bool = typer.Option(False, '--csv',
-                                          help='Export results to stdout as a CSV file')):
+                                          help='Export results to stdout as a CSV file'),
+                 output: str = typer.Option(None,
+                                            help='Export results to the given .csv, .jsonl, .parquet, .arrow '
+                                                 'or .npz file'),
+                 precision: int = typer.Option(2, min=0,
+                                               help='Number of decimals of the CSV and JSON Lines outputs'),
+                 properties: str = typer.Option(None,
+                                                help='Comma separated list of the properties to calculate, '
+                                                     'e.g. omega_parameter,atomic_size_difference'),
+                 where: str = typer.Option(None,
+                                           help='Condition the compositions should satisfy to be exported, '
+                                                'e.g. "omega_parameter >= 1.1 and atomic_size_difference < 6.6"'),
+                 top: int = typer.Option(None, min=1,
+                                         help='Export only the given number of compositions with the best --by value'),
+                 by: str = typer.Option(None,
+                                        help='Objective of --top, e.g. omega_parameter:max or abs(mixing_enthalpy):min'),
+                 pareto: str = typer.Option(None,
+                                            help='Export only the Pareto front of the given objectives, '
+                                                 'e.g. omega_parameter:max,density:min'),
+                 count: bool = typer.Option(False, '--count',
+                                            help='Print the number of compositions in the range and exit'),
+                 workers: int = typer.Option(1, min=1,
+                                             help='Number of processes evaluating the compositions'),
+                 chunk_size: int = typer.Option(DEFAULT_CHUNK_SIZE, min=1,
+                                                help='Number of compositions evaluated at once by each process'),
+                 cache: bool = typer.Option(False, '--cache',
+                                            help='Load and store the results in the persistent result cache'),
+                 database: List[str] = typer.Option(None,
+                                                    help='Database file replacing (.npz) or overriding (.csv) the built-in data, can be repeated')):
     """Screens given composition range of the given elements"""
     if start > end:
         raise typer.BadParameter('The End option should be higher than the Start option')
+    if step <= 0:
+        raise typer.BadParameter('The Step option should be positive')
+
+    formula, lattice = find_all_comps(elements, start, end, step)
+    if count:
+        print(len(lattice))
+        return
+
+    try:
+        selected = None if properties is None else select_properties(properties)
+        condition = None if where is None else Expression(where, condition=True)
+        selection = get_selection(top, by, pareto)
+        writer = get_writer(output, csv, formula.keys(), selected, precision)
+    except (ValueError, ImportError) as e:
+        raise typer.BadParameter(str(e))
+    user_database = get_database(database)
+
+    with get_cache(cache) as result_cache:
+        chunks = screen(formula.keys(), lattice, properties=selected, output='report' if writer is None else 'columns',
+                        where=condition, selection=selection, workers=workers, chunk_size=chunk_size,
+                        cache=result_cache, database=user_database)
+
+        if writer is None:
+            for lines in chunks:
+                for line in lines:
+                    print(line)
+            return
+
+        with writer:
+            for compositions, columns in chunks:
+                writer.write(compositions, columns)
+
+
+@app.command(no_args_is_help=True, name='file')
+def file_search(path: str = typer.Argument(...,
+                                           help='CSV file listing the alloys, or - to read it from stdin'),
+                column: str = typer.Option('formula',
+                                           help='Name of the column of the alloy formulas'),
+                csv: bool = typer.Option(False, '--csv',
+                                         help='Export results to stdout as a CSV file'),
+                output: str = typer.Option(None,
+                                           help='Export results to the given .csv, .jsonl, .parquet, .arrow '
+                                                'or .npz file'),
+                precision: int = typer.Option(2, min=0,
+                                              help='Number of decimals of the CSV and JSON Lines outputs'),
+                properties: str = typer.Option(None,
+                                               help='Comma separated list of the properties to calculate, '
+                                                    'e.g. omega_parameter,atomic_size_difference'),
+                where: str = typer.Option(None,
+                                          help='Condition the alloys should satisfy to be exported, '
+                                               'e.g. "omega_parameter >= 1.1 and atomic_size_difference < 6.6"'),
+                workers: int = typer.Option(1, min=1,
+                                            help='Number of processes evaluating the alloys'),
+                chunk_size: int = typer.Option(DEFAULT_CHUNK_SIZE, min=1,
+                                               help='Number of alloys evaluated at once by each process'),
+                cache: bool = typer.Option(False, '--cache',
+                                           help='Load and store the results in the persistent result cache'),
+                database: List[str] = typer.Option(None,
+                                                   help='Database file replacing (.npz) or overriding (.csv) the built-in data, can be repeated')):
+    """Calculates HEA parameters of the alloys listed in the given CSV file"""
+    user_database = get_database(database)
+    try:
+        file = sys.stdin if path == '-' else open(path, newline='')
+    except OSError as e:
+        raise typer.BadParameter(str(e))
+
+    with file, get_cache(cache) as result_cache:
+        try:
+            formulas = read_formulas(file, column)
+            selected = None if properties is None else select_properties(properties)
+            condition = None if where is None else Expression(where, condition=True)
+            writer = get_writer(output, csv, None, selected, precision)
+        except (ValueError, ImportError) as e:
+            raise typer.BadParameter(str(e))
+
+        chunks = screen_formulas(formulas, properties=selected, output='report' if writer is None else 'columns',
+                                 where=condition, workers=workers, chunk_size=chunk_size, cache=result_cache,
+                                 database=user_database)
+
+        with writer or contextlib.nullcontext():
+            for result, errors in chunks:
+                for idx, message in errors:
+                    # The first line of the file is the header
+                    typer.echo(f'Line {idx + 2}: {message}', err=True)
+                if writer is None:
+                    for report in result:
+                        print(report)
+                else:
+                    writer.write(*result)
+
 
+def get_writer(output: str,
+               csv: bool,
+               elements,
+               properties,
+               precision: int):
+    """Opens the writer of the results, if they are not printed as reports"""
+    if output is not None and csv:
+        raise ValueError('The CSV and Output options cannot be combined')
+    if output is not None:
+        return open_writer(output, elements, properties, precision=precision)
     if csv:
-        HEADER = ['Formula',
-                  'Density',
-                  'Delta',
-                  'Omega',
-                  'VEC',
-                  'Mixing Enthalpy',
-                  'Mixing Entropy',
-                  'Formation Enthalpy',
-                  'Melting Temperature',
-                  'Crystal Structure',
-                  'Model 1',
-                  'Model 2',
-                  'Model 3',
-                  'Model 4',
-                  'Model 5',
-                  'Model 6',
-                  'Model 7',
-                  'Model 8', ]
-        print(', '.join(HEADER))
-
-    formula, composition_set = find_all_comps(elements, start, end, step)
-    for composition in composition_set:
-        new_alloy = ''.join(f'{k}{v}' for k, v in {**formula, **dict(zip(formula.keys(), composition))}.items())
-        if csv:
-            print(', '.join(HEACalculator(new_alloy).get_list()))
-        else:
-            print(HEACalculator(new_alloy))
+        return CsvWriter(sys.stdout, elements, properties, precision=precision)
+    return None
+
+
+def get_cache(enabled: bool):
+    """Opens the persistent result cache, if it is enabled"""
+    return ResultCache() if enabled else contextlib.nullcontext()
+
+
+def get_database(paths):
+    """Loads the database of the given files, if any"""
+    if not paths:
+        return None
+    try:
+        return Database.load(*paths)
+    except (ValueError, OSError) as e:
+        raise typer.BadParameter(str(e))
+
+
+@cache_app.command(name='stats')
+def cache_stats():
+    """Prints statistics about the persistent result cache"""
+    with ResultCache() as result_cache:
+        stats = result_cache.stats()
+    print(f'Path        : {stats["path"]}')
+    print(f'Entries     : {stats["entries"]} ({stats["stale_entries"]} calculated with other data)')
+    print(f'Size        : {stats["size"] / 2 ** 20:.2f} MiB')
+    print(f'Maximum size: {stats["max_size"] / 2 ** 20:.2f} MiB')
+
+
+@cache_app.command(name='clear')
+def cache_clear():
+    """Removes every result from the persistent result cache"""
+    with ResultCache() as result_cache:
+        result_cache.clear()
+
+
+def get_selection(top: int,
+                  by: str,
+                  pareto: str):
+    """Creates the selection of the compositions to export, if any"""
+    if pareto is not None:
+        if top is not None or by is not None:
+            raise ValueError('The Pareto option cannot be combined with the Top and By options')
+        return ParetoSelection([parse_objective(objective) for objective in pareto.split(',')])
+    if (top is None) != (by is None):
+        raise ValueError('The Top and By options should be used together')
+    if top is not None:
+        expression, maximize = parse_objective(by)
+        return TopSelection(expression, top, maximize=maximize)
+    return None
 
 
 def find_all_comps(alloy: str,
                    start: int,
                    end: int,
                    step: int):
-    """Finds all composition possibilities"""
+    """Finds all composition possibilities
 
+    Returns the parsed alloy and the lattice of its compositions, which streams
+    every composition exactly once, in a deterministic order.
+    """
     formula = nested_formula_parser(alloy)
-    no_of_elements = len(formula)
-    composition_set = set()
-    results = [i for i in combinations_with_replacement(np.arange(start, end, step), no_of_elements)
-               if sum(i) == 100 if min(i) != 0]
-
-    for result in results:
-        for composition in permutations(result):
-            composition_set.add(composition)
-
-    return formula, composition_set
+    return formula, CompositionLattice(len(formula), start, end, step)
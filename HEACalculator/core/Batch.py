@@ -0,0 +1,268 @@
+#!/usr/bin/env python3
+
+# Copyright (C) 2022  Doguhan Sariturk
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+import functools
+
+import numpy as np
+
+from HEACalculator.core import kernels
+from HEACalculator.core.helpers import parse_many
+from HEACalculator.core.properties import PROPERTY_DEPENDENCIES, AlloyProperties, select_properties
+from HEACalculator import data
+
+__author__ = "Doguhan Sariturk"
+__email__ = "dogu.sariturk@gmail.com"
+
+
+class HEABatch(AlloyProperties):
+    """Vectorized calculator for many alloys sharing the same set of elements.
+
+    Every attribute of :class:`HEACalculator.core.HEA.HEACalculator` is available
+    as an array with one entry per composition. A zero amount means that the
+    element is absent from that alloy. The arrays are calculated lazily, on
+    first access, for all the compositions at once.
+
+    Parameters
+    ----------
+    elements : sequence of str
+        Element symbols, one per column of `compositions`.
+
+    compositions : array_like
+        (N, E) matrix of element amounts. Each row is normalized to atomic fractions,
+        so at%, atomic fractions or formula units can be used interchangeably.
+
+    properties : sequence of str, optional
+        The properties to calculate and output. By default None, which implies to all the properties.
+
+    database : HEACalculator.data.Database.Database, optional
+        Element properties and pair enthalpies, by default None which implies to the database shipped with the package
+
+    Raises
+    ------
+    ValueError
+        If the shape of `compositions` does not match `elements` or one of the properties is unknown
+
+    KeyError
+        If one of the elements does not exist in the database. Missing pairs of
+        elements present together in an alloy are reported when an enthalpy based
+        property is first accessed.
+    """
+
+    _ELEMENT_PROPERTIES = ('atomic_weight', 'atomic_volume', 'atomic_radius', 'nvalence', 'melting_point')
+
+    def __init__(self, elements, compositions, properties=None, database=None):
+        self.database = data.default_database if database is None else database
+        self.elements = list(elements)
+        self.compositions = np.atleast_2d(np.asarray(compositions, dtype=float))
+        self.properties = None if properties is None else select_properties(properties)
+
+        if len(set(self.elements)) != len(self.elements):
+            raise ValueError('Elements should be unique.')
+        if self.compositions.ndim != 2 or self.compositions.shape[1] != len(self.elements):
+            raise ValueError('Compositions should be an (N, E) matrix with one column per element.')
+
+        self._element_indices = self.database.element_table.indices(self.elements)
+        self._atomic_fractions = kernels.atomic_fractions(self.compositions)
+
+        self.model_5 = np.full(len(self), kernels.NOT_IMPLEMENTED)
+        self.model_8 = np.full(len(self), kernels.NOT_IMPLEMENTED)
+
+    @classmethod
+    def from_formulas(cls, formulas, properties=None, database=None):
+        """Creates the batch of the given alloy formulas
+
+        The formulas are parsed straight into a composition matrix over all their elements.
+
+        Parameters
+        ----------
+        formulas : iterable of str
+            Alloy formulas
+
+        properties : sequence of str, optional
+            The properties to calculate and output. By default None, which implies to all the properties.
+
+        database : HEACalculator.data.Database.Database, optional
+            Element properties and pair enthalpies, by default None which implies to the default database
+
+        Returns
+        -------
+        HEABatch
+            Batch of the alloys
+        """
+        elements, compositions = parse_many(formulas)
+        return cls(elements, compositions, properties=properties, database=database)
+
+    def __len__(self):
+        return self.compositions.shape[0]
+
+    def get_columns(self):
+        """Returns the output properties as columns
+
+        Returns
+        -------
+        dict
+            Arrays of the selected properties, in output order, indexed by property name
+        """
+        return {name: getattr(self, name) for name in self.output_properties}
+
+    def subset(self, index):
+        """Returns the batch of the selected compositions
+
+        The properties already calculated for this batch are carried over
+        instead of being calculated again.
+
+        Parameters
+        ----------
+        index : numpy.ndarray
+            Boolean mask or integer indices of the compositions to select
+
+        Returns
+        -------
+        HEABatch
+            Batch of the selected compositions
+        """
+        batch = self.__class__(self.elements, self.compositions[index], properties=self.properties,
+                               database=self.database)
+        for name in PROPERTY_DEPENDENCIES:
+            if self.is_calculated(name):
+                batch.__dict__[name] = self.__dict__[name][index]
+        for name in ('_element_properties', '_mixing_matrix', '_formation_matrix'):
+            if name in self.__dict__:
+                batch.__dict__[name] = self.__dict__[name]
+        return batch
+
+    @functools.cached_property
+    def _element_properties(self):
+        return {prop: self.database.element_table[prop][self._element_indices] for prop in self._ELEMENT_PROPERTIES}
+
+    @functools.cached_property
+    def _mixing_matrix(self):
+        return self._pair_matrix(self.database.mixing_enthalpy_matrix)
+
+    @functools.cached_property
+    def _formation_matrix(self):
+        return self._pair_matrix(self.database.formation_enthalpy_matrix)
+
+    def _pair_matrix(self, pair_matrix):
+        # The elements of a batch may never meet in one alloy, e.g. in a batch of
+        # formulas, so only the pairs of elements present together have to exist
+        matrix = pair_matrix.take(self.elements, check=False)
+        missing = np.isnan(matrix)
+        if missing.any():
+            present = (self._atomic_fractions > 0).astype(float)
+            if np.einsum('ni,ij,nj->n', present, missing, present).any():
+                raise KeyError(f'The requested pair does not exist in the {pair_matrix.name} database.')
+            matrix = np.where(missing, 0.0, matrix)
+        return matrix
+
+    def get_mixing_enthalpy(self):
+        """Returns the mixing enthalpies in kJ/mol"""
+        return kernels.pair_enthalpy(self._atomic_fractions, self._mixing_matrix)
+
+    def get_formation_enthalpy(self):
+        """Returns the formation enthalpies in meV/atom"""
+        return kernels.pair_enthalpy(self._atomic_fractions, self._formation_matrix)
+
+    def get_min_formation_enthalpy(self):
+        """Returns the minimum binary formation enthalpies in meV/atom"""
+        return kernels.min_pair_enthalpy(self._atomic_fractions, self._formation_matrix)
+
+    def get_density(self):
+        """Returns the densities in g/cm^3"""
+        return kernels.density(self._atomic_fractions,
+                               self._element_properties['atomic_weight'],
+                               self._element_properties['atomic_volume'])
+
+    def get_valance_electron_concentration(self):
+        """Returns the valance electron concentrations (VEC)"""
+        return kernels.weighted_average(self._atomic_fractions, self._element_properties['nvalence'])
+
+    def get_melting_temperature(self):
+        """Returns the melting temperatures in Kelvin"""
+        return kernels.melting_temperature(self._atomic_fractions, self._element_properties['melting_point'])
+
+    def get_atomic_size_difference(self):
+        """Returns the atomic size differences, delta"""
+        return kernels.atomic_size_difference(self._atomic_fractions, self._element_properties['atomic_radius'])
+
+    def get_mixing_entropy(self):
+        """Returns the mixing entropies in J/K.mol"""
+        return kernels.mixing_entropy(self._atomic_fractions)
+
+    def get_gamma(self):
+        """Returns the Gamma parameters"""
+        return kernels.gamma(self._atomic_fractions, self._element_properties['atomic_radius'])
+
+    def get_omega(self, temperature=None):
+        """Returns the Omega parameters
+
+        Parameters
+        ----------
+        temperature : float or numpy.ndarray, optional
+            The critical temperature for which the omega parameter should be calculated
+            By default None, which implies to the melting temperature of each alloy
+        """
+        if temperature is None:
+            temperature = self.melting_temperature
+
+        return kernels.omega(temperature, self.mixing_entropy, self.mixing_enthalpy)
+
+    def get_lambda(self):
+        """Returns the Lambda parameters"""
+        return kernels.lambda_parameter(self.mixing_entropy, self.atomic_size_difference)
+
+    def get_microstructure(self):
+        """Returns the expected crystal structures"""
+        return kernels.microstructure(self.valance_electron_concentration)
+
+    def get_model_1_result(self):
+        """Returns the Model 1 predictions"""
+        return kernels.model_1(self.omega_parameter, self.atomic_size_difference)
+
+    def get_model_2_result(self):
+        """Returns the Model 2 predictions"""
+        return kernels.model_2(self.mixing_enthalpy, self.atomic_size_difference)
+
+    def get_model_3_result(self):
+        """Returns the Model 3 predictions"""
+        return kernels.model_3(self.omega_parameter, self.gamma_parameter)
+
+    def get_model_4_result(self):
+        """Returns the Model 4 predictions"""
+        return kernels.model_4(self.lambda_parameter)
+
+    def get_model_6_result(self):
+        """Returns the Model 6 predictions"""
+        return kernels.model_6(self.melting_temperature, self.mixing_entropy, self.min_formation_enthalpy)
+
+    def get_model_7_result(self, k_2=kernels.MODEL_7_K_2, annealing_temperature=None):
+        """Returns the Model 7 predictions
+
+        Parameters
+        ----------
+        k_2 : float, optional
+            The parameter that corresponds to the ratio of intermetallic and mixing entropies
+
+        annealing_temperature : float or numpy.ndarray, optional
+            The critical temperature for which the omega parameter should be calculated
+            By default None, which implies to the 60% of the melting temperature of each alloy
+        """
+        if annealing_temperature is None:
+            annealing_temperature = self.melting_temperature * kernels.MODEL_7_ANNEALING_TEMPERATURE_RATIO
+
+        return kernels.model_7(self.formation_enthalpy, self.mixing_enthalpy,
+                               self.get_omega(temperature=annealing_temperature), k_2)
@@ -17,90 +17,143 @@
 
 import numpy as np
 
-from HEACalculator.data import Element
+from HEACalculator import data
 
 __author__ = "Doguhan Sariturk"
 __email__ = "dogu.sariturk@gmail.com"
 
 
+UNITS = ('at', 'wt', 'vol')
+
+
 class BatchCalculator:
-    """Class for converting at% to wt% and vol%
+    """Class for converting compositions between at%, wt% and vol%
+
+    The element properties are looked up once, when the calculator is
+    created, so the same calculator converts any number of compositions of
+    the same elements. The compositions are converted all at once, one per
+    row of a matrix, or one at a time as a vector.
 
     Parameters
     ----------
-    selected_elements: dict
-        A dictionary of elements and their respective atomic percents.
+    selected_elements : dict or sequence of str
+        A dictionary of elements and their respective amounts, or the element symbols only.
+
+    values : array_like, optional
+        Amounts of the elements, either a vector or a matrix with one composition per row and one column per element.
+        By default the amounts of `selected_elements`, or zero if only the symbols are given.
+
+    database : HEACalculator.data.Database.Database, optional
+        Element properties, by default None which implies to the database shipped with the package
 
+    Raises
+    ------
+    KeyError
+        If one of the elements does not exist in the database
     """
 
-    def __init__(self, selected_elements):
-        self.elements = selected_elements.keys()
-        self.values = np.fromiter(selected_elements.values(), dtype=float)
-        self.at_wt_list = np.array([Element(elm).atomic_weight for elm in self.elements])
-        self.density_list = np.array([Element(elm).atomic_weight / Element(elm).atomic_volume for elm in self.elements])
+    def __init__(self, selected_elements, values=None, database=None):
+        self.elements = list(selected_elements)
+        if values is None and isinstance(selected_elements, dict):
+            values = list(selected_elements.values())
+        self.values = np.zeros(len(self.elements)) if values is None else np.array(values, dtype=float)
+        self.database = data.default_database if database is None else database
+        _properties = self.database.element_table.take(self.elements, ('atomic_weight', 'atomic_volume'))
+        self.at_wt_list = _properties['atomic_weight']
+        self.density_list = _properties['atomic_weight'] / _properties['atomic_volume']
+        # Quantity of each element per atom, in each unit
+        self._per_atom = {'at': np.ones(len(self.elements)),
+                          'wt': self.at_wt_list,
+                          'vol': _properties['atomic_volume']}
+
+    def convert(self, values, source, target):
+        """Converts compositions from a unit to another
+
+        Parameters
+        ----------
+        values : array_like
+            Amounts of the elements in the source unit, either a vector or a matrix with one composition per row
+
+        source : str
+            Unit of the amounts, one of ``'at'``, ``'wt'`` and ``'vol'``
+
+        target : str
+            Unit to convert to, one of ``'at'``, ``'wt'`` and ``'vol'``
+
+        Raises
+        ------
+        ValueError
+            If one of the units is unknown
+
+        Returns
+        -------
+        numpy.ndarray
+            Percent of each element in the target unit, with the shape of `values`.
+            The compositions without any element are undefined.
+        """
+        unknown = [unit for unit in (source, target) if unit not in self._per_atom]
+        if unknown:
+            raise ValueError(f'Unknown units: {", ".join(unknown)}. Available units are: {", ".join(UNITS)}')
+        amounts = np.asarray(values, dtype=float) * (self._per_atom[target] / self._per_atom[source])
+        with np.errstate(divide='ignore', invalid='ignore'):
+            return 100 * amounts / amounts.sum(axis=-1, keepdims=True)
 
     def at_to_wt(self):
         """Converts from at% to wt%
 
         Returns
         -------
-        float
+        numpy.ndarray
             wt%
         """
-        _sum_product = np.dot(self.values, self.at_wt_list)
-        return 100 * self.at_wt_list * self.values / _sum_product
+        return self.convert(self.values, 'at', 'wt')
 
     def at_to_vol(self):
         """Converts from at% to vol%
 
         Returns
         -------
-        float
+        numpy.ndarray
             vol%
         """
-        _sum_product = np.dot(self.values, self.at_wt_list / self.density_list)
-        return 100 * (self.values * self.at_wt_list / self.density_list) / _sum_product
+        return self.convert(self.values, 'at', 'vol')
 
     def wt_to_at(self):
         """Converts from wt% to at%
 
         Returns
         -------
-        float
+        numpy.ndarray
             at%
         """
-        _sum_divide = np.sum(np.divide(self.values, self.at_wt_list))
-        return 100 * (self.values / self.at_wt_list) / _sum_divide
+        return self.convert(self.values, 'wt', 'at')
 
     def wt_to_vol(self):
         """Converts from wt% to vol%
 
         Returns
         -------
-        float
+        numpy.ndarray
             vol%
         """
-        _sum_divide = np.sum(np.divide(self.values, self.density_list))
-        return 100 * (self.values / self.density_list) / _sum_divide
+        return self.convert(self.values, 'wt', 'vol')
 
     def vol_to_at(self):
         """Converts from vol% to at%
 
         Returns
         -------
-        float
+        numpy.ndarray
             at%
         """
-        _sum_product = np.dot(self.values, self.density_list / self.at_wt_list)
-        return 100 * (self.values * self.density_list / self.at_wt_list) / _sum_product
+        return self.convert(self.values, 'vol', 'at')
 
     def vol_to_wt(self):
         """Converts from vol% to wt%
 
         Returns
         -------
-        float
+        numpy.ndarray
             wt%
         """
-        _sum_product = np.dot(self.values, self.density_list)
-        return 100 * (self.values * self.density_list) / _sum_product
+        return self.convert(self.values, 'vol', 'wt')
@@ -15,32 +15,45 @@
 # You should have received a copy of the GNU General Public License
 # along with this program.  If not, see <https://www.gnu.org/licenses/>.
 
-import itertools
-import math
-
-import numpy as np
-
-from HEACalculator.core.helpers import nested_formula_parser
-from HEACalculator.data import Element
-from HEACalculator.data.FormationEnthalpy import FormationEnthalpy
-from HEACalculator.data.MixingEnthalpy import MixingEnthalpy
+from HEACalculator.core import kernels
+from HEACalculator.core.Batch import HEABatch
+from HEACalculator.core.helpers import composition_formula, parse_formula
+from HEACalculator.core.properties import PROPERTY_DEPENDENCIES, AlloyProperties, select_properties
+from HEACalculator.core.kernels import GAS_CONSTANT, J_PER_MOL_TO_EV_PER_ATOM
 
 __author__ = "Doguhan Sariturk"
 __email__ = "dogu.sariturk@gmail.com"
 __version__ = "1.3.0"
 
-GAS_CONSTANT = 8.314462618
-J_PER_MOL_TO_EV_PER_ATOM = 0.0103642688 / 1000
 
-
-class HEACalculator:
+class HEACalculator(AlloyProperties):
     """General class for the high entropy alloys.
 
+    The calculations are delegated to a single-row :class:`HEACalculator.core.Batch.HEABatch`,
+    so the results are identical to the ones of a batch calculation. The attributes are
+    calculated lazily, on first access, together with the attributes they depend on.
+
     Parameters
     ----------
     formula : str
         Alloy formula.
 
+    properties : sequence of str, optional
+        The properties to calculate and output, e.g. ``("omega_parameter", "atomic_size_difference")``.
+        By default None, which implies to all the properties.
+
+    cache : HEACalculator.core.cache.ResultCache, optional
+        Persistent cache the properties are loaded from, or stored into once calculated.
+        By default None, which implies to calculating the properties on every run.
+
+    database : HEACalculator.data.Database.Database, optional
+        Element properties and pair enthalpies, by default None which implies to the database shipped with the package
+
+    Raises
+    ------
+    ValueError
+        If one of the selected properties is unknown
+
     Attributes
     ----------
 
@@ -119,78 +132,86 @@ class HEACalculator:
     .. [11] D.J.M. King, S.C. Middleburgh, A.G. McGregor, M.B. Cortie, Acta Mater. 104 (2016) 172–179.
     """
 
-    def __init__(self, formula):
-        self.formula = formula
-
-        self._alloy = nested_formula_parser(self.formula)
-        self._atomic_percentage = {elm: num / sum(self._alloy.values()) for (elm, num) in self._alloy.items()}
-        self._pair_list = list(itertools.combinations(self._alloy, 2))
-        self._pair_percentage = [(self._alloy[each[0]] / sum(self._alloy.values())) *
-                                 (self._alloy[each[1]] / sum(self._alloy.values())) for each in self._pair_list]
-        self._atomic_radius_list = [Element(elm).atomic_radius for elm in self._alloy]
-        self._average_atomic_radius = sum([percentage * radius
-                                           for percentage, radius in
-                                           zip(self._atomic_percentage.values(), self._atomic_radius_list)])
-
-        self.mixing_enthalpy = None
-        self.formation_enthalpy = None
-        self.density = None
-        self.valance_electron_concentration = None
-        self.melting_temperature = None
-        self.atomic_size_difference = None
-        self.min_formation_enthalpy = None
-        self.mixing_entropy = None
-        self.microstructure = None
-
-        self.gamma_parameter = None
-        self.omega_parameter = None
-        self.lambda_parameter = None
-        self.phi_parameter = None
+    _REPORT_PARAMETERS = (('density', 'Density', '{: >10.2} g/cm^3'),
+                          ('atomic_size_difference', 'Delta', '{:>10.2f} '),
+                          ('omega_parameter', 'Omega', '{:>10.2f} '),
+                          ('gamma_parameter', 'Gamma', '{:>10.2f} '),
+                          ('lambda_parameter', 'Lambda', '{:>10.2f} '),
+                          ('valance_electron_concentration', 'VEC', '{:>10.2f} '),
+                          ('mixing_enthalpy', 'Mixing Enthalpy', '{: >10.2f} kJ/mol'),
+                          ('mixing_entropy', 'Mixing Entropy', '{: >10.2f} J/K.mol'),
+                          ('formation_enthalpy', 'Formation Enthalpy', '{: >10.2f} meV/atom'),
+                          ('min_formation_enthalpy', 'Min. Formation Enthalpy', '{: >10.2f} meV/atom'),
+                          ('melting_temperature', 'Melting Temperature', '{: >10.0f} K'))
+
+    _REPORT_PREDICTIONS = (('microstructure', 'Microstructure', '    {} '),
+                           ('model_1', 'Model 1', '    {}'),
+                           ('model_2', 'Model 2', '    {}'),
+                           ('model_3', 'Model 3', '    {}'),
+                           ('model_4', 'Model 4', '    {}'),
+                           ('model_5', 'Model 5', '    {}'),
+                           ('model_6', 'Model 6', '    {}'),
+                           ('model_7', 'Model 7', '    {}'),
+                           ('model_8', 'Model 8', '    {}'))
+
+    def __init__(self, formula, properties=None, cache=None, database=None):
+        self._formula = formula
+        self._setup(parse_formula(formula), properties, cache, database)
+
+    @classmethod
+    def from_composition(cls, composition, properties=None, cache=None, database=None):
+        """Creates the calculator of an alloy from its element amounts, without parsing a formula
+
+        The formula is written from the composition only when it is first accessed.
+
+        Parameters
+        ----------
+        composition : dict
+            Amounts of the elements, indexed by element symbol, e.g. ``{'Fe': 20.0, 'Co': 80.0}``
 
-        self.model_1 = None
-        self.model_2 = None
-        self.model_3 = None
-        self.model_4 = None
-        self.model_5 = 'Not Implemented Yet'
-        self.model_6 = None
-        self.model_7 = None
-        self.model_8 = 'Not Implemented Yet'
-
-        self.calculate()
-
-    def calculate(self):
-        """This method calculates phenomenological parameters based on thermodynamics and physics
-        in order to predict the formation of solid solutions in High Entropy Alloys (HEAs)
-
-        Raises
-        ------
-        TypeError
-            If one of the entries are not in the database
+        properties : sequence of str, optional
+            The properties to calculate and output. By default None, which implies to all the properties.
+
+        cache : HEACalculator.core.cache.ResultCache, optional
+            Persistent cache of the properties, by default None
+
+        database : HEACalculator.data.Database.Database, optional
+            Element properties and pair enthalpies, by default None which implies to the default database
+
+        Returns
+        -------
+        HEACalculator
+            Calculator of the alloy
         """
-        self.mixing_enthalpy = self.get_mixing_enthalpy()
-        self.formation_enthalpy = self.get_formation_enthalpy()
-        self.min_formation_enthalpy = self.get_min_formation_enthalpy()
-        self.density = self.get_density()
-        self.valance_electron_concentration = self.get_valance_electron_concentration()
-        self.melting_temperature = self.get_melting_temperature()
-        self.atomic_size_difference = self.get_atomic_size_difference()
-        self.mixing_entropy = self.get_mixing_entropy()
-
-        self.gamma_parameter = self.get_gamma()
-        self.omega_parameter = self.get_omega()
-        self.lambda_parameter = self.get_lambda()
-        # self.phi_parameter = self.get_phi()
-
-        self.microstructure = self.get_microstructure()
-
-        self.model_1 = self.get_model_1_result()
-        self.model_2 = self.get_model_2_result()
-        self.model_3 = self.get_model_3_result()
-        self.model_4 = self.get_model_4_result()
-        # self.model_5 = self.get_model_5_result()
-        self.model_6 = self.get_model_6_result()
-        self.model_7 = self.get_model_7_result()
-        # self.model_8 = self.get_model_8_result()
+        self = cls.__new__(cls)
+        self._formula = None
+        self._setup(dict(composition), properties, cache, database)
+        return self
+
+    def _setup(self, alloy, properties, cache=None, database=None):
+        self.properties = None if properties is None else select_properties(properties)
+
+        self._alloy = alloy
+        self._batch = HEABatch(self._alloy.keys(), [list(self._alloy.values())], database=database)
+
+        self.phi_parameter = None
+        self.model_5 = kernels.NOT_IMPLEMENTED
+        self.model_8 = kernels.NOT_IMPLEMENTED
+
+        if cache is not None:
+            cache.fill(self)
+
+    @property
+    def database(self):
+        """HEACalculator.data.Database.Database: Element properties and pair enthalpies of the calculations"""
+        return self._batch.database
+
+    @property
+    def formula(self):
+        """str: Alloy formula, written from the composition if the calculator was not created from one"""
+        if self._formula is None:
+            self._formula = composition_formula(self._alloy)
+        return self._formula
 
     def get_mixing_enthalpy(self):
         """Returns the enthalpy of mixing of the alloy
@@ -200,9 +221,7 @@ class HEACalculator:
         float
             The mixing enthalpy of the alloy in kJ/mol
         """
-        pair_mixing_enthalpy = [MixingEnthalpy(pair) for pair in self._pair_list]
-        return 4 * sum(
-                [percent * enthalpy for percent, enthalpy in zip(self._pair_percentage, pair_mixing_enthalpy)])
+        return self._batch.get_mixing_enthalpy().item()
 
     def get_formation_enthalpy(self):
         """Returns the enthalpy of formation of the alloy
@@ -212,9 +231,7 @@ class HEACalculator:
         float
             The formation enthalpy of the alloy in meV/atom
         """
-        pair_formation_enthalpy = [FormationEnthalpy(pair) for pair in self._pair_list]
-        return 4 * sum(
-                [percent * enthalpy for percent, enthalpy in zip(self._pair_percentage, pair_formation_enthalpy)])
+        return self._batch.get_formation_enthalpy().item()
 
     def get_density(self):
         """Returns the density of the alloy
@@ -224,9 +241,7 @@ class HEACalculator:
         float
             The density of the alloy in g/cm^3
         """
-        total_weight = sum(Element(elm).atomic_weight * af for elm, af in self._alloy.items())
-        total_volume = sum(Element(elm).atomic_volume * af for elm, af in self._alloy.items())
-        return total_weight / total_volume
+        return self._batch.get_density().item()
 
     def get_valance_electron_concentration(self):
         """Returns the valance electron concentration (VEC) of the alloy
@@ -236,10 +251,7 @@ class HEACalculator:
         float
             The valance electron concentration (VEC) of the alloy
         """
-        nvalence_list = [Element(elm).nvalence for elm in self._alloy]
-        return sum(
-                [percentage * valence for percentage, valence in
-                 zip(self._atomic_percentage.values(), nvalence_list)])
+        return self._batch.get_valance_electron_concentration().item()
 
     def get_melting_temperature(self):
         """Returns the melting temperature of the alloy in Kelvin
@@ -249,10 +261,7 @@ class HEACalculator:
         float
             The melting temperature of the alloy in Kelvin
         """
-        melting_temperature_list = [Element(elm).melting_point for elm in self._alloy]
-        return math.ceil(sum([percentage * melting_temp
-                              for percentage, melting_temp in
-                              zip(self._atomic_percentage.values(), melting_temperature_list)]))
+        return int(self._batch.get_melting_temperature().item())
 
     def get_atomic_size_difference(self):
         """Returns the atomic size difference, delta, of the alloy
@@ -262,9 +271,7 @@ class HEACalculator:
         float
             The atomic size difference, delta, of the alloy
         """
-        _delta = sum([percentage * (1 - (radius / self._average_atomic_radius)) ** 2
-                      for percentage, radius in zip(self._atomic_percentage.values(), self._atomic_radius_list)])
-        return math.sqrt(_delta) * 100
+        return self._batch.get_atomic_size_difference().item()
 
     def get_min_formation_enthalpy(self):
         """Returns the minimum binary enthalpy of formation of ordered compounds of the system in meV/atom
@@ -274,8 +281,7 @@ class HEACalculator:
         float
             The minimum binary enthalpy of formation of ordered compounds of the system in meV/atom
         """
-        pair_formation_enthalpy = [FormationEnthalpy(pair) for pair in self._pair_list]
-        return min(pair_formation_enthalpy)
+        return self._batch.get_min_formation_enthalpy().item()
 
     def get_mixing_entropy(self):
         """Returns the entropy of mixing of the alloy in J/K.mol
@@ -285,8 +291,7 @@ class HEACalculator:
         float
             The mixing entropy of the alloy in J/K.mol
         """
-        return -1 * GAS_CONSTANT * sum(
-                list(self._atomic_percentage.values()) * np.log(list(self._atomic_percentage.values())))
+        return self._batch.get_mixing_entropy().item()
 
     def get_gamma(self):
         """Returns the Gamma parameter, atomic size difference of the alloy. According to [12]_
@@ -300,15 +305,7 @@ class HEACalculator:
         ----------
         .. [12] Wang, Z.; Huang, Y.; Yang, Y.; Wang, J.; Liu, C.T.; Scr. Mater. 94 (2015) 28–31.
         """
-        smallest_solid_angle = (1 - np.sqrt(
-                (((min(self._atomic_radius_list) + self._average_atomic_radius) ** 2) - (
-                        self._average_atomic_radius ** 2)) / (
-                        (min(self._atomic_radius_list) + self._average_atomic_radius) ** 2)))
-        largest_solid_angle = (1 - np.sqrt(
-                (((max(self._atomic_radius_list) + self._average_atomic_radius) ** 2) - (
-                        self._average_atomic_radius ** 2)) / (
-                        (max(self._atomic_radius_list) + self._average_atomic_radius) ** 2)))
-        return smallest_solid_angle / largest_solid_angle
+        return self._batch.get_gamma().item()
 
     def get_omega(self, temperature=None):
         """Returns the Omega parameter. According to [13]_
@@ -328,19 +325,10 @@ class HEACalculator:
         ----------
         .. [13] Yang, X.; Zhang, Y. Mater. Chem. Phys. 2012, 132, 233–238.
         """
-        if self.melting_temperature is None:
-            self.melting_temperature = self.get_melting_temperature()
-
-        if self.mixing_entropy is None:
-            self.mixing_entropy = self.get_mixing_entropy()
-
-        if self.mixing_enthalpy is None:
-            self.mixing_enthalpy = self.get_mixing_enthalpy()
-
         if temperature is None:
-            return (self.melting_temperature * self.mixing_entropy) / (abs(self.mixing_enthalpy) * 1000)
+            temperature = self.melting_temperature
 
-        return (temperature * self.mixing_entropy) / (abs(self.mixing_enthalpy) * 1000)
+        return float(kernels.omega(temperature, self.mixing_entropy, self.mixing_enthalpy))
 
     def get_lambda(self):
         """Returns the Lambda parameter focuses on the configurational entropy and the atomic size difference.
@@ -354,13 +342,7 @@ class HEACalculator:
         ----------
         .. [14] Singh, A.K.; Kumar N.; Dwivedi A.; Subramaniam A.; Intermetallics 53 (2014) 112–119.
         """
-        if self.mixing_entropy is None:
-            self.mixing_entropy = self.get_mixing_entropy()
-
-        if self.atomic_size_difference is None:
-            self.atomic_size_difference = self.get_atomic_size_difference()
-
-        return self.mixing_entropy / (self.atomic_size_difference ** 2)
+        return float(kernels.lambda_parameter(self.mixing_entropy, self.atomic_size_difference))
 
     def get_phi(self):
         """Returns the Phi parameter. According to [15]_
@@ -428,17 +410,7 @@ class HEACalculator:
         ----------
         .. [16] Guo, S.; Ng, C.; Lu, J.; Liu, C.T. J. Appl. Phys. 2011, 109, 103505.
         """
-        if self.valance_electron_concentration is None:
-            self.valance_electron_concentration = self.get_valance_electron_concentration()
-
-        if 2.5 <= self.valance_electron_concentration <= 3.5:
-            return "HCP"
-        if self.valance_electron_concentration >= 8.0:
-            return "FCC"
-        if self.valance_electron_concentration <= 6.87:
-            return "BCC"
-
-        return "BCC+FCC"
+        return kernels.microstructure(self.valance_electron_concentration).item()
 
     def get_model_1_result(self):
         """Returns the solid solution / intermetallic prediction according to [17]_
@@ -452,13 +424,7 @@ class HEACalculator:
         ----------
         .. [17] X. Yang, Y. Zhang, Mater. Chem. Phys. 132 (2) (2012) 233–238.
         """
-        if self.omega_parameter is None:
-            self.omega_parameter = self.get_omega()
-
-        if self.atomic_size_difference is None:
-            self.atomic_size_difference = self.get_atomic_size_difference()
-
-        return 'Solid Solution' if self.omega_parameter >= 1.1 and self.atomic_size_difference <= 6.6 else 'Intermetallic'
+        return kernels.model_1(self.omega_parameter, self.atomic_size_difference).item()
 
     def get_model_2_result(self):
         """Returns the solid solution / intermetallic prediction according to [18]_
@@ -472,14 +438,7 @@ class HEACalculator:
         ----------
         .. [18] S. Guo, Q. Hu, C. Ng, C.T. Liu, Intermetallics 41 (0) (2013) 96–103.
         """
-        if self.mixing_enthalpy is None:
-            self.mixing_enthalpy = self.get_mixing_enthalpy()
-
-        if self.atomic_size_difference is None:
-            self.atomic_size_difference = self.get_atomic_size_difference()
-
-        return 'Solid Solution' \
-            if -11.6 < self.mixing_enthalpy < 3.2 and self.atomic_size_difference < 6.6 else 'Intermetallic'
+        return kernels.model_2(self.mixing_enthalpy, self.atomic_size_difference).item()
 
     def get_model_3_result(self):
         """Returns the solid solution / intermetallic prediction according to [19]_
@@ -493,13 +452,7 @@ class HEACalculator:
         ----------
         .. [19] Z. Wang, Y. Huang, Y. Yang, J. Wang, C.T. Liu, Scr. Mater. 94 (2015) 28–31.
         """
-        if self.omega_parameter is None:
-            self.omega_parameter = self.get_omega()
-
-        if self.gamma_parameter is None:
-            self.gamma_parameter = self.get_gamma()
-
-        return 'Solid Solution' if self.omega_parameter >= 1.1 and self.gamma_parameter < 1.175 else 'Intermetallic'
+        return kernels.model_3(self.omega_parameter, self.gamma_parameter).item()
 
     def get_model_4_result(self):
         """Returns the solid solution / intermetallic prediction according to [20]_
@@ -513,10 +466,7 @@ class HEACalculator:
         ----------
         .. [20] A.K. Singh, N. Kumar, A. Dwivedi, A. Subramaniam, Intermetallics 53 (2014) 112–119.
         """
-        if self.lambda_parameter is None:
-            self.lambda_parameter = self.get_lambda()
-
-        return 'Solid Solution' if self.lambda_parameter > 0.96 else 'Intermetallic'
+        return kernels.model_4(self.lambda_parameter).item()
 
     def get_model_5_result(self):
         """Returns the solid solution / intermetallic prediction according to [21]_
@@ -552,19 +502,9 @@ class HEACalculator:
         ----------
         .. [22] Troparevsky, M. C.; Morris, J. R.; Kent, P. R. C.; Lupini, A. R.; Stocks, G. M.; Phys. Rev. X, 5(1) (2015)
         """
-        if self.melting_temperature is None:
-            self.melting_temperature = self.get_melting_temperature()
-
-        if self.min_formation_enthalpy is None:
-            self.min_formation_enthalpy = self.get_min_formation_enthalpy()
+        return kernels.model_6(self.melting_temperature, self.mixing_entropy, self.min_formation_enthalpy).item()
 
-        _critical_temperature = self.melting_temperature * 0.55
-        return 'Solid Solution' \
-            if (-1 * 1000 * _critical_temperature * self.mixing_entropy * J_PER_MOL_TO_EV_PER_ATOM) \
-               < float(self.min_formation_enthalpy) < 37 \
-            else 'Multiple Phases'
-
-    def get_model_7_result(self, k_2=0.6, annealing_temperature=None):
+    def get_model_7_result(self, k_2=kernels.MODEL_7_K_2, annealing_temperature=None):
         """Returns the solid solution / intermetallic prediction according to [23]_
 
         Parameters
@@ -585,18 +525,11 @@ class HEACalculator:
         ----------
         .. [23] O.N. Senkov, D.B. Miracle, J. Alloys Compd. 658 (2016) 603–607.
         """
-        if self.formation_enthalpy is None:
-            self.formation_enthalpy = self.get_formation_enthalpy()
-
         if annealing_temperature is None:
-            annealing_temperature = self.melting_temperature * 0.6
-
-        k_1 = self.formation_enthalpy / self.mixing_enthalpy
+            annealing_temperature = self.melting_temperature * kernels.MODEL_7_ANNEALING_TEMPERATURE_RATIO
 
         omega = self.get_omega(temperature=annealing_temperature)
-        k_1_cr = (omega * (1 - k_2)) + 1
-
-        return 'Solid Solution' if k_1_cr > k_1 else 'Intermetallic'
+        return kernels.model_7(self.formation_enthalpy, self.mixing_enthalpy, omega, k_2).item()
 
     def get_model_8_result(self):
         """Returns the solid solution / intermetallic prediction according to [24]_
@@ -622,54 +555,58 @@ class HEACalculator:
         Returns
         -------
         list
-            All the calculated properties of the alloy
+            All the calculated properties of the alloy, or only the selected ones
         """
         return_list = [self.formula]
-        for item in [
-                self.density,
-                self.atomic_size_difference,
-                self.omega_parameter,
-                self.valance_electron_concentration,
-                self.mixing_enthalpy,
-                self.mixing_entropy,
-                self.formation_enthalpy,
-                self.melting_temperature,
-        ]:
-            return_list.append("%.2f" % item)
-        return_list.append(self.microstructure)
-        for item in [
-                self.model_1,
-                self.model_2,
-                self.model_3,
-                self.model_4,
-                self.model_5,
-                self.model_6,
-                self.model_7,
-                self.model_8,
-        ]:
-            return_list.append(item)
+        for name in self.output_properties:
+            item = getattr(self, name)
+            return_list.append(item if isinstance(item, str) else "%.2f" % item)
         return return_list
 
+    @classmethod
+    def report_properties(cls, properties=None):
+        """Returns the properties shown in the report of an alloy
+
+        Parameters
+        ----------
+        properties : sequence of str, optional
+            The selected properties. By default None, which implies to all the properties.
+
+        Returns
+        -------
+        tuple of str
+            The reported properties, in report order
+        """
+        selected = set(PROPERTY_DEPENDENCIES if properties is None else properties)
+        return tuple(name for name, _, _ in cls._REPORT_PARAMETERS + cls._REPORT_PREDICTIONS if name in selected)
+
+    @classmethod
+    def format_report(cls, formula, values):
+        """Formats the report of an alloy from the values of its properties
+
+        Parameters
+        ----------
+        formula : str
+            Alloy formula
+
+        values : dict
+            Values of the reported properties, indexed by property name. See :meth:`report_properties`.
+
+        Returns
+        -------
+        str
+            Report of the alloy
+        """
+        lines = [f'{formula:=^48}\n']
+        lines.extend(f'{label:25}: {template.format(values[name])}\n'
+                     for name, label, template in cls._REPORT_PARAMETERS if name in values)
+        predictions = [f'{label:25}: {template.format(values[name])}\n'
+                       for name, label, template in cls._REPORT_PREDICTIONS if name in values]
+        if predictions:
+            lines.append(f'{"Predictions":=^48}\n')
+            lines.extend(predictions)
+        return ''.join(lines)
+
     def __str__(self):
-        return f'{self.formula:=^48}\n' \
-               f'{"Density":25}: {self.density: >10.2} g/cm^3\n' \
-               f'{"Delta":25}: {self.atomic_size_difference:>10.2f} \n' \
-               f'{"Omega":25}: {self.omega_parameter:>10.2f} \n' \
-               f'{"Gamma":25}: {self.gamma_parameter:>10.2f} \n' \
-               f'{"Lambda":25}: {self.lambda_parameter:>10.2f} \n' \
-               f'{"VEC":25}: {self.valance_electron_concentration:>10.2f} \n' \
-               f'{"Mixing Enthalpy":25}: {self.mixing_enthalpy: >10.2f} kJ/mol\n' \
-               f'{"Mixing Entropy":25}: {self.mixing_entropy: >10.2f} J/K.mol\n' \
-               f'{"Formation Enthalpy":25}: {self.formation_enthalpy: >10.2f} meV/atom\n' \
-               f'{"Min. Formation Enthalpy":25}: {self.min_formation_enthalpy: >10.2f} meV/atom\n' \
-               f'{"Melting Temperature":25}: {self.melting_temperature: >10} K\n' \
-               f'{"Predictions":=^48}\n' \
-               f'{"Microstructure":25}:     {self.microstructure} \n' \
-               f'{"Model 1":25}:     {self.model_1}\n' \
-               f'{"Model 2":25}:     {self.model_2}\n' \
-               f'{"Model 3":25}:     {self.model_3}\n' \
-               f'{"Model 4":25}:     {self.model_4}\n' \
-               f'{"Model 5":25}:     {self.model_5}\n' \
-               f'{"Model 6":25}:     {self.model_6}\n' \
-               f'{"Model 7":25}:     {self.model_7}\n' \
-               f'{"Model 8":25}:     {self.model_8}\n'
+        return self.format_report(self.formula,
+                                  {name: getattr(self, name) for name in self.report_properties(self.properties)})
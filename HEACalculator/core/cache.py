@@ -0,0 +1,508 @@
+#!/usr/bin/env python3
+
+# Copyright (C) 2022  Doguhan Sariturk
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+import functools
+import hashlib
+import json
+import os
+import sqlite3
+import sys
+import threading
+import time
+import types
+from collections import OrderedDict
+
+import numpy as np
+
+from HEACalculator.core import kernels
+from HEACalculator.core.Batch import HEABatch
+from HEACalculator.core.properties import PROPERTY_DEPENDENCIES, AlloyProperties, LazyProperty, resolve_properties
+from HEACalculator import data
+
+__author__ = "Doguhan Sariturk"
+__email__ = "dogu.sariturk@gmail.com"
+
+CACHE_VERSION = 1
+CACHE_FILENAME = 'results.sqlite'
+DEFAULT_MAX_SIZE = 256 * 2 ** 20
+DEFAULT_CAPACITY = 4096
+
+# Fraction of the maximum size the cache is shrunk to once it is full
+EVICTION_RATIO = 0.9
+
+# Number of decimals of the atomic fractions in the keys
+KEY_DECIMALS = 12
+
+# Namespace of the records of the properties of alloys, shared by the calculators and the batches
+PROPERTIES_KIND = 'properties'
+
+# The scalar calculator gives the melting temperature as an integer, the batches as a float
+_SCALAR_TYPES = {'melting_temperature': int}
+
+CACHED_PROPERTIES = tuple(name for name in PROPERTY_DEPENDENCIES
+                          if isinstance(getattr(AlloyProperties, name, None), LazyProperty))
+
+_SQL_VARIABLES = 500
+
+
+def default_cache_dir():
+    """Returns the directory of the result cache
+
+    The ``HEACALCULATOR_CACHE_DIR`` environment variable overrides the
+    platform's user cache directory.
+
+    Returns
+    -------
+    str
+        Path of the directory
+    """
+    if os.environ.get('HEACALCULATOR_CACHE_DIR'):
+        return os.environ['HEACALCULATOR_CACHE_DIR']
+    if sys.platform == 'win32':
+        base = os.environ.get('LOCALAPPDATA') or os.path.expanduser('~\\AppData\\Local')
+        return os.path.join(base, 'HEACalculator', 'Cache')
+    if sys.platform == 'darwin':
+        return os.path.expanduser('~/Library/Caches/HEACalculator')
+    return os.path.join(os.environ.get('XDG_CACHE_HOME') or os.path.expanduser('~/.cache'), 'HEACalculator')
+
+
+def fingerprint(database=None):
+    """Returns the fingerprint of the data and the model thresholds the results depend on
+
+    Results calculated with another database or another version of the
+    thresholds have another fingerprint, so they are never returned.
+
+    Parameters
+    ----------
+    database : HEACalculator.data.Database.Database, optional
+        Database of the results, by default None which implies to the database shipped with the package
+
+    Returns
+    -------
+    str
+        Hexadecimal digest
+    """
+    return _fingerprint((data.default_database if database is None else database).fingerprint)
+
+
+@functools.lru_cache(maxsize=None)
+def _fingerprint(database_fingerprint):
+    constants = {name: value for name, value in vars(kernels).items() if name.isupper()}
+    return hashlib.sha256(repr((CACHE_VERSION, sorted(constants.items()), database_fingerprint)).encode()).hexdigest()
+
+
+def composition_keys(elements, compositions):
+    """Returns the canonical keys of compositions
+
+    The key only depends on the atomic fractions, so ``FeCo``, ``Fe50Co50``
+    and ``CoFe`` share the same key.
+
+    Parameters
+    ----------
+    elements : sequence of str
+        Element symbols, one per column of `compositions`
+
+    compositions : array_like
+        (N, E) matrix of element amounts
+
+    Returns
+    -------
+    list of str
+        Key of each composition, e.g. ``'Co:0.5,Fe:0.5'``
+    """
+    order = sorted(range(len(elements)), key=lambda idx: elements[idx])
+    fractions = kernels.atomic_fractions(np.atleast_2d(np.asarray(compositions, dtype=float)))
+    fractions = np.round(fractions[:, order], KEY_DECIMALS) + 0.0
+    symbols = [elements[idx] for idx in order]
+    return [','.join(f'{symbol}:{fraction!r}' for symbol, fraction in zip(symbols, row))
+            for row in fractions.tolist()]
+
+
+def _cached_properties(alloys):
+    if alloys.properties is None:
+        return CACHED_PROPERTIES
+    return tuple(name for name in resolve_properties(alloys.properties) if name in CACHED_PROPERTIES)
+
+
+def _calculate_records(alloys, count, names):
+    columns = {}
+    for name in names:
+        try:
+            columns[name] = np.broadcast_to(np.asarray(getattr(alloys, name)), (count,)).tolist()
+        except Exception:
+            # The property is calculated again, and raises, when it is accessed
+            continue
+    return [{name: values[idx] for name, values in columns.items()} for idx in range(count)]
+
+
+class BaseCache:
+    """Cache of the calculated properties of alloys, indexed by canonical composition.
+
+    Subclasses implement :meth:`get_many` and :meth:`put_many`, and count the
+    hits and misses of :meth:`get_many`.
+
+    Attributes
+    ----------
+    hits : int
+        Number of compositions found in the cache
+
+    misses : int
+        Number of compositions not found in the cache
+    """
+
+    hits = 0
+    misses = 0
+
+    def get_many(self, kind, keys, digest=None):
+        """Returns the cached records of the given compositions
+
+        Parameters
+        ----------
+        kind : str
+            Namespace of the records, e.g. :data:`PROPERTIES_KIND`
+
+        keys : sequence of str
+            Canonical compositions, see :func:`composition_keys`
+
+        digest : str, optional
+            :func:`fingerprint` of the data the records were calculated with, by default the one of the default database
+
+        Returns
+        -------
+        dict
+            Records of the cached compositions, indexed by key
+        """
+        raise NotImplementedError
+
+    def put_many(self, kind, records, digest=None):
+        """Stores the records of the given compositions
+
+        Parameters
+        ----------
+        kind : str
+            Namespace of the records, e.g. :data:`PROPERTIES_KIND`
+
+        records : dict
+            Records, dictionaries of property values, indexed by canonical composition
+
+        digest : str, optional
+            :func:`fingerprint` of the data the records were calculated with, by default the one of the default database
+        """
+        raise NotImplementedError
+
+    def fill(self, alloys):
+        """Loads the cached properties of alloys, and stores the ones of the alloys which are not cached
+
+        Only the properties selected on `alloys`, and their dependencies, are
+        calculated, for the alloys whose records do not hold them yet. The new
+        values are merged into the cached records, so the records build up as
+        other properties are requested. The loaded properties are memoized on
+        `alloys` as if they were calculated.
+
+        Parameters
+        ----------
+        alloys : HEACalculator.core.HEA.HEACalculator or HEACalculator.core.Batch.HEABatch
+            Alloy or batch of alloys
+        """
+        digest = fingerprint(alloys.database)
+        if isinstance(alloys, HEABatch):
+            keys = composition_keys(alloys.elements, alloys.compositions)
+        else:
+            keys = composition_keys(list(alloys._alloy), [list(alloys._alloy.values())])
+        if not keys:
+            return
+
+        names = _cached_properties(alloys)
+        found = self.get_many(PROPERTIES_KIND, keys, digest)
+        missing = [idx for idx, key in enumerate(keys) if not all(name in found.get(key, ()) for name in names)]
+
+        if len(missing) == len(keys) and not found:
+            records = _calculate_records(alloys, len(keys), names)
+            self.put_many(PROPERTIES_KIND, dict(zip(keys, records)), digest)
+            return
+
+        if missing:
+            if len(missing) == len(keys) or not isinstance(alloys, HEABatch):
+                # A calculator holds a single alloy, so it has no subset
+                subset = alloys
+            else:
+                subset = alloys.subset(np.array(missing, dtype=np.intp))
+            records = {}
+            for idx, record in zip(missing, _calculate_records(subset, len(missing), names)):
+                # The properties already cached are kept, the new ones are added
+                records[keys[idx]] = dict(found.get(keys[idx], {}), **record)
+            found.update(records)
+            self.put_many(PROPERTIES_KIND, records, digest)
+
+        rows = [found[key] for key in keys]
+        for name in CACHED_PROPERTIES:
+            if all(name in row for row in rows):
+                values = [row[name] for row in rows]
+                if isinstance(alloys, HEABatch):
+                    alloys.__dict__[name] = np.array(values)
+                else:
+                    convert = _SCALAR_TYPES.get(name)
+                    alloys.__dict__[name] = values[0] if convert is None else convert(values[0])
+
+
+class ResultCache(BaseCache):
+    """Persistent cache of the calculated properties of alloys, stored in an SQLite database.
+
+    The results are indexed by the canonical composition of the alloy, see
+    :func:`composition_keys`, and by the :func:`fingerprint` of the data they
+    were calculated with. Once the records exceed `max_size` bytes, the least
+    recently used ones are evicted.
+
+    The cache can be shared by several processes, each one opening its own
+    connection on first use.
+
+    Parameters
+    ----------
+    path : str, optional
+        Path of the database file. By default None, which implies to a file in :func:`default_cache_dir`.
+
+    max_size : int, optional
+        Approximate maximum size of the records in bytes
+
+    Attributes
+    ----------
+    hits : int
+        Number of alloys found in the cache by this instance
+
+    misses : int
+        Number of alloys not found in the cache by this instance
+    """
+
+    def __init__(self, path=None, max_size=DEFAULT_MAX_SIZE):
+        self.path = path or os.path.join(default_cache_dir(), CACHE_FILENAME)
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        self._connection = None
+        self._size = 0
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        state.update(_connection=None, hits=0, misses=0)
+        return state
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    @property
+    def connection(self):
+        """sqlite3.Connection: Connection to the database, opened on first use"""
+        if self._connection is None:
+            directory = os.path.dirname(os.path.abspath(self.path))
+            os.makedirs(directory, exist_ok=True)
+            connection = sqlite3.connect(self.path, timeout=60)
+            connection.execute('PRAGMA journal_mode=WAL')
+            connection.execute('CREATE TABLE IF NOT EXISTS results ('
+                               'fingerprint TEXT NOT NULL, kind TEXT NOT NULL, composition TEXT NOT NULL, '
+                               'record TEXT NOT NULL, size INTEGER NOT NULL, accessed REAL NOT NULL, '
+                               'PRIMARY KEY (fingerprint, kind, composition)) WITHOUT ROWID')
+            connection.execute('CREATE INDEX IF NOT EXISTS results_accessed ON results (accessed)')
+            connection.commit()
+            self._connection = connection
+            self._size = connection.execute('SELECT COALESCE(SUM(size), 0) FROM results').fetchone()[0]
+        return self._connection
+
+    def close(self):
+        """Closes the connection to the database"""
+        if self._connection is not None:
+            self._connection.close()
+            self._connection = None
+
+    def get_many(self, kind, keys, digest=None):
+        records = {}
+        unique = list(dict.fromkeys(keys))
+        digest = digest or fingerprint()
+        with self.connection as connection:
+            for start in range(0, len(unique), _SQL_VARIABLES):
+                part = unique[start:start + _SQL_VARIABLES]
+                marks = ','.join('?' * len(part))
+                parameters = [digest, kind] + part
+                rows = connection.execute(f'SELECT composition, record FROM results WHERE fingerprint = ? '
+                                          f'AND kind = ? AND composition IN ({marks})', parameters).fetchall()
+                if rows:
+                    connection.execute(f'UPDATE results SET accessed = ? WHERE fingerprint = ? '
+                                       f'AND kind = ? AND composition IN ({marks})', [time.time()] + parameters)
+                records.update((key, json.loads(record)) for key, record in rows)
+        self.hits += len(records)
+        self.misses += len(unique) - len(records)
+        return records
+
+    def put_many(self, kind, records, digest=None):
+        digest = digest or fingerprint()
+        now = time.time()
+        rows = []
+        for key, record in records.items():
+            text = json.dumps(record, separators=(',', ':'))
+            rows.append((digest, kind, key, text, len(key) + len(text), now))
+
+        with self.connection as connection:
+            connection.executemany('INSERT OR REPLACE INTO results VALUES (?, ?, ?, ?, ?, ?)', rows)
+        self._size += sum(row[4] for row in rows)
+        if self._size > self.max_size:
+            self.evict(int(self.max_size * EVICTION_RATIO))
+
+    def evict(self, size):
+        """Evicts the least recently used records until the records take at most the given size
+
+        Parameters
+        ----------
+        size : int
+            Target size of the records in bytes
+        """
+        with self.connection as connection:
+            total = connection.execute('SELECT COALESCE(SUM(size), 0) FROM results').fetchone()[0]
+            if total > size:
+                # The records of one put share the same access time, so they are
+                # evicted one by one rather than by access time
+                evicted, freed = [], 0
+                cursor = connection.execute('SELECT fingerprint, kind, composition, size FROM results '
+                                            'ORDER BY accessed')
+                for digest, kind, key, record_size in cursor:
+                    evicted.append((digest, kind, key))
+                    freed += record_size
+                    if total - freed <= size:
+                        break
+                cursor.close()
+                connection.executemany('DELETE FROM results WHERE fingerprint = ? AND kind = ? AND composition = ?',
+                                       evicted)
+                total = connection.execute('SELECT COALESCE(SUM(size), 0) FROM results').fetchone()[0]
+        self._size = total
+
+    def clear(self):
+        """Removes every record from the cache"""
+        with self.connection as connection:
+            connection.execute('DELETE FROM results')
+        self.connection.execute('VACUUM')
+        self._size = 0
+
+    def stats(self):
+        """Returns statistics about the cache
+
+        Returns
+        -------
+        dict
+            Path of the database, number of records, number of records calculated
+            with other data than the default database, size of the records and maximum size in bytes
+        """
+        entries, stale, size = self.connection.execute(
+                'SELECT COUNT(*), COALESCE(SUM(fingerprint != ?), 0), COALESCE(SUM(size), 0) FROM results',
+                (fingerprint(),)).fetchone()
+        return {'path': self.path, 'entries': entries, 'stale_entries': stale, 'size': size,
+                'max_size': self.max_size}
+
+
+class MemoryCache(BaseCache):
+    """Bounded, thread-safe, in-process LRU cache of the calculated properties of alloys.
+
+    The records are read-only mappings, shared by every calculator of the
+    same composition. :data:`memory_cache` is the cache shared by the whole process.
+
+    Parameters
+    ----------
+    capacity : int, optional
+        Maximum number of records
+
+    Attributes
+    ----------
+    hits : int
+        Number of compositions found in the cache
+
+    misses : int
+        Number of compositions not found in the cache
+
+    evictions : int
+        Number of records evicted to respect the capacity
+    """
+
+    def __init__(self, capacity=DEFAULT_CAPACITY):
+        self.capacity = capacity
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._records = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._records)
+
+    def get_many(self, kind, keys, digest=None):
+        records = {}
+        digest = digest or fingerprint()
+        with self._lock:
+            for key in dict.fromkeys(keys):
+                record = self._records.get((kind, digest, key))
+                if record is None:
+                    self.misses += 1
+                else:
+                    self._records.move_to_end((kind, digest, key))
+                    records[key] = record
+                    self.hits += 1
+        return records
+
+    def put_many(self, kind, records, digest=None):
+        digest = digest or fingerprint()
+        with self._lock:
+            for key, record in records.items():
+                self._records[(kind, digest, key)] = types.MappingProxyType(dict(record))
+                self._records.move_to_end((kind, digest, key))
+            self._evict()
+
+    def _evict(self):
+        while len(self._records) > self.capacity:
+            self._records.popitem(last=False)
+            self.evictions += 1
+
+    def resize(self, capacity):
+        """Changes the capacity of the cache, evicting the least recently used records if needed
+
+        Parameters
+        ----------
+        capacity : int
+            Maximum number of records
+        """
+        with self._lock:
+            self.capacity = capacity
+            self._evict()
+
+    def clear(self):
+        """Removes every record from the cache and resets the metrics"""
+        with self._lock:
+            self._records.clear()
+            self.hits = self.misses = self.evictions = 0
+
+    def stats(self):
+        """Returns the metrics of the cache
+
+        Returns
+        -------
+        dict
+            Number of records, capacity, hits, misses and evictions
+        """
+        with self._lock:
+            return {'entries': len(self._records), 'capacity': self.capacity,
+                    'hits': self.hits, 'misses': self.misses, 'evictions': self.evictions}
+
+
+memory_cache = MemoryCache()
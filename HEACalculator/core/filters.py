@@ -0,0 +1,194 @@
+#!/usr/bin/env python3
+
+# Copyright (C) 2022  Doguhan Sariturk
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+import ast
+import operator
+
+import numpy as np
+
+from HEACalculator.core.properties import PROPERTY_DEPENDENCIES
+
+__author__ = "Doguhan Sariturk"
+__email__ = "dogu.sariturk@gmail.com"
+
+_COMPARISONS = {
+        ast.Eq: operator.eq,
+        ast.NotEq: operator.ne,
+        ast.Lt: operator.lt,
+        ast.LtE: operator.le,
+        ast.Gt: operator.gt,
+        ast.GtE: operator.ge,
+}
+
+_ARITHMETIC = {
+        ast.Add: operator.add,
+        ast.Sub: operator.sub,
+        ast.Mult: operator.mul,
+        ast.Div: operator.truediv,
+        ast.Pow: operator.pow,
+}
+
+_UNARY = {
+        ast.USub: operator.neg,
+        ast.UAdd: operator.pos,
+        ast.Not: np.logical_not,
+}
+
+_FUNCTIONS = {
+        'abs': np.abs,
+}
+
+
+class Expression:
+    """Expression over the properties of alloys, evaluated on whole batches at once.
+
+    The expressions use the Python syntax restricted to property names,
+    number and string literals, arithmetic, comparisons, ``and``, ``or``,
+    ``not`` and ``abs()``, e.g.
+    ``"omega_parameter >= 1.1 and atomic_size_difference < 6.6 and model_6 == 'Solid Solution'"``.
+
+    Parameters
+    ----------
+    source : str
+        The expression.
+
+    condition : bool, optional
+        Whether the expression should be a condition, i.e. a comparison, ``and``,
+        ``or`` or ``not``, by default False
+
+    Raises
+    ------
+    ValueError
+        If the expression is not valid, refers to an unknown property or is not a required condition
+
+    Attributes
+    ----------
+    names : tuple of str
+        The properties the expression refers to.
+    """
+
+    def __init__(self, source, condition=False):
+        self.source = source
+        try:
+            self._tree = ast.parse(source.strip(), mode='eval').body
+        except SyntaxError as e:
+            raise ValueError(f'Invalid expression: {source}') from e
+
+        names = {}
+        self._check(self._tree, names)
+        self.names = tuple(names)
+
+        if condition and not (isinstance(self._tree, (ast.Compare, ast.BoolOp))
+                              or isinstance(self._tree, ast.UnaryOp) and isinstance(self._tree.op, ast.Not)):
+            raise ValueError(f'Expression is not a condition: {source}')
+
+    def __repr__(self):
+        return f'{self.__class__.__name__}({self.source!r})'
+
+    def _check(self, node, names):
+        if isinstance(node, ast.Name):
+            if node.id not in PROPERTY_DEPENDENCIES:
+                raise ValueError(f'Unknown property in expression: {node.id}. '
+                                 f'Available properties are: {", ".join(PROPERTY_DEPENDENCIES)}')
+            names[node.id] = None
+        elif isinstance(node, ast.Constant):
+            if not isinstance(node.value, (int, float, str)) or isinstance(node.value, bool):
+                raise ValueError(f'Unsupported literal in expression: {node.value!r}')
+        elif isinstance(node, ast.BoolOp):
+            for value in node.values:
+                self._check(value, names)
+        elif isinstance(node, ast.Compare) and all(type(op) in _COMPARISONS for op in node.ops):
+            for operand in [node.left] + node.comparators:
+                self._check(operand, names)
+        elif isinstance(node, ast.BinOp) and type(node.op) in _ARITHMETIC:
+            self._check(node.left, names)
+            self._check(node.right, names)
+        elif isinstance(node, ast.UnaryOp) and type(node.op) in _UNARY:
+            self._check(node.operand, names)
+        elif (isinstance(node, ast.Call) and isinstance(node.func, ast.Name) and node.func.id in _FUNCTIONS
+              and len(node.args) == 1 and not node.keywords):
+            self._check(node.args[0], names)
+        else:
+            raise ValueError(f'Unsupported syntax in expression: {ast.unparse(node)}')
+
+    def evaluate(self, batch):
+        """Evaluates the expression on a batch of alloys
+
+        Only the properties the expression refers to, and their dependencies,
+        are calculated.
+
+        Parameters
+        ----------
+        batch : HEACalculator.core.Batch.HEABatch
+            The alloys
+
+        Returns
+        -------
+        numpy.ndarray
+            Value of the expression for each alloy
+        """
+        with np.errstate(divide='ignore', invalid='ignore'):
+            return np.broadcast_to(self._evaluate(self._tree, batch), (len(batch),))
+
+    def mask(self, batch):
+        """Returns whether each alloy of a batch satisfies the expression
+
+        Parameters
+        ----------
+        batch : HEACalculator.core.Batch.HEABatch
+            The alloys
+
+        Raises
+        ------
+        ValueError
+            If the expression is not a condition
+
+        Returns
+        -------
+        numpy.ndarray
+            Boolean mask of the alloys satisfying the expression
+        """
+        values = self.evaluate(batch)
+        if values.dtype != bool:
+            raise ValueError(f'Expression is not a condition: {self.source}')
+        return values
+
+    def _evaluate(self, node, batch):
+        if isinstance(node, ast.Name):
+            return getattr(batch, node.id)
+        if isinstance(node, ast.Constant):
+            return node.value
+        if isinstance(node, ast.BoolOp):
+            combine = np.logical_and if isinstance(node.op, ast.And) else np.logical_or
+            result = self._evaluate(node.values[0], batch)
+            for value in node.values[1:]:
+                result = combine(result, self._evaluate(value, batch))
+            return result
+        if isinstance(node, ast.Compare):
+            result = True
+            left = self._evaluate(node.left, batch)
+            for op, comparator in zip(node.ops, node.comparators):
+                right = self._evaluate(comparator, batch)
+                result = np.logical_and(result, _COMPARISONS[type(op)](np.asarray(left), right))
+                left = right
+            return result
+        if isinstance(node, ast.BinOp):
+            return _ARITHMETIC[type(node.op)](np.asarray(self._evaluate(node.left, batch)),
+                                              self._evaluate(node.right, batch))
+        if isinstance(node, ast.UnaryOp):
+            return _UNARY[type(node.op)](np.asarray(self._evaluate(node.operand, batch)))
+        return _FUNCTIONS[node.func.id](self._evaluate(node.args[0], batch))
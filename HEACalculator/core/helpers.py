@@ -15,15 +15,22 @@
 # You should have received a copy of the GNU General Public License
 # along with this program.  If not, see <https://www.gnu.org/licenses/>.
 
+import functools
 import re
 import string
 
+import numpy as np
+
 __author__ = "Doguhan Sariturk"
 __email__ = "dogu.sariturk@gmail.com"
 
 formula_token_matcher_rational = re.compile(r'[A-Z][a-z]?|(?:\d*[.])?\d+|\d+|[()]')
 letter_set = set(string.ascii_letters)
 bracketed_charge_re = re.compile(r'\([+-]?\d+\)$|\(\d+[+-]?\)$|\([+-]+\)$')
+flat_formula_re = re.compile(r'(?:[A-Z][a-z]?(?:\d+\.?\d*|\.\d+)?)+')
+element_amount_re = re.compile(r'([A-Z][a-z]?)(\d+\.?\d*|\.\d+)?')
+
+FORMULA_CACHE_SIZE = 65536
 
 
 def nested_formula_parser(formula, check=True):
@@ -104,3 +111,93 @@ def nested_formula_parser(formula, check=True):
             else:
                 ans[ele] = count
     return ans
+
+
+def composition_formula(composition):
+    """Writes the formula of a composition, the inverse of :func:`nested_formula_parser`
+
+    Parameters
+    ----------
+    composition : dict
+        Amounts of the elements, indexed by element symbol, e.g. ``{'Fe': 20.0, 'Co': 80.0}``
+
+    Returns
+    -------
+    str
+        Alloy formula, e.g. ``'Fe20.0Co80.0'``
+    """
+    return ''.join(f'{element}{amount}' for element, amount in composition.items())
+
+
+def _canonical_formula(formula):
+    # Flat formulas are written with their elements sorted and their amounts explicit,
+    # so FeCo, CoFe and Fe1Co1 share one cache entry. The other ones keep their spelling.
+    if not flat_formula_re.fullmatch(formula):
+        return formula, None
+    tokens = element_amount_re.findall(formula)
+    order = list(dict.fromkeys(element for element, _ in tokens))
+    return ''.join(sorted(f'{element}{amount or 1}' for element, amount in tokens)), order
+
+
+@functools.lru_cache(maxsize=FORMULA_CACHE_SIZE)
+def _parse_formula(formula):
+    return tuple(nested_formula_parser(formula).items())
+
+
+def parse_formula(formula):
+    """Memoized :func:`nested_formula_parser`
+
+    The parsed formulas are kept in a bounded LRU cache, whose hit and miss
+    counters are reported by ``parse_formula.cache_info()``. The formulas
+    without parentheses or charges are cached by their canonical spelling,
+    so the equivalent spellings of an alloy, e.g. ``FeCo``, ``CoFe`` and
+    ``Fe1Co1``, are only parsed once.
+
+    Parameters
+    ----------
+    formula : str
+        Alloy formula
+
+    Returns
+    -------
+    dict
+        Amounts of the elements, indexed by element symbol in order of appearance.
+        A new dictionary is returned on every call.
+    """
+    key, order = _canonical_formula(formula)
+    alloy = dict(_parse_formula(key))
+    return alloy if order is None else {element: alloy[element] for element in order}
+
+
+parse_formula.cache_info = _parse_formula.cache_info
+parse_formula.cache_clear = _parse_formula.cache_clear
+
+
+def parse_many(formulas):
+    """Parses many formulas into a composition matrix
+
+    Parameters
+    ----------
+    formulas : iterable of str
+        Alloy formulas
+
+    Returns
+    -------
+    elements : list of str
+        Element symbols, in order of first appearance, one per column of the matrix
+
+    compositions : numpy.ndarray
+        (N, E) matrix of element amounts, zero for the elements absent from an alloy
+    """
+    index = {}
+    rows, columns, amounts = [], [], []
+    count = 0
+    for count, formula in enumerate(formulas, start=1):
+        for element, amount in parse_formula(formula).items():
+            rows.append(count - 1)
+            columns.append(index.setdefault(element, len(index)))
+            amounts.append(amount)
+
+    compositions = np.zeros((count, len(index)))
+    compositions[rows, columns] = amounts
+    return list(index), compositions
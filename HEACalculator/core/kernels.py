@@ -0,0 +1,195 @@
+#!/usr/bin/env python3
+
+# Copyright (C) 2022  Doguhan Sariturk
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+import numpy as np
+
+__author__ = "Doguhan Sariturk"
+__email__ = "dogu.sariturk@gmail.com"
+
+GAS_CONSTANT = 8.314462618
+J_PER_MOL_TO_EV_PER_ATOM = 0.0103642688 / 1000
+
+SOLID_SOLUTION = 'Solid Solution'
+INTERMETALLIC = 'Intermetallic'
+MULTIPLE_PHASES = 'Multiple Phases'
+NOT_IMPLEMENTED = 'Not Implemented Yet'
+
+PREDICTIONS = (SOLID_SOLUTION, INTERMETALLIC, MULTIPLE_PHASES, NOT_IMPLEMENTED)
+MICROSTRUCTURES = ('BCC', 'FCC', 'BCC+FCC', 'HCP')
+
+MODEL_1_OMEGA = 1.1
+MODEL_1_DELTA = 6.6
+MODEL_2_MIXING_ENTHALPY = (-11.6, 3.2)
+MODEL_2_DELTA = 6.6
+MODEL_3_OMEGA = 1.1
+MODEL_3_GAMMA = 1.175
+MODEL_4_LAMBDA = 0.96
+MODEL_6_CRITICAL_TEMPERATURE_RATIO = 0.55
+MODEL_6_MAX_FORMATION_ENTHALPY = 37
+MODEL_7_K_2 = 0.6
+MODEL_7_ANNEALING_TEMPERATURE_RATIO = 0.6
+
+
+def atomic_fractions(compositions):
+    """Normalizes each row of a composition matrix to atomic fractions
+
+    Parameters
+    ----------
+    compositions : numpy.ndarray
+        (N, E) matrix of element amounts, one alloy per row
+
+    Returns
+    -------
+    numpy.ndarray
+        (N, E) matrix of atomic fractions
+    """
+    return compositions / compositions.sum(axis=1, keepdims=True)
+
+
+def pair_enthalpy(fractions, matrix):
+    """Returns 4 * sum_{i<j} x_i * x_j * H_ij, i.e. 2 * x^T H x, for each alloy
+
+    Parameters
+    ----------
+    fractions : numpy.ndarray
+        (N, E) matrix of atomic fractions
+
+    matrix : numpy.ndarray
+        Symmetric (E, E) matrix of pair enthalpies with a zero diagonal
+
+    Returns
+    -------
+    numpy.ndarray
+        Regular solution enthalpy of each alloy
+    """
+    return 2 * np.einsum('ni,ij,nj->n', fractions, matrix, fractions)
+
+
+def min_pair_enthalpy(fractions, matrix):
+    """Returns the minimum pair enthalpy among the elements present in each alloy
+
+    Parameters
+    ----------
+    fractions : numpy.ndarray
+        (N, E) matrix of atomic fractions
+
+    matrix : numpy.ndarray
+        Symmetric (E, E) matrix of pair enthalpies
+
+    Returns
+    -------
+    numpy.ndarray
+        Minimum pair enthalpy of each alloy
+    """
+    present = fractions > 0
+    mask = present[:, :, None] & present[:, None, :] & ~np.eye(matrix.shape[0], dtype=bool)
+    return np.where(mask, matrix, np.inf).min(axis=(1, 2))
+
+
+def weighted_average(fractions, values):
+    """Returns the atomic fraction weighted average of an element property for each alloy"""
+    return (fractions * values).sum(axis=1)
+
+
+def density(fractions, atomic_weight, atomic_volume):
+    """Returns the approximate density of each alloy in g/cm^3"""
+    return weighted_average(fractions, atomic_weight) / weighted_average(fractions, atomic_volume)
+
+
+def melting_temperature(fractions, melting_point):
+    """Returns the approximate melting temperature of each alloy in Kelvin"""
+    return np.ceil(weighted_average(fractions, melting_point))
+
+
+def atomic_size_difference(fractions, atomic_radius):
+    """Returns the atomic size difference, delta, of each alloy"""
+    average_radius = weighted_average(fractions, atomic_radius)[:, None]
+    return np.sqrt((fractions * (1 - atomic_radius / average_radius) ** 2).sum(axis=1)) * 100
+
+
+def mixing_entropy(fractions):
+    """Returns the ideal configurational entropy of each alloy in J/K.mol"""
+    return -1 * GAS_CONSTANT * (fractions * np.log(np.where(fractions > 0, fractions, 1))).sum(axis=1)
+
+
+def _solid_angle(radius, average_radius):
+    return 1 - np.sqrt(((radius + average_radius) ** 2 - average_radius ** 2) / (radius + average_radius) ** 2)
+
+
+def gamma(fractions, atomic_radius):
+    """Returns the ratio of the smallest to the largest solid angle of each alloy"""
+    present = fractions > 0
+    average_radius = weighted_average(fractions, atomic_radius)
+    smallest_radius = np.where(present, atomic_radius, np.inf).min(axis=1)
+    largest_radius = np.where(present, atomic_radius, -np.inf).max(axis=1)
+    return _solid_angle(smallest_radius, average_radius) / _solid_angle(largest_radius, average_radius)
+
+
+def omega(temperature, entropy, enthalpy):
+    """Returns T * S_mix / |H_mix| for each alloy, with H_mix in kJ/mol"""
+    return (temperature * entropy) / (np.abs(enthalpy) * 1000)
+
+
+def lambda_parameter(entropy, delta):
+    """Returns S_mix / delta^2 for each alloy"""
+    return entropy / (delta ** 2)
+
+
+def microstructure(vec):
+    """Returns the expected crystal structure of each alloy from its valence electron concentration"""
+    return np.select([(2.5 <= vec) & (vec <= 3.5), vec >= 8.0, vec <= 6.87],
+                     ['HCP', 'FCC', 'BCC'],
+                     default='BCC+FCC')
+
+
+def verdict(condition, positive=SOLID_SOLUTION, negative=INTERMETALLIC):
+    """Maps a boolean array onto the prediction labels"""
+    return np.where(condition, positive, negative)
+
+
+def model_1(omega_parameter, delta):
+    """Yang & Zhang criterion, Omega >= 1.1 and delta <= 6.6"""
+    return verdict((omega_parameter >= MODEL_1_OMEGA) & (delta <= MODEL_1_DELTA))
+
+
+def model_2(enthalpy, delta):
+    """Guo et al. criterion, -11.6 < H_mix < 3.2 and delta < 6.6"""
+    lower, upper = MODEL_2_MIXING_ENTHALPY
+    return verdict((lower < enthalpy) & (enthalpy < upper) & (delta < MODEL_2_DELTA))
+
+
+def model_3(omega_parameter, gamma_parameter):
+    """Wang et al. criterion, Omega >= 1.1 and gamma < 1.175"""
+    return verdict((omega_parameter >= MODEL_3_OMEGA) & (gamma_parameter < MODEL_3_GAMMA))
+
+
+def model_4(lambda_value):
+    """Singh et al. criterion, Lambda > 0.96"""
+    return verdict(lambda_value > MODEL_4_LAMBDA)
+
+
+def model_6(melting_temp, entropy, min_formation):
+    """Troparevsky et al. criterion, -T_c * S_mix < min(H_f) < 37 meV/atom"""
+    critical_temperature = melting_temp * MODEL_6_CRITICAL_TEMPERATURE_RATIO
+    lower = -1 * 1000 * critical_temperature * entropy * J_PER_MOL_TO_EV_PER_ATOM
+    return verdict((lower < min_formation) & (min_formation < MODEL_6_MAX_FORMATION_ENTHALPY),
+                   negative=MULTIPLE_PHASES)
+
+
+def model_7(formation, enthalpy, annealing_omega, k_2=MODEL_7_K_2):
+    """Senkov & Miracle criterion, k_1 = H_IM / H_mix < k_1_cr = Omega(T_A) * (1 - k_2) + 1"""
+    return verdict((annealing_omega * (1 - k_2)) + 1 > formation / enthalpy)
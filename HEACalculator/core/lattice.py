@@ -0,0 +1,178 @@
+#!/usr/bin/env python3
+
+# Copyright (C) 2022  Doguhan Sariturk
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+import numpy as np
+
+__author__ = "Doguhan Sariturk"
+__email__ = "dogu.sariturk@gmail.com"
+
+
+class CompositionLattice:
+    """Simplex lattice of the compositions screened by a range search.
+
+    Every element takes one of the levels of ``numpy.arange(start, end, step)``
+    except zero, and the amounts of each composition add up to `total`. The
+    compositions are enumerated in lexicographic order of their levels without
+    building the whole lattice: they are counted with a stars-and-bars table and
+    any rank can be turned back into a composition.
+
+    Parameters
+    ----------
+    no_of_elements : int
+        Number of elements of each composition.
+
+    start : float
+        Lowest amount of each element.
+
+    end : float
+        Upper bound of the amount of each element, exclusive.
+
+    step : float
+        Screening step of the amount of each element.
+
+    total : float, optional
+        Sum of the amounts of each composition, by default 100
+
+    Raises
+    ------
+    ValueError
+        If `no_of_elements` or `step` is not positive
+    """
+
+    def __init__(self, no_of_elements, start, end, step, total=100):
+        if no_of_elements < 1:
+            raise ValueError('The number of elements should be positive.')
+        if step <= 0:
+            raise ValueError('The Step option should be positive.')
+
+        self.no_of_elements = int(no_of_elements)
+        self.start = start
+        self.end = end
+        self.step = step
+        self.total = total
+
+        levels = np.arange(start, end, step, dtype=float)
+        self._lower = 1 if len(levels) and levels[0] == 0 else 0
+        self.levels = levels[self._lower:]
+        self._upper = len(self.levels) - 1
+
+        # Number of steps above the lowest level shared by the elements of a composition
+        self._target = -1
+        if len(self.levels):
+            target = (total - self.no_of_elements * self.levels[0]) / step
+            if target >= 0 and abs(target - round(target)) < 1e-9:
+                self._target = int(round(target))
+
+        self._table = self._count_table()
+        self._size = self._table[self.no_of_elements][self._target] if self._target >= 0 else 0
+        self._dtype = np.int64 if self._size < 2 ** 62 else object
+
+    def _count_table(self):
+        """Returns table[p][r], the number of ways to split r steps into p levels of at most `_upper` steps"""
+        target = max(self._target, 0)
+        table = [[1] + [0] * target]
+        for _ in range(self.no_of_elements):
+            previous = table[-1]
+            cumulative = [0]
+            for count in previous:
+                cumulative.append(cumulative[-1] + count)
+            table.append([cumulative[r + 1] - cumulative[max(r - self._upper, 0)] for r in range(target + 1)])
+        return table
+
+    def __len__(self):
+        return self._size
+
+    def __iter__(self):
+        """Streams the compositions one by one, in lexicographic order, using O(no_of_elements) memory
+
+        Yields
+        ------
+        tuple of float
+            Amount of each element
+        """
+        if not self._size:
+            return
+        levels = self.levels.tolist()
+        for indices in self._iter_indices(self._target, self.no_of_elements):
+            yield tuple(levels[idx] for idx in indices)
+
+    def _iter_indices(self, remaining, parts):
+        if parts == 1:
+            yield remaining,
+            return
+        for first in range(max(0, remaining - (parts - 1) * self._upper), min(self._upper, remaining) + 1):
+            for rest in self._iter_indices(remaining - first, parts - 1):
+                yield (first,) + rest
+
+    def block(self, offset, count):
+        """Returns the compositions with ranks in [offset, offset + count) as a matrix
+
+        Parameters
+        ----------
+        offset : int
+            Rank of the first composition
+
+        count : int
+            Number of compositions
+
+        Returns
+        -------
+        numpy.ndarray
+            (count, no_of_elements) matrix of amounts, truncated at the end of the lattice
+        """
+        offset = max(int(offset), 0)
+        stop = min(offset + int(count), self._size)
+        if stop <= offset:
+            return np.empty((0, self.no_of_elements))
+
+        ranks = np.arange(offset, stop, dtype=np.int64).astype(self._dtype)
+        remaining = np.full(len(ranks), self._target, dtype=np.intp)
+        indices = np.empty((len(ranks), self.no_of_elements), dtype=np.intp)
+
+        for position in range(self.no_of_elements - 1):
+            counts = np.array(self._table[self.no_of_elements - position - 1], dtype=self._dtype)
+            chosen = np.full(len(ranks), -1, dtype=np.intp)
+            for level in range(self._upper + 1):
+                unassigned = chosen < 0
+                if not unassigned.any():
+                    break
+                rest = remaining - level
+                completions = np.where(rest >= 0, counts[np.clip(rest, 0, None)], 0)
+                pick = unassigned & (ranks < completions)
+                chosen[pick] = level
+                ranks = np.where(unassigned & ~pick, ranks - completions, ranks)
+            indices[:, position] = chosen
+            remaining -= chosen
+        indices[:, -1] = remaining
+
+        return self.levels[indices]
+
+    def chunks(self, size):
+        """Streams the compositions as matrices of at most `size` rows, in lexicographic order
+
+        Parameters
+        ----------
+        size : int
+            Number of compositions of each chunk
+
+        Yields
+        ------
+        numpy.ndarray
+            (size, no_of_elements) matrix of amounts
+        """
+        for offset in range(0, self._size, size):
+            yield self.block(offset, size)
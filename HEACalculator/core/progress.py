@@ -0,0 +1,139 @@
+#!/usr/bin/env python3
+
+# Copyright (C) 2022  Doguhan Sariturk
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+import time
+
+__author__ = "Doguhan Sariturk"
+__email__ = "dogu.sariturk@gmail.com"
+
+
+class ProgressMeter:
+    """Progress of a long calculation, with its throughput and estimated time left.
+
+    The time spent paused is not counted, so the throughput and the estimate
+    stay meaningful when a calculation is paused and resumed.
+
+    Parameters
+    ----------
+    total : int
+        Number of items to process
+
+    clock : callable, optional
+        Function returning the current time in seconds, by default :func:`time.monotonic`
+
+    Attributes
+    ----------
+    done : int
+        Number of items processed
+    """
+
+    def __init__(self, total, clock=time.monotonic):
+        self.total = total
+        self.done = 0
+        self._clock = clock
+        self._started = clock()
+        self._paused_at = None
+        self._paused_for = 0.0
+        self._stopped = False
+
+    @property
+    def paused(self):
+        """bool: Whether the meter is paused"""
+        return self._paused_at is not None and not self._stopped
+
+    @property
+    def stopped(self):
+        """bool: Whether the calculation is over, either finished or cancelled"""
+        return self._stopped
+
+    def pause(self):
+        """Stops counting the time until :meth:`resume` is called"""
+        if self._paused_at is None:
+            self._paused_at = self._clock()
+
+    def resume(self):
+        """Counts the time again, unless the meter is stopped"""
+        if self._paused_at is not None and not self._stopped:
+            self._paused_for += self._clock() - self._paused_at
+            self._paused_at = None
+
+    def stop(self):
+        """Stops counting the time for good, once the calculation is over"""
+        self.pause()
+        self._stopped = True
+
+    def update(self, done):
+        """Sets the number of items processed
+
+        Parameters
+        ----------
+        done : int
+            Number of items processed, at most :attr:`total`
+        """
+        self.done = min(done, self.total)
+
+    @property
+    def elapsed(self):
+        """float: Time spent processing, in seconds"""
+        now = self._paused_at if self._paused_at is not None else self._clock()
+        return max(now - self._started - self._paused_for, 0.0)
+
+    @property
+    def fraction(self):
+        """float: Fraction of the items processed, between 0 and 1"""
+        return self.done / self.total if self.total else 1.0
+
+    @property
+    def rate(self):
+        """float: Number of items processed per second, or None before the first item"""
+        elapsed = self.elapsed
+        return self.done / elapsed if self.done and elapsed > 0 else None
+
+    @property
+    def remaining(self):
+        """float: Estimated time left in seconds, or None until the throughput is known"""
+        rate = self.rate
+        return (self.total - self.done) / rate if rate else None
+
+    def __str__(self):
+        rate, remaining = self.rate, self.remaining
+        text = f'{self.done:,} / {self.total:,} alloys'
+        if rate is not None:
+            text += f' | {rate:,.0f} alloys/s'
+            if not self._stopped:
+                text += f' | ETA {format_duration(remaining)}'
+        if self.paused:
+            text += ' | Paused'
+        return text
+
+
+def format_duration(seconds):
+    """Formats a duration as hours, minutes and seconds
+
+    Parameters
+    ----------
+    seconds : float
+        Duration in seconds
+
+    Returns
+    -------
+    str
+        Duration, e.g. ``'1:02:03'`` or ``'02:03'`` if it is shorter than an hour
+    """
+    minutes, seconds = divmod(int(round(seconds)), 60)
+    hours, minutes = divmod(minutes, 60)
+    return f'{hours}:{minutes:02d}:{seconds:02d}' if hours else f'{minutes:02d}:{seconds:02d}'
@@ -0,0 +1,247 @@
+#!/usr/bin/env python3
+
+# Copyright (C) 2022  Doguhan Sariturk
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+import numpy as np
+
+__author__ = "Doguhan Sariturk"
+__email__ = "dogu.sariturk@gmail.com"
+
+PROPERTY_DEPENDENCIES = {
+        'mixing_enthalpy': (),
+        'formation_enthalpy': (),
+        'min_formation_enthalpy': (),
+        'density': (),
+        'valance_electron_concentration': (),
+        'melting_temperature': (),
+        'atomic_size_difference': (),
+        'mixing_entropy': (),
+        'gamma_parameter': (),
+        'omega_parameter': ('melting_temperature', 'mixing_entropy', 'mixing_enthalpy'),
+        'lambda_parameter': ('mixing_entropy', 'atomic_size_difference'),
+        'microstructure': ('valance_electron_concentration',),
+        'model_1': ('omega_parameter', 'atomic_size_difference'),
+        'model_2': ('mixing_enthalpy', 'atomic_size_difference'),
+        'model_3': ('omega_parameter', 'gamma_parameter'),
+        'model_4': ('lambda_parameter',),
+        'model_5': (),
+        'model_6': ('melting_temperature', 'mixing_entropy', 'min_formation_enthalpy'),
+        'model_7': ('formation_enthalpy', 'mixing_enthalpy', 'melting_temperature', 'mixing_entropy'),
+        'model_8': (),
+}
+
+PROPERTY_LABELS = {
+        'mixing_enthalpy': 'Mixing Enthalpy',
+        'formation_enthalpy': 'Formation Enthalpy',
+        'min_formation_enthalpy': 'Min. Formation Enthalpy',
+        'density': 'Density',
+        'valance_electron_concentration': 'VEC',
+        'melting_temperature': 'Melting Temperature',
+        'atomic_size_difference': 'Delta',
+        'mixing_entropy': 'Mixing Entropy',
+        'gamma_parameter': 'Gamma',
+        'omega_parameter': 'Omega',
+        'lambda_parameter': 'Lambda',
+        'microstructure': 'Crystal Structure',
+        'model_1': 'Model 1',
+        'model_2': 'Model 2',
+        'model_3': 'Model 3',
+        'model_4': 'Model 4',
+        'model_5': 'Model 5',
+        'model_6': 'Model 6',
+        'model_7': 'Model 7',
+        'model_8': 'Model 8',
+}
+
+DEFAULT_OUTPUT = ('density',
+                  'atomic_size_difference',
+                  'omega_parameter',
+                  'valance_electron_concentration',
+                  'mixing_enthalpy',
+                  'mixing_entropy',
+                  'formation_enthalpy',
+                  'melting_temperature',
+                  'microstructure',
+                  'model_1',
+                  'model_2',
+                  'model_3',
+                  'model_4',
+                  'model_5',
+                  'model_6',
+                  'model_7',
+                  'model_8')
+
+
+def select_properties(properties):
+    """Validates a selection of properties
+
+    Parameters
+    ----------
+    properties : str or sequence of str or None
+        Property names, either as a sequence or as a comma separated string.
+        None selects the default output.
+
+    Raises
+    ------
+    ValueError
+        If one of the properties is unknown
+
+    Returns
+    -------
+    tuple of str
+        The selected property names, without duplicates
+    """
+    if properties is None:
+        return DEFAULT_OUTPUT
+    if isinstance(properties, str):
+        properties = [name.strip() for name in properties.split(',') if name.strip()]
+
+    unknown = [name for name in properties if name not in PROPERTY_DEPENDENCIES]
+    if unknown:
+        raise ValueError(f'Unknown properties: {", ".join(unknown)}. '
+                         f'Available properties are: {", ".join(PROPERTY_DEPENDENCIES)}')
+    return tuple(dict.fromkeys(properties))
+
+
+def resolve_properties(properties):
+    """Returns the given properties together with their transitive dependencies
+
+    Parameters
+    ----------
+    properties : sequence of str
+        Property names
+
+    Returns
+    -------
+    tuple of str
+        Property names, every dependency listed before the properties that need it
+    """
+    resolved = {}
+
+    def _visit(name):
+        if name not in resolved:
+            for dependency in PROPERTY_DEPENDENCIES[name]:
+                _visit(dependency)
+            resolved[name] = None
+
+    for prop in select_properties(properties):
+        _visit(prop)
+    return tuple(resolved)
+
+
+class LazyProperty:
+    """Memoized attribute, calculated by the given getter method on first access.
+
+    The calculated value is stored in the instance ``__dict__`` under the same
+    name, so later accesses are plain attribute lookups. Assigning to the
+    attribute overrides the calculation and deleting it resets the memo.
+
+    Parameters
+    ----------
+    getter : str
+        Name of the method that calculates the value.
+
+    Attributes
+    ----------
+    requires : tuple of str
+        The properties the getter depends on, according to `PROPERTY_DEPENDENCIES`.
+    """
+
+    def __init__(self, getter):
+        self.getter = getter
+        self.name = None
+        self.requires = ()
+
+    def __set_name__(self, owner, name):
+        self.name = name
+        self.requires = PROPERTY_DEPENDENCIES[name]
+
+    def __get__(self, instance, owner=None):
+        if instance is None:
+            return self
+        with np.errstate(divide='ignore', invalid='ignore'):
+            value = getattr(instance, self.getter)()
+        instance.__dict__[self.name] = value
+        return value
+
+
+class AlloyProperties:
+    """Lazily evaluated phenomenological parameters and predictions.
+
+    Subclasses implement the ``get_*`` methods; each property is calculated on
+    first access, together with the properties it depends on, and memoized.
+    Subclasses set :attr:`properties` to the selected output properties, or to
+    None for the default output.
+    """
+
+    properties = None
+
+    mixing_enthalpy = LazyProperty('get_mixing_enthalpy')
+    formation_enthalpy = LazyProperty('get_formation_enthalpy')
+    min_formation_enthalpy = LazyProperty('get_min_formation_enthalpy')
+    density = LazyProperty('get_density')
+    valance_electron_concentration = LazyProperty('get_valance_electron_concentration')
+    melting_temperature = LazyProperty('get_melting_temperature')
+    atomic_size_difference = LazyProperty('get_atomic_size_difference')
+    mixing_entropy = LazyProperty('get_mixing_entropy')
+
+    gamma_parameter = LazyProperty('get_gamma')
+    omega_parameter = LazyProperty('get_omega')
+    lambda_parameter = LazyProperty('get_lambda')
+
+    microstructure = LazyProperty('get_microstructure')
+
+    model_1 = LazyProperty('get_model_1_result')
+    model_2 = LazyProperty('get_model_2_result')
+    model_3 = LazyProperty('get_model_3_result')
+    model_4 = LazyProperty('get_model_4_result')
+    model_6 = LazyProperty('get_model_6_result')
+    model_7 = LazyProperty('get_model_7_result')
+
+    def calculate(self):
+        """This method calculates phenomenological parameters based on thermodynamics and physics
+        in order to predict the formation of solid solutions in High Entropy Alloys (HEAs)
+
+        Only the selected properties and their dependencies are calculated, and
+        the properties that were already calculated are not calculated again.
+
+        Raises
+        ------
+        KeyError
+            If one of the entries are not in the database
+        """
+        for name in (PROPERTY_DEPENDENCIES if self.properties is None else resolve_properties(self.properties)):
+            getattr(self, name)
+
+    @property
+    def output_properties(self):
+        """tuple of str: The properties emitted by the outputs, in column order"""
+        return select_properties(self.properties)
+
+    def is_calculated(self, name):
+        """Returns whether the given property has already been calculated
+
+        Parameters
+        ----------
+        name : str
+            Name of the property
+
+        Returns
+        -------
+        bool
+            True if the property is memoized
+        """
+        return name in self.__dict__
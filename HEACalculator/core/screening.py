@@ -0,0 +1,460 @@
+#!/usr/bin/env python3
+
+# Copyright (C) 2022  Doguhan Sariturk
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+import copy
+import csv
+import itertools
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from HEACalculator.core.Batch import HEABatch
+from HEACalculator.core.HEA import HEACalculator
+from HEACalculator.core.helpers import composition_formula, parse_formula
+
+__author__ = "Doguhan Sariturk"
+__email__ = "dogu.sariturk@gmail.com"
+
+DEFAULT_CHUNK_SIZE = 1024
+
+
+def format_reports(formulas, batch):
+    """Formats the report of each alloy of a batch from its vectorized properties
+
+    The reports are the same as the ones of :class:`HEACalculator.core.HEA.HEACalculator`.
+
+    Parameters
+    ----------
+    formulas : sequence of str
+        Formula of each alloy of the batch
+
+    batch : HEACalculator.core.Batch.HEABatch
+        The alloys
+
+    Raises
+    ------
+    KeyError
+        If a pair enthalpy of the alloys does not exist in the database
+
+    Returns
+    -------
+    list of str
+        Report of each alloy
+    """
+    names = HEACalculator.report_properties(batch.properties)
+    columns = [getattr(batch, name).tolist() for name in names]
+    rows = zip(*columns) if columns else itertools.repeat((), len(batch))
+    return [HEACalculator.format_report(formula, dict(zip(names, values))) for formula, values in zip(formulas, rows)]
+
+
+def format_batch(batch, output='report'):
+    """Formats the output of a batch
+
+    Parameters
+    ----------
+    batch : HEACalculator.core.Batch.HEABatch
+        The alloys
+
+    output : str, optional
+        ``'report'`` to output the report of each alloy, or ``'columns'`` to output
+        the compositions and the columns of the output properties, which can be
+        written with :mod:`HEACalculator.core.writers`. By default ``'report'``.
+
+    Returns
+    -------
+    list of str or tuple
+        Report of each alloy, or the compositions matrix and the columns dictionary
+    """
+    if output == 'columns':
+        return batch.compositions, batch.get_columns()
+
+    return format_reports([composition_formula(dict(zip(batch.elements, amounts)))
+                           for amounts in batch.compositions.tolist()], batch)
+
+
+def _load_chunk(elements, lattice, offset, count, properties, where, cache, database):
+    batch = HEABatch(elements, lattice.block(offset, count), properties=properties, database=database)
+    if cache is not None:
+        cache.fill(batch)
+    ranks = np.arange(offset, offset + len(batch), dtype=np.int64)
+    if where is not None:
+        kept = np.flatnonzero(where.mask(batch))
+        batch, ranks = batch.subset(kept), ranks[kept]
+    return batch, ranks
+
+
+def evaluate_chunk(elements, lattice, offset, count, properties=None, output='report', where=None, cache=None,
+                   database=None):
+    """Evaluates one chunk of a composition lattice
+
+    Parameters
+    ----------
+    elements : sequence of str
+        Element symbols, one per lattice dimension
+
+    lattice : HEACalculator.core.lattice.CompositionLattice
+        Compositions to screen
+
+    offset : int
+        Rank of the first composition of the chunk
+
+    count : int
+        Number of compositions of the chunk
+
+    properties : sequence of str, optional
+        The properties to calculate and output. By default None, which implies to all the properties.
+
+    output : str, optional
+        Output format, ``'report'`` or ``'columns'``. See :func:`format_batch`.
+
+    where : HEACalculator.core.filters.Expression, optional
+        Condition the compositions should satisfy to be output, by default None
+
+    cache : HEACalculator.core.cache.ResultCache, optional
+        Persistent cache of the properties, by default None
+
+    database : HEACalculator.data.Database.Database, optional
+        Element properties and pair enthalpies, by default None which implies to the database shipped with the package
+
+    Returns
+    -------
+    list of str or tuple
+        Output of the chunk, in lattice order. See :func:`format_batch`.
+    """
+    batch, _ = _load_chunk(elements, lattice, offset, count, properties, where, cache, database)
+    return format_batch(batch, output)
+
+
+def select_chunk(elements, lattice, offset, count, selection, where=None, cache=None, database=None):
+    """Selects the best compositions of one chunk of a composition lattice
+
+    Parameters
+    ----------
+    elements : sequence of str
+        Element symbols, one per lattice dimension
+
+    lattice : HEACalculator.core.lattice.CompositionLattice
+        Compositions to screen
+
+    offset : int
+        Rank of the first composition of the chunk
+
+    count : int
+        Number of compositions of the chunk
+
+    selection : HEACalculator.core.selection.Selection
+        Empty selection defining the objectives. It is not modified.
+
+    where : HEACalculator.core.filters.Expression, optional
+        Condition the compositions should satisfy to be selected, by default None
+
+    cache : HEACalculator.core.cache.ResultCache, optional
+        Persistent cache of the properties, by default None
+
+    database : HEACalculator.data.Database.Database, optional
+        Element properties and pair enthalpies, by default None which implies to the database shipped with the package
+
+    Returns
+    -------
+    HEACalculator.core.selection.Selection
+        Selection of the compositions of the chunk
+    """
+    selection = copy.deepcopy(selection)
+    selection.update(*_load_chunk(elements, lattice, offset, count, None, where, cache, database))
+    return selection
+
+
+def _evaluate_task(task):
+    return evaluate_chunk(*task)
+
+
+def _select_task(task):
+    return select_chunk(*task)
+
+
+def _error_message(error):
+    return error.args[0] if isinstance(error, KeyError) and error.args else str(error)
+
+
+def evaluate_formulas(formulas, properties=None, output='report', where=None, cache=None, database=None):
+    """Evaluates a chunk of alloy formulas
+
+    The alloys are grouped by element system, and each group is evaluated as
+    one :class:`HEACalculator.core.Batch.HEABatch`, so the pair enthalpy
+    matrices are gathered once per system. The results are put back in the
+    order of the formulas.
+
+    Parameters
+    ----------
+    formulas : sequence of str
+        Alloy formulas
+
+    properties : sequence of str, optional
+        The properties to calculate and output. By default None, which implies to all the properties.
+
+    output : str, optional
+        ``'report'`` to output the report of each alloy, or ``'columns'`` to output
+        the formulas and the columns of the output properties. By default ``'report'``.
+
+    where : HEACalculator.core.filters.Expression, optional
+        Condition the alloys should satisfy to be output, by default None
+
+    cache : HEACalculator.core.cache.ResultCache, optional
+        Persistent cache of the properties, by default None
+
+    database : HEACalculator.data.Database.Database, optional
+        Element properties and pair enthalpies, by default None which implies to the database shipped with the package
+
+    Returns
+    -------
+    tuple
+        The output, either a list of reports or a list of formulas and a dictionary
+        of columns, and a list of the index and the error message of each formula
+        that could not be evaluated
+    """
+    errors = []
+    systems = {}
+    for idx, formula in enumerate(formulas):
+        try:
+            alloy = parse_formula(formula)
+        except Exception as e:
+            errors.append((idx, str(e)))
+            continue
+        if not alloy:
+            errors.append((idx, 'Empty formula'))
+            continue
+        # The alloys of one element system share a batch, whatever the order of their elements
+        elements = tuple(sorted(alloy))
+        systems.setdefault(elements, []).append((idx, [alloy[element] for element in elements]))
+
+    indices, parts = [], []
+    for elements, rows in systems.items():
+        rows_idx = np.array([idx for idx, _ in rows], dtype=np.intp)
+        try:
+            batch = HEABatch(elements, [amounts for _, amounts in rows], properties=properties, database=database)
+            if cache is not None:
+                cache.fill(batch)
+            if where is not None:
+                kept = np.flatnonzero(where.mask(batch))
+                batch, rows_idx = batch.subset(kept), rows_idx[kept]
+            if output == 'columns':
+                part = batch.get_columns()
+            else:
+                part = format_reports([formulas[idx] for idx in rows_idx.tolist()], batch)
+        except (KeyError, ValueError) as e:
+            errors.extend((idx, _error_message(e)) for idx in rows_idx.tolist())
+            continue
+        indices.append(rows_idx)
+        parts.append(part)
+
+    errors.sort()
+    order = np.concatenate(indices) if indices else np.empty(0, dtype=np.intp)
+    kept = np.sort(order).tolist()
+    order = np.argsort(order, kind='stable').tolist()
+
+    if output != 'columns':
+        reports = list(itertools.chain.from_iterable(parts))
+        return [reports[position] for position in order], errors
+
+    if not kept:
+        return ([], {}), errors
+    columns = {name: np.concatenate([part[name] for part in parts])[order] for name in parts[0]}
+    return ([formulas[idx] for idx in kept], columns), errors
+
+
+def _evaluate_formulas_task(task):
+    return evaluate_formulas(*task)
+
+
+def read_formulas(file, column='formula'):
+    """Streams the alloy formulas of a CSV file
+
+    Parameters
+    ----------
+    file : file object
+        CSV file with a header line
+
+    column : str, optional
+        Name of the column of the formulas, by default 'formula'
+
+    Raises
+    ------
+    ValueError
+        If the file does not have the given column
+
+    Returns
+    -------
+    generator of str
+        Formula of each row
+    """
+    reader = csv.DictReader(file, skipinitialspace=True)
+    if reader.fieldnames is None or column not in reader.fieldnames:
+        raise ValueError(f'The input file does not have a {column} column.')
+    return ((row[column] or '').strip() for row in reader)
+
+
+def screen_formulas(formulas, properties=None, output='report', where=None, workers=1, chunk_size=DEFAULT_CHUNK_SIZE,
+                    cache=None, database=None):
+    """Evaluates a stream of alloy formulas, chunk by chunk
+
+    Parameters
+    ----------
+    formulas : iterable of str
+        Alloy formulas
+
+    properties : sequence of str, optional
+        The properties to calculate and output. By default None, which implies to all the properties.
+
+    output : str, optional
+        Output format, ``'report'`` or ``'columns'``. See :func:`evaluate_formulas`.
+
+    where : HEACalculator.core.filters.Expression, optional
+        Condition the alloys should satisfy to be output, by default None
+
+    workers : int, optional
+        Number of worker processes, by default 1 which evaluates the chunks in the calling process
+
+    chunk_size : int, optional
+        Number of formulas evaluated at once
+
+    cache : HEACalculator.core.cache.ResultCache, optional
+        Persistent cache of the properties, by default None
+
+    database : HEACalculator.data.Database.Database, optional
+        Element properties and pair enthalpies, by default None which implies to the database shipped with the package
+
+    Yields
+    ------
+    tuple
+        Output of each chunk, in input order, and the errors of the chunk,
+        indexed by the position of the formula in the stream. See :func:`evaluate_formulas`.
+    """
+    formulas = iter(formulas)
+    chunks = iter(lambda: list(itertools.islice(formulas, chunk_size)), [])
+    tasks = ((chunk, properties, output, where, cache, database) for chunk in chunks)
+
+    # Every chunk but the last one has chunk_size formulas
+    for number, (result, errors) in enumerate(_map(_evaluate_formulas_task, tasks, workers)):
+        yield result, [(number * chunk_size + idx, message) for idx, message in errors]
+
+
+def ordered_map(function, tasks, workers, max_pending=None):
+    """Maps a function over tasks in a process pool, yielding the results in task order
+
+    At most `max_pending` tasks are submitted ahead of the result being
+    consumed, so the memory use does not grow with the number of tasks.
+
+    Parameters
+    ----------
+    function : callable
+        Picklable function of one argument
+
+    tasks : iterable
+        Arguments of the function
+
+    workers : int
+        Number of worker processes
+
+    max_pending : int, optional
+        Number of tasks in flight, by default twice the number of workers
+
+    Yields
+    ------
+    object
+        Result of each task
+    """
+    max_pending = max_pending or 2 * workers
+    executor = ProcessPoolExecutor(max_workers=workers)
+    pending = deque()
+    try:
+        for task in tasks:
+            if len(pending) >= max_pending:
+                yield pending.popleft().result()
+            pending.append(executor.submit(function, task))
+        while pending:
+            yield pending.popleft().result()
+    finally:
+        executor.shutdown(wait=True, cancel_futures=True)
+
+
+def screen(elements, lattice, properties=None, output='report', where=None, selection=None,
+           workers=1, chunk_size=DEFAULT_CHUNK_SIZE, cache=None, database=None):
+    """Evaluates every composition of a lattice, chunk by chunk
+
+    Parameters
+    ----------
+    elements : sequence of str
+        Element symbols, one per lattice dimension
+
+    lattice : HEACalculator.core.lattice.CompositionLattice
+        Compositions to screen
+
+    properties : sequence of str, optional
+        The properties to calculate and output. By default None, which implies to all the properties.
+
+    output : str, optional
+        Output format, ``'report'`` or ``'columns'``. See :func:`format_batch`.
+
+    where : HEACalculator.core.filters.Expression, optional
+        Condition the compositions should satisfy to be output, by default None
+
+    selection : HEACalculator.core.selection.Selection, optional
+        Empty selection, updated in place with the best compositions of the lattice, which are the only ones output.
+        By default None, which outputs all the compositions.
+
+    workers : int, optional
+        Number of worker processes, by default 1 which evaluates the chunks in the calling process
+
+    chunk_size : int, optional
+        Number of compositions evaluated at once
+
+    cache : HEACalculator.core.cache.ResultCache, optional
+        Persistent cache of the properties, by default None
+
+    database : HEACalculator.data.Database.Database, optional
+        Element properties and pair enthalpies, by default None which implies to the database shipped with the package
+
+    Yields
+    ------
+    list of str or tuple
+        Output of each chunk, in lattice order, or of the selected compositions, in selection order.
+        See :func:`format_batch`.
+    """
+    elements = list(elements)
+    offsets = range(0, len(lattice), chunk_size)
+
+    if selection is None:
+        tasks = ((elements, lattice, offset, chunk_size, properties, output, where, cache, database)
+                 for offset in offsets)
+        yield from _map(_evaluate_task, tasks, workers)
+        return
+
+    template = copy.deepcopy(selection)
+    tasks = ((elements, lattice, offset, chunk_size, template, where, cache, database) for offset in offsets)
+    for part in _map(_select_task, tasks, workers):
+        selection.merge(part)
+
+    compositions = selection.compositions if len(selection) else np.empty((0, len(elements)))
+    batch = HEABatch(elements, compositions, properties=properties, database=database)
+    if cache is not None:
+        cache.fill(batch)
+    yield format_batch(batch, output)
+
+
+def _map(function, tasks, workers):
+    return map(function, tasks) if workers <= 1 else ordered_map(function, tasks, workers)
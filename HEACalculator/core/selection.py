@@ -0,0 +1,177 @@
+#!/usr/bin/env python3
+
+# Copyright (C) 2022  Doguhan Sariturk
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+import numpy as np
+
+from HEACalculator.core.filters import Expression
+from HEACalculator.core.writers import categories
+
+__author__ = "Doguhan Sariturk"
+__email__ = "dogu.sariturk@gmail.com"
+
+
+def parse_objective(text):
+    """Parses an objective written as ``expression[:max|:min]``
+
+    Parameters
+    ----------
+    text : str
+        The objective, e.g. ``"omega_parameter:max"`` or ``"abs(mixing_enthalpy):min"``.
+        Objectives are maximized by default.
+
+    Raises
+    ------
+    ValueError
+        If the expression is not valid or refers to a categorical property, which cannot be ranked
+
+    Returns
+    -------
+    tuple
+        The expression and whether it is maximized
+    """
+    source, _, direction = text.rpartition(':')
+    if direction.strip() not in ('max', 'min'):
+        source, direction = text, 'max'
+    expression = Expression(source)
+    categorical = [name for name in expression.names if categories(name) is not None]
+    if categorical:
+        raise ValueError(f'Objectives should be numerical, not categorical properties: {", ".join(categorical)}')
+    return expression, direction.strip() == 'max'
+
+
+class Selection:
+    """Best compositions of a stream of batches, according to the given objectives.
+
+    The state only holds the selected compositions, so its size does not
+    depend on the number of screened compositions. Selections updated with
+    different parts of a stream can be merged, and the result does not
+    depend on how the stream was split, since ties are broken by rank.
+
+    Parameters
+    ----------
+    objectives : sequence of tuple
+        Expressions and whether they are maximized.
+
+    Attributes
+    ----------
+    ranks : numpy.ndarray
+        Ranks of the selected compositions in the stream.
+
+    compositions : numpy.ndarray
+        Selected compositions, one per row.
+
+    scores : numpy.ndarray
+        Objective values of the selected compositions, negated for the maximized objectives.
+    """
+
+    def __init__(self, objectives):
+        self.objectives = list(objectives)
+        self.ranks = np.empty(0, dtype=np.int64)
+        self.compositions = None
+        self.scores = np.empty((0, len(self.objectives)))
+
+    def __len__(self):
+        return len(self.ranks)
+
+    @property
+    def names(self):
+        """tuple of str: The properties the objectives refer to"""
+        return tuple(dict.fromkeys(name for expression, _ in self.objectives for name in expression.names))
+
+    def update(self, batch, ranks):
+        """Selects the best compositions among the current ones and the ones of a batch
+
+        Compositions with undefined objective values are ignored.
+
+        Parameters
+        ----------
+        batch : HEACalculator.core.Batch.HEABatch
+            The alloys
+
+        ranks : numpy.ndarray
+            Rank of each alloy of the batch in the stream
+        """
+        scores = np.column_stack([-expression.evaluate(batch) if maximize else expression.evaluate(batch)
+                                  for expression, maximize in self.objectives]).astype(float)
+        valid = ~np.isnan(scores).any(axis=1)
+        self._combine(np.asarray(ranks, dtype=np.int64)[valid], batch.compositions[valid], scores[valid])
+
+    def merge(self, other):
+        """Selects the best compositions among the current ones and the ones of another selection
+
+        Parameters
+        ----------
+        other : Selection
+            Selection with the same objectives
+        """
+        if len(other):
+            self._combine(other.ranks, other.compositions, other.scores)
+
+    def _combine(self, ranks, compositions, scores):
+        if self.compositions is not None:
+            ranks = np.concatenate([self.ranks, ranks])
+            compositions = np.concatenate([self.compositions, compositions])
+            scores = np.concatenate([self.scores, scores])
+        keep = self._select(ranks, scores)
+        self.ranks, self.compositions, self.scores = ranks[keep], compositions[keep], scores[keep]
+
+    def _select(self, ranks, scores):
+        """Returns the indices of the compositions to keep, in output order"""
+        raise NotImplementedError
+
+
+class TopSelection(Selection):
+    """The `k` compositions with the best value of an objective.
+
+    Parameters
+    ----------
+    expression : HEACalculator.core.filters.Expression
+        The objective.
+
+    k : int
+        Number of compositions to keep.
+
+    maximize : bool, optional
+        Whether the highest values are the best ones, by default True
+    """
+
+    def __init__(self, expression, k, maximize=True):
+        super().__init__([(expression, maximize)])
+        self.k = k
+
+    def _select(self, ranks, scores):
+        return np.lexsort((ranks, scores[:, 0]))[:self.k]
+
+
+class ParetoSelection(Selection):
+    """The compositions which are not dominated on all the objectives by another composition.
+
+    A composition dominates another one when it is at least as good on every
+    objective and better on at least one of them.
+    """
+
+    def _select(self, ranks, scores):
+        # In lexicographic order, a composition can only be dominated by the ones before it
+        order = np.lexsort((ranks,) + tuple(scores.T[::-1]))
+        front = []
+        for idx in order:
+            if front:
+                previous = scores[front]
+                if np.any(np.all(previous <= scores[idx], axis=1) & np.any(previous < scores[idx], axis=1)):
+                    continue
+            front.append(idx)
+        return np.array(front, dtype=np.intp)
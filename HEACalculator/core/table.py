@@ -0,0 +1,316 @@
+#!/usr/bin/env python3
+
+# Copyright (C) 2022  Doguhan Sariturk
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+import numpy as np
+
+from HEACalculator.core.properties import select_properties
+from HEACalculator.core.writers import categories, encode
+
+__author__ = "Doguhan Sariturk"
+__email__ = "dogu.sariturk@gmail.com"
+
+MIN_CAPACITY = 1024
+
+
+class ResultTable:
+    """Growable table of calculated properties, stored column by column.
+
+    The rows are appended by batches into arrays whose capacity doubles when
+    they are full, so the table grows in amortized constant time per row. The
+    numerical properties are stored as float64, the categorical ones as int8
+    codes (see :func:`HEACalculator.core.writers.encode`), and the formulas of
+    the alloys are only formatted when they are asked for. Sorting and
+    filtering work on the arrays, without formatting the values.
+
+    Parameters
+    ----------
+    elements : sequence of str, optional
+        Element symbols, one per column of the compositions. None if the rows are given by the formulas of the alloys.
+
+    properties : sequence of str, optional
+        The properties of the table. By default None, which implies to the default output.
+
+    Attributes
+    ----------
+    elements : list of str or None
+        Element symbols of the compositions, None if the table holds the formulas of the alloys
+
+    properties : tuple of str
+        The properties of the table
+    """
+
+    def __init__(self, elements=None, properties=None):
+        self.elements = None if elements is None else list(elements)
+        self.properties = select_properties(properties)
+        self._labels = {name: categories(name) for name in self.properties}
+        self._formula_format = ''.join(f'{element}%r' for element in self.elements or ())
+        self._size = 0
+        self._capacity = 0
+        self._columns = {name: np.empty(0, dtype=np.float64 if labels is None else np.int8)
+                         for name, labels in self._labels.items()}
+        if self.elements is None:
+            self._formulas = []
+        else:
+            self._compositions = np.empty((0, len(self.elements)))
+        self._index = None
+
+    def __len__(self):
+        return self._size
+
+    def __contains__(self, formula):
+        """Whether an alloy is in the table, looked up in a hash index of the formulas
+
+        The index is built on the first lookup and kept up to date by :meth:`append`.
+        """
+        if self._index is None:
+            self._index = set(self._format(0, self._size))
+        return formula in self._index
+
+    def append(self, compositions, columns):
+        """Appends a batch of results
+
+        Parameters
+        ----------
+        compositions : numpy.ndarray or sequence of str
+            (N, E) matrix of element amounts, or the formulas of the alloys if the table has no elements
+
+        columns : dict
+            Arrays of the properties, indexed by property name
+        """
+        count = len(compositions)
+        if not count:
+            return
+        start, end = self._size, self._size + count
+        self._reserve(end)
+        if self.elements is None:
+            self._formulas.extend(compositions)
+        else:
+            self._compositions[start:end] = compositions
+        for name, labels in self._labels.items():
+            column = np.asarray(columns[name])
+            self._columns[name][start:end] = column if labels is None else encode(column, labels)
+        self._size = end
+        if self._index is not None:
+            self._index.update(self._format(start, end))
+
+    def _reserve(self, size):
+        if size <= self._capacity:
+            return
+        self._capacity = max(size, 2 * self._capacity, MIN_CAPACITY)
+        for name, column in self._columns.items():
+            self._columns[name] = self._grow(column)
+        if self.elements is not None:
+            self._compositions = self._grow(self._compositions)
+
+    def _grow(self, array):
+        grown = np.empty((self._capacity,) + array.shape[1:], dtype=array.dtype)
+        grown[:self._size] = array[:self._size]
+        return grown
+
+    def _format(self, start, end):
+        if self.elements is None:
+            return self._formulas[start:end]
+        return [self._formula_format % tuple(row) for row in self._compositions[start:end].tolist()]
+
+    @property
+    def compositions(self):
+        """numpy.ndarray: (N, E) matrix of element amounts, None if the table holds the formulas of the alloys"""
+        return None if self.elements is None else self._compositions[:self._size]
+
+    def formula(self, row):
+        """Returns the formula of the alloy of a row
+
+        Parameters
+        ----------
+        row : int
+            Row of the alloy
+
+        Returns
+        -------
+        str
+            Alloy formula
+        """
+        return self._format(row, row + 1)[0]
+
+    def value(self, row, name):
+        """Returns the value of a property of the alloy of a row
+
+        Parameters
+        ----------
+        row : int
+            Row of the alloy
+
+        name : str
+            Name of the property
+
+        Returns
+        -------
+        float or str
+            Value of the property
+        """
+        value = self._columns[name][row].item()
+        labels = self._labels[name]
+        return value if labels is None else labels[value]
+
+    def column(self, name, rows=None):
+        """Returns the values of a property
+
+        Parameters
+        ----------
+        name : str
+            Name of the property
+
+        rows : numpy.ndarray or slice, optional
+            Indices of the rows, by default every row
+
+        Returns
+        -------
+        numpy.ndarray
+            Values of the property, the categorical ones decoded to their labels
+        """
+        column = self._columns[name][:self._size]
+        if rows is not None:
+            column = column[rows]
+        labels = self._labels[name]
+        return column if labels is None else np.asarray(labels)[column]
+
+    def order(self, name=None, rows=None, descending=False):
+        """Sorts rows by the value of a property, or by formula
+
+        The sort is stable, and the undefined values come last in both directions.
+        The categorical properties are sorted in the order of their categories.
+
+        Parameters
+        ----------
+        name : str, optional
+            Name of the property, by default None which sorts by formula
+
+        rows : numpy.ndarray, optional
+            Indices of the rows to sort, by default every row
+
+        descending : bool, optional
+            Whether to sort in descending order, by default False
+
+        Returns
+        -------
+        numpy.ndarray
+            The sorted indices of the rows
+        """
+        rows = np.arange(self._size) if rows is None else np.asarray(rows, dtype=np.intp)
+        if name is not None:
+            keys = self._columns[name][rows]
+            keys = -keys.astype(np.int16 if keys.dtype == np.int8 else keys.dtype) if descending else keys
+            return rows[np.argsort(keys, kind='stable')]
+        if self.elements is None:
+            order = np.argsort(np.array(self._formulas, dtype=object)[rows], kind='stable')
+            return rows[order[::-1] if descending else order]
+        keys = self._compositions[rows]
+        # The first element is the primary key of lexsort when it comes last
+        return rows[np.lexsort((-keys if descending else keys).T[::-1])]
+
+    def mask(self, expression, rows=None):
+        """Returns whether the alloys of some rows satisfy an expression
+
+        Only the properties the expression refers to are read.
+
+        Parameters
+        ----------
+        expression : HEACalculator.core.filters.Expression
+            The condition
+
+        rows : numpy.ndarray, optional
+            Indices of the rows, by default every row
+
+        Raises
+        ------
+        ValueError
+            If the expression refers to a property which is not in the table, or is not a condition
+
+        Returns
+        -------
+        numpy.ndarray
+            Boolean mask of the rows satisfying the expression
+        """
+        missing = [name for name in expression.names if name not in self._columns]
+        if missing:
+            raise ValueError(f'Properties not in the results: {", ".join(missing)}')
+        size = self._size if rows is None else len(rows)
+        return expression.mask(_Rows(size, {name: self.column(name, rows) for name in expression.names}))
+
+    def take(self, rows=None):
+        """Returns a copy of some rows of the table
+
+        The copy does not change when rows are appended to this table, so it
+        can be read by another thread.
+
+        Parameters
+        ----------
+        rows : numpy.ndarray, optional
+            Indices of the rows, in the order of the copy, by default every row
+
+        Returns
+        -------
+        ResultTable
+            Table of the rows
+        """
+        index = np.arange(self._size) if rows is None else np.asarray(rows, dtype=np.intp)
+        table = self.__class__(self.elements, self.properties)
+        table._columns = {name: column.take(index) for name, column in self._columns.items()}
+        if self.elements is None:
+            table._formulas = [self._formulas[row] for row in index.tolist()]
+        else:
+            table._compositions = self._compositions.take(index, axis=0)
+        table._size = table._capacity = len(index)
+        return table
+
+    def batches(self, size, rows=None):
+        """Yields rows of the table by batches, in the format of :meth:`append`
+
+        Parameters
+        ----------
+        size : int
+            Number of rows of each batch
+
+        rows : numpy.ndarray, optional
+            Indices of the rows, in output order, by default every row
+
+        Yields
+        ------
+        tuple
+            Compositions, or formulas, and the columns of the properties of each batch
+        """
+        count = self._size if rows is None else len(rows)
+        for start in range(0, count, size):
+            chunk = slice(start, min(start + size, count)) if rows is None else rows[start:start + size]
+            if self.elements is not None:
+                compositions = self._compositions[chunk]
+            elif rows is None:
+                compositions = self._formulas[chunk]
+            else:
+                compositions = [self._formulas[row] for row in chunk.tolist()]
+            yield compositions, {name: self.column(name, chunk) for name in self.properties}
+
+
+class _Rows:
+    """Columns of some rows of a table, as the namespace an expression is evaluated on"""
+
+    def __init__(self, size, columns):
+        self._size = size
+        self.__dict__.update(columns)
+
+    def __len__(self):
+        return self._size
@@ -0,0 +1,427 @@
+#!/usr/bin/env python3
+
+# Copyright (C) 2022  Doguhan Sariturk
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+import io
+import itertools
+import json
+import os
+import shutil
+import tempfile
+import zipfile
+
+import numpy as np
+
+from HEACalculator.core import kernels
+from HEACalculator.core.properties import PROPERTY_LABELS, select_properties
+
+__author__ = "Doguhan Sariturk"
+__email__ = "dogu.sariturk@gmail.com"
+
+DEFAULT_ROW_GROUP_SIZE = 65536
+
+QUOTED_CHARACTERS = frozenset(',"\r\n')
+
+
+def categories(name):
+    """Returns the possible values of a categorical property
+
+    Parameters
+    ----------
+    name : str
+        Name of the property
+
+    Returns
+    -------
+    tuple of str or None
+        The categories, or None if the property is numerical
+    """
+    if name == 'microstructure':
+        return kernels.MICROSTRUCTURES
+    if name.startswith('model_'):
+        return kernels.PREDICTIONS
+    return None
+
+
+def encode(column, labels):
+    """Encodes a column of labels as the indices of the labels
+
+    Parameters
+    ----------
+    column : numpy.ndarray
+        Labels
+
+    labels : sequence of str
+        The possible labels
+
+    Returns
+    -------
+    numpy.ndarray
+        int8 index of each label
+
+    Raises
+    ------
+    ValueError
+        If a label is not one of the possible labels
+    """
+    codes = np.full(len(column), -1, dtype=np.int8)
+    for code, label in enumerate(labels):
+        codes[column == label] = code
+    if (codes < 0).any():
+        unknown = sorted(set(np.asarray(column)[codes < 0].tolist()))
+        raise ValueError(f'Unknown labels: {", ".join(map(str, unknown))}')
+    return codes
+
+
+def _import_pyarrow():
+    try:
+        import pyarrow
+        import pyarrow.parquet
+    except ImportError:
+        raise ImportError('Parquet and Arrow outputs require pyarrow, '
+                          'which can be installed with "pip install pyarrow"') from None
+    return pyarrow
+
+
+class ColumnWriter:
+    """Base class of the writers of calculated properties, fed with columnar batches.
+
+    The batches are buffered and written in row groups of at least
+    `row_group_size` rows, so arbitrarily long screens are streamed to the
+    file. Each composition is written as one float64 column per element, or
+    as a formula column when the alloys do not share the same elements,
+    followed by one column per property, with full precision.
+
+    Parameters
+    ----------
+    path : str
+        Path of the output file.
+
+    elements : sequence of str or None
+        Element symbols, one per column of the compositions. None to write the formulas of the alloys instead.
+
+    properties : sequence of str, optional
+        The properties to output. By default None, which implies to the default output.
+
+    row_group_size : int, optional
+        Number of rows buffered before they are written.
+    """
+
+    def __init__(self, path, elements, properties=None, row_group_size=DEFAULT_ROW_GROUP_SIZE):
+        self.path = path
+        self.elements = None if elements is None else list(elements)
+        self.properties = select_properties(properties)
+        self.row_group_size = row_group_size
+        self.rows = 0
+
+        self._pending = []
+        self._pending_rows = 0
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    @property
+    def columns(self):
+        """tuple of str: Names of the written columns"""
+        return (('formula',) if self.elements is None else tuple(self.elements)) + self.properties
+
+    def write(self, compositions, columns):
+        """Writes a batch of results
+
+        Parameters
+        ----------
+        compositions : numpy.ndarray or sequence of str
+            (N, E) matrix of element amounts, or the formulas of the alloys if the writer has no elements
+
+        columns : dict
+            Arrays of the output properties, indexed by property name
+        """
+        if not len(compositions):
+            return
+        self._pending.append((compositions, columns))
+        self._pending_rows += len(compositions)
+        if self._pending_rows >= self.row_group_size:
+            self.flush()
+
+    def flush(self):
+        """Writes the buffered batches"""
+        if not self._pending:
+            return
+        if self.elements is None:
+            table = {'formula': [formula for batch in self._pending for formula in batch[0]]}
+        else:
+            compositions = np.concatenate([batch[0] for batch in self._pending])
+            table = {element: compositions[:, idx] for idx, element in enumerate(self.elements)}
+        table.update({name: np.concatenate([batch[1][name] for batch in self._pending]) for name in self.properties})
+
+        self._write_group(table)
+        self.rows += self._pending_rows
+        self._pending = []
+        self._pending_rows = 0
+
+    def close(self):
+        """Writes the buffered batches and closes the file"""
+        self.flush()
+        self._finish()
+
+    def _write_group(self, table):
+        raise NotImplementedError
+
+    def _finish(self):
+        pass
+
+
+class ArrowWriter(ColumnWriter):
+    """Writer of Arrow IPC files, with dictionary encoded categorical properties."""
+
+    def __init__(self, path, elements, properties=None, row_group_size=DEFAULT_ROW_GROUP_SIZE):
+        super().__init__(path, elements, properties, row_group_size)
+        self._pa = _import_pyarrow()
+        self._dictionaries = {name: self._pa.array(categories(name), type=self._pa.string())
+                              for name in self.properties if categories(name)}
+        self.schema = self._pa.schema(
+                [(name, self._pa.dictionary(self._pa.int8(), self._pa.string()) if name in self._dictionaries
+                  else self._pa.string() if name == 'formula' else self._pa.float64()) for name in self.columns])
+        self._writer = self._open()
+
+    def _open(self):
+        return self._pa.ipc.new_file(self.path, self.schema)
+
+    def _write_group(self, table):
+        arrays = [self._pa.DictionaryArray.from_arrays(encode(table[name], categories(name)), self._dictionaries[name])
+                  if name in self._dictionaries else self._pa.array(table[name], type=self.schema.field(name).type)
+                  for name in self.columns]
+        self._writer.write_batch(self._pa.RecordBatch.from_arrays(arrays, schema=self.schema))
+
+    def _finish(self):
+        self._writer.close()
+
+
+class ParquetWriter(ArrowWriter):
+    """Writer of Parquet files, with one row group per flush and dictionary encoded categorical properties."""
+
+    def _open(self):
+        return self._pa.parquet.ParquetWriter(self.path, self.schema)
+
+
+class NpzWriter(ColumnWriter):
+    """Writer of uncompressed NumPy ``.npz`` archives.
+
+    Each column is streamed to a temporary file and the archive is assembled
+    when the writer is closed, so it can be read with :func:`numpy.load`.
+    Categorical properties are stored as int8 codes, and their labels are
+    stored in a ``<name>_categories`` array. Formulas are stored as a
+    fixed-width unicode array as wide as the longest formula.
+    """
+
+    def __init__(self, path, elements, properties=None, row_group_size=DEFAULT_ROW_GROUP_SIZE):
+        super().__init__(path, elements, properties, row_group_size)
+        directory = os.path.dirname(os.path.abspath(path))
+        self._files = {name: tempfile.TemporaryFile(dir=directory) for name in self.columns}
+        self._dtypes = {name: np.dtype(np.int8) if categories(name) else np.dtype(np.float64) for name in self.columns}
+        self._formula_width = 1
+
+    def _write_group(self, table):
+        for name in self.columns:
+            if name == 'formula':
+                self._formula_width = max(self._formula_width, *map(len, table[name]))
+                self._files[name].write(''.join(f'{formula}\n' for formula in table[name]).encode())
+                continue
+            labels = categories(name)
+            column = encode(table[name], labels) if labels else table[name]
+            self._files[name].write(np.ascontiguousarray(column, dtype=self._dtypes[name]).tobytes())
+
+    def _finish(self):
+        with zipfile.ZipFile(self.path, 'w', compression=zipfile.ZIP_STORED, allowZip64=True) as archive:
+            for name, file in self._files.items():
+                file.seek(0)
+                dtype = np.dtype(f'<U{self._formula_width}') if name == 'formula' else self._dtypes[name]
+                header = {'descr': np.lib.format.dtype_to_descr(dtype),
+                          'fortran_order': False,
+                          'shape': (self.rows,)}
+                with archive.open(f'{name}.npy', 'w', force_zip64=True) as member:
+                    np.lib.format.write_array_header_1_0(member, header)
+                    if name == 'formula':
+                        lines = (line.rstrip('\n') for line in io.TextIOWrapper(file))
+                        while block := list(itertools.islice(lines, self.row_group_size)):
+                            member.write(np.array(block, dtype=dtype).tobytes())
+                    else:
+                        shutil.copyfileobj(file, member)
+                file.close()
+
+                if categories(name):
+                    with archive.open(f'{name}_categories.npy', 'w') as member:
+                        np.lib.format.write_array(member, np.array(categories(name)))
+
+
+class TextWriter(ColumnWriter):
+    """Base class of the writers of text files, one line per composition.
+
+    Every column of a batch is formatted at once and every line is produced by
+    a single formatting operation, and the lines of a batch are written to the
+    buffered file with a single call.
+
+    Parameters
+    ----------
+    path : str or file object
+        Path of the output file, or a text file object such as :data:`sys.stdout`, which is not closed.
+
+    elements : sequence of str or None
+        Element symbols, one per column of the compositions. None if the formulas of the alloys are written instead.
+
+    properties : sequence of str, optional
+        The properties to output. By default None, which implies to the default output.
+
+    precision : int, optional
+        Number of decimals of the numerical properties, by default 2.
+        None writes the shortest representation with full precision.
+
+    row_group_size : int, optional
+        Number of rows buffered before they are formatted, by default 1 which formats every batch as it is written.
+    """
+
+    BUFFER_SIZE = 1 << 20
+    NON_FINITE = None
+
+    def __init__(self, path, elements, properties=None, precision=2, row_group_size=1):
+        super().__init__(path, elements, properties, row_group_size)
+        self.precision = precision
+        self._number_format = '%r' if precision is None else f'%.{int(precision)}f'
+        self._formula_format = ''.join(f'{element}%r' for element in self.elements or ())
+        self._line_format = self._get_line_format()
+
+        self._owns_file = not hasattr(path, 'write')
+        self._file = open(path, 'w', buffering=self.BUFFER_SIZE, newline='') if self._owns_file else path
+        header = self._get_header()
+        if header is not None:
+            self._file.write(header + '\n')
+
+    def _get_header(self):
+        return None
+
+    def _get_line_format(self):
+        raise NotImplementedError
+
+    def _format_column(self, name, column):
+        if column.dtype.kind in 'US':
+            return column.tolist()
+        formatted = list(map(self._number_format.__mod__, column.tolist()))
+        if self.NON_FINITE is not None:
+            for idx in np.flatnonzero(~np.isfinite(column)):
+                formatted[idx] = self.NON_FINITE
+        return formatted
+
+    def _format_formulas(self, table):
+        if self.elements is None:
+            return table['formula']
+        return map(self._formula_format.__mod__, zip(*(table[element].tolist() for element in self.elements)))
+
+    def _write_group(self, table):
+        columns = [self._format_column(name, table[name]) for name in self.properties]
+        self._file.write(''.join(map(self._line_format.__mod__, zip(self._format_formulas(table), *columns))))
+
+    def _finish(self):
+        if self._owns_file:
+            self._file.close()
+        else:
+            self._file.flush()
+
+
+class CsvWriter(TextWriter):
+    """Writer of CSV files, in the format of the ``--csv`` output of the range search.
+
+    Formulas containing a comma, a quote or a line break are quoted.
+    """
+
+    def _format_formulas(self, table):
+        formulas = super()._format_formulas(table)
+        if self.elements is not None:
+            return formulas
+        return ['"' + formula.replace('"', '""') + '"' if QUOTED_CHARACTERS.intersection(formula) else formula
+                for formula in formulas]
+
+    def _get_header(self):
+        return ', '.join(['Formula'] + [PROPERTY_LABELS[name] for name in self.properties])
+
+    def _get_line_format(self):
+        return ', '.join(['%s'] * (len(self.properties) + 1)) + '\n'
+
+
+class JsonLinesWriter(TextWriter):
+    """Writer of JSON Lines files, one object per composition with the formula and the properties.
+
+    Non-finite values are written as null.
+    """
+
+    NON_FINITE = 'null'
+
+    def _format_formulas(self, table):
+        return map(json.dumps, super()._format_formulas(table))
+
+    def _get_line_format(self):
+        fields = ['"formula": %s'] + [f'"{name}": "%s"' if categories(name) else f'"{name}": %s'
+                                        for name in self.properties]
+        return '{' + ', '.join(fields) + '}\n'
+
+
+WRITERS = {
+        '.csv': CsvWriter,
+        '.jsonl': JsonLinesWriter,
+        '.ndjson': JsonLinesWriter,
+        '.arrow': ArrowWriter,
+        '.feather': ArrowWriter,
+        '.parquet': ParquetWriter,
+        '.npz': NpzWriter,
+}
+
+
+def open_writer(path, elements, properties=None, precision=2, **kwargs):
+    """Opens the writer matching the extension of the given path
+
+    Parameters
+    ----------
+    path : str
+        Path of the output file, ending with one of the extensions of :data:`WRITERS`
+
+    elements : sequence of str
+        Element symbols, one per column of the compositions
+
+    properties : sequence of str, optional
+        The properties to output. By default None, which implies to the default output.
+
+    precision : int, optional
+        Number of decimals of the numerical properties of the text formats, by default 2
+
+    Raises
+    ------
+    ValueError
+        If the extension is not supported
+
+    Returns
+    -------
+    ColumnWriter
+        The writer
+    """
+    extension = os.path.splitext(path)[1].lower()
+    if extension not in WRITERS:
+        raise ValueError(f'Unsupported output format: {extension or path}. '
+                         f'Supported formats are: {", ".join(WRITERS)}')
+    if issubclass(WRITERS[extension], TextWriter):
+        kwargs['precision'] = precision
+    return WRITERS[extension](path, elements, properties, **kwargs)
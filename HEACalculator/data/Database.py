@@ -0,0 +1,245 @@
+#!/usr/bin/env python3
+
+# Copyright (C) 2022  Doguhan Sariturk
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+import csv
+import hashlib
+import math
+import os
+import re
+
+import numpy as np
+
+from HEACalculator.data.PairMatrix import PairMatrix
+from HEACalculator.data.PropertyTable import PropertyTable
+from HEACalculator.data.Storage import (ELEMENT_PROPERTIES, PAIR_DATABASES, database_arrays, element_table_data,
+                                        load_database, pair_table_data, write_database)
+
+__author__ = 'Doguhan Sariturk'
+__email__ = 'dogu.sariturk@gmail.com'
+
+_SYMBOL = re.compile(r'[A-Z][a-z]{0,2}$')
+
+
+class Database:
+    """Element properties and pair enthalpies the calculations are based on.
+
+    The tables are indexed once, when the database is created, so every batch
+    evaluated with the database only gathers the rows of its elements.
+
+    Parameters
+    ----------
+    arrays : dict
+        Arrays of the database, in the format of :func:`HEACalculator.data.Storage.load_database`.
+
+    name : str, optional
+        Name of the database, e.g. the files it was loaded from.
+
+    Raises
+    ------
+    ValueError
+        If the arrays are not a valid database
+
+    Attributes
+    ----------
+    element_table : HEACalculator.data.PropertyTable.PropertyTable
+        Element properties.
+
+    mixing_enthalpy_matrix : HEACalculator.data.PairMatrix.PairMatrix
+        Pair mixing enthalpies in kJ/mol.
+
+    formation_enthalpy_matrix : HEACalculator.data.PairMatrix.PairMatrix
+        Pair formation enthalpies in meV/atom.
+
+    fingerprint : str
+        Digest of the content of the database, which only depends on the values it holds.
+    """
+
+    def __init__(self, arrays, name='database'):
+        self.name = name
+        self._arrays = {key: np.asarray(value) for key, value in arrays.items()}
+        _validate(self._arrays)
+
+        symbols = self._arrays['symbols'].tolist()
+        self.element_table = PropertyTable.from_arrays(symbols, {prop: self._arrays[prop]
+                                                                 for prop in ELEMENT_PROPERTIES})
+        self.mixing_enthalpy_matrix, self.formation_enthalpy_matrix = (
+                PairMatrix.from_arrays(symbols, self._arrays[f'{table}_pairs'], self._arrays[f'{table}_values'],
+                                       name=table.replace('_', ' '))
+                for table in PAIR_DATABASES)
+
+        digest = hashlib.sha256()
+        for key, value in sorted(self._arrays.items()):
+            digest.update(f'{key}:{value.dtype.str}:{value.shape}'.encode())
+            digest.update(np.ascontiguousarray(value).tobytes())
+        self.fingerprint = digest.hexdigest()
+
+    def __reduce__(self):
+        # The tables are built again from the arrays, rather than pickled along with them
+        return self.__class__, (self._arrays, self.name)
+
+    def __repr__(self):
+        return f'{self.__class__.__name__}({self.name!r})'
+
+    @classmethod
+    def default(cls):
+        """Returns the database shipped with the package
+
+        Returns
+        -------
+        Database
+            The default database
+        """
+        return cls(load_database(), name='default')
+
+    @classmethod
+    def load(cls, *paths, base=None):
+        """Loads a database from files
+
+        Each file either replaces the whole database, if it is a ``.npz`` file
+        written by :meth:`save`, or adds and overrides the values of one table,
+        if it is a ``.csv`` file. The table of a CSV file is given by its header:
+
+        - ``symbol`` and any of the element properties, e.g. ``atomic_radius``, for the element table.
+          Empty cells are unknown values. New elements need every property.
+        - ``first``, ``second`` and ``mixing_enthalpy``, in kJ/mol, for the mixing enthalpy table.
+        - ``first``, ``second`` and ``formation_enthalpy``, in meV/atom, for the formation enthalpy table.
+
+        The files are applied in the given order.
+
+        Parameters
+        ----------
+        *paths : str
+            Paths of the ``.npz`` and ``.csv`` files
+
+        base : Database, optional
+            The database the files are applied to, by default the database shipped with the package
+
+        Raises
+        ------
+        ValueError
+            If one of the files is not valid
+
+        OSError
+            If one of the files cannot be read
+
+        Returns
+        -------
+        Database
+            The loaded database
+        """
+        base = cls.default() if base is None else base
+        arrays = base._arrays
+        elements = element_table_data(arrays)
+        pairs = {table: pair_table_data(arrays, table) for table in PAIR_DATABASES}
+
+        for path in paths:
+            if os.path.splitext(path)[1].lower() == '.npz':
+                arrays = cls(load_database(path), name=path)._arrays
+                elements = element_table_data(arrays)
+                pairs = {table: pair_table_data(arrays, table) for table in PAIR_DATABASES}
+            else:
+                with open(path, newline='') as file:
+                    _read_table(path, file, elements, pairs)
+
+        for table, data in pairs.items():
+            unknown = sorted({symbol for pair in data for symbol in pair if symbol not in elements})
+            if unknown:
+                raise ValueError(f'The {table.replace("_", " ")} table refers to unknown elements: '
+                                 f'{", ".join(unknown)}')
+        return cls(database_arrays(elements, pairs), name=', '.join(paths) or base.name)
+
+    def save(self, path):
+        """Saves the database to a ``.npz`` file, which can be loaded with :meth:`load`
+
+        Parameters
+        ----------
+        path : str
+            Path of the file
+        """
+        write_database(path, element_table_data(self._arrays),
+                       {table: pair_table_data(self._arrays, table) for table in PAIR_DATABASES})
+
+
+def _validate(arrays):
+    missing = [key for key in ('symbols', *ELEMENT_PROPERTIES,
+                               *(f'{table}_{part}' for table in PAIR_DATABASES for part in ('pairs', 'values')))
+               if key not in arrays]
+    if missing:
+        raise ValueError(f'The database does not have the following arrays: {", ".join(missing)}')
+
+    symbols = arrays['symbols'].tolist()
+    if len(set(symbols)) != len(symbols):
+        raise ValueError('The element symbols of the database should be unique.')
+    for prop in ELEMENT_PROPERTIES:
+        if arrays[prop].shape != (len(symbols),):
+            raise ValueError(f'The {prop} array should have one value per element.')
+    for table in PAIR_DATABASES:
+        pairs, values = arrays[f'{table}_pairs'], arrays[f'{table}_values']
+        if pairs.ndim != 2 or pairs.shape[1:] != (2,) or values.shape != (len(pairs),):
+            raise ValueError(f'The {table} arrays should hold one pair of indices and one value per pair.')
+        if len(pairs) and (pairs.min() < 0 or pairs.max() >= len(symbols) or np.any(pairs[:, 0] == pairs[:, 1])):
+            raise ValueError(f'The {table} pairs should refer to two different elements of the database.')
+        if not np.all(np.isfinite(values)):
+            raise ValueError(f'The {table} values should be finite.')
+
+
+def _parse_value(path, line, column, text, allow_missing):
+    text = (text or '').strip()
+    if allow_missing and text in ('', 'NaN', 'nan'):
+        return math.nan
+    try:
+        value = float(text)
+    except ValueError:
+        raise ValueError(f'{path}, line {line}: invalid {column} value: {text!r}') from None
+    if not math.isfinite(value) and not allow_missing:
+        raise ValueError(f'{path}, line {line}: the {column} value should be finite')
+    return value
+
+
+def _read_table(path, file, elements, pairs):
+    reader = csv.DictReader(file, skipinitialspace=True)
+    columns = [name.strip() for name in reader.fieldnames or ()]
+    reader.fieldnames = columns
+
+    if 'symbol' in columns:
+        unknown = [name for name in columns if name != 'symbol' and name not in ELEMENT_PROPERTIES]
+        if unknown:
+            raise ValueError(f'{path}: unknown element properties: {", ".join(unknown)}')
+        properties = [name for name in columns if name != 'symbol']
+        for line, row in enumerate(reader, start=2):
+            symbol = (row['symbol'] or '').strip()
+            if not _SYMBOL.match(symbol):
+                raise ValueError(f'{path}, line {line}: invalid element symbol: {symbol!r}')
+            if symbol not in elements and len(properties) != len(ELEMENT_PROPERTIES):
+                raise ValueError(f'{path}, line {line}: the new element {symbol} needs every property: '
+                                 f'{", ".join(ELEMENT_PROPERTIES)}')
+            values = elements.setdefault(symbol, {})
+            for prop in properties:
+                values[prop] = _parse_value(path, line, prop, row[prop], allow_missing=True)
+        return
+
+    tables = [name for name in columns if name in PAIR_DATABASES]
+    if 'first' not in columns or 'second' not in columns or len(tables) != 1:
+        raise ValueError(f'{path}: the header should either have a symbol column, or first, second and one of '
+                         f'{", ".join(PAIR_DATABASES)} columns')
+    table = tables[0]
+    for line, row in enumerate(reader, start=2):
+        first, second = (row['first'] or '').strip(), (row['second'] or '').strip()
+        if first == second:
+            raise ValueError(f'{path}, line {line}: a pair should have two different elements')
+        pairs[table][tuple(sorted((first, second)))] = _parse_value(path, line, table, row[table],
+                                                                    allow_missing=False)
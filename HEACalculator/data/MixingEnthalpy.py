@@ -15,535 +15,17 @@
 # You should have received a copy of the GNU General Public License
 # along with this program.  If not, see <https://www.gnu.org/licenses/>.
 
+from HEACalculator.data.Storage import pair_data
+
 __author__ = 'Doguhan Sariturk'
 __email__ = 'dogu.sariturk@gmail.com'
 
-_mixing_data = {
-        ('H', 'Li'): -25.0, ('Be', 'H'): 2.0, ('B', 'H'): 5.0, ('C', 'H'): -3.0, ('H', 'N'): -18.0, ('H', 'Na'): -16.0,
-        ('H', 'Mg'): -19.0, ('Al', 'H'): -8.0, ('H', 'Si'): -19.0, ('H', 'P'): 0.5, ('H', 'K'): -16.0,
-        ('Ca', 'H'): -46.0, ('H', 'Sc'): -60.0, ('H', 'Ti'): -54.0, ('H', 'V'): -39.0, ('Cr', 'H'): -28.0,
-        ('H', 'Mn'): -34.0, ('Fe', 'H'): -23.0, ('Co', 'H'): -23.0, ('H', 'Ni'): -23.0, ('Cu', 'H'): -6.0,
-        ('H', 'Zn'): -8.0, ('Ga', 'H'): -8.0, ('Ge', 'H'): -14.5, ('As', 'H'): -1.0, ('H', 'Rb'): -16.0,
-        ('H', 'Sr'): -45.0, ('H', 'Y'): -61.0, ('H', 'Zr'): -69.0, ('H', 'Nb'): -46.0, ('H', 'Mo'): -28.0,
-        ('H', 'Tc'): -21.0, ('H', 'Ru'): -20.0, ('H', 'Rh'): -23.0, ('H', 'Pd'): -27.0, ('Ag', 'H'): -10.0,
-        ('Cd', 'H'): -6.0, ('H', 'In'): -6.0, ('H', 'Sn'): -4.0, ('H', 'Sb'): -1.0, ('Cs', 'H'): -16.0,
-        ('Ba', 'H'): -49.0, ('H', 'La'): -60.0, ('Ce', 'H'): -61.0, ('H', 'Pr'): -61.0, ('H', 'Nd'): -61.0,
-        ('H', 'Pm'): -61.0, ('H', 'Sm'): -61.0, ('Eu', 'H'): -45.0, ('Gd', 'H'): -61.0, ('H', 'Tb'): -61.0,
-        ('Dy', 'H'): -61.0, ('H', 'Ho'): -60.0, ('Er', 'H'): -61.0, ('H', 'Tm'): -61.0, ('H', 'Yb'): -45.0,
-        ('H', 'Lu'): -61.0, ('H', 'Hf'): -63.0, ('H', 'Ta'): -46.0, ('H', 'W'): -24.0, ('H', 'Re'): -18.0,
-        ('H', 'Os'): -19.0, ('H', 'Ir'): -20.0, ('H', 'Pt'): -24.0, ('Au', 'H'): -8.0, ('H', 'Hg'): -3.0,
-        ('H', 'Tl'): -3.0, ('H', 'Pb'): -1.0, ('Bi', 'H'): 0.0, ('H', 'Th'): -61.0, ('H', 'U'): -53.0,
-        ('H', 'Pu'): -54.0, ('Be', 'Li'): -5.0, ('B', 'Li'): -6.0, ('C', 'Li'): -61.0, ('Li', 'N'): -145.0,
-        ('Li', 'Na'): 4.0, ('Li', 'Mg'): 0.0, ('Al', 'Li'): -4.0, ('Li', 'Si'): -30.0, ('Li', 'P'): -45.5,
-        ('K', 'Li'): 11.0, ('Ca', 'Li'): -1.0, ('Li', 'Sc'): 12.0, ('Li', 'Ti'): 34.0, ('Li', 'V'): 37.0,
-        ('Cr', 'Li'): 35.0, ('Li', 'Mn'): 19.0, ('Fe', 'Li'): 26.0, ('Co', 'Li'): 8.0, ('Li', 'Ni'): 1.0,
-        ('Cu', 'Li'): -5.0, ('Li', 'Zn'): -7.0, ('Ga', 'Li'): -9.0, ('Ge', 'Li'): -34.5, ('As', 'Li'): -29.0,
-        ('Li', 'Rb'): 13.0, ('Li', 'Sr'): 0.0, ('Li', 'Y'): 8.0, ('Li', 'Zr'): 27.0, ('Li', 'Nb'): 51.0,
-        ('Li', 'Mo'): 49.0, ('Li', 'Tc'): 8.0, ('Li', 'Ru'): 5.0, ('Li', 'Rh'): -14.0, ('Li', 'Pd'): -40.0,
-        ('Ag', 'Li'): -16.0, ('Cd', 'Li'): -13.0, ('In', 'Li'): -12.0, ('Li', 'Sn'): -18.0, ('Li', 'Sb'): -28.0,
-        ('Cs', 'Li'): 16.0, ('Ba', 'Li'): 0.0, ('La', 'Li'): 6.0, ('Ce', 'Li'): 7.0, ('Li', 'Pr'): 7.0,
-        ('Li', 'Nd'): 7.0, ('Li', 'Pm'): 8.0, ('Li', 'Sm'): 8.0, ('Eu', 'Li'): -1.0, ('Gd', 'Li'): 8.0,
-        ('Li', 'Tb'): 9.0, ('Dy', 'Li'): 9.0, ('Ho', 'Li'): 8.0, ('Er', 'Li'): 9.0, ('Li', 'Tm'): 9.0,
-        ('Li', 'Yb'): -1.0, ('Li', 'Lu'): 10.0, ('Hf', 'Li'): 30.0, ('Li', 'Ta'): 48.0, ('Li', 'W'): 50.0,
-        ('Li', 'Re'): 29.0, ('Li', 'Os'): 11.0, ('Ir', 'Li'): -9.0, ('Li', 'Pt'): -33.0, ('Au', 'Li'): -37.0,
-        ('Hg', 'Li'): -19.0, ('Li', 'Tl'): -15.0, ('Li', 'Pb'): -21.0, ('Bi', 'Li'): -23.0, ('Li', 'Th'): 14.0,
-        ('Li', 'U'): 30.0, ('Li', 'Pu'): 21.0, ('B', 'Be'): 0.0, ('Be', 'C'): -15.0, ('Be', 'N'): -39.0,
-        ('Be', 'Na'): 18.0, ('Be', 'Mg'): -3.0, ('Al', 'Be'): 0.0, ('Be', 'Si'): -15.0, ('Be', 'P'): -3.5,
-        ('Be', 'K'): 27.0, ('Be', 'Ca'): -14.0, ('Be', 'Sc'): -36.0, ('Be', 'Ti'): -30.0, ('Be', 'V'): -16.0,
-        ('Be', 'Cr'): -7.0, ('Be', 'Mn'): -10.0, ('Be', 'Fe'): -4.0, ('Be', 'Co'): -4.0, ('Be', 'Ni'): -4.0,
-        ('Be', 'Cu'): 0.0, ('Be', 'Zn'): 4.0, ('Be', 'Ga'): 5.0, ('Be', 'Ge'): -3.5, ('As', 'Be'): 7.0,
-        ('Be', 'Rb'): 28.0, ('Be', 'Sr'): -10.0, ('Be', 'Y'): -32.0, ('Be', 'Zr'): -43.0, ('Be', 'Nb'): -25.0,
-        ('Be', 'Mo'): -7.0, ('Be', 'Tc'): -3.0, ('Be', 'Ru'): -3.0, ('Be', 'Rh'): -6.0, ('Be', 'Pd'): -8.0,
-        ('Ag', 'Be'): 6.0, ('Be', 'Cd'): 11.0, ('Be', 'In'): 16.0, ('Be', 'Sn'): 15.0, ('Be', 'Sb'): 18.0,
-        ('Be', 'Cs'): 29.0, ('Ba', 'Be'): -10.0, ('Be', 'La'): -29.0, ('Be', 'Ce'): -30.0, ('Be', 'Pr'): -31.0,
-        ('Be', 'Nd'): -31.0, ('Be', 'Pm'): -33.0, ('Be', 'Sm'): -32.0, ('Be', 'Eu'): -12.0, ('Be', 'Gd'): -32.0,
-        ('Be', 'Tb'): -33.0, ('Be', 'Dy'): -32.0, ('Be', 'Ho'): -32.0, ('Be', 'Er'): -33.0, ('Be', 'Tm'): -33.0,
-        ('Be', 'Yb'): -14.0, ('Be', 'Lu'): -35.0, ('Be', 'Hf'): -37.0, ('Be', 'Ta'): -24.0, ('Be', 'W'): -3.0,
-        ('Be', 'Re'): 0.0, ('Be', 'Os'): -2.0, ('Be', 'Ir'): -5.0, ('Be', 'Pt'): -10.0, ('Au', 'Be'): 0.0,
-        ('Be', 'Hg'): 15.0, ('Be', 'Tl'): 23.0, ('Be', 'Pb'): 25.0, ('Be', 'Bi'): 26.0, ('Be', 'Th'): -37.0,
-        ('Be', 'U'): -27.0, ('Be', 'Pu'): -25.0, ('B', 'C'): -10.0, ('B', 'N'): -28.0, ('B', 'Na'): 18.0,
-        ('B', 'Mg'): -4.0, ('Al', 'B'): 0.0, ('B', 'Si'): -14.0, ('B', 'P'): 0.5, ('B', 'K'): 27.0, ('B', 'Ca'): -22.0,
-        ('B', 'Sc'): -55.0, ('B', 'Ti'): -58.0, ('B', 'V'): -42.0, ('B', 'Cr'): -31.0, ('B', 'Mn'): -32.0,
-        ('B', 'Fe'): -26.0, ('B', 'Co'): -24.0, ('B', 'Ni'): -24.0, ('B', 'Cu'): 0.0, ('B', 'Zn'): 4.0,
-        ('B', 'Ga'): 6.0, ('B', 'Ge'): -0.5, ('As', 'B'): 10.0, ('B', 'Rb'): 28.0, ('B', 'Sr'): -18.0,
-        ('B', 'Y'): -50.0, ('B', 'Zr'): -71.0, ('B', 'Nb'): -54.0, ('B', 'Mo'): -34.0, ('B', 'Tc'): -25.0,
-        ('B', 'Ru'): -24.0, ('B', 'Rh'): -25.0, ('B', 'Pd'): -24.0, ('Ag', 'B'): 5.0, ('B', 'Cd'): 13.0,
-        ('B', 'In'): 18.0, ('B', 'Sn'): 18.0, ('B', 'Sb'): 23.0, ('B', 'Cs'): 29.0, ('B', 'Ba'): -19.0,
-        ('B', 'La'): -47.0, ('B', 'Ce'): -48.0, ('B', 'Pr'): -49.0, ('B', 'Nd'): -49.0, ('B', 'Pm'): -51.0,
-        ('B', 'Sm'): -50.0, ('B', 'Eu'): -19.0, ('B', 'Gd'): -50.0, ('B', 'Tb'): -51.0, ('B', 'Dy'): -51.0,
-        ('B', 'Ho'): -50.0, ('B', 'Er'): -52.0, ('B', 'Tm'): -52.0, ('B', 'Yb'): -22.0, ('B', 'Lu'): -54.0,
-        ('B', 'Hf'): -66.0, ('B', 'Ta'): -54.0, ('B', 'W'): -31.0, ('B', 'Re'): -25.0, ('B', 'Os'): -24.0,
-        ('B', 'Ir'): -26.0, ('B', 'Pt'): -28.0, ('Au', 'B'): -2.0, ('B', 'Hg'): 19.0, ('B', 'Tl'): 27.0,
-        ('B', 'Pb'): 30.0, ('B', 'Bi'): 31.0, ('B', 'Th'): -57.0, ('B', 'U'): -54.0, ('B', 'Pu'): -50.0,
-        ('C', 'N'): -2.0, ('C', 'Na'): -45.0, ('C', 'Mg'): -55.0, ('Al', 'C'): -36.0, ('C', 'Si'): -39.0,
-        ('C', 'P'): -4.5, ('C', 'K'): -43.0, ('C', 'Ca'): -89.0, ('C', 'Sc'): -118.0, ('C', 'Ti'): -109.0,
-        ('C', 'V'): -82.0, ('C', 'Cr'): -61.0, ('C', 'Mn'): -66.0, ('C', 'Fe'): -50.0, ('C', 'Co'): -42.0,
-        ('C', 'Ni'): -39.0, ('C', 'Cu'): -33.0, ('C', 'Zn'): -32.0, ('C', 'Ga'): -33.0, ('C', 'Ge'): -29.5,
-        ('As', 'C'): -14.0, ('C', 'Rb'): -44.0, ('C', 'Sr'): -87.0, ('C', 'Y'): -117.0, ('C', 'Zr'): -131.0,
-        ('C', 'Nb'): -102.0, ('C', 'Mo'): -67.0, ('C', 'Tc'): -39.0, ('C', 'Ru'): -35.0, ('C', 'Rh'): -35.0,
-        ('C', 'Pd'): -32.0, ('Ag', 'C'): -32.0, ('C', 'Cd'): -27.0, ('C', 'In'): -27.0, ('C', 'Sn'): -23.0,
-        ('C', 'Sb'): -13.0, ('C', 'Cs'): -43.0, ('Ba', 'C'): -90.0, ('C', 'La'): -116.0, ('C', 'Ce'): -116.0,
-        ('C', 'Pr'): -117.0, ('C', 'Nd'): -116.0, ('C', 'Pm'): -118.0, ('C', 'Sm'): -117.0, ('C', 'Eu'): -87.0,
-        ('C', 'Gd'): -117.0, ('C', 'Tb'): -118.0, ('C', 'Dy'): -117.0, ('C', 'Ho'): -116.0, ('C', 'Er'): -118.0,
-        ('C', 'Tm'): -117.0, ('C', 'Yb'): -88.0, ('C', 'Lu'): -119.0, ('C', 'Hf'): -123.0, ('C', 'Ta'): -101.0,
-        ('C', 'W'): -60.0, ('C', 'Re'): -42.0, ('C', 'Os'): -35.0, ('C', 'Ir'): -32.0, ('C', 'Pt'): -30.0,
-        ('Au', 'C'): -20.0, ('C', 'Hg'): -20.0, ('C', 'Tl'): -19.0, ('C', 'Pb'): -13.0, ('Bi', 'C'): -12.0,
-        ('C', 'Th'): -123.0, ('C', 'U'): -105.0, ('C', 'Pu'): -102.0, ('N', 'Na'): -141.0, ('Mg', 'N'): -134.0,
-        ('Al', 'N'): -92.0, ('N', 'Si'): -81.0, ('N', 'P'): -24.5, ('K', 'N'): -152.0, ('Ca', 'N'): -201.0,
-        ('N', 'Sc'): -224.0, ('N', 'Ti'): -190.0, ('N', 'V'): -143.0, ('Cr', 'N'): -107.0, ('Mn', 'N'): -119.0,
-        ('Fe', 'N'): -87.0, ('Co', 'N'): -75.0, ('N', 'Ni'): -69.0, ('Cu', 'N'): -84.0, ('N', 'Zn'): -88.0,
-        ('Ga', 'N'): -95.0, ('Ge', 'N'): -78.5, ('As', 'N'): -59.0, ('N', 'Rb'): -154.0, ('N', 'Sr'): -206.0,
-        ('N', 'Y'): -232.0, ('N', 'Zr'): -233.0, ('N', 'Nb'): -174.0, ('Mo', 'N'): -115.0, ('N', 'Tc'): -68.0,
-        ('N', 'Ru'): -61.0, ('N', 'Rh'): -63.0, ('N', 'Pd'): -62.0, ('Ag', 'N'): -94.0, ('Cd', 'N'): -91.0,
-        ('In', 'N'): -98.0, ('N', 'Sn'): -90.0, ('N', 'Sb'): -74.0, ('Cs', 'N'): -155.0, ('Ba', 'N'): -212.0,
-        ('La', 'N'): -235.0, ('Ce', 'N'): -234.0, ('N', 'Pr'): -233.0, ('N', 'Nd'): -235.0, ('N', 'Pm'): -233.0,
-        ('N', 'Sm'): -202.0, ('Eu', 'N'): -231.0, ('Gd', 'N'): -232.0, ('N', 'Tb'): -232.0, ('Dy', 'N'): -231.0,
-        ('Ho', 'N'): -229.0, ('Er', 'N'): -230.0, ('N', 'Tm'): -229.0, ('N', 'Yb'): -199.0, ('Lu', 'N'): -231.0,
-        ('Hf', 'N'): -218.0, ('N', 'Ta'): -173.0, ('N', 'W'): -103.0, ('N', 'Re'): -72.0, ('N', 'Os'): -60.0,
-        ('Ir', 'N'): -54.0, ('N', 'Pt'): -52.0, ('Au', 'N'): -58.0, ('Hg', 'N'): -81.0, ('N', 'Tl'): -91.0,
-        ('N', 'Pb'): -82.0, ('Bi', 'N'): -80.0, ('N', 'Th'): -237.0, ('N', 'U'): -189.0, ('N', 'Pu'): -188.0,
-        ('Mg', 'Na'): 10.0, ('Al', 'Na'): 13.0, ('Na', 'Si'): -11.0, ('Na', 'P'): -26.5, ('K', 'Na'): 1.0,
-        ('Ca', 'Na'): 1.0, ('Na', 'Sc'): 34.0, ('Na', 'Ti'): 68.0, ('Na', 'V'): 73.0, ('Cr', 'Na'): 71.0,
-        ('Mn', 'Na'): 49.0, ('Fe', 'Na'): 62.0, ('Co', 'Na'): 41.0, ('Na', 'Ni'): 32.0, ('Cu', 'Na'): 16.0,
-        ('Na', 'Zn'): 6.0, ('Ga', 'Na'): 5.0, ('Ge', 'Na'): -21.5, ('As', 'Na'): -14.0, ('Na', 'Rb'): 2.0,
-        ('Na', 'Sr'): -2.0, ('Na', 'Y'): 28.0, ('Na', 'Zr'): 59.0, ('Na', 'Nb'): 93.0, ('Mo', 'Na'): 93.0,
-        ('Na', 'Tc'): 47.0, ('Na', 'Ru'): 44.0, ('Na', 'Rh'): 19.0, ('Na', 'Pd'): -15.0, ('Ag', 'Na'): 0.0,
-        ('Cd', 'Na'): -3.0, ('In', 'Na'): -5.0, ('Na', 'Sn'): -8.0, ('Na', 'Sb'): -20.0, ('Cs', 'Na'): 3.0,
-        ('Ba', 'Na'): -3.0, ('La', 'Na'): 24.0, ('Ce', 'Na'): 25.0, ('Na', 'Pr'): 26.0, ('Na', 'Nd'): 26.0,
-        ('Na', 'Pm'): 28.0, ('Na', 'Sm'): 28.0, ('Eu', 'Na'): 0.0, ('Gd', 'Na'): 28.0, ('Na', 'Tb'): 29.0,
-        ('Dy', 'Na'): 29.0, ('Ho', 'Na'): 28.0, ('Er', 'Na'): 30.0, ('Na', 'Tm'): 30.0, ('Na', 'Yb'): 2.0,
-        ('Lu', 'Na'): 31.0, ('Hf', 'Na'): 63.0, ('Na', 'Ta'): 89.0, ('Na', 'W'): 97.0, ('Na', 'Re'): 73.0,
-        ('Na', 'Os'): 52.0, ('Ir', 'Na'): 28.0, ('Na', 'Pt'): -1.0, ('Au', 'Na'): -14.0, ('Hg', 'Na'): -11.0,
-        ('Na', 'Tl'): -11.0, ('Na', 'Pb'): -18.0, ('Bi', 'Na'): -20.0, ('Na', 'Th'): 39.0, ('Na', 'U'): 65.0,
-        ('Na', 'Pu'): 49.0, ('Al', 'Mg'): -2.0, ('Mg', 'Si'): -26.0, ('Mg', 'P'): -39.5, ('K', 'Mg'): 20.0,
-        ('Ca', 'Mg'): -6.0, ('Mg', 'Sc'): -3.0, ('Mg', 'Ti'): 16.0, ('Mg', 'V'): 23.0, ('Cr', 'Mg'): 24.0,
-        ('Mg', 'Mn'): 10.0, ('Fe', 'Mg'): 18.0, ('Co', 'Mg'): 3.0, ('Mg', 'Ni'): -4.0, ('Cu', 'Mg'): -3.0,
-        ('Mg', 'Zn'): -4.0, ('Ga', 'Mg'): -4.0, ('Ge', 'Mg'): -26.5, ('As', 'Mg'): -21.0, ('Mg', 'Rb'): 23.0,
-        ('Mg', 'Sr'): -4.0, ('Mg', 'Y'): -6.0, ('Mg', 'Zr'): 6.0, ('Mg', 'Nb'): 32.0, ('Mg', 'Mo'): 36.0,
-        ('Mg', 'Tc'): 3.0, ('Mg', 'Ru'): 0.0, ('Mg', 'Rh'): -17.0, ('Mg', 'Pd'): -40.0, ('Ag', 'Mg'): -10.0,
-        ('Cd', 'Mg'): -6.0, ('In', 'Mg'): -4.0, ('Mg', 'Sn'): -9.0, ('Mg', 'Sb'): -16.0, ('Cs', 'Mg'): 25.0,
-        ('Ba', 'Mg'): -4.0, ('La', 'Mg'): -7.0, ('Ce', 'Mg'): -7.0, ('Mg', 'Pr'): -6.0, ('Mg', 'Nd'): -6.0,
-        ('Mg', 'Pm'): -6.0, ('Mg', 'Sm'): -6.0, ('Eu', 'Mg'): -5.0, ('Gd', 'Mg'): -6.0, ('Mg', 'Tb'): -6.0,
-        ('Dy', 'Mg'): -6.0, ('Ho', 'Mg'): -6.0, ('Er', 'Mg'): -5.0, ('Mg', 'Tm'): -5.0, ('Mg', 'Yb'): -6.0,
-        ('Lu', 'Mg'): -5.0, ('Hf', 'Mg'): 10.0, ('Mg', 'Ta'): 30.0, ('Mg', 'W'): 38.0, ('Mg', 'Re'): 21.0,
-        ('Mg', 'Os'): 5.0, ('Ir', 'Mg'): -13.0, ('Mg', 'Pt'): -35.0, ('Au', 'Mg'): -32.0, ('Hg', 'Mg'): -10.0,
-        ('Mg', 'Tl'): -3.0, ('Mg', 'Pb'): -8.0, ('Bi', 'Mg'): -10.0, ('Mg', 'Th'): -3.0, ('Mg', 'U'): 14.0,
-        ('Mg', 'Pu'): 6.0, ('Al', 'Si'): -19.0, ('Al', 'P'): -20.5, ('Al', 'K'): 23.0, ('Al', 'Ca'): -20.0,
-        ('Al', 'Sc'): -38.0, ('Al', 'Ti'): -30.0, ('Al', 'V'): -16.0, ('Al', 'Cr'): -10.0, ('Al', 'Mn'): -19.0,
-        ('Al', 'Fe'): -11.0, ('Al', 'Co'): -19.0, ('Al', 'Ni'): -22.0, ('Al', 'Cu'): -1.0, ('Al', 'Zn'): 1.0,
-        ('Al', 'Ga'): 1.0, ('Al', 'Ge'): -14.5, ('Al', 'As'): -6.0, ('Al', 'Rb'): 25.0, ('Al', 'Sr'): -18.0,
-        ('Al', 'Y'): -38.0, ('Al', 'Zr'): -44.0, ('Al', 'Nb'): -18.0, ('Al', 'Mo'): -5.0, ('Al', 'Tc'): -20.0,
-        ('Al', 'Ru'): -21.0, ('Al', 'Rh'): -32.0, ('Al', 'Pd'): -46.0, ('Ag', 'Al'): -4.0, ('Al', 'Cd'): 3.0,
-        ('Al', 'In'): 7.0, ('Al', 'Sn'): 4.0, ('Al', 'Sb'): 2.0, ('Al', 'Cs'): 26.0, ('Al', 'Ba'): -20.0,
-        ('Al', 'La'): -38.0, ('Al', 'Ce'): -38.0, ('Al', 'Pr'): -38.0, ('Al', 'Nd'): -38.0, ('Al', 'Pm'): -39.0,
-        ('Al', 'Sm'): -38.0, ('Al', 'Eu'): -19.0, ('Al', 'Gd'): -39.0, ('Al', 'Tb'): -39.0, ('Al', 'Dy'): -38.0,
-        ('Al', 'Ho'): -38.0, ('Al', 'Er'): -38.0, ('Al', 'Tm'): -38.0, ('Al', 'Yb'): -20.0, ('Al', 'Lu'): -39.0,
-        ('Al', 'Hf'): -39.0, ('Al', 'Ta'): -19.0, ('Al', 'W'): -2.0, ('Al', 'Re'): -9.0, ('Al', 'Os'): -18.0,
-        ('Al', 'Ir'): -30.0, ('Al', 'Pt'): -44.0, ('Al', 'Au'): -22.0, ('Al', 'Hg'): 4.0, ('Al', 'Tl'): 11.0,
-        ('Al', 'Pb'): 10.0, ('Al', 'Bi'): 10.0, ('Al', 'Th'): -40.0, ('Al', 'U'): -30.0, ('Al', 'Pu'): -33.0,
-        ('P', 'Si'): -25.5, ('K', 'Si'): -4.0, ('Ca', 'Si'): -51.0, ('Sc', 'Si'): -74.0, ('Si', 'Ti'): -66.0,
-        ('Si', 'V'): -48.0, ('Cr', 'Si'): -37.0, ('Mn', 'Si'): -45.0, ('Fe', 'Si'): -35.0, ('Co', 'Si'): -38.0,
-        ('Ni', 'Si'): -40.0, ('Cu', 'Si'): -19.0, ('Si', 'Zn'): -18.0, ('Ga', 'Si'): -17.0, ('Ge', 'Si'): -14.5,
-        ('As', 'Si'): -17.0, ('Rb', 'Si'): -4.0, ('Si', 'Sr'): -49.0, ('Si', 'Y'): -73.0, ('Si', 'Zr'): -84.0,
-        ('Nb', 'Si'): -56.0, ('Mo', 'Si'): -35.0, ('Si', 'Tc'): -38.0, ('Ru', 'Si'): -38.0, ('Rh', 'Si'): -46.0,
-        ('Pd', 'Si'): -55.0, ('Ag', 'Si'): -20.0, ('Cd', 'Si'): -13.0, ('In', 'Si'): -10.0, ('Si', 'Sn'): -11.0,
-        ('Sb', 'Si'): -8.0, ('Cs', 'Si'): -3.0, ('Ba', 'Si'): -52.0, ('La', 'Si'): -73.0, ('Ce', 'Si'): -73.0,
-        ('Pr', 'Si'): -73.0, ('Nd', 'Si'): -73.0, ('Pm', 'Si'): -74.0, ('Si', 'Sm'): -74.0, ('Eu', 'Si'): -49.0,
-        ('Gd', 'Si'): -73.0, ('Si', 'Tb'): -74.0, ('Dy', 'Si'): -74.0, ('Ho', 'Si'): -73.0, ('Er', 'Si'): -74.0,
-        ('Si', 'Tm'): -74.0, ('Si', 'Yb'): -51.0, ('Lu', 'Si'): -75.0, ('Hf', 'Si'): -77.0, ('Si', 'Ta'): -56.0,
-        ('Si', 'W'): -31.0, ('Re', 'Si'): -31.0, ('Os', 'Si'): -36.0, ('Ir', 'Si'): -43.0, ('Pt', 'Si'): -53.0,
-        ('Au', 'Si'): -30.0, ('Hg', 'Si'): -10.0, ('Si', 'Tl'): -4.0, ('Pb', 'Si'): -2.0, ('Bi', 'Si'): -2.0,
-        ('Si', 'Th'): -77.0, ('Si', 'U'): -66.0, ('Pu', 'Si'): -66.0, ('K', 'P'): -24.5, ('Ca', 'P'): -81.5,
-        ('P', 'Sc'): -112.5, ('P', 'Ti'): -100.5, ('P', 'V'): -70.5, ('Cr', 'P'): -49.5, ('Mn', 'P'): -57.5,
-        ('Fe', 'P'): -39.5, ('Co', 'P'): -35.5, ('Ni', 'P'): -34.5, ('Cu', 'P'): -17.5, ('P', 'Zn'): -17.5,
-        ('Ga', 'P'): -18.5, ('Ge', 'P'): -17.0, ('As', 'P'): -2.5, ('P', 'Rb'): -24.5, ('P', 'Sr'): -81.5,
-        ('P', 'Y'): -113.5, ('P', 'Zr'): -127.5, ('Nb', 'P'): -89.5, ('Mo', 'P'): -53.5, ('P', 'Tc'): -33.5,
-        ('P', 'Ru'): -30.5, ('P', 'Rh'): -34.5, ('P', 'Pd'): -36.5, ('Ag', 'P'): -18.5, ('Cd', 'P'): -11.5,
-        ('In', 'P'): -10.5, ('P', 'Sn'): -7.5, ('P', 'Sb'): 2.5, ('Cs', 'P'): -24.5, ('Ba', 'P'): -85.5,
-        ('La', 'P'): -112.5, ('Ce', 'P'): -112.5, ('P', 'Pr'): -112.5, ('Nd', 'P'): -112.5, ('P', 'Pm'): -114.5,
-        ('P', 'Sm'): -113.5, ('Eu', 'P'): -79.5, ('Gd', 'P'): -113.5, ('P', 'Tb'): -113.5, ('Dy', 'P'): -112.5,
-        ('Ho', 'P'): -111.5, ('Er', 'P'): -113.5, ('P', 'Tm'): -112.5, ('P', 'Yb'): -80.5, ('Lu', 'P'): -114.5,
-        ('Hf', 'P'): -117.5, ('P', 'Ta'): -89.5, ('P', 'W'): -46.5, ('P', 'Re'): -32.5, ('Os', 'P'): -29.5,
-        ('Ir', 'P'): -30.5, ('P', 'Pt'): -34.5, ('Au', 'P'): -13.5, ('Hg', 'P'): -4.5, ('P', 'Tl'): -1.5,
-        ('P', 'Pb'): 4.5, ('Bi', 'P'): 5.5, ('P', 'Th'): -119.5, ('P', 'U'): -98.5, ('P', 'Pu'): -95.5,
-        ('Ca', 'K'): 12.0, ('K', 'Sc'): 58.0, ('K', 'Ti'): 94.0, ('K', 'V'): 96.0, ('Cr', 'K'): 91.0, ('K', 'Mn'): 66.0,
-        ('Fe', 'K'): 81.0, ('Co', 'K'): 55.0, ('K', 'Ni'): 45.0, ('Cu', 'K'): 25.0, ('K', 'Zn'): 13.0,
-        ('Ga', 'K'): 12.0, ('Ge', 'K'): -19.5, ('As', 'K'): -11.0, ('K', 'Rb'): 0.0, ('K', 'Sr'): 7.0, ('K', 'Y'): 50.0,
-        ('K', 'Zr'): 88.0, ('K', 'Nb'): 123.0, ('K', 'Mo'): 120.0, ('K', 'Tc'): 65.0, ('K', 'Ru'): 60.0,
-        ('K', 'Rh'): 31.0, ('K', 'Pd'): -9.0, ('Ag', 'K'): 7.0, ('Cd', 'K'): 1.0, ('In', 'K'): -4.0, ('K', 'Sn'): -7.0,
-        ('K', 'Sb'): -22.0, ('Cs', 'K'): 0.0, ('Ba', 'K'): 6.0, ('K', 'La'): 46.0, ('Ce', 'K'): 47.0, ('K', 'Pr'): 49.0,
-        ('K', 'Nd'): 49.0, ('K', 'Pm'): 51.0, ('K', 'Sm'): 50.0, ('Eu', 'K'): 10.0, ('Gd', 'K'): 50.0,
-        ('K', 'Tb'): 52.0, ('Dy', 'K'): 51.0, ('Ho', 'K'): 51.0, ('Er', 'K'): 53.0, ('K', 'Tm'): 52.0,
-        ('K', 'Yb'): 12.0, ('K', 'Lu'): 55.0, ('Hf', 'K'): 92.0, ('K', 'Ta'): 119.0, ('K', 'W'): 124.0,
-        ('K', 'Re'): 95.0, ('K', 'Os'): 70.0, ('Ir', 'K'): 42.0, ('K', 'Pt'): 9.0, ('Au', 'K'): -9.0,
-        ('Hg', 'K'): -10.0, ('K', 'Tl'): -13.0, ('K', 'Pb'): -21.0, ('Bi', 'K'): -24.0, ('K', 'Th'): 65.0,
-        ('K', 'U'): 93.0, ('K', 'Pu'): 72.0, ('Ca', 'Sc'): 17.0, ('Ca', 'Ti'): 43.0, ('Ca', 'V'): 44.0,
-        ('Ca', 'Cr'): 38.0, ('Ca', 'Mn'): 19.0, ('Ca', 'Fe'): 25.0, ('Ca', 'Co'): 2.0, ('Ca', 'Ni'): -7.0,
-        ('Ca', 'Cu'): -13.0, ('Ca', 'Zn'): -22.0, ('Ca', 'Ga'): -28.0, ('Ca', 'Ge'): -59.5, ('As', 'Ca'): -61.0,
-        ('Ca', 'Rb'): 15.0, ('Ca', 'Sr'): 1.0, ('Ca', 'Y'): 11.0, ('Ca', 'Zr'): 37.0, ('Ca', 'Nb'): 63.0,
-        ('Ca', 'Mo'): 56.0, ('Ca', 'Tc'): 1.0, ('Ca', 'Ru'): -4.0, ('Ca', 'Rh'): -28.0, ('Ca', 'Pd'): -63.0,
-        ('Ag', 'Ca'): -28.0, ('Ca', 'Cd'): -32.0, ('Ca', 'In'): -35.0, ('Ca', 'Sn'): -45.0, ('Ca', 'Sb'): -62.0,
-        ('Ca', 'Cs'): 19.0, ('Ba', 'Ca'): 1.0, ('Ca', 'La'): 8.0, ('Ca', 'Ce'): 9.0, ('Ca', 'Pr'): 10.0,
-        ('Ca', 'Nd'): 10.0, ('Ca', 'Pm'): 11.0, ('Ca', 'Sm'): 11.0, ('Ca', 'Eu'): 0.0, ('Ca', 'Gd'): 11.0,
-        ('Ca', 'Tb'): 12.0, ('Ca', 'Dy'): 12.0, ('Ca', 'Ho'): 11.0, ('Ca', 'Er'): 13.0, ('Ca', 'Tm'): 13.0,
-        ('Ca', 'Yb'): 0.0, ('Ca', 'Lu'): 14.0, ('Ca', 'Hf'): 39.0, ('Ca', 'Ta'): 60.0, ('Ca', 'W'): 57.0,
-        ('Ca', 'Re'): 28.0, ('Ca', 'Os'): 4.0, ('Ca', 'Ir'): -23.0, ('Ca', 'Pt'): -55.0, ('Au', 'Ca'): -60.0,
-        ('Ca', 'Hg'): -43.0, ('Ca', 'Tl'): -40.0, ('Ca', 'Pb'): -52.0, ('Bi', 'Ca'): -56.0, ('Ca', 'Th'): 19.0,
-        ('Ca', 'U'): 37.0, ('Ca', 'Pu'): 24.0, ('Sc', 'Ti'): 8.0, ('Sc', 'V'): 7.0, ('Cr', 'Sc'): 1.0,
-        ('Mn', 'Sc'): -8.0, ('Fe', 'Sc'): -11.0, ('Co', 'Sc'): -30.0, ('Ni', 'Sc'): -39.0, ('Cu', 'Sc'): -24.0,
-        ('Sc', 'Zn'): -29.0, ('Ga', 'Sc'): -38.0, ('Ge', 'Sc'): -69.5, ('As', 'Sc'): -77.0, ('Rb', 'Sc'): 64.0,
-        ('Sc', 'Sr'): 25.0, ('Sc', 'Y'): 1.0, ('Sc', 'Zr'): 4.0, ('Nb', 'Sc'): 18.0, ('Mo', 'Sc'): 11.0,
-        ('Sc', 'Tc'): -39.0, ('Ru', 'Sc'): -44.0, ('Rh', 'Sc'): -61.0, ('Pd', 'Sc'): -86.0, ('Ag', 'Sc'): -28.0,
-        ('Cd', 'Sc'): -30.0, ('In', 'Sc'): -30.0, ('Sc', 'Sn'): -45.0, ('Sb', 'Sc'): -61.0, ('Cs', 'Sc'): 70.0,
-        ('Ba', 'Sc'): 28.0, ('La', 'Sc'): 2.0, ('Ce', 'Sc'): 2.0, ('Pr', 'Sc'): 1.0, ('Nd', 'Sc'): 2.0,
-        ('Pm', 'Sc'): 1.0, ('Sc', 'Sm'): 1.0, ('Eu', 'Sc'): 21.0, ('Gd', 'Sc'): 1.0, ('Sc', 'Tb'): 1.0,
-        ('Dy', 'Sc'): 1.0, ('Ho', 'Sc'): 1.0, ('Er', 'Sc'): 0.0, ('Sc', 'Tm'): 0.0, ('Sc', 'Yb'): 16.0,
-        ('Lu', 'Sc'): 0.0, ('Hf', 'Sc'): 5.0, ('Sc', 'Ta'): 16.0, ('Sc', 'W'): 9.0, ('Re', 'Sc'): -17.0,
-        ('Os', 'Sc'): -39.0, ('Ir', 'Sc'): -62.0, ('Pt', 'Sc'): -89.0, ('Au', 'Sc'): -74.0, ('Hg', 'Sc'): -37.0,
-        ('Sc', 'Tl'): -28.0, ('Pb', 'Sc'): -40.0, ('Bi', 'Sc'): -46.0, ('Sc', 'Th'): 0.0, ('Sc', 'U'): 3.0,
-        ('Pu', 'Sc'): -1.0, ('Ti', 'V'): -2.0, ('Cr', 'Ti'): -7.0, ('Mn', 'Ti'): -8.0, ('Fe', 'Ti'): -17.0,
-        ('Co', 'Ti'): -28.0, ('Ni', 'Ti'): -35.0, ('Cu', 'Ti'): -9.0, ('Ti', 'Zn'): -15.0, ('Ga', 'Ti'): -23.0,
-        ('Ge', 'Ti'): -51.5, ('As', 'Ti'): -60.0, ('Rb', 'Ti'): 100.0, ('Sr', 'Ti'): 53.0, ('Ti', 'Y'): 15.0,
-        ('Ti', 'Zr'): 0.0, ('Nb', 'Ti'): 2.0, ('Mo', 'Ti'): -4.0, ('Tc', 'Ti'): -39.0, ('Ru', 'Ti'): -43.0,
-        ('Rh', 'Ti'): -52.0, ('Pd', 'Ti'): -65.0, ('Ag', 'Ti'): -2.0, ('Cd', 'Ti'): -8.0, ('In', 'Ti'): -5.0,
-        ('Sn', 'Ti'): -21.0, ('Sb', 'Ti'): -33.0, ('Cs', 'Ti'): 104.0, ('Ba', 'Ti'): 57.0, ('La', 'Ti'): 20.0,
-        ('Ce', 'Ti'): 18.0, ('Pr', 'Ti'): 17.0, ('Nd', 'Ti'): 17.0, ('Pm', 'Ti'): 15.0, ('Sm', 'Ti'): 15.0,
-        ('Eu', 'Ti'): 48.0, ('Gd', 'Ti'): 15.0, ('Tb', 'Ti'): 14.0, ('Dy', 'Ti'): 14.0, ('Ho', 'Ti'): 14.0,
-        ('Er', 'Ti'): 13.0, ('Ti', 'Tm'): 12.0, ('Ti', 'Yb'): 41.0, ('Lu', 'Ti'): 11.0, ('Hf', 'Ti'): 0.0,
-        ('Ta', 'Ti'): 1.0, ('Ti', 'W'): -6.0, ('Re', 'Ti'): -25.0, ('Os', 'Ti'): -41.0, ('Ir', 'Ti'): -57.0,
-        ('Pt', 'Ti'): -74.0, ('Au', 'Ti'): -47.0, ('Hg', 'Ti'): -10.0, ('Ti', 'Tl'): 2.0, ('Pb', 'Ti'): -8.0,
-        ('Bi', 'Ti'): -14.0, ('Th', 'Ti'): 8.0, ('Ti', 'U'): 0.0, ('Pu', 'Ti'): 2.0, ('Cr', 'V'): -2.0,
-        ('Mn', 'V'): -1.0, ('Fe', 'V'): -7.0, ('Co', 'V'): -14.0, ('Ni', 'V'): -18.0, ('Cu', 'V'): 5.0,
-        ('V', 'Zn'): -2.0, ('Ga', 'V'): -8.0, ('Ge', 'V'): -31.5, ('As', 'V'): -35.0, ('Rb', 'V'): 100.0,
-        ('Sr', 'V'): 54.0, ('V', 'Y'): 17.0, ('V', 'Zr'): -4.0, ('Nb', 'V'): -1.0, ('Mo', 'V'): 0.0, ('Tc', 'V'): -21.0,
-        ('Ru', 'V'): -25.0, ('Rh', 'V'): -29.0, ('Pd', 'V'): -35.0, ('Ag', 'V'): 17.0, ('Cd', 'V'): 9.0,
-        ('In', 'V'): 12.0, ('Sn', 'V'): -1.0, ('Sb', 'V'): -8.0, ('Cs', 'V'): 103.0, ('Ba', 'V'): 57.0,
-        ('La', 'V'): 22.0, ('Ce', 'V'): 20.0, ('Pr', 'V'): 18.0, ('Nd', 'V'): 18.0, ('Pm', 'V'): 16.0,
-        ('Sm', 'V'): 17.0, ('Eu', 'V'): 49.0, ('Gd', 'V'): 17.0, ('Tb', 'V'): 15.0, ('Dy', 'V'): 15.0,
-        ('Ho', 'V'): 16.0, ('Er', 'V'): 14.0, ('Tm', 'V'): 13.0, ('V', 'Yb'): 43.0, ('Lu', 'V'): 11.0,
-        ('Hf', 'V'): -2.0, ('Ta', 'V'): -1.0, ('V', 'W'): -1.0, ('Re', 'V'): -13.0, ('Os', 'V'): -23.0,
-        ('Ir', 'V'): -34.0, ('Pt', 'V'): -45.0, ('Au', 'V'): -19.0, ('Hg', 'V'): 10.0, ('Tl', 'V'): 22.0,
-        ('Pb', 'V'): 15.0, ('Bi', 'V'): 10.0, ('Th', 'V'): 9.0, ('U', 'V'): 1.0, ('Pu', 'V'): 4.0, ('Cr', 'Mn'): 2.0,
-        ('Cr', 'Fe'): -1.0, ('Co', 'Cr'): -4.0, ('Cr', 'Ni'): -7.0, ('Cr', 'Cu'): 12.0, ('Cr', 'Zn'): 5.0,
-        ('Cr', 'Ga'): -1.0, ('Cr', 'Ge'): -18.5, ('As', 'Cr'): -19.0, ('Cr', 'Rb'): 94.0, ('Cr', 'Sr'): 47.0,
-        ('Cr', 'Y'): 11.0, ('Cr', 'Zr'): -12.0, ('Cr', 'Nb'): -7.0, ('Cr', 'Mo'): 0.0, ('Cr', 'Tc'): -9.0,
-        ('Cr', 'Ru'): -12.0, ('Cr', 'Rh'): -13.0, ('Cr', 'Pd'): -15.0, ('Ag', 'Cr'): 27.0, ('Cd', 'Cr'): 17.0,
-        ('Cr', 'In'): 20.0, ('Cr', 'Sn'): 10.0, ('Cr', 'Sb'): 7.0, ('Cr', 'Cs'): 97.0, ('Ba', 'Cr'): 50.0,
-        ('Cr', 'La'): 17.0, ('Ce', 'Cr'): 15.0, ('Cr', 'Pr'): 13.0, ('Cr', 'Nd'): 13.0, ('Cr', 'Pm'): 10.0,
-        ('Cr', 'Sm'): 11.0, ('Cr', 'Eu'): 43.0, ('Cr', 'Gd'): 11.0, ('Cr', 'Tb'): 9.0, ('Cr', 'Dy'): 9.0,
-        ('Cr', 'Ho'): 10.0, ('Cr', 'Er'): 8.0, ('Cr', 'Tm'): 8.0, ('Cr', 'Yb'): 37.0, ('Cr', 'Lu'): 5.0,
-        ('Cr', 'Hf'): -9.0, ('Cr', 'Ta'): -7.0, ('Cr', 'W'): 1.0, ('Cr', 'Re'): -4.0, ('Cr', 'Os'): -11.0,
-        ('Cr', 'Ir'): -18.0, ('Cr', 'Pt'): -24.0, ('Au', 'Cr'): 0.0, ('Cr', 'Hg'): 21.0, ('Cr', 'Tl'): 31.0,
-        ('Cr', 'Pb'): 28.0, ('Bi', 'Cr'): 24.0, ('Cr', 'Th'): 2.0, ('Cr', 'U'): -3.0, ('Cr', 'Pu'): 2.0,
-        ('Fe', 'Mn'): 0.0, ('Co', 'Mn'): -5.0, ('Mn', 'Ni'): -8.0, ('Cu', 'Mn'): 4.0, ('Mn', 'Zn'): -6.0,
-        ('Ga', 'Mn'): -13.0, ('Ge', 'Mn'): -31.5, ('As', 'Mn'): -31.0, ('Mn', 'Rb'): 69.0, ('Mn', 'Sr'): 27.0,
-        ('Mn', 'Y'): -1.0, ('Mn', 'Zr'): -15.0, ('Mn', 'Nb'): -4.0, ('Mn', 'Mo'): 5.0, ('Mn', 'Tc'): -8.0,
-        ('Mn', 'Ru'): -11.0, ('Mn', 'Rh'): -16.0, ('Mn', 'Pd'): -23.0, ('Ag', 'Mn'): 13.0, ('Cd', 'Mn'): 2.0,
-        ('In', 'Mn'): 3.0, ('Mn', 'Sn'): -7.0, ('Mn', 'Sb'): -11.0, ('Cs', 'Mn'): 71.0, ('Ba', 'Mn'): 29.0,
-        ('La', 'Mn'): 3.0, ('Ce', 'Mn'): 1.0, ('Mn', 'Pr'): 0.0, ('Mn', 'Nd'): 0.0, ('Mn', 'Pm'): -2.0,
-        ('Mn', 'Sm'): -1.0, ('Eu', 'Mn'): 23.0, ('Gd', 'Mn'): -1.0, ('Mn', 'Tb'): -3.0, ('Dy', 'Mn'): -3.0,
-        ('Ho', 'Mn'): -2.0, ('Er', 'Mn'): -4.0, ('Mn', 'Tm'): -4.0, ('Mn', 'Yb'): 19.0, ('Lu', 'Mn'): -6.0,
-        ('Hf', 'Mn'): -12.0, ('Mn', 'Ta'): -4.0, ('Mn', 'W'): 6.0, ('Mn', 'Re'): -1.0, ('Mn', 'Os'): -9.0,
-        ('Ir', 'Mn'): -18.0, ('Mn', 'Pt'): -28.0, ('Au', 'Mn'): -11.0, ('Hg', 'Mn'): 4.0, ('Mn', 'Tl'): 11.0,
-        ('Mn', 'Pb'): 7.0, ('Bi', 'Mn'): 3.0, ('Mn', 'Th'): -8.0, ('Mn', 'U'): -5.0, ('Mn', 'Pu'): -4.0,
-        ('Co', 'Fe'): -1.0, ('Fe', 'Ni'): -2.0, ('Cu', 'Fe'): 13.0, ('Fe', 'Zn'): 4.0, ('Fe', 'Ga'): -2.0,
-        ('Fe', 'Ge'): -15.5, ('As', 'Fe'): -14.0, ('Fe', 'Rb'): 83.0, ('Fe', 'Sr'): 34.0, ('Fe', 'Y'): -1.0,
-        ('Fe', 'Zr'): -25.0, ('Fe', 'Nb'): -16.0, ('Fe', 'Mo'): -2.0, ('Fe', 'Tc'): -3.0, ('Fe', 'Ru'): -5.0,
-        ('Fe', 'Rh'): -5.0, ('Fe', 'Pd'): -4.0, ('Ag', 'Fe'): 28.0, ('Cd', 'Fe'): 17.0, ('Fe', 'In'): 19.0,
-        ('Fe', 'Sn'): 11.0, ('Fe', 'Sb'): 10.0, ('Cs', 'Fe'): 85.0, ('Ba', 'Fe'): 37.0, ('Fe', 'La'): 5.0,
-        ('Ce', 'Fe'): 3.0, ('Fe', 'Pr'): 1.0, ('Fe', 'Nd'): 1.0, ('Fe', 'Pm'): -2.0, ('Fe', 'Sm'): -1.0,
-        ('Eu', 'Fe'): 30.0, ('Fe', 'Gd'): -1.0, ('Fe', 'Tb'): -3.0, ('Dy', 'Fe'): -3.0, ('Fe', 'Ho'): -2.0,
-        ('Er', 'Fe'): -5.0, ('Fe', 'Tm'): -5.0, ('Fe', 'Yb'): 25.0, ('Fe', 'Lu'): -7.0, ('Fe', 'Hf'): -21.0,
-        ('Fe', 'Ta'): -15.0, ('Fe', 'W'): 0.0, ('Fe', 'Re'): 0.0, ('Fe', 'Os'): -4.0, ('Fe', 'Ir'): -9.0,
-        ('Fe', 'Pt'): -13.0, ('Au', 'Fe'): 8.0, ('Fe', 'Hg'): 22.0, ('Fe', 'Tl'): 31.0, ('Fe', 'Pb'): 29.0,
-        ('Bi', 'Fe'): 26.0, ('Fe', 'Th'): -11.0, ('Fe', 'U'): -11.0, ('Fe', 'Pu'): -6.0, ('Co', 'Ni'): 0.0,
-        ('Co', 'Cu'): 6.0, ('Co', 'Zn'): -5.0, ('Co', 'Ga'): -11.0, ('Co', 'Ge'): -21.5, ('As', 'Co'): -18.0,
-        ('Co', 'Rb'): 57.0, ('Co', 'Sr'): 10.0, ('Co', 'Y'): -22.0, ('Co', 'Zr'): -41.0, ('Co', 'Nb'): -25.0,
-        ('Co', 'Mo'): -5.0, ('Co', 'Tc'): 0.0, ('Co', 'Ru'): -1.0, ('Co', 'Rh'): -2.0, ('Co', 'Pd'): -1.0,
-        ('Ag', 'Co'): 19.0, ('Cd', 'Co'): 6.0, ('Co', 'In'): 7.0, ('Co', 'Sn'): 0.0, ('Co', 'Sb'): 2.0,
-        ('Co', 'Cs'): 58.0, ('Ba', 'Co'): 11.0, ('Co', 'La'): -17.0, ('Ce', 'Co'): -18.0, ('Co', 'Pr'): -20.0,
-        ('Co', 'Nd'): -20.0, ('Co', 'Pm'): -23.0, ('Co', 'Sm'): -22.0, ('Co', 'Eu'): 7.0, ('Co', 'Gd'): -22.0,
-        ('Co', 'Tb'): -23.0, ('Co', 'Dy'): -23.0, ('Co', 'Ho'): -22.0, ('Co', 'Er'): -24.0, ('Co', 'Tm'): -24.0,
-        ('Co', 'Yb'): 2.0, ('Co', 'Lu'): -27.0, ('Co', 'Hf'): -35.0, ('Co', 'Ta'): -24.0, ('Co', 'W'): -1.0,
-        ('Co', 'Re'): 2.0, ('Co', 'Os'): 0.0, ('Co', 'Ir'): -3.0, ('Co', 'Pt'): -7.0, ('Au', 'Co'): 7.0,
-        ('Co', 'Hg'): 12.0, ('Co', 'Tl'): 18.0, ('Co', 'Pb'): 17.0, ('Bi', 'Co'): 14.0, ('Co', 'Th'): -30.0,
-        ('Co', 'U'): -23.0, ('Co', 'Pu'): -19.0, ('Cu', 'Ni'): 4.0, ('Ni', 'Zn'): -9.0, ('Ga', 'Ni'): -15.0,
-        ('Ge', 'Ni'): -23.5, ('As', 'Ni'): -19.0, ('Ni', 'Rb'): 47.0, ('Ni', 'Sr'): -1.0, ('Ni', 'Y'): -31.0,
-        ('Ni', 'Zr'): -49.0, ('Nb', 'Ni'): -30.0, ('Mo', 'Ni'): -7.0, ('Ni', 'Tc'): 1.0, ('Ni', 'Ru'): 0.0,
-        ('Ni', 'Rh'): -1.0, ('Ni', 'Pd'): 0.0, ('Ag', 'Ni'): 15.0, ('Cd', 'Ni'): 2.0, ('In', 'Ni'): 2.0,
-        ('Ni', 'Sn'): -4.0, ('Ni', 'Sb'): -1.0, ('Cs', 'Ni'): 48.0, ('Ba', 'Ni'): 0.0, ('La', 'Ni'): -27.0,
-        ('Ce', 'Ni'): -28.0, ('Ni', 'Pr'): -30.0, ('Nd', 'Ni'): -30.0, ('Ni', 'Pm'): -32.0, ('Ni', 'Sm'): -31.0,
-        ('Eu', 'Ni'): -3.0, ('Gd', 'Ni'): -31.0, ('Ni', 'Tb'): -32.0, ('Dy', 'Ni'): -32.0, ('Ho', 'Ni'): -31.0,
-        ('Er', 'Ni'): -34.0, ('Ni', 'Tm'): -34.0, ('Ni', 'Yb'): -7.0, ('Lu', 'Ni'): -36.0, ('Hf', 'Ni'): -42.0,
-        ('Ni', 'Ta'): -29.0, ('Ni', 'W'): -3.0, ('Ni', 'Re'): 2.0, ('Ni', 'Os'): 1.0, ('Ir', 'Ni'): -2.0,
-        ('Ni', 'Pt'): -5.0, ('Au', 'Ni'): 7.0, ('Hg', 'Ni'): 8.0, ('Ni', 'Tl'): 13.0, ('Ni', 'Pb'): 13.0,
-        ('Bi', 'Ni'): 10.0, ('Ni', 'Th'): -39.0, ('Ni', 'U'): -29.0, ('Ni', 'Pu'): -25.0, ('Cu', 'Zn'): 1.0,
-        ('Cu', 'Ga'): 1.0, ('Cu', 'Ge'): -11.5, ('As', 'Cu'): -3.0, ('Cu', 'Rb'): 27.0, ('Cu', 'Sr'): -9.0,
-        ('Cu', 'Y'): -22.0, ('Cu', 'Zr'): -23.0, ('Cu', 'Nb'): 3.0, ('Cu', 'Mo'): 19.0, ('Cu', 'Tc'): 8.0,
-        ('Cu', 'Ru'): 7.0, ('Cu', 'Rh'): -2.0, ('Cu', 'Pd'): -14.0, ('Ag', 'Cu'): 2.0, ('Cd', 'Cu'): 6.0,
-        ('Cu', 'In'): 10.0, ('Cu', 'Sn'): 7.0, ('Cu', 'Sb'): 7.0, ('Cs', 'Cu'): 28.0, ('Ba', 'Cu'): -9.0,
-        ('Cu', 'La'): -21.0, ('Ce', 'Cu'): -21.0, ('Cu', 'Pr'): -22.0, ('Cu', 'Nd'): -22.0, ('Cu', 'Pm'): -23.0,
-        ('Cu', 'Sm'): -22.0, ('Cu', 'Eu'): -10.0, ('Cu', 'Gd'): -22.0, ('Cu', 'Tb'): -23.0, ('Cu', 'Dy'): -22.0,
-        ('Cu', 'Ho'): -22.0, ('Cu', 'Er'): -23.0, ('Cu', 'Tm'): -23.0, ('Cu', 'Yb'): -12.0, ('Cu', 'Lu'): -24.0,
-        ('Cu', 'Hf'): -17.0, ('Cu', 'Ta'): 2.0, ('Cu', 'W'): 22.0, ('Cu', 'Re'): 18.0, ('Cu', 'Os'): 10.0,
-        ('Cu', 'Ir'): 0.0, ('Cu', 'Pt'): -12.0, ('Au', 'Cu'): -9.0, ('Cu', 'Hg'): 8.0, ('Cu', 'Tl'): 15.0,
-        ('Cu', 'Pb'): 15.0, ('Bi', 'Cu'): 15.0, ('Cu', 'Th'): -24.0, ('Cu', 'U'): -7.0, ('Cu', 'Pu'): -9.0,
-        ('Ga', 'Zn'): 0.0, ('Ge', 'Zn'): -15.5, ('As', 'Zn'): -6.0, ('Rb', 'Zn'): 14.0, ('Sr', 'Zn'): -21.0,
-        ('Y', 'Zn'): -32.0, ('Zn', 'Zr'): -29.0, ('Nb', 'Zn'): -1.0, ('Mo', 'Zn'): 12.0, ('Tc', 'Zn'): -4.0,
-        ('Ru', 'Zn'): -5.0, ('Rh', 'Zn'): -17.0, ('Pd', 'Zn'): -33.0, ('Ag', 'Zn'): -4.0, ('Cd', 'Zn'): 1.0,
-        ('In', 'Zn'): 3.0, ('Sn', 'Zn'): 1.0, ('Sb', 'Zn'): -1.0, ('Cs', 'Zn'): 15.0, ('Ba', 'Zn'): -23.0,
-        ('La', 'Zn'): -31.0, ('Ce', 'Zn'): -31.0, ('Pr', 'Zn'): -31.0, ('Nd', 'Zn'): -31.0, ('Pm', 'Zn'): -32.0,
-        ('Sm', 'Zn'): -31.0, ('Eu', 'Zn'): -21.0, ('Gd', 'Zn'): -31.0, ('Tb', 'Zn'): -31.0, ('Dy', 'Zn'): -31.0,
-        ('Ho', 'Zn'): -30.0, ('Er', 'Zn'): -31.0, ('Tm', 'Zn'): -30.0, ('Yb', 'Zn'): -21.0, ('Lu', 'Zn'): -31.0,
-        ('Hf', 'Zn'): -24.0, ('Ta', 'Zn'): -3.0, ('W', 'Zn'): 15.0, ('Re', 'Zn'): 8.0, ('Os', 'Zn'): -1.0,
-        ('Ir', 'Zn'): -13.0, ('Pt', 'Zn'): -29.0, ('Au', 'Zn'): -16.0, ('Hg', 'Zn'): 1.0, ('Tl', 'Zn'): 6.0,
-        ('Pb', 'Zn'): 5.0, ('Bi', 'Zn'): 4.0, ('Th', 'Zn'): -30.0, ('U', 'Zn'): -15.0, ('Pu', 'Zn'): -20.0,
-        ('Ga', 'Ge'): -15.5, ('As', 'Ga'): -6.0, ('Ga', 'Rb'): 13.0, ('Ga', 'Sr'): -27.0, ('Ga', 'Y'): -40.0,
-        ('Ga', 'Zr'): -40.0, ('Ga', 'Nb'): -8.0, ('Ga', 'Mo'): 7.0, ('Ga', 'Tc'): -10.0, ('Ga', 'Ru'): -11.0,
-        ('Ga', 'Rh'): -25.0, ('Ga', 'Pd'): -42.0, ('Ag', 'Ga'): -5.0, ('Cd', 'Ga'): 1.0, ('Ga', 'In'): 3.0,
-        ('Ga', 'Sn'): 1.0, ('Ga', 'Sb'): -1.0, ('Cs', 'Ga'): 14.0, ('Ba', 'Ga'): -30.0, ('Ga', 'La'): -41.0,
-        ('Ce', 'Ga'): -41.0, ('Ga', 'Pr'): -41.0, ('Ga', 'Nd'): -40.0, ('Ga', 'Pm'): -41.0, ('Ga', 'Sm'): -40.0,
-        ('Eu', 'Ga'): -27.0, ('Ga', 'Gd'): -40.0, ('Ga', 'Tb'): -40.0, ('Dy', 'Ga'): -40.0, ('Ga', 'Ho'): -39.0,
-        ('Er', 'Ga'): -40.0, ('Ga', 'Tm'): -39.0, ('Ga', 'Yb'): -27.0, ('Ga', 'Lu'): -40.0, ('Ga', 'Hf'): -34.0,
-        ('Ga', 'Ta'): -10.0, ('Ga', 'W'): 11.0, ('Ga', 'Re'): 3.0, ('Ga', 'Os'): -7.0, ('Ga', 'Ir'): -21.0,
-        ('Ga', 'Pt'): -38.0, ('Au', 'Ga'): -19.0, ('Ga', 'Hg'): 1.0, ('Ga', 'Tl'): 6.0, ('Ga', 'Pb'): 5.0,
-        ('Bi', 'Ga'): 4.0, ('Ga', 'Th'): -39.0, ('Ga', 'U'): -25.0, ('Ga', 'Pu'): -29.0, ('As', 'Ge'): -12.5,
-        ('Ge', 'Rb'): -19.5, ('Ge', 'Sr'): -59.5, ('Ge', 'Y'): -72.5, ('Ge', 'Zr'): -72.5, ('Ge', 'Nb'): -36.5,
-        ('Ge', 'Mo'): -13.5, ('Ge', 'Tc'): -18.5, ('Ge', 'Ru'): -18.5, ('Ge', 'Rh'): -29.5, ('Ge', 'Pd'): -43.5,
-        ('Ag', 'Ge'): -17.5, ('Cd', 'Ge'): -14.5, ('Ge', 'In'): -13.5, ('Ge', 'Sn'): -12.5, ('Ge', 'Sb'): -10.5,
-        ('Cs', 'Ge'): -19.5, ('Ba', 'Ge'): -63.5, ('Ge', 'La'): -73.5, ('Ce', 'Ge'): -73.5, ('Ge', 'Pr'): -72.5,
-        ('Ge', 'Nd'): -101.5, ('Ge', 'Pm'): -73.5, ('Ge', 'Sm'): -72.5, ('Eu', 'Ge'): -58.5, ('Gd', 'Ge'): -72.5,
-        ('Ge', 'Tb'): -72.5, ('Dy', 'Ge'): -71.5, ('Ge', 'Ho'): -71.5, ('Er', 'Ge'): -71.5, ('Ge', 'Tm'): -71.5,
-        ('Ge', 'Yb'): -58.5, ('Ge', 'Lu'): -71.5, ('Ge', 'Hf'): -65.5, ('Ge', 'Ta'): -37.5, ('Ge', 'W'): -7.5,
-        ('Ge', 'Re'): -7.5, ('Ge', 'Os'): -14.5, ('Ge', 'Ir'): -24.5, ('Ge', 'Pt'): -37.5, ('Au', 'Ge'): -21.5,
-        ('Ge', 'Hg'): -11.5, ('Ge', 'Tl'): -9.5, ('Ge', 'Pb'): -7.5, ('Bi', 'Ge'): -7.5, ('Ge', 'Th'): -72.5,
-        ('Ge', 'U'): -52.5, ('Ge', 'Pu'): -56.5, ('As', 'Rb'): -12.0, ('As', 'Sr'): -61.0, ('As', 'Y'): -80.0,
-        ('As', 'Zr'): -85.0, ('As', 'Nb'): -44.0, ('As', 'Mo'): -16.0, ('As', 'Tc'): -15.0, ('As', 'Ru'): -14.0,
-        ('As', 'Rh'): -24.0, ('As', 'Pd'): -36.0, ('Ag', 'As'): -8.0, ('As', 'Cd'): -4.0, ('As', 'In'): -3.0,
-        ('As', 'Sn'): -1.0, ('As', 'Sb'): 3.0, ('As', 'Cs'): -12.0, ('As', 'Ba'): -66.0, ('As', 'La'): -81.0,
-        ('As', 'Ce'): -81.0, ('As', 'Pr'): -81.0, ('As', 'Nd'): -80.0, ('As', 'Pm'): -81.0, ('As', 'Sm'): -80.0,
-        ('As', 'Eu'): -60.0, ('As', 'Gd'): -80.0, ('As', 'Tb'): -80.0, ('As', 'Dy'): -80.0, ('As', 'Ho'): -79.0,
-        ('As', 'Er'): -79.0, ('As', 'Tm'): -79.0, ('As', 'Yb'): -59.0, ('As', 'Lu'): -80.0, ('As', 'Hf'): -75.0,
-        ('As', 'Ta'): -45.0, ('As', 'W'): -9.0, ('As', 'Re'): -6.0, ('As', 'Os'): -11.0, ('As', 'Ir'): -19.0,
-        ('As', 'Pt'): -31.0, ('As', 'Au'): -11.0, ('As', 'Hg'): 0.0, ('As', 'Tl'): 3.0, ('As', 'Pb'): 6.0,
-        ('As', 'Bi'): 7.0, ('As', 'Th'): -82.0, ('As', 'U'): -60.0, ('As', 'Pu'): -62.0, ('Rb', 'Sr'): 10.0,
-        ('Rb', 'Y'): 56.0, ('Rb', 'Zr'): 95.0, ('Nb', 'Rb'): 130.0, ('Mo', 'Rb'): 125.0, ('Rb', 'Tc'): 67.0,
-        ('Rb', 'Ru'): 62.0, ('Rb', 'Rh'): 33.0, ('Pd', 'Rb'): -9.0, ('Ag', 'Rb'): 7.0, ('Cd', 'Rb'): 1.0,
-        ('In', 'Rb'): -4.0, ('Rb', 'Sn'): -7.0, ('Rb', 'Sb'): -24.0, ('Cs', 'Rb'): 0.0, ('Ba', 'Rb'): 9.0,
-        ('La', 'Rb'): 52.0, ('Ce', 'Rb'): 53.0, ('Pr', 'Rb'): 55.0, ('Nd', 'Rb'): 55.0, ('Pm', 'Rb'): 57.0,
-        ('Rb', 'Sm'): 56.0, ('Eu', 'Rb'): 13.0, ('Gd', 'Rb'): 56.0, ('Rb', 'Tb'): 58.0, ('Dy', 'Rb'): 58.0,
-        ('Ho', 'Rb'): 57.0, ('Er', 'Rb'): 59.0, ('Rb', 'Tm'): 59.0, ('Rb', 'Yb'): 16.0, ('Lu', 'Rb'): 61.0,
-        ('Hf', 'Rb'): 98.0, ('Rb', 'Ta'): 125.0, ('Rb', 'W'): 129.0, ('Rb', 'Re'): 98.0, ('Os', 'Rb'): 72.0,
-        ('Ir', 'Rb'): 44.0, ('Pt', 'Rb'): 9.0, ('Au', 'Rb'): -10.0, ('Hg', 'Rb'): -11.0, ('Rb', 'Tl'): -14.0,
-        ('Pb', 'Rb'): -23.0, ('Bi', 'Rb'): -26.0, ('Rb', 'Th'): 72.0, ('Rb', 'U'): 99.0, ('Pu', 'Rb'): 77.0,
-        ('Sr', 'Y'): 17.0, ('Sr', 'Zr'): 48.0, ('Nb', 'Sr'): 76.0, ('Mo', 'Sr'): 69.0, ('Sr', 'Tc'): 10.0,
-        ('Ru', 'Sr'): 5.0, ('Rh', 'Sr'): -22.0, ('Pd', 'Sr'): -61.0, ('Ag', 'Sr'): -27.0, ('Cd', 'Sr'): -33.0,
-        ('In', 'Sr'): -37.0, ('Sn', 'Sr'): -46.0, ('Sb', 'Sr'): -66.0, ('Cs', 'Sr'): 14.0, ('Ba', 'Sr'): 0.0,
-        ('La', 'Sr'): 14.0, ('Ce', 'Sr'): 15.0, ('Pr', 'Sr'): 16.0, ('Nd', 'Sr'): 16.0, ('Pm', 'Sr'): 18.0,
-        ('Sm', 'Sr'): 17.0, ('Eu', 'Sr'): 0.0, ('Gd', 'Sr'): 17.0, ('Sr', 'Tb'): 18.0, ('Dy', 'Sr'): 18.0,
-        ('Ho', 'Sr'): 18.0, ('Er', 'Sr'): 20.0, ('Sr', 'Tm'): 20.0, ('Sr', 'Yb'): 1.0, ('Lu', 'Sr'): 21.0,
-        ('Hf', 'Sr'): 50.0, ('Sr', 'Ta'): 73.0, ('Sr', 'W'): 70.0, ('Re', 'Sr'): 39.0, ('Os', 'Sr'): 13.0,
-        ('Ir', 'Sr'): -16.0, ('Pt', 'Sr'): -50.0, ('Au', 'Sr'): -59.0, ('Hg', 'Sr'): -45.0, ('Sr', 'Tl'): -44.0,
-        ('Pb', 'Sr'): -56.0, ('Bi', 'Sr'): -61.0, ('Sr', 'Th'): 27.0, ('Sr', 'U'): 48.0, ('Pu', 'Sr'): 33.0,
-        ('Y', 'Zr'): 9.0, ('Nb', 'Y'): 30.0, ('Mo', 'Y'): 24.0, ('Tc', 'Y'): -29.0, ('Ru', 'Y'): -34.0,
-        ('Rh', 'Y'): -54.0, ('Pd', 'Y'): -84.0, ('Ag', 'Y'): -29.0, ('Cd', 'Y'): -35.0, ('In', 'Y'): -36.0,
-        ('Sn', 'Y'): -51.0, ('Sb', 'Y'): -68.0, ('Cs', 'Y'): 62.0, ('Ba', 'Y'): 20.0, ('La', 'Y'): 0.0,
-        ('Ce', 'Y'): 0.0, ('Pr', 'Y'): 0.0, ('Nd', 'Y'): 0.0, ('Pm', 'Y'): 0.0, ('Sm', 'Y'): 0.0, ('Eu', 'Y'): 14.0,
-        ('Gd', 'Y'): 0.0, ('Tb', 'Y'): 0.0, ('Dy', 'Y'): 0.0, ('Ho', 'Y'): 0.0, ('Er', 'Y'): 0.0, ('Tm', 'Y'): 0.0,
-        ('Y', 'Yb'): 10.0, ('Lu', 'Y'): 0.0, ('Hf', 'Y'): 11.0, ('Ta', 'Y'): 27.0, ('W', 'Y'): 24.0, ('Re', 'Y'): -4.0,
-        ('Os', 'Y'): -28.0, ('Ir', 'Y'): -53.0, ('Pt', 'Y'): -83.0, ('Au', 'Y'): -74.0, ('Hg', 'Y'): -43.0,
-        ('Tl', 'Y'): -35.0, ('Pb', 'Y'): -48.0, ('Bi', 'Y'): -54.0, ('Th', 'Y'): 1.0, ('U', 'Y'): 11.0,
-        ('Pu', 'Y'): 4.0, ('Nb', 'Zr'): 4.0, ('Mo', 'Zr'): -6.0, ('Tc', 'Zr'): -53.0, ('Ru', 'Zr'): -59.0,
-        ('Rh', 'Zr'): -72.0, ('Pd', 'Zr'): -91.0, ('Ag', 'Zr'): -20.0, ('Cd', 'Zr'): -26.0, ('In', 'Zr'): -25.0,
-        ('Sn', 'Zr'): -43.0, ('Sb', 'Zr'): -60.0, ('Cs', 'Zr'): 101.0, ('Ba', 'Zr'): 52.0, ('La', 'Zr'): 13.0,
-        ('Ce', 'Zr'): 12.0, ('Pr', 'Zr'): 10.0, ('Nd', 'Zr'): 10.0, ('Pm', 'Zr'): 9.0, ('Sm', 'Zr'): 9.0,
-        ('Eu', 'Zr'): 42.0, ('Gd', 'Zr'): 9.0, ('Tb', 'Zr'): 8.0, ('Dy', 'Zr'): 8.0, ('Ho', 'Zr'): 9.0,
-        ('Er', 'Zr'): 7.0, ('Tm', 'Zr'): 7.0, ('Yb', 'Zr'): 36.0, ('Lu', 'Zr'): 6.0, ('Hf', 'Zr'): 0.0,
-        ('Ta', 'Zr'): 3.0, ('W', 'Zr'): -9.0, ('Re', 'Zr'): -35.0, ('Os', 'Zr'): -55.0, ('Ir', 'Zr'): -76.0,
-        ('Pt', 'Zr'): -100.0, ('Au', 'Zr'): -74.0, ('Hg', 'Zr'): -31.0, ('Tl', 'Zr'): -19.0, ('Pb', 'Zr'): -33.0,
-        ('Bi', 'Zr'): -40.0, ('Th', 'Zr'): 4.0, ('U', 'Zr'): -3.0, ('Pu', 'Zr'): -3.0, ('Mo', 'Nb'): -6.0,
-        ('Nb', 'Tc'): -36.0, ('Nb', 'Ru'): -41.0, ('Nb', 'Rh'): -46.0, ('Nb', 'Pd'): -53.0, ('Ag', 'Nb'): 16.0,
-        ('Cd', 'Nb'): 11.0, ('In', 'Nb'): 15.0, ('Nb', 'Sn'): -1.0, ('Nb', 'Sb'): -11.0, ('Cs', 'Nb'): 135.0,
-        ('Ba', 'Nb'): 81.0, ('La', 'Nb'): 36.0, ('Ce', 'Nb'): 34.0, ('Nb', 'Pr'): 32.0, ('Nb', 'Nd'): 32.0,
-        ('Nb', 'Pm'): 29.0, ('Nb', 'Sm'): 30.0, ('Eu', 'Nb'): 69.0, ('Gd', 'Nb'): 30.0, ('Nb', 'Tb'): 28.0,
-        ('Dy', 'Nb'): 27.0, ('Ho', 'Nb'): 28.0, ('Er', 'Nb'): 26.0, ('Nb', 'Tm'): 25.0, ('Nb', 'Yb'): 61.0,
-        ('Lu', 'Nb'): 23.0, ('Hf', 'Nb'): 4.0, ('Nb', 'Ta'): 0.0, ('Nb', 'W'): -8.0, ('Nb', 'Re'): -26.0,
-        ('Nb', 'Os'): -39.0, ('Ir', 'Nb'): -53.0, ('Nb', 'Pt'): -67.0, ('Au', 'Nb'): -32.0, ('Hg', 'Nb'): 11.0,
-        ('Nb', 'Tl'): 26.0, ('Nb', 'Pb'): 17.0, ('Bi', 'Nb'): 12.0, ('Nb', 'Th'): 20.0, ('Nb', 'U'): 4.0,
-        ('Nb', 'Pu'): 9.0, ('Mo', 'Tc'): -11.0, ('Mo', 'Ru'): -14.0, ('Mo', 'Rh'): -15.0, ('Mo', 'Pd'): -15.0,
-        ('Ag', 'Mo'): 37.0, ('Cd', 'Mo'): 28.0, ('In', 'Mo'): 33.0, ('Mo', 'Sn'): 20.0, ('Mo', 'Sb'): 17.0,
-        ('Cs', 'Mo'): 128.0, ('Ba', 'Mo'): 73.0, ('La', 'Mo'): 31.0, ('Ce', 'Mo'): 29.0, ('Mo', 'Pr'): 26.0,
-        ('Mo', 'Nd'): 26.0, ('Mo', 'Pm'): 23.0, ('Mo', 'Sm'): 24.0, ('Eu', 'Mo'): 63.0, ('Gd', 'Mo'): 24.0,
-        ('Mo', 'Tb'): 22.0, ('Dy', 'Mo'): 22.0, ('Ho', 'Mo'): 22.0, ('Er', 'Mo'): 20.0, ('Mo', 'Tm'): 19.0,
-        ('Mo', 'Yb'): 55.0, ('Lu', 'Mo'): 17.0, ('Hf', 'Mo'): -4.0, ('Mo', 'Ta'): -5.0, ('Mo', 'W'): 0.0,
-        ('Mo', 'Re'): -7.0, ('Mo', 'Os'): -14.0, ('Ir', 'Mo'): -21.0, ('Mo', 'Pt'): -28.0, ('Au', 'Mo'): 3.0,
-        ('Hg', 'Mo'): 32.0, ('Mo', 'Tl'): 46.0, ('Mo', 'Pb'): 42.0, ('Bi', 'Mo'): 38.0, ('Mo', 'Th'): 13.0,
-        ('Mo', 'U'): 2.0, ('Mo', 'Pu'): 8.0, ('Ru', 'Tc'): 0.0, ('Rh', 'Tc'): 0.0, ('Pd', 'Tc'): 4.0,
-        ('Ag', 'Tc'): 24.0, ('Cd', 'Tc'): 10.0, ('In', 'Tc'): 11.0, ('Sn', 'Tc'): 5.0, ('Sb', 'Tc'): 8.0,
-        ('Cs', 'Tc'): 69.0, ('Ba', 'Tc'): 11.0, ('La', 'Tc'): -23.0, ('Ce', 'Tc'): -25.0, ('Pr', 'Tc'): -27.0,
-        ('Nd', 'Tc'): -27.0, ('Pm', 'Tc'): -30.0, ('Sm', 'Tc'): -29.0, ('Eu', 'Tc'): 6.0, ('Gd', 'Tc'): -29.0,
-        ('Tb', 'Tc'): -30.0, ('Dy', 'Tc'): -30.0, ('Ho', 'Tc'): -29.0, ('Er', 'Tc'): -32.0, ('Tc', 'Tm'): -32.0,
-        ('Tc', 'Yb'): 1.0, ('Lu', 'Tc'): -35.0, ('Hf', 'Tc'): -47.0, ('Ta', 'Tc'): -35.0, ('Tc', 'W'): -7.0,
-        ('Re', 'Tc'): 0.0, ('Os', 'Tc'): 0.0, ('Ir', 'Tc'): -2.0, ('Pt', 'Tc'): -3.0, ('Au', 'Tc'): 14.0,
-        ('Hg', 'Tc'): 18.0, ('Tc', 'Tl'): 25.0, ('Pb', 'Tc'): 26.0, ('Bi', 'Tc'): 23.0, ('Tc', 'Th'): -39.0,
-        ('Tc', 'U'): -31.0, ('Pu', 'Tc'): -26.0, ('Rh', 'Ru'): 1.0, ('Pd', 'Ru'): 6.0, ('Ag', 'Ru'): 23.0,
-        ('Cd', 'Ru'): 9.0, ('In', 'Ru'): 10.0, ('Ru', 'Sn'): 4.0, ('Ru', 'Sb'): 9.0, ('Cs', 'Ru'): 64.0,
-        ('Ba', 'Ru'): 6.0, ('La', 'Ru'): -28.0, ('Ce', 'Ru'): -30.0, ('Pr', 'Ru'): -32.0, ('Nd', 'Ru'): -32.0,
-        ('Pm', 'Ru'): -35.0, ('Ru', 'Sm'): -34.0, ('Eu', 'Ru'): 2.0, ('Gd', 'Ru'): -34.0, ('Ru', 'Tb'): -35.0,
-        ('Dy', 'Ru'): -35.0, ('Ho', 'Ru'): -34.0, ('Er', 'Ru'): -37.0, ('Ru', 'Tm'): -37.0, ('Ru', 'Yb'): -4.0,
-        ('Lu', 'Ru'): -40.0, ('Hf', 'Ru'): -52.0, ('Ru', 'Ta'): -39.0, ('Ru', 'W'): -10.0, ('Re', 'Ru'): -1.0,
-        ('Os', 'Ru'): 0.0, ('Ir', 'Ru'): -1.0, ('Pt', 'Ru'): -1.0, ('Au', 'Ru'): 15.0, ('Hg', 'Ru'): 18.0,
-        ('Ru', 'Tl'): 24.0, ('Pb', 'Ru'): 25.0, ('Bi', 'Ru'): 23.0, ('Ru', 'Th'): -45.0, ('Ru', 'U'): -36.0,
-        ('Pu', 'Ru'): -30.0, ('Pd', 'Rh'): 2.0, ('Ag', 'Rh'): 10.0, ('Cd', 'Rh'): -6.0, ('In', 'Rh'): -8.0,
-        ('Rh', 'Sn'): -13.0, ('Rh', 'Sb'): -8.0, ('Cs', 'Rh'): 34.0, ('Ba', 'Rh'): -21.0, ('La', 'Rh'): -50.0,
-        ('Ce', 'Rh'): -52.0, ('Pr', 'Rh'): -53.0, ('Nd', 'Rh'): -53.0, ('Pm', 'Rh'): -56.0, ('Rh', 'Sm'): -54.0,
-        ('Eu', 'Rh'): -24.0, ('Gd', 'Rh'): -54.0, ('Rh', 'Tb'): -56.0, ('Dy', 'Rh'): -55.0, ('Ho', 'Rh'): -54.0,
-        ('Er', 'Rh'): -57.0, ('Rh', 'Tm'): -56.0, ('Rh', 'Yb'): -28.0, ('Lu', 'Rh'): -59.0, ('Hf', 'Rh'): -63.0,
-        ('Rh', 'Ta'): -45.0, ('Rh', 'W'): -9.0, ('Re', 'Rh'): 1.0, ('Os', 'Rh'): 2.0, ('Ir', 'Rh'): 1.0,
-        ('Pt', 'Rh'): -2.0, ('Au', 'Rh'): 7.0, ('Hg', 'Rh'): 2.0, ('Rh', 'Tl'): 5.0, ('Pb', 'Rh'): 6.0,
-        ('Bi', 'Rh'): 3.0, ('Rh', 'Th'): -63.0, ('Rh', 'U'): -46.0, ('Pu', 'Rh'): -42.0, ('Ag', 'Pd'): -7.0,
-        ('Cd', 'Pd'): -26.0, ('In', 'Pd'): -31.0, ('Pd', 'Sn'): -34.0, ('Pd', 'Sb'): -28.0, ('Cs', 'Pd'): -9.0,
-        ('Ba', 'Pd'): -62.0, ('La', 'Pd'): -82.0, ('Ce', 'Pd'): -83.0, ('Pd', 'Pr'): -83.0, ('Nd', 'Pd'): -83.0,
-        ('Pd', 'Pm'): -86.0, ('Pd', 'Sm'): -84.0, ('Eu', 'Pd'): -61.0, ('Gd', 'Pd'): -84.0, ('Pd', 'Tb'): -85.0,
-        ('Dy', 'Pd'): -84.0, ('Ho', 'Pd'): -83.0, ('Er', 'Pd'): -85.0, ('Pd', 'Tm'): -85.0, ('Pd', 'Yb'): -62.0,
-        ('Lu', 'Pd'): -87.0, ('Hf', 'Pd'): -80.0, ('Pd', 'Ta'): -52.0, ('Pd', 'W'): -6.0, ('Pd', 'Re'): 6.0,
-        ('Os', 'Pd'): 8.0, ('Ir', 'Pd'): 6.0, ('Pd', 'Pt'): 2.0, ('Au', 'Pd'): 0.0, ('Hg', 'Pd'): -18.0,
-        ('Pd', 'Tl'): -21.0, ('Pb', 'Pd'): -18.0, ('Bi', 'Pd'): -21.0, ('Pd', 'Th'): -91.0, ('Pd', 'U'): -59.0,
-        ('Pd', 'Pu'): -58.0, ('Ag', 'Cd'): -2.0, ('Ag', 'In'): -2.0, ('Ag', 'Sn'): -3.0, ('Ag', 'Sb'): -4.0,
-        ('Ag', 'Cs'): 8.0, ('Ag', 'Ba'): -28.0, ('Ag', 'La'): -30.0, ('Ag', 'Ce'): -30.0, ('Ag', 'Pr'): -30.0,
-        ('Ag', 'Nd'): -29.0, ('Ag', 'Pm'): -30.0, ('Ag', 'Sm'): -30.0, ('Ag', 'Eu'): -27.0, ('Ag', 'Gd'): -29.0,
-        ('Ag', 'Tb'): -29.0, ('Ag', 'Dy'): -29.0, ('Ag', 'Ho'): -29.0, ('Ag', 'Er'): -29.0, ('Ag', 'Tm'): -29.0,
-        ('Ag', 'Yb'): -28.0, ('Ag', 'Lu'): -30.0, ('Ag', 'Hf'): -13.0, ('Ag', 'Ta'): 15.0, ('Ag', 'W'): 43.0,
-        ('Ag', 'Re'): 38.0, ('Ag', 'Os'): 28.0, ('Ag', 'Ir'): 16.0, ('Ag', 'Pt'): -1.0, ('Ag', 'Au'): -6.0,
-        ('Ag', 'Hg'): -1.0, ('Ag', 'Tl'): 3.0, ('Ag', 'Pb'): 3.0, ('Ag', 'Bi'): 2.0, ('Ag', 'Th'): -29.0,
-        ('Ag', 'U'): 0.0, ('Ag', 'Pu'): -6.0, ('Cd', 'In'): 0.0, ('Cd', 'Sn'): 0.0, ('Cd', 'Sb'): -2.0,
-        ('Cd', 'Cs'): 1.0, ('Ba', 'Cd'): -36.0, ('Cd', 'La'): -36.0, ('Cd', 'Ce'): -36.0, ('Cd', 'Pr'): -35.0,
-        ('Cd', 'Nd'): -35.0, ('Cd', 'Pm'): -35.0, ('Cd', 'Sm'): -35.0, ('Cd', 'Eu'): -32.0, ('Cd', 'Gd'): -35.0,
-        ('Cd', 'Tb'): -34.0, ('Cd', 'Dy'): -34.0, ('Cd', 'Ho'): -33.0, ('Cd', 'Er'): -33.0, ('Cd', 'Tm'): -33.0,
-        ('Cd', 'Yb'): -31.0, ('Cd', 'Lu'): -33.0, ('Cd', 'Hf'): -19.0, ('Cd', 'Ta'): 9.0, ('Cd', 'W'): 33.0,
-        ('Cd', 'Re'): 25.0, ('Cd', 'Os'): 14.0, ('Cd', 'Ir'): 0.0, ('Cd', 'Pt'): -18.0, ('Au', 'Cd'): -11.0,
-        ('Cd', 'Hg'): 0.0, ('Cd', 'Tl'): 2.0, ('Cd', 'Pb'): 2.0, ('Bi', 'Cd'): 1.0, ('Cd', 'Th'): -32.0,
-        ('Cd', 'U'): -8.0, ('Cd', 'Pu'): -16.0, ('In', 'Sn'): 0.0, ('In', 'Sb'): -4.0, ('Cs', 'In'): -4.0,
-        ('Ba', 'In'): -42.0, ('In', 'La'): -39.0, ('Ce', 'In'): -38.0, ('In', 'Pr'): -37.0, ('In', 'Nd'): -37.0,
-        ('In', 'Pm'): -37.0, ('In', 'Sm'): -36.0, ('Eu', 'In'): -35.0, ('Gd', 'In'): -36.0, ('In', 'Tb'): -35.0,
-        ('Dy', 'In'): -35.0, ('Ho', 'In'): -35.0, ('Er', 'In'): -34.0, ('In', 'Tm'): -34.0, ('In', 'Yb'): -34.0,
-        ('In', 'Lu'): -34.0, ('Hf', 'In'): -18.0, ('In', 'Ta'): 13.0, ('In', 'W'): 38.0, ('In', 'Re'): 29.0,
-        ('In', 'Os'): 16.0, ('In', 'Ir'): 0.0, ('In', 'Pt'): -21.0, ('Au', 'In'): -11.0, ('Hg', 'In'): -1.0,
-        ('In', 'Tl'): 0.0, ('In', 'Pb'): -1.0, ('Bi', 'In'): -1.0, ('In', 'Th'): -31.0, ('In', 'U'): -7.0,
-        ('In', 'Pu'): -16.0, ('Sb', 'Sn'): -1.0, ('Cs', 'Sn'): -7.0, ('Ba', 'Sn'): -51.0, ('La', 'Sn'): -53.0,
-        ('Ce', 'Sn'): -52.0, ('Pr', 'Sn'): -52.0, ('Nd', 'Sn'): -51.0, ('Pm', 'Sn'): -52.0, ('Sm', 'Sn'): -51.0,
-        ('Eu', 'Sn'): -44.0, ('Gd', 'Sn'): -51.0, ('Sn', 'Tb'): -50.0, ('Dy', 'Sn'): -50.0, ('Ho', 'Sn'): -49.0,
-        ('Er', 'Sn'): -49.0, ('Sn', 'Tm'): -49.0, ('Sn', 'Yb'): -43.0, ('Lu', 'Sn'): -49.0, ('Hf', 'Sn'): -35.0,
-        ('Sn', 'Ta'): -3.0, ('Sn', 'W'): 27.0, ('Re', 'Sn'): 20.0, ('Os', 'Sn'): 9.0, ('Ir', 'Sn'): -5.0,
-        ('Pt', 'Sn'): -25.0, ('Au', 'Sn'): -10.0, ('Hg', 'Sn'): 0.0, ('Sn', 'Tl'): 2.0, ('Pb', 'Sn'): 2.0,
-        ('Bi', 'Sn'): 1.0, ('Sn', 'Th'): -48.0, ('Sn', 'U'): -23.0, ('Pu', 'Sn'): -30.0, ('Cs', 'Sb'): -25.0,
-        ('Ba', 'Sb'): -72.0, ('La', 'Sb'): -71.0, ('Ce', 'Sb'): -70.0, ('Pr', 'Sb'): -69.0, ('Nd', 'Sb'): -69.0,
-        ('Pm', 'Sb'): -69.0, ('Sb', 'Sm'): -68.0, ('Eu', 'Sb'): -63.0, ('Gd', 'Sb'): -68.0, ('Sb', 'Tb'): -67.0,
-        ('Dy', 'Sb'): -67.0, ('Ho', 'Sb'): -66.0, ('Er', 'Sb'): -66.0, ('Sb', 'Tm'): -66.0, ('Sb', 'Yb'): -61.0,
-        ('Lu', 'Sb'): -66.0, ('Hf', 'Sb'): -50.0, ('Sb', 'Ta'): -13.0, ('Sb', 'W'): 25.0, ('Re', 'Sb'): 23.0,
-        ('Os', 'Sb'): 14.0, ('Ir', 'Sb'): 1.0, ('Pt', 'Sb'): -17.0, ('Au', 'Sb'): -4.0, ('Hg', 'Sb'): -1.0,
-        ('Sb', 'Tl'): -1.0, ('Pb', 'Sb'): 1.0, ('Bi', 'Sb'): 1.0, ('Sb', 'Th'): -65.0, ('Sb', 'U'): -34.0,
-        ('Pu', 'Sb'): -42.0, ('Ba', 'Cs'): 12.0, ('Cs', 'La'): 57.0, ('Ce', 'Cs'): 59.0, ('Cs', 'Pr'): 60.0,
-        ('Cs', 'Nd'): 60.0, ('Cs', 'Pm'): 63.0, ('Cs', 'Sm'): 62.0, ('Cs', 'Eu'): 16.0, ('Cs', 'Gd'): 62.0,
-        ('Cs', 'Tb'): 64.0, ('Cs', 'Dy'): 63.0, ('Cs', 'Ho'): 62.0, ('Cs', 'Er'): 65.0, ('Cs', 'Tm'): 65.0,
-        ('Cs', 'Yb'): 19.0, ('Cs', 'Lu'): 67.0, ('Cs', 'Hf'): 104.0, ('Cs', 'Ta'): 130.0, ('Cs', 'W'): 132.0,
-        ('Cs', 'Re'): 101.0, ('Cs', 'Os'): 74.0, ('Cs', 'Ir'): 45.0, ('Cs', 'Pt'): 10.0, ('Au', 'Cs'): -9.0,
-        ('Cs', 'Hg'): -11.0, ('Cs', 'Tl'): -15.0, ('Cs', 'Pb'): -25.0, ('Bi', 'Cs'): -27.0, ('Cs', 'Th'): 78.0,
-        ('Cs', 'U'): 104.0, ('Cs', 'Pu'): 81.0, ('Ba', 'La'): 16.0, ('Ba', 'Ce'): 17.0, ('Ba', 'Pr'): 18.0,
-        ('Ba', 'Nd'): 18.0, ('Ba', 'Pm'): 20.0, ('Ba', 'Sm'): 20.0, ('Ba', 'Eu'): 0.0, ('Ba', 'Gd'): 20.0,
-        ('Ba', 'Tb'): 21.0, ('Ba', 'Dy'): 21.0, ('Ba', 'Ho'): 20.0, ('Ba', 'Er'): 22.0, ('Ba', 'Tm'): 22.0,
-        ('Ba', 'Yb'): 1.0, ('Ba', 'Lu'): 24.0, ('Ba', 'Hf'): 54.0, ('Ba', 'Ta'): 77.0, ('Ba', 'W'): 74.0,
-        ('Ba', 'Re'): 42.0, ('Ba', 'Os'): 15.0, ('Ba', 'Ir'): -14.0, ('Ba', 'Pt'): -50.0, ('Au', 'Ba'): -60.0,
-        ('Ba', 'Hg'): -49.0, ('Ba', 'Tl'): -49.0, ('Ba', 'Pb'): -62.0, ('Ba', 'Bi'): -68.0, ('Ba', 'Th'): 30.0,
-        ('Ba', 'U'): 52.0, ('Ba', 'Pu'): 36.0, ('Ce', 'La'): 0.0, ('La', 'Pr'): 0.0, ('La', 'Nd'): 0.0,
-        ('La', 'Pm'): 0.0, ('La', 'Sm'): 0.0, ('Eu', 'La'): 11.0, ('Gd', 'La'): 0.0, ('La', 'Tb'): 0.0,
-        ('Dy', 'La'): 0.0, ('Ho', 'La'): 0.0, ('Er', 'La'): 1.0, ('La', 'Tm'): 1.0, ('La', 'Yb'): 8.0,
-        ('La', 'Lu'): 1.0, ('Hf', 'La'): 15.0, ('La', 'Ta'): 33.0, ('La', 'W'): 32.0, ('La', 'Re'): 3.0,
-        ('La', 'Os'): -21.0, ('Ir', 'La'): -48.0, ('La', 'Pt'): -80.0, ('Au', 'La'): -73.0, ('Hg', 'La'): -45.0,
-        ('La', 'Tl'): -38.0, ('La', 'Pb'): -51.0, ('Bi', 'La'): -58.0, ('La', 'Th'): 3.0, ('La', 'U'): 15.0,
-        ('La', 'Pu'): 7.0, ('Ce', 'Pr'): 0.0, ('Ce', 'Nd'): 0.0, ('Ce', 'Pm'): 0.0, ('Ce', 'Sm'): 0.0,
-        ('Ce', 'Eu'): 12.0, ('Ce', 'Gd'): 0.0, ('Ce', 'Tb'): 0.0, ('Ce', 'Dy'): 0.0, ('Ce', 'Ho'): 0.0,
-        ('Ce', 'Er'): 0.0, ('Ce', 'Tm'): 0.0, ('Ce', 'Yb'): 8.0, ('Ce', 'Lu'): 1.0, ('Ce', 'Hf'): 14.0,
-        ('Ce', 'Ta'): 31.0, ('Ce', 'W'): 29.0, ('Ce', 'Re'): 0.0, ('Ce', 'Os'): -24.0, ('Ce', 'Ir'): -50.0,
-        ('Ce', 'Pt'): -81.0, ('Au', 'Ce'): -73.0, ('Ce', 'Hg'): -44.0, ('Ce', 'Tl'): -37.0, ('Ce', 'Pb'): -50.0,
-        ('Bi', 'Ce'): -57.0, ('Ce', 'Th'): 2.0, ('Ce', 'U'): 14.0, ('Ce', 'Pu'): 6.0, ('Nd', 'Pr'): 0.0,
-        ('Pm', 'Pr'): 0.0, ('Pr', 'Sm'): 0.0, ('Eu', 'Pr'): 13.0, ('Gd', 'Pr'): 0.0, ('Pr', 'Tb'): 0.0,
-        ('Dy', 'Pr'): 0.0, ('Ho', 'Pr'): 0.0, ('Er', 'Pr'): 0.0, ('Pr', 'Tm'): 0.0, ('Pr', 'Yb'): 9.0,
-        ('Lu', 'Pr'): 0.0, ('Hf', 'Pr'): 13.0, ('Pr', 'Ta'): 29.0, ('Pr', 'W'): 26.0, ('Pr', 'Re'): -2.0,
-        ('Os', 'Pr'): -26.0, ('Ir', 'Pr'): -52.0, ('Pr', 'Pt'): -82.0, ('Au', 'Pr'): -73.0, ('Hg', 'Pr'): -43.0,
-        ('Pr', 'Tl'): -36.0, ('Pb', 'Pr'): -49.0, ('Bi', 'Pr'): -56.0, ('Pr', 'Th'): 2.0, ('Pr', 'U'): 12.0,
-        ('Pr', 'Pu'): 5.0, ('Nd', 'Pm'): 0.0, ('Nd', 'Sm'): 0.0, ('Eu', 'Nd'): 13.0, ('Gd', 'Nd'): 0.0,
-        ('Nd', 'Tb'): 0.0, ('Dy', 'Nd'): 0.0, ('Ho', 'Nd'): 0.0, ('Er', 'Nd'): 0.0, ('Nd', 'Tm'): 0.0,
-        ('Nd', 'Yb'): 9.0, ('Lu', 'Nd'): 0.0, ('Hf', 'Nd'): 13.0, ('Nd', 'Ta'): 29.0, ('Nd', 'W'): 26.0,
-        ('Nd', 'Re'): -2.0, ('Nd', 'Os'): -26.0, ('Ir', 'Nd'): -51.0, ('Nd', 'Pt'): -82.0, ('Au', 'Nd'): -73.0,
-        ('Hg', 'Nd'): -43.0, ('Nd', 'Tl'): -36.0, ('Nd', 'Pb'): -49.0, ('Bi', 'Nd'): -55.0, ('Nd', 'Th'): 2.0,
-        ('Nd', 'U'): 12.0, ('Nd', 'Pu'): 5.0, ('Pm', 'Sm'): 0.0, ('Eu', 'Pm'): 14.0, ('Gd', 'Pm'): 0.0,
-        ('Pm', 'Tb'): 0.0, ('Dy', 'Pm'): 0.0, ('Ho', 'Pm'): 0.0, ('Er', 'Pm'): 0.0, ('Pm', 'Tm'): 0.0,
-        ('Pm', 'Yb'): 11.0, ('Lu', 'Pm'): 0.0, ('Hf', 'Pm'): 11.0, ('Pm', 'Ta'): 27.0, ('Pm', 'W'): 23.0,
-        ('Pm', 'Re'): -5.0, ('Os', 'Pm'): -29.0, ('Ir', 'Pm'): -55.0, ('Pm', 'Pt'): -85.0, ('Au', 'Pm'): -75.0,
-        ('Hg', 'Pm'): -43.0, ('Pm', 'Tl'): -35.0, ('Pb', 'Pm'): -49.0, ('Bi', 'Pm'): -55.0, ('Pm', 'Th'): 1.0,
-        ('Pm', 'U'): 10.0, ('Pm', 'Pu'): 4.0, ('Eu', 'Sm'): 14.0, ('Gd', 'Sm'): 0.0, ('Sm', 'Tb'): 0.0,
-        ('Dy', 'Sm'): 0.0, ('Ho', 'Sm'): 0.0, ('Er', 'Sm'): 0.0, ('Sm', 'Tm'): 0.0, ('Sm', 'Yb'): 10.0,
-        ('Lu', 'Sm'): 0.0, ('Hf', 'Sm'): 11.0, ('Sm', 'Ta'): 27.0, ('Sm', 'W'): 24.0, ('Re', 'Sm'): -4.0,
-        ('Os', 'Sm'): -28.0, ('Ir', 'Sm'): -53.0, ('Pt', 'Sm'): -84.0, ('Au', 'Sm'): -74.0, ('Hg', 'Sm'): -43.0,
-        ('Sm', 'Tl'): -35.0, ('Pb', 'Sm'): -48.0, ('Bi', 'Sm'): -54.0, ('Sm', 'Th'): 1.0, ('Sm', 'U'): 11.0,
-        ('Pu', 'Sm'): 4.0, ('Eu', 'Gd'): 14.0, ('Eu', 'Tb'): 15.0, ('Dy', 'Eu'): 15.0, ('Eu', 'Ho'): 15.0,
-        ('Er', 'Eu'): 16.0, ('Eu', 'Tm'): 16.0, ('Eu', 'Yb'): 0.0, ('Eu', 'Lu'): 18.0, ('Eu', 'Hf'): 44.0,
-        ('Eu', 'Ta'): 66.0, ('Eu', 'W'): 64.0, ('Eu', 'Re'): 34.0, ('Eu', 'Os'): 9.0, ('Eu', 'Ir'): -18.0,
-        ('Eu', 'Pt'): -51.0, ('Au', 'Eu'): -58.0, ('Eu', 'Hg'): -43.0, ('Eu', 'Tl'): -41.0, ('Eu', 'Pb'): -53.0,
-        ('Bi', 'Eu'): -58.0, ('Eu', 'Th'): 23.0, ('Eu', 'U'): 43.0, ('Eu', 'Pu'): 29.0, ('Gd', 'Tb'): 0.0,
-        ('Dy', 'Gd'): 0.0, ('Gd', 'Ho'): 0.0, ('Er', 'Gd'): 0.0, ('Gd', 'Tm'): 0.0, ('Gd', 'Yb'): 10.0,
-        ('Gd', 'Lu'): 0.0, ('Gd', 'Hf'): 11.0, ('Gd', 'Ta'): 27.0, ('Gd', 'W'): 24.0, ('Gd', 'Re'): -4.0,
-        ('Gd', 'Os'): -28.0, ('Gd', 'Ir'): -53.0, ('Gd', 'Pt'): -83.0, ('Au', 'Gd'): -74.0, ('Gd', 'Hg'): -43.0,
-        ('Gd', 'Tl'): -35.0, ('Gd', 'Pb'): -48.0, ('Bi', 'Gd'): -54.0, ('Gd', 'Th'): 1.0, ('Gd', 'U'): 11.0,
-        ('Gd', 'Pu'): 4.0, ('Dy', 'Tb'): 0.0, ('Ho', 'Tb'): 0.0, ('Er', 'Tb'): 0.0, ('Tb', 'Tm'): 0.0,
-        ('Tb', 'Yb'): 11.0, ('Lu', 'Tb'): 0.0, ('Hf', 'Tb'): 10.0, ('Ta', 'Tb'): 25.0, ('Tb', 'W'): 21.0,
-        ('Re', 'Tb'): -7.0, ('Os', 'Tb'): -30.0, ('Ir', 'Tb'): -55.0, ('Pt', 'Tb'): -85.0, ('Au', 'Tb'): -74.0,
-        ('Hg', 'Tb'): -42.0, ('Tb', 'Tl'): -34.0, ('Pb', 'Tb'): -47.0, ('Bi', 'Tb'): -53.0, ('Tb', 'Th'): 1.0,
-        ('Tb', 'U'): 10.0, ('Pu', 'Tb'): 3.0, ('Dy', 'Ho'): 0.0, ('Dy', 'Er'): 0.0, ('Dy', 'Tm'): 0.0,
-        ('Dy', 'Yb'): 11.0, ('Dy', 'Lu'): 0.0, ('Dy', 'Hf'): 10.0, ('Dy', 'Ta'): 25.0, ('Dy', 'W'): 21.0,
-        ('Dy', 'Re'): -7.0, ('Dy', 'Os'): -29.0, ('Dy', 'Ir'): -55.0, ('Dy', 'Pt'): -84.0, ('Au', 'Dy'): -74.0,
-        ('Dy', 'Hg'): -42.0, ('Dy', 'Tl'): -34.0, ('Dy', 'Pb'): -46.0, ('Bi', 'Dy'): -53.0, ('Dy', 'Th'): 1.0,
-        ('Dy', 'U'): 9.0, ('Dy', 'Pu'): 3.0, ('Er', 'Ho'): 0.0, ('Ho', 'Tm'): 0.0, ('Ho', 'Yb'): 11.0,
-        ('Ho', 'Lu'): 0.0, ('Hf', 'Ho'): 10.0, ('Ho', 'Ta'): 26.0, ('Ho', 'W'): 22.0, ('Ho', 'Re'): -5.0,
-        ('Ho', 'Os'): -28.0, ('Ho', 'Ir'): -53.0, ('Ho', 'Pt'): -83.0, ('Au', 'Ho'): -72.0, ('Hg', 'Ho'): -41.0,
-        ('Ho', 'Tl'): -33.0, ('Ho', 'Pb'): -46.0, ('Bi', 'Ho'): -52.0, ('Ho', 'Th'): 1.0, ('Ho', 'U'): 10.0,
-        ('Ho', 'Pu'): 3.0, ('Er', 'Tm'): 0.0, ('Er', 'Yb'): 12.0, ('Er', 'Lu'): 0.0, ('Er', 'Hf'): 9.0,
-        ('Er', 'Ta'): 23.0, ('Er', 'W'): 19.0, ('Er', 'Re'): -9.0, ('Er', 'Os'): -31.0, ('Er', 'Ir'): -56.0,
-        ('Er', 'Pt'): -86.0, ('Au', 'Er'): -74.0, ('Er', 'Hg'): -41.0, ('Er', 'Tl'): -33.0, ('Er', 'Pb'): -45.0,
-        ('Bi', 'Er'): -52.0, ('Er', 'Th'): 1.0, ('Er', 'U'): 8.0, ('Er', 'Pu'): 2.0, ('Tm', 'Yb'): 12.0,
-        ('Lu', 'Tm'): 0.0, ('Hf', 'Tm'): 9.0, ('Ta', 'Tm'): 23.0, ('Tm', 'W'): 19.0, ('Re', 'Tm'): -9.0,
-        ('Os', 'Tm'): -31.0, ('Ir', 'Tm'): -56.0, ('Pt', 'Tm'): -85.0, ('Au', 'Tm'): -74.0, ('Hg', 'Tm'): -41.0,
-        ('Tl', 'Tm'): -32.0, ('Pb', 'Tm'): -45.0, ('Bi', 'Tm'): -51.0, ('Th', 'Tm'): 1.0, ('Tm', 'U'): 8.0,
-        ('Pu', 'Tm'): 2.0, ('Lu', 'Yb'): 14.0, ('Hf', 'Yb'): 38.0, ('Ta', 'Yb'): 58.0, ('W', 'Yb'): 56.0,
-        ('Re', 'Yb'): 28.0, ('Os', 'Yb'): 4.0, ('Ir', 'Yb'): -22.0, ('Pt', 'Yb'): -54.0, ('Au', 'Yb'): -59.0,
-        ('Hg', 'Yb'): -42.0, ('Tl', 'Yb'): -39.0, ('Pb', 'Yb'): -50.0, ('Bi', 'Yb'): -55.0, ('Th', 'Yb'): 18.0,
-        ('U', 'Yb'): 36.0, ('Pu', 'Yb'): 24.0, ('Hf', 'Lu'): 8.0, ('Lu', 'Ta'): 21.0, ('Lu', 'W'): 16.0,
-        ('Lu', 'Re'): -12.0, ('Lu', 'Os'): -34.0, ('Ir', 'Lu'): -59.0, ('Lu', 'Pt'): -88.0, ('Au', 'Lu'): -75.0,
-        ('Hg', 'Lu'): -41.0, ('Lu', 'Tl'): -32.0, ('Lu', 'Pb'): -45.0, ('Bi', 'Lu'): -51.0, ('Lu', 'Th'): 0.0,
-        ('Lu', 'U'): 7.0, ('Lu', 'Pu'): 1.0, ('Hf', 'Ta'): 3.0, ('Hf', 'W'): -6.0, ('Hf', 'Re'): -30.0,
-        ('Hf', 'Os'): -48.0, ('Hf', 'Ir'): -68.0, ('Hf', 'Pt'): -90.0, ('Au', 'Hf'): -63.0, ('Hf', 'Hg'): -23.0,
-        ('Hf', 'Tl'): -11.0, ('Hf', 'Pb'): -23.0, ('Bi', 'Hf'): -30.0, ('Hf', 'Th'): 6.0, ('Hf', 'U'): -2.0,
-        ('Hf', 'Pu'): -1.0, ('Ta', 'W'): -7.0, ('Re', 'Ta'): -24.0, ('Os', 'Ta'): -38.0, ('Ir', 'Ta'): -52.0,
-        ('Pt', 'Ta'): -66.0, ('Au', 'Ta'): -32.0, ('Hg', 'Ta'): 9.0, ('Ta', 'Tl'): 24.0, ('Pb', 'Ta'): 15.0,
-        ('Bi', 'Ta'): 9.0, ('Ta', 'Th'): 18.0, ('Ta', 'U'): 3.0, ('Pu', 'Ta'): 8.0, ('Re', 'W'): -4.0,
-        ('Os', 'W'): -10.0, ('Ir', 'W'): -16.0, ('Pt', 'W'): -20.0, ('Au', 'W'): 12.0, ('Hg', 'W'): 38.0,
-        ('Tl', 'W'): 52.0, ('Pb', 'W'): 49.0, ('Bi', 'W'): 45.0, ('Th', 'W'): 12.0, ('U', 'W'): 1.0, ('Pu', 'W'): 8.0,
-        ('Os', 'Re'): -1.0, ('Ir', 'Re'): -3.0, ('Pt', 'Re'): -4.0, ('Au', 'Re'): 20.0, ('Hg', 'Re'): 33.0,
-        ('Re', 'Tl'): 44.0, ('Pb', 'Re'): 44.0, ('Bi', 'Re'): 40.0, ('Re', 'Th'): -16.0, ('Re', 'U'): -17.0,
-        ('Pu', 'Re'): -10.0, ('Ir', 'Os'): -1.0, ('Os', 'Pt'): 0.0, ('Au', 'Os'): 18.0, ('Hg', 'Os'): 23.0,
-        ('Os', 'Tl'): 30.0, ('Os', 'Pb'): 32.0, ('Bi', 'Os'): 29.0, ('Os', 'Th'): -39.0, ('Os', 'U'): -33.0,
-        ('Os', 'Pu'): -26.0, ('Ir', 'Pt'): 0.0, ('Au', 'Ir'): 13.0, ('Hg', 'Ir'): 9.0, ('Ir', 'Tl'): 14.0,
-        ('Ir', 'Pb'): 16.0, ('Bi', 'Ir'): 14.0, ('Ir', 'Th'): -64.0, ('Ir', 'U'): -50.0, ('Ir', 'Pu'): -44.0,
-        ('Au', 'Pt'): 4.0, ('Hg', 'Pt'): -9.0, ('Pt', 'Tl'): -8.0, ('Pb', 'Pt'): -5.0, ('Bi', 'Pt'): -8.0,
-        ('Pt', 'Th'): -94.0, ('Pt', 'U'): -68.0, ('Pt', 'Pu'): -63.0, ('Au', 'Hg'): -4.0, ('Au', 'Tl'): -2.0,
-        ('Au', 'Pb'): 2.0, ('Au', 'Bi'): 2.0, ('Au', 'Th'): -78.0, ('Au', 'U'): -43.0, ('Au', 'Pu'): -45.0,
-        ('Hg', 'Tl'): 1.0, ('Hg', 'Pb'): 1.0, ('Bi', 'Hg'): 1.0, ('Hg', 'Th'): -39.0, ('Hg', 'U'): -10.0,
-        ('Hg', 'Pu'): -18.0, ('Pb', 'Tl'): -1.0, ('Bi', 'Tl'): -1.0, ('Th', 'Tl'): -28.0, ('Tl', 'U'): 1.0,
-        ('Pu', 'Tl'): -10.0, ('Bi', 'Pb'): 0.0, ('Pb', 'Th'): -41.0, ('Pb', 'U'): -9.0, ('Pb', 'Pu'): -20.0,
-        ('Bi', 'Th'): -48.0, ('Bi', 'U'): -15.0, ('Bi', 'Pu'): -26.0, ('Th', 'U'): 4.0, ('Pu', 'Th'): 0.0,
-        ('Pu', 'U'): 1.0
-}
+
+def __getattr__(name):
+    """Returns the pair values, loaded from the binary database on first access, as ``_mixing_data``"""
+    if name == '_mixing_data':
+        return pair_data('mixing_enthalpy')
+    raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
 
 
 def MixingEnthalpy(pair=None):
@@ -575,7 +57,8 @@ def MixingEnthalpy(pair=None):
         raise SyntaxError("Usage: Mixing(('X', 'Y')) where X and Y are element names.")
 
     _pair = tuple(sorted(pair))
-    if _pair not in _mixing_data:
+    data = pair_data('mixing_enthalpy')
+    if _pair not in data:
         raise KeyError('The requested pair does not exist in the mixing enthalpy database.')
 
-    return _mixing_data[_pair]
+    return data[_pair]
@@ -0,0 +1,148 @@
+#!/usr/bin/env python3
+
+# Copyright (C) 2022  Doguhan Sariturk
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+import numpy as np
+
+__author__ = 'Doguhan Sariturk'
+__email__ = 'dogu.sariturk@gmail.com'
+
+
+class PairMatrix:
+    """Dense, symmetric matrix of pair values over every element of the database.
+
+    Missing pairs are stored as NaN and the diagonal is zero.
+
+    Parameters
+    ----------
+    pair_data : dict
+        Pair values indexed by alphabetically sorted element tuples.
+
+    symbols : sequence of str
+        Element symbols, in row/column order.
+
+    name : str, optional
+        Name of the database, used in error messages.
+
+    Attributes
+    ----------
+    symbols : list of str
+        Element symbols, in row/column order.
+
+    index : dict
+        Row/column index of each element symbol.
+
+    values : numpy.ndarray
+        Read-only (E, E) matrix of pair values.
+    """
+
+    def __init__(self, pair_data, symbols, name='pair'):
+        index = {symbol: idx for idx, symbol in enumerate(symbols)}
+        pairs = np.array([[index[first], index[second]] for first, second in pair_data], dtype=np.intp).reshape(-1, 2)
+        self._setup(list(symbols), pairs, list(pair_data.values()), name)
+
+    @classmethod
+    def from_arrays(cls, symbols, pairs, values, name='pair'):
+        """Creates the matrix from pair indices
+
+        Parameters
+        ----------
+        symbols : sequence of str
+            Element symbols, in row/column order
+
+        pairs : numpy.ndarray
+            (P, 2) row/column indices of the pairs
+
+        values : numpy.ndarray
+            (P,) values of the pairs
+
+        name : str, optional
+            Name of the database, used in error messages
+
+        Returns
+        -------
+        PairMatrix
+            Matrix of the pair values
+        """
+        self = cls.__new__(cls)
+        self._setup(list(symbols), np.asarray(pairs, dtype=np.intp), values, name)
+        return self
+
+    def _setup(self, symbols, pairs, values, name):
+        self.name = name
+        self.symbols = symbols
+        self.index = {symbol: idx for idx, symbol in enumerate(self.symbols)}
+
+        self.values = np.full((len(self.symbols), len(self.symbols)), np.nan)
+        np.fill_diagonal(self.values, 0)
+        self.values[pairs[:, 0], pairs[:, 1]] = values
+        self.values[pairs[:, 1], pairs[:, 0]] = values
+        self.values.flags.writeable = False
+
+    @property
+    def missing(self):
+        """numpy.ndarray: Boolean (E, E) mask of the pairs that do not exist in the database"""
+        return np.isnan(self.values)
+
+    def indices(self, elements):
+        """Returns the row/column indices of the given elements
+
+        Parameters
+        ----------
+        elements : sequence of str
+            Element symbols
+
+        Raises
+        ------
+        KeyError
+            If one of the elements does not exist in the database
+
+        Returns
+        -------
+        numpy.ndarray
+            Integer indices of the elements
+        """
+        try:
+            return np.array([self.index[elm] for elm in elements], dtype=np.intp)
+        except KeyError:
+            raise KeyError('The requested element does not exist in the elements database.') from None
+
+    def take(self, elements, check=True):
+        """Returns the (E', E') sub-matrix of the given elements
+
+        Parameters
+        ----------
+        elements : sequence of str
+            Element symbols, in row/column order of the sub-matrix
+
+        check : bool, optional
+            If True, a KeyError is raised when one of the pairs is missing, by default True
+
+        Raises
+        ------
+        KeyError
+            If `check` is True and one of the pairs does not exist in the database
+
+        Returns
+        -------
+        numpy.ndarray
+            Sub-matrix of the pair values, NaN for the missing pairs
+        """
+        idx = self.indices(elements)
+        sub_matrix = self.values[np.ix_(idx, idx)]
+        if check and np.isnan(sub_matrix).any():
+            raise KeyError(f'The requested pair does not exist in the {self.name} database.')
+        return sub_matrix
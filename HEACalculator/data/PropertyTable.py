@@ -0,0 +1,144 @@
+#!/usr/bin/env python3
+
+# Copyright (C) 2022  Doguhan Sariturk
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+import numpy as np
+
+__author__ = 'Doguhan Sariturk'
+__email__ = 'dogu.sariturk@gmail.com'
+
+
+class PropertyTable:
+    """Columnar table of element properties.
+
+    Every property is stored as one contiguous, read-only float64 array, in the
+    order of :attr:`symbols`, so the properties of many elements can be gathered
+    with a single fancy-indexing operation.
+
+    Parameters
+    ----------
+    element_data : dict
+        Element properties indexed by element symbol, e.g. ``{'Fe': {'atomic_weight': 55.845, ...}}``.
+
+    Attributes
+    ----------
+    symbols : list of str
+        Element symbols, in row order.
+
+    index : dict
+        Row index of each element symbol.
+
+    properties : tuple of str
+        Names of the property columns.
+    """
+
+    def __init__(self, element_data):
+        symbols = list(element_data)
+        properties = tuple(next(iter(element_data.values()))) if element_data else ()
+        self._setup(symbols, {prop: [element_data[symbol][prop] for symbol in symbols] for prop in properties})
+
+    @classmethod
+    def from_arrays(cls, symbols, columns):
+        """Creates the table from property columns
+
+        Parameters
+        ----------
+        symbols : sequence of str
+            Element symbols, in row order
+
+        columns : dict
+            Property vectors in the order of `symbols`, indexed by property name
+
+        Returns
+        -------
+        PropertyTable
+            Table of the element properties
+        """
+        self = cls.__new__(cls)
+        self._setup(list(symbols), columns)
+        return self
+
+    def _setup(self, symbols, columns):
+        self.symbols = symbols
+        self.index = {symbol: idx for idx, symbol in enumerate(self.symbols)}
+        self.properties = tuple(columns)
+
+        self._columns = {}
+        for prop, values in columns.items():
+            column = np.ascontiguousarray(values, dtype=np.float64)
+            column.flags.writeable = False
+            self._columns[prop] = column
+
+        self._atomic_number_index = {int(number): idx for idx, number in
+                                     enumerate(self._columns.get('atomic_number', ()))}
+
+    def __len__(self):
+        return len(self.symbols)
+
+    def __contains__(self, symbol):
+        return symbol in self.index
+
+    def __getitem__(self, prop):
+        """Returns the whole column of the given property"""
+        return self._columns[prop]
+
+    def indices(self, elements):
+        """Returns the row indices of the given elements
+
+        Parameters
+        ----------
+        elements : sequence of str or int
+            Element symbols or atomic numbers
+
+        Raises
+        ------
+        KeyError
+            If one of the elements does not exist in the database
+
+        Returns
+        -------
+        numpy.ndarray
+            Integer row indices of the elements
+        """
+        try:
+            return np.array([self._atomic_number_index[elm] if isinstance(elm, (int, np.integer)) else self.index[elm]
+                             for elm in elements], dtype=np.intp)
+        except KeyError:
+            raise KeyError('The requested element does not exist in the elements database.') from None
+
+    def take(self, elements, properties=None):
+        """Gathers the properties of the given elements
+
+        Parameters
+        ----------
+        elements : sequence of str or int
+            Element symbols or atomic numbers
+
+        properties : sequence of str, optional
+            Names of the properties to gather, by default all of them
+
+        Raises
+        ------
+        KeyError
+            If one of the elements does not exist in the database
+
+        Returns
+        -------
+        dict
+            Property vectors in the order of `elements`, indexed by property name
+        """
+        idx = self.indices(elements)
+        return {prop: self._columns[prop][idx] for prop in (properties or self.properties)}
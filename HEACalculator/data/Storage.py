@@ -0,0 +1,189 @@
+#!/usr/bin/env python3
+
+# Copyright (C) 2022  Doguhan Sariturk
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+import functools
+import os
+
+import numpy as np
+
+__author__ = 'Doguhan Sariturk'
+__email__ = 'dogu.sariturk@gmail.com'
+
+DATABASE_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'database.npz')
+
+ELEMENT_PROPERTIES = ('atomic_number', 'melting_point', 'atomic_volume', 'atomic_weight', 'atomic_radius', 'nvalence')
+PAIR_DATABASES = ('mixing_enthalpy', 'formation_enthalpy')
+
+
+@functools.lru_cache(maxsize=None)
+def load_database(path=DATABASE_FILE):
+    """Loads the arrays of a binary database, once per path
+
+    The database holds the element symbols, one float64 column per element
+    property, NaN for the unknown values, and, for each pair database, the
+    ``(P, 2)`` symbol indices of the pairs and their ``(P,)`` values.
+
+    Parameters
+    ----------
+    path : str, optional
+        Path of the ``.npz`` file, by default the database shipped with the package
+
+    Returns
+    -------
+    dict
+        Read-only arrays, indexed by name
+    """
+    with np.load(path) as file:
+        arrays = {name: file[name] for name in file.files}
+    for array in arrays.values():
+        array.flags.writeable = False
+    return arrays
+
+
+def write_database(path, element_data, pair_data):
+    """Writes a binary database, which can be loaded with :func:`load_database`
+
+    Parameters
+    ----------
+    path : str
+        Path of the ``.npz`` file
+
+    element_data : dict
+        Element properties indexed by element symbol, see :func:`database_arrays`
+
+    pair_data : dict
+        Pair databases indexed by name, see :func:`database_arrays`
+    """
+    np.savez_compressed(path, **database_arrays(element_data, pair_data))
+
+
+def database_arrays(element_data, pair_data):
+    """Converts the tables of a database to its arrays
+
+    Parameters
+    ----------
+    element_data : dict
+        Element properties indexed by element symbol, e.g. ``{'Fe': {'atomic_weight': 55.845, ...}}``.
+        Missing values can be given as NaN or ``'NaN'``.
+
+    pair_data : dict
+        Pair values indexed by alphabetically sorted element tuples, indexed by pair database name,
+        e.g. ``{'mixing_enthalpy': {('Co', 'Fe'): -1.0, ...}, 'formation_enthalpy': {...}}``
+
+    Raises
+    ------
+    KeyError
+        If a pair refers to an element which is not in `element_data`
+
+    Returns
+    -------
+    dict
+        Arrays of the database, indexed by name
+    """
+    symbols = list(element_data)
+    index = {symbol: idx for idx, symbol in enumerate(symbols)}
+    arrays = {'symbols': np.array(symbols)}
+    for prop in ELEMENT_PROPERTIES:
+        arrays[prop] = np.array([float(element_data[symbol][prop]) for symbol in symbols])
+    for name in PAIR_DATABASES:
+        pairs = pair_data[name]
+        arrays[f'{name}_pairs'] = np.array([[index[first], index[second]] for first, second in pairs],
+                                           dtype=np.uint16).reshape(-1, 2)
+        arrays[f'{name}_values'] = np.array(list(pairs.values()), dtype=np.float64)
+    return arrays
+
+
+def element_table_data(arrays):
+    """Returns the element properties of the arrays of a database as a dictionary
+
+    Parameters
+    ----------
+    arrays : dict
+        Arrays of the database
+
+    Returns
+    -------
+    dict
+        Element properties indexed by element symbol, NaN for the unknown values
+    """
+    columns = {prop: arrays[prop].tolist() for prop in ELEMENT_PROPERTIES}
+    return {symbol: {prop: columns[prop][idx] for prop in ELEMENT_PROPERTIES}
+            for idx, symbol in enumerate(arrays['symbols'].tolist())}
+
+
+def pair_table_data(arrays, name):
+    """Returns a pair database of the arrays of a database as a dictionary
+
+    Parameters
+    ----------
+    arrays : dict
+        Arrays of the database
+
+    name : str
+        ``'mixing_enthalpy'`` or ``'formation_enthalpy'``
+
+    Returns
+    -------
+    dict
+        Pair values indexed by alphabetically sorted element tuples
+    """
+    symbols = arrays['symbols'].tolist()
+    return {(symbols[first], symbols[second]): value
+            for (first, second), value in zip(arrays[f'{name}_pairs'].tolist(), arrays[f'{name}_values'].tolist())}
+
+
+def _value(value):
+    # The unknown values of the element database are reported as 'NaN'
+    return 'NaN' if np.isnan(value) else value
+
+
+@functools.lru_cache(maxsize=None)
+def element_data(path=DATABASE_FILE):
+    """Returns the element properties of a binary database as a dictionary
+
+    Parameters
+    ----------
+    path : str, optional
+        Path of the ``.npz`` file, by default the database shipped with the package
+
+    Returns
+    -------
+    dict
+        Element properties indexed by element symbol, ``'NaN'`` for the unknown values
+    """
+    return {symbol: {prop: _value(value) for prop, value in properties.items()}
+            for symbol, properties in element_table_data(load_database(path)).items()}
+
+
+@functools.lru_cache(maxsize=None)
+def pair_data(name, path=DATABASE_FILE):
+    """Returns a pair database of a binary database as a dictionary
+
+    Parameters
+    ----------
+    name : str
+        ``'mixing_enthalpy'`` or ``'formation_enthalpy'``
+
+    path : str, optional
+        Path of the ``.npz`` file, by default the database shipped with the package
+
+    Returns
+    -------
+    dict
+        Pair values indexed by alphabetically sorted element tuples
+    """
+    return pair_table_data(load_database(path), name)
@@ -15,14 +15,51 @@
 # You should have received a copy of the GNU General Public License
 # along with this program.  If not, see <https://www.gnu.org/licenses/>.
 
-from HEACalculator.data.Elements import _Element, _element_data
+import functools
+
+from HEACalculator.data.Database import Database
+from HEACalculator.data.Elements import _Element
 from HEACalculator.data.FormationEnthalpy import FormationEnthalpy
 from HEACalculator.data.MixingEnthalpy import MixingEnthalpy
+from HEACalculator.data.PairMatrix import PairMatrix
+from HEACalculator.data.PropertyTable import PropertyTable
+from HEACalculator.data.Storage import ELEMENT_PROPERTIES, element_data, pair_data
 
 __author__ = 'Doguhan Sariturk'
 __email__ = 'dogu.sariturk@gmail.com'
 
-__all__ = ['MixingEnthalpy', 'FormationEnthalpy', 'Element']
+__all__ = ['MixingEnthalpy', 'FormationEnthalpy', 'Element', 'Database', 'PairMatrix', 'PropertyTable',
+           'default_database', 'element_table', 'mixing_enthalpy_matrix', 'formation_enthalpy_matrix']
+
+
+def _default_attribute(name):
+    if 'default_database' not in globals():
+        __getattr__('default_database')
+    return getattr(globals()['default_database'], name)
+
+
+_LAZY_ATTRIBUTES = {
+        'default_database': Database.default,
+        'element_table': functools.partial(_default_attribute, 'element_table'),
+        'mixing_enthalpy_matrix': functools.partial(_default_attribute, 'mixing_enthalpy_matrix'),
+        'formation_enthalpy_matrix': functools.partial(_default_attribute, 'formation_enthalpy_matrix'),
+        '_element_data': element_data,
+        '_mixing_data': functools.partial(pair_data, 'mixing_enthalpy'),
+        '_formation_enthalpy_data': functools.partial(pair_data, 'formation_enthalpy'),
+}
+
+
+def __getattr__(name):
+    """Loads the databases on first access
+
+    The tables of the default database are built from the binary database
+    once, and then stored as plain module attributes.
+    """
+    if name not in _LAZY_ATTRIBUTES:
+        raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
+    value = _LAZY_ATTRIBUTES[name]()
+    globals()[name] = value
+    return value
 
 
 def Element(name=None):
@@ -48,13 +85,8 @@ def Element(name=None):
     """
     if name is None or not isinstance(name, str):
         raise SyntaxError('Usage: Element(X) where X is the element name.')
-    if name not in _element_data:
+    data = element_data()
+    if name not in data:
         raise KeyError('The requested element does not exist in the elements database.')
 
-    return _Element(name,
-                    _element_data[name]['melting_point'],
-                    _element_data[name]['atomic_number'],
-                    _element_data[name]['atomic_volume'],
-                    _element_data[name]['atomic_weight'],
-                    _element_data[name]['atomic_radius'],
-                    _element_data[name]['nvalence'])
+    return _Element(name, **{prop: data[name][prop] for prop in ELEMENT_PROPERTIES})
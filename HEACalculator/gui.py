@@ -15,11 +15,10 @@
 # You should have received a copy of the GNU General Public License
 # along with this program.  If not, see <https://www.gnu.org/licenses/>.
 
-import csv
 import os
 import sys
 
-import typer
+import numpy as np
 
 from PyQt5 import QtCore
 from PyQt5 import QtGui
@@ -28,13 +27,106 @@ from PyQt5.QtWidgets import QMessageBox
 
 from HEACalculator.ui.HEACalculatorMain import Ui_HEACalculator
 from HEACalculator.ui.parametersPage import Ui_ParametersPage
-# from HEACalculator.ui.batchCalculationsPage import Ui_BatchCalculationsPage
+from HEACalculator.ui.batchCalculationsPage import Ui_BatchCalculationsPage
 from HEACalculator.ui.aboutPage import Ui_AboutPage
-# from HEACalculator.ui.converterPage import Ui_ConverterPage
+from HEACalculator.ui.converterPage import Ui_ConverterPage
+from HEACalculator.ui.models import ConverterModel, ResultsModel, ResultsProxyModel
+from HEACalculator.ui.resources import register_resources
+from HEACalculator.ui.workers import WorkerPool
 
 from HEACalculator.core.HEA import HEACalculator, __version__
-
-app = typer.Typer()
+from HEACalculator.core.cache import memory_cache
+from HEACalculator.core.filters import Expression
+from HEACalculator.core.helpers import nested_formula_parser
+from HEACalculator.core.lattice import CompositionLattice
+from HEACalculator.core.progress import ProgressMeter
+from HEACalculator.core.screening import DEFAULT_CHUNK_SIZE, read_formulas, screen, screen_formulas
+from HEACalculator.core.writers import WRITERS, open_writer
+
+EXPORT_CHUNK_SIZE = 16384
+EXPORT_FILTERS = {
+        'CSV (*.csv)': '.csv',
+        'Parquet (*.parquet)': '.parquet',
+        'JSON Lines (*.jsonl)': '.jsonl',
+}
+
+
+def calculate_row(formula):
+    """Calculates the results row of an alloy, in a worker thread"""
+    res = HEACalculator(formula, cache=memory_cache)
+    res.calculate()
+    return res.formula, {name: [getattr(res, name)] for name in res.output_properties}
+
+
+def screen_range(elements, lattice, where, chunk_size, worker):
+    """Screens a composition lattice chunk by chunk, in a worker thread"""
+    done = 0
+    for compositions, columns in screen(elements, lattice, output='columns', where=where, chunk_size=chunk_size):
+        done = min(done + chunk_size, len(lattice))
+        worker.report((done, len(lattice), compositions, columns, []))
+        if not worker.checkpoint():
+            return None
+    return done
+
+
+def count_rows(path):
+    """Counts the lines of a CSV file after its header, to estimate the progress of its calculation"""
+    lines, last = 0, b'\n'
+    with open(path, 'rb') as file:
+        for block in iter(lambda: file.read(1 << 20), b''):
+            lines += block.count(b'\n')
+            last = block[-1:]
+    # The last line may not end with a newline
+    return max(lines + (last != b'\n') - 1, 0)
+
+
+def screen_file(path, where, chunk_size, worker):
+    """Calculates the alloys of a CSV file chunk by chunk as it is read, in a worker thread"""
+    total = count_rows(path)
+    worker.report((0, total, [], {}, []))
+    read = 0
+
+    def formulas(file):
+        nonlocal read
+        for formula in read_formulas(file):
+            read += 1
+            yield formula
+
+    with open(path, newline='') as file:
+        # Each chunk is read from the file only when the previous one is done
+        for (names, columns), errors in screen_formulas(formulas(file), output='columns', where=where,
+                                                        chunk_size=chunk_size):
+            worker.report((read, max(total, read), names, columns, errors))
+            if not worker.checkpoint():
+                return None
+    return read
+
+
+def export_results(table, rows, path, chunk_size, worker):
+    """Writes rows of a results table, or all of them if rows is None, to a file chunk by chunk, in a worker thread"""
+    total = len(table) if rows is None else len(rows)
+    done = 0
+    with open_writer(path, table.elements, table.properties) as writer:
+        for compositions, columns in table.batches(chunk_size, rows):
+            writer.write(compositions, columns)
+            done += len(compositions)
+            worker.report((done, total))
+            if not worker.checkpoint():
+                break
+    if worker.cancelled:
+        # A truncated file is not left behind
+        os.remove(path)
+        return None
+    return done
+
+
+def get_export_path(parent):
+    """Asks where to save the results, the file format is given by the extension"""
+    path, selected = QtWidgets.QFileDialog.getSaveFileName(parent, 'Save Results', os.getenv('HOME'),
+                                                           ';;'.join(EXPORT_FILTERS))
+    if path and os.path.splitext(path)[1].lower() not in WRITERS:
+        path += EXPORT_FILTERS.get(selected, '.csv')
+    return path
 
 
 class AlignDelegate(QtWidgets.QStyledItemDelegate):
@@ -51,12 +143,53 @@ class ItemDelegate(QtWidgets.QStyledItemDelegate):
         return lineEdt
 
 
-# class ConverterPage(QtWidgets.QWidget):
-#     def __init__(self, *args, **kwargs):
-#         super().__init__(*args, **kwargs)
-#
-#         self.aboutPage = Ui_ConverterPage()
-#         self.aboutPage.setupUi(self)
+class LiveItemDelegate(ItemDelegate):
+    def createEditor(self, parent, option, index):
+        lineEdt = super().createEditor(parent, option, index)
+        # The amount is committed on each keystroke, so the alloy is converted as it is typed
+        lineEdt.textEdited.connect(lambda: self.commitData.emit(lineEdt))
+        return lineEdt
+
+
+class ConverterPage(QtWidgets.QWidget):
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+
+        self.converterPage = Ui_ConverterPage()
+        self.converterPage.setupUi(self)
+
+        self.converterModel = ConverterModel(parent=self)
+        self.converterPage.resultsTableView.setModel(self.converterModel)
+        self.converterPage.resultsTableView.setItemDelegate(LiveItemDelegate(self.converterPage.resultsTableView))
+
+        self.converterPage.ElementsPushButton.clicked.connect(self.handleElementsButton)
+        self.converterPage.elementsLineEdit.returnPressed.connect(self.handleElementsButton)
+        self.converterPage.AddAlloyPushButton.clicked.connect(self.handleAddAlloyButton)
+        self.converterPage.ClearAllPushButton.clicked.connect(self.handleClearAllButton)
+        self.handleClearAllButton()
+
+    def handleElementsButton(self):
+        try:
+            formula = nested_formula_parser(self.converterPage.elementsLineEdit.text().strip())
+            if not formula:
+                raise ValueError('Enter the elements of the alloys, e.g. AlTiVCrMn')
+            self.converterModel.setElements(list(formula))
+        except (KeyError, ValueError) as e:
+            QMessageBox.warning(self, 'HEA Calculator', e.args[0] if isinstance(e, KeyError) else str(e))
+            return
+        self.converterModel.appendRows([list(formula.values())])
+        self.converterPage.AddAlloyPushButton.setEnabled(True)
+        self.converterPage.ClearAllPushButton.setEnabled(True)
+
+    def handleAddAlloyButton(self):
+        count = len(self.converterModel.elements)
+        self.converterModel.appendRows(np.full((1, count), 100 / count))
+
+    def handleClearAllButton(self):
+        self.converterModel.setElements([])
+        self.converterPage.elementsLineEdit.clear()
+        self.converterPage.AddAlloyPushButton.setEnabled(False)
+        self.converterPage.ClearAllPushButton.setEnabled(False)
 
 
 class AboutPage(QtWidgets.QWidget):
@@ -67,12 +200,194 @@ class AboutPage(QtWidgets.QWidget):
         self.aboutPage.setupUi(self)
 
 
-# class BatchCalculationsPage(QtWidgets.QWidget):
-#     def __init__(self, *args, **kwargs):
-#         super().__init__(*args, **kwargs)
-#
-#         self.batchCalculationsPage = Ui_BatchCalculationsPage()
-#         self.batchCalculationsPage.setupUi(self)
+class BatchCalculationsPage(QtWidgets.QWidget):
+    STATUS_INTERVAL = 500
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+
+        self.batchCalculationsPage = Ui_BatchCalculationsPage()
+        self.batchCalculationsPage.setupUi(self)
+
+        self.progress = None
+        self.errors = 0
+        self.savePath = None
+
+        self.resultsModel = ResultsModel(parent=self)
+        self.resultsProxyModel = ResultsProxyModel(self)
+        self.resultsProxyModel.setSourceModel(self.resultsModel)
+        self.batchCalculationsPage.resultsTableView.setModel(self.resultsProxyModel)
+        # The results are shown in the order they are calculated until a column is sorted
+        self.batchCalculationsPage.resultsTableView.horizontalHeader().setSortIndicator(-1, QtCore.Qt.AscendingOrder)
+        self.batchCalculationsPage.resultsTableView.setSortingEnabled(True)
+        self.batchCalculationsPage.progressBar.setMaximum(1000)
+
+        self.workers = WorkerPool(self)
+        self.workers.busyChanged.connect(self.handleBusyChanged)
+
+        # The throughput and the time left are refreshed between two chunks too
+        self.statusTimer = QtCore.QTimer(self)
+        self.statusTimer.setInterval(self.STATUS_INTERVAL)
+        self.statusTimer.timeout.connect(self.updateStatus)
+
+        self.batchCalculationsPage.RangePushButton.clicked.connect(self.handleRangeButton)
+        self.batchCalculationsPage.FilePushButton.clicked.connect(self.handleFileButton)
+        self.batchCalculationsPage.SavePushButton.clicked.connect(self.handleSaveButton)
+        self.batchCalculationsPage.PausePushButton.toggled.connect(self.handlePauseButton)
+        self.batchCalculationsPage.CancelPushButton.clicked.connect(self.handleCancelButton)
+        self.batchCalculationsPage.ClearAllPushButton.clicked.connect(self.handleClearAllButton)
+        self.batchCalculationsPage.whereLineEdit.returnPressed.connect(self.handleWhereEdited)
+        self.handleBusyChanged(False)
+
+    def getCondition(self):
+        where = self.batchCalculationsPage.whereLineEdit.text().strip()
+        return Expression(where, condition=True) if where else None
+
+    def handleRangeButton(self):
+        try:
+            formula = nested_formula_parser(self.batchCalculationsPage.elementsLineEdit.text().strip())
+            if not formula:
+                raise ValueError('Enter the elements to screen, e.g. FeCoNiCr')
+            start = self.batchCalculationsPage.startSpinBox.value()
+            end = self.batchCalculationsPage.endSpinBox.value()
+            if start > end:
+                raise ValueError('The End value should be higher than the Start value')
+            lattice = CompositionLattice(len(formula), start, end, self.batchCalculationsPage.stepSpinBox.value())
+            where = self.getCondition()
+        except Exception as e:
+            QMessageBox.warning(self, 'HEA Calculator', str(e))
+            return
+        self.resultsModel.reset(list(formula))
+        self.startScreen(len(lattice), screen_range, list(formula), lattice, where)
+
+    def handleWhereEdited(self):
+        # Filters the results at hand, without calculating them again
+        try:
+            self.resultsProxyModel.setCondition(self.getCondition())
+        except ValueError as e:
+            QMessageBox.warning(self, 'HEA Calculator', str(e))
+            return
+        self.updateStatus()
+
+    def handleFileButton(self):
+        path, _ = QtWidgets.QFileDialog.getOpenFileName(self, 'Open CSV', os.getenv('HOME'), 'CSV(*.csv)')
+        if not path:
+            return
+        try:
+            where = self.getCondition()
+        except ValueError as e:
+            QMessageBox.warning(self, 'HEA Calculator', str(e))
+            return
+        self.resultsModel.reset(None)
+        self.startScreen(0, screen_file, path, where)
+
+    def handleSaveButton(self):
+        path = get_export_path(self)
+        if not path:
+            return
+        rows = self.resultsProxyModel.sourceRows()
+        self.progress = ProgressMeter(len(rows))
+        self.savePath = path
+        self.workers.start(export_results, self.resultsModel.table, rows, path, EXPORT_CHUNK_SIZE, pass_worker=True,
+                           slots={'progress': self.handleSaveProgress, 'result': self.handleResult,
+                                  'error': self.handleError})
+        self.updateStatus()
+
+    def handleSaveProgress(self, request, progress):
+        if self.workers.is_current(request):
+            self.progress.update(progress[0])
+            self.updateStatus()
+
+    def startScreen(self, total, function, *args):
+        self.resultsProxyModel.setCondition(None)
+        self.progress = ProgressMeter(total)
+        self.errors = 0
+        self.savePath = None
+        self.workers.start(function, *args, DEFAULT_CHUNK_SIZE, pass_worker=True,
+                           slots={'progress': self.handleProgress, 'result': self.handleResult,
+                                  'error': self.handleError})
+        self.updateStatus()
+
+    def handleProgress(self, request, progress):
+        if not self.workers.is_current(request):
+            return
+        done, total, compositions, columns, errors = progress
+        self.progress.total = total
+        self.progress.update(done)
+        self.errors += len(errors)
+        # The whole chunk is inserted at once
+        self.resultsModel.append(compositions, columns)
+        self.updateStatus()
+
+    def handleResult(self, request, done):
+        if self.workers.is_current(request):
+            # The total of a file is only estimated from its lines until it is read
+            self.progress.total = done
+            self.progress.update(done)
+            self.progress.stop()
+            self.updateStatus()
+
+    def handleError(self, request, message):
+        if self.workers.is_current(request):
+            QMessageBox.warning(self, 'HEA Calculator', message)
+
+    def handlePauseButton(self, checked):
+        if self.progress is None or not self.workers.busy:
+            return
+        if checked:
+            self.workers.pause()
+            self.progress.pause()
+        else:
+            self.workers.resume()
+            self.progress.resume()
+        self.batchCalculationsPage.PausePushButton.setText('Resume' if checked else 'Pause')
+        self.updateStatus()
+
+    def handleCancelButton(self):
+        self.workers.cancel()
+
+    def handleClearAllButton(self):
+        self.workers.cancel()
+        self.progress = None
+        self.savePath = None
+        self.resultsModel.reset(self.resultsModel.elements)
+        self.updateStatus()
+
+    def handleBusyChanged(self, busy):
+        self.batchCalculationsPage.RangePushButton.setEnabled(not busy)
+        self.batchCalculationsPage.FilePushButton.setEnabled(not busy)
+        self.batchCalculationsPage.SavePushButton.setEnabled(not busy)
+        self.batchCalculationsPage.PausePushButton.setEnabled(busy)
+        self.batchCalculationsPage.CancelPushButton.setEnabled(busy)
+        self.batchCalculationsPage.PausePushButton.setChecked(False)
+        self.batchCalculationsPage.PausePushButton.setText('Pause')
+        if busy:
+            self.statusTimer.start()
+        else:
+            self.statusTimer.stop()
+            if self.progress is not None:
+                self.progress.stop()
+            self.updateStatus()
+
+    def updateStatus(self):
+        if self.progress is None:
+            self.batchCalculationsPage.progressBar.setValue(0)
+            self.batchCalculationsPage.statusLabel.clear()
+            return
+        self.batchCalculationsPage.progressBar.setValue(int(self.progress.fraction * 1000))
+        cancelled = not self.workers.busy and self.progress.done < self.progress.total
+        if self.savePath is not None:
+            action = 'Saving' if self.workers.busy else 'Saved' if not cancelled else 'Cancelled saving'
+            status = f'{action} {os.path.basename(self.savePath)} | {self.progress}'
+        else:
+            status = f'{self.progress} | {self.resultsModel.rowCount():,} kept'
+            if self.resultsProxyModel.condition is not None:
+                status += f' | {self.resultsProxyModel.rowCount():,} shown'
+            if self.errors:
+                status += f' | {self.errors:,} errors'
+            if cancelled:
+                status += ' | Cancelled'
+        self.batchCalculationsPage.statusLabel.setText(status)
 
 
 class ParametersPage(QtWidgets.QWidget):
@@ -85,8 +400,19 @@ class ParametersPage(QtWidgets.QWidget):
         self.parametersPage.setupUi(self)
 
         self.selectedElements = {}
+        self.pendingFormula = None
+
+        self.workers = WorkerPool(self)
+        self.workers.busyChanged.connect(self.handleBusyChanged)
+        # Saving does not cancel the pending calculation
+        self.exportWorkers = WorkerPool(self)
+        self.exportWorkers.busyChanged.connect(self.handleSavingChanged)
 
-        self.parametersPage.resultsTreeWidget.header().setSectionResizeMode(QtWidgets.QHeaderView.ResizeToContents)
+        self.resultsModel = ResultsModel(parent=self)
+        self.resultsProxyModel = ResultsProxyModel(self)
+        self.resultsProxyModel.setSourceModel(self.resultsModel)
+        self.parametersPage.resultsTreeView.setModel(self.resultsProxyModel)
+        self.parametersPage.resultsTreeView.header().setSectionResizeMode(QtWidgets.QHeaderView.ResizeToContents)
 
         itemDelegate = ItemDelegate(self.parametersPage.tableWidget)
         self.parametersPage.tableWidget.setItemDelegate(itemDelegate)
@@ -107,20 +433,44 @@ class ParametersPage(QtWidgets.QWidget):
         self.parametersPage.SavePushButton.clicked.connect(self.handleSaveButton)
 
     def calculate(self, formula):
-        if not self.parametersPage.resultsTreeWidget.findItems(formula, QtCore.Qt.MatchExactly):
-            res = HEACalculator(formula)
-            res.calculate()
-            resList = res.get_list()
-            QtWidgets.QTreeWidgetItem(self.parametersPage.resultsTreeWidget, resList)
-            self.parametersPage.SavePushButton.setEnabled(True)
+        if formula == self.pendingFormula and self.workers.busy:
+            return
+        if formula not in self.resultsModel.table:
+            # A new request supersedes the pending one, whose result is dropped
+            self.workers.start(calculate_row, formula,
+                               slots={'result': self.handleCalculationResult, 'error': self.handleCalculationError})
+            self.pendingFormula = formula
+
+    def handleCalculationResult(self, request, result):
+        if not self.workers.is_current(request):
+            return
+        formula, columns = result
+        if formula not in self.resultsModel.table:
+            self.resultsModel.append([formula], columns)
+            self.parametersPage.SavePushButton.setEnabled(not self.exportWorkers.busy)
+
+    def handleCalculationError(self, request, message):
+        if self.workers.is_current(request):
+            QMessageBox.warning(self, 'HEA Calculator', message)
+
+    def handleBusyChanged(self, busy):
+        if busy:
+            self.setCursor(QtCore.Qt.BusyCursor)
+            self.parametersPage.CalculatePushButton.setText('Calculating...')
+        else:
+            self.unsetCursor()
+            self.parametersPage.CalculatePushButton.setText('Calculate')
+            self.pendingFormula = None
 
     def handleCalculateButton(self):
         formula = ''.join(['%s%d' % (k, v) for k, v in dict(sorted(self.selectedElements.items())).items()])
         self.calculate(formula)
 
     def handleClearAllButton(self):
+        self.workers.cancel()
+        self.exportWorkers.cancel()
         self.parametersPage.tableWidget.setRowCount(0)
-        self.parametersPage.resultsTreeWidget.clear()
+        self.resultsModel.reset()
         self.selectedElements.clear()
         for name in dir(self.parametersPage):
             if 'ebtn' in name:
@@ -131,19 +481,25 @@ class ParametersPage(QtWidgets.QWidget):
         self.parametersPage.SavePushButton.setEnabled(False)
 
     def handleSaveButton(self):
-        path, ok = QtWidgets.QFileDialog.getSaveFileName(
-                self, 'Save CSV', os.getenv('HOME'), 'CSV(*.csv)')
-        if ok:
-            columns = range(self.parametersPage.resultsTreeWidget.columnCount())
-            header = [self.parametersPage.resultsTreeWidget.headerItem().text(column)
-                      for column in columns]
-            with open(path, 'w') as csvfile:
-                writer = csv.writer(csvfile)
-                writer.writerow(header)
-                for row in range(self.parametersPage.resultsTreeWidget.topLevelItemCount()):
-                    writer.writerow(
-                            self.parametersPage.resultsTreeWidget.topLevelItem(row).text(column)
-                            for column in columns)
+        path = get_export_path(self)
+        if path:
+            # The calculations go on while saving, so the worker saves a copy of the rows
+            table = self.resultsModel.table.take(self.resultsProxyModel.sourceRows())
+            self.exportWorkers.start(export_results, table, None, path, EXPORT_CHUNK_SIZE, pass_worker=True,
+                                     slots={'progress': self.handleSaveProgress, 'error': self.handleSaveError})
+
+    def handleSaveProgress(self, request, progress):
+        if self.exportWorkers.is_current(request):
+            done, total = progress
+            self.parametersPage.SavePushButton.setText(f'Saving... {100 * done // max(total, 1)}%')
+
+    def handleSaveError(self, request, message):
+        if self.exportWorkers.is_current(request):
+            QMessageBox.warning(self, 'HEA Calculator', message)
+
+    def handleSavingChanged(self, busy):
+        self.parametersPage.SavePushButton.setEnabled(not busy and self.resultsModel.rowCount() > 0)
+        self.parametersPage.SavePushButton.setText('Saving...' if busy else 'Save')
 
     def handleElementClicked(self, symbol, checked):
         currentRowCount = self.parametersPage.tableWidget.rowCount()
@@ -213,51 +569,51 @@ class HEACalculatorMainWindow(QtWidgets.QMainWindow):
 
         self.parametersPage = ParametersPage()
         self.aboutPage = AboutPage()
-        # self.batchCalculationsPage = BatchCalculationsPage()
-        # self.converterPage = ConverterPage()
+        self.batchCalculationsPage = BatchCalculationsPage()
+        self.converterPage = ConverterPage()
 
         self.setWindowFlags(QtCore.Qt.FramelessWindowHint)
         self.setAttribute(QtCore.Qt.WA_TranslucentBackground)
 
         self.ui.stackedWidget.addWidget(self.parametersPage)
-        # self.ui.stackedWidget.addWidget(self.converterPage)
-        # self.ui.stackedWidget.addWidget(self.batchCalculationsPage)
+        self.ui.stackedWidget.addWidget(self.converterPage)
+        self.ui.stackedWidget.addWidget(self.batchCalculationsPage)
         self.ui.stackedWidget.addWidget(self.aboutPage)
 
         self.ui.btnParameters.setStyleSheet('QPushButton{background-color: #3E5C76}')
 
         self.ui.btnParameters.clicked.connect(self.btn_parameters_clicked)
-        # self.ui.btnConverter.clicked.connect(self.btn_converter_clicked)
-        # self.ui.btnBatchAmount.clicked.connect(self.btn_batch_amount_clicked)
+        self.ui.btnConverter.clicked.connect(self.btn_converter_clicked)
+        self.ui.btnBatchAmount.clicked.connect(self.btn_batch_amount_clicked)
         self.ui.btnMDL.clicked.connect(self.helpAbout)
         self.ui.btnClose.clicked.connect(self.close)
 
     def btn_parameters_clicked(self):
         self.ui.stackedWidget.setCurrentWidget(self.parametersPage)
         self.ui.btnParameters.setStyleSheet(self.BTN_BACKGROUND_COLOR_HIGHLIGHTED)
-        # self.ui.btnConverter.setStyleSheet(self.BTN_BACKGROUND_COLOR_DEFAULT)
-        # self.ui.btnBatchAmount.setStyleSheet(self.BTN_BACKGROUND_COLOR_DEFAULT)
+        self.ui.btnConverter.setStyleSheet(self.BTN_BACKGROUND_COLOR_DEFAULT)
+        self.ui.btnBatchAmount.setStyleSheet(self.BTN_BACKGROUND_COLOR_DEFAULT)
         self.ui.btnMDL.setStyleSheet(self.BTN_BACKGROUND_COLOR_DEFAULT)
 
-    # def btn_converter_clicked(self):
-    #     self.ui.stackedWidget.setCurrentWidget(self.converterPage)
-    #     self.ui.btnParameters.setStyleSheet(self.BTN_BACKGROUND_COLOR_DEFAULT)
-    #     self.ui.btnConverter.setStyleSheet(self.BTN_BACKGROUND_COLOR_HIGHLIGHTED)
-    #     self.ui.btnBatchAmount.setStyleSheet(self.BTN_BACKGROUND_COLOR_DEFAULT)
-    #     self.ui.btnMDL.setStyleSheet(self.BTN_BACKGROUND_COLOR_DEFAULT)
-    #
-    # def btn_batch_amount_clicked(self):
-    #     self.ui.stackedWidget.setCurrentWidget(self.batchCalculationsPage)
-    #     self.ui.btnParameters.setStyleSheet(self.BTN_BACKGROUND_COLOR_DEFAULT)
-    #     self.ui.btnConverter.setStyleSheet(self.BTN_BACKGROUND_COLOR_DEFAULT)
-    #     self.ui.btnBatchAmount.setStyleSheet(self.BTN_BACKGROUND_COLOR_HIGHLIGHTED)
-    #     self.ui.btnMDL.setStyleSheet(self.BTN_BACKGROUND_COLOR_DEFAULT)
+    def btn_converter_clicked(self):
+        self.ui.stackedWidget.setCurrentWidget(self.converterPage)
+        self.ui.btnParameters.setStyleSheet(self.BTN_BACKGROUND_COLOR_DEFAULT)
+        self.ui.btnConverter.setStyleSheet(self.BTN_BACKGROUND_COLOR_HIGHLIGHTED)
+        self.ui.btnBatchAmount.setStyleSheet(self.BTN_BACKGROUND_COLOR_DEFAULT)
+        self.ui.btnMDL.setStyleSheet(self.BTN_BACKGROUND_COLOR_DEFAULT)
+
+    def btn_batch_amount_clicked(self):
+        self.ui.stackedWidget.setCurrentWidget(self.batchCalculationsPage)
+        self.ui.btnParameters.setStyleSheet(self.BTN_BACKGROUND_COLOR_DEFAULT)
+        self.ui.btnConverter.setStyleSheet(self.BTN_BACKGROUND_COLOR_DEFAULT)
+        self.ui.btnBatchAmount.setStyleSheet(self.BTN_BACKGROUND_COLOR_HIGHLIGHTED)
+        self.ui.btnMDL.setStyleSheet(self.BTN_BACKGROUND_COLOR_DEFAULT)
 
     def btn_mdl_clicked(self):
         self.ui.stackedWidget.setCurrentWidget(self.aboutPage)
         self.ui.btnParameters.setStyleSheet(self.BTN_BACKGROUND_COLOR_DEFAULT)
-        # self.ui.btnConverter.setStyleSheet(self.BTN_BACKGROUND_COLOR_DEFAULT)
-        # self.ui.btnBatchAmount.setStyleSheet(self.BTN_BACKGROUND_COLOR_DEFAULT)
+        self.ui.btnConverter.setStyleSheet(self.BTN_BACKGROUND_COLOR_DEFAULT)
+        self.ui.btnBatchAmount.setStyleSheet(self.BTN_BACKGROUND_COLOR_DEFAULT)
         self.ui.btnMDL.setStyleSheet(self.BTN_BACKGROUND_COLOR_HIGHLIGHTED)
 
     @staticmethod
@@ -273,6 +629,14 @@ class HEACalculatorMainWindow(QtWidgets.QMainWindow):
         __ABOUT_BOX.setWindowTitle('About | HEA Calculator | MDL')
         __ABOUT_BOX.exec_()
 
+    def closeEvent(self, event):
+        # A paused worker would keep the thread pool, and the application, from exiting,
+        # and a file still being saved is removed rather than left truncated
+        self.parametersPage.workers.cancel()
+        self.parametersPage.exportWorkers.cancel()
+        self.batchCalculationsPage.workers.cancel()
+        super().closeEvent(event)
+
     def mousePressEvent(self, event):
         self.oldPos = event.globalPos()
 
@@ -282,8 +646,8 @@ class HEACalculatorMainWindow(QtWidgets.QMainWindow):
         self.oldPos = event.globalPos()
 
 
-@app.callback(invoke_without_command=True)
 def run():
+    register_resources()
     application = QtWidgets.QApplication([])
     application.setWindowIcon(QtGui.QIcon(QtGui.QPixmap(':/icons/images/icon.ico')))
     window = HEACalculatorMainWindow()
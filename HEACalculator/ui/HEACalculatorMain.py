@@ -167,18 +167,18 @@ class Ui_HEACalculator(object):
         self.btnParameters.setStyleSheet("")
         self.btnParameters.setObjectName("btnParameters")
         self.verticalLayout_4.addWidget(self.btnParameters)
-        # self.btnConverter = QtWidgets.QPushButton(self.menu_top_f)
-        # self.btnConverter.setMinimumSize(QtCore.QSize(0, 45))
-        # self.btnConverter.setFocusPolicy(QtCore.Qt.NoFocus)
-        # self.btnConverter.setStyleSheet("")
-        # self.btnConverter.setObjectName("btnConverter")
-        # self.verticalLayout_4.addWidget(self.btnConverter)
-        # self.btnBatchAmount = QtWidgets.QPushButton(self.menu_top_f)
-        # self.btnBatchAmount.setMinimumSize(QtCore.QSize(0, 45))
-        # self.btnBatchAmount.setFocusPolicy(QtCore.Qt.NoFocus)
-        # self.btnBatchAmount.setStyleSheet("")
-        # self.btnBatchAmount.setObjectName("btnBatchAmount")
-        # self.verticalLayout_4.addWidget(self.btnBatchAmount)
+        self.btnConverter = QtWidgets.QPushButton(self.menu_top_f)
+        self.btnConverter.setMinimumSize(QtCore.QSize(0, 45))
+        self.btnConverter.setFocusPolicy(QtCore.Qt.NoFocus)
+        self.btnConverter.setStyleSheet("")
+        self.btnConverter.setObjectName("btnConverter")
+        self.verticalLayout_4.addWidget(self.btnConverter)
+        self.btnBatchAmount = QtWidgets.QPushButton(self.menu_top_f)
+        self.btnBatchAmount.setMinimumSize(QtCore.QSize(0, 45))
+        self.btnBatchAmount.setFocusPolicy(QtCore.Qt.NoFocus)
+        self.btnBatchAmount.setStyleSheet("")
+        self.btnBatchAmount.setObjectName("btnBatchAmount")
+        self.verticalLayout_4.addWidget(self.btnBatchAmount)
         self.verticalLayout_3.addWidget(self.menu_top_f, 0, QtCore.Qt.AlignTop)
         self.menu_down_f = QtWidgets.QFrame(self.menu_f)
         self.menu_down_f.setStyleSheet("QPushButton {\n"
@@ -226,10 +226,9 @@ class Ui_HEACalculator(object):
         self.retranslateUi(HEACalculator)
         self.stackedWidget.setCurrentIndex(-1)
         QtCore.QMetaObject.connectSlotsByName(HEACalculator)
-        # HEACalculator.setTabOrder(self.btnParameters, self.btnBatchAmount)
-        # HEACalculator.setTabOrder(self.btnBatchAmount, self.btnMDL)
-        # HEACalculator.setTabOrder(self.btnMDL, self.btnClose)
-        HEACalculator.setTabOrder(self.btnParameters, self.btnMDL)
+        HEACalculator.setTabOrder(self.btnParameters, self.btnConverter)
+        HEACalculator.setTabOrder(self.btnConverter, self.btnBatchAmount)
+        HEACalculator.setTabOrder(self.btnBatchAmount, self.btnMDL)
         HEACalculator.setTabOrder(self.btnMDL, self.btnClose)
 
     def retranslateUi(self, HEACalculator):
@@ -238,11 +237,8 @@ class Ui_HEACalculator(object):
         self.lblTitle.setText(_translate("HEACalculator", "HEACalculator"))
         self.btnParameters.setText(_translate("HEACalculator", "HEA\n"
                                                                "Parameters"))
-        #         self.btnConverter.setText(_translate("HEACalculator", "At% - Wt% - Vol%\n"
-        # "Converter"))
-        #         self.btnBatchAmount.setText(_translate("HEACalculator", "Batch Amount\n"
-        # "Calculator"))
+        self.btnConverter.setText(_translate("HEACalculator", "At% - Wt% - Vol%\n"
+                                                              "Converter"))
+        self.btnBatchAmount.setText(_translate("HEACalculator", "Batch\n"
+                                                                "Calculations"))
         self.btnMDL.setText(_translate("HEACalculator", "MDL"))
-
-
-from HEACalculator.ui import HEACalculator_rc
@@ -29,6 +29,3 @@ class Ui_AboutPage(object):
     def retranslateUi(self, AboutPage):
         _translate = QtCore.QCoreApplication.translate
         AboutPage.setWindowTitle(_translate("AboutPage", "Form"))
-
-
-from HEACalculator.ui import HEACalculator_rc
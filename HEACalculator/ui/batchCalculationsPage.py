@@ -21,7 +21,115 @@ class Ui_BatchCalculationsPage(object):
         font.setBold(True)
         font.setWeight(75)
         BatchCalculationsPage.setFont(font)
-        BatchCalculationsPage.setStyleSheet("QWidget{background-color: #0D1321;};")
+        BatchCalculationsPage.setStyleSheet("QWidget{background-color: #0D1321;color: #F0EBD8;alternate-background-color: rgb(24,30,43);}\n"
+                                            "QLineEdit, QDoubleSpinBox{background-color: #1D2D44;border: none;}\n"
+                                            "QProgressBar{background-color: #1D2D44;border: none;}\n"
+                                            "QProgressBar::chunk{background-color: #3E5C76;}\n"
+                                            "QHeaderView::section{background-color: #1D2D44;color: #F0EBD8;border: none;}\n"
+                                            "QToolTip { color: #F0EBD8; background-color: rgb(34,45,67); border: none; }")
+        self.elementsLabel = QtWidgets.QLabel(BatchCalculationsPage)
+        self.elementsLabel.setGeometry(QtCore.QRect(10, 10, 80, 25))
+        self.elementsLabel.setObjectName("elementsLabel")
+        self.elementsLineEdit = QtWidgets.QLineEdit(BatchCalculationsPage)
+        self.elementsLineEdit.setGeometry(QtCore.QRect(90, 10, 260, 25))
+        self.elementsLineEdit.setObjectName("elementsLineEdit")
+        self.startLabel = QtWidgets.QLabel(BatchCalculationsPage)
+        self.startLabel.setGeometry(QtCore.QRect(370, 10, 45, 25))
+        self.startLabel.setObjectName("startLabel")
+        self.startSpinBox = QtWidgets.QDoubleSpinBox(BatchCalculationsPage)
+        self.startSpinBox.setGeometry(QtCore.QRect(415, 10, 80, 25))
+        self.startSpinBox.setMaximum(100.0)
+        self.startSpinBox.setProperty("value", 0.0)
+        self.startSpinBox.setObjectName("startSpinBox")
+        self.endLabel = QtWidgets.QLabel(BatchCalculationsPage)
+        self.endLabel.setGeometry(QtCore.QRect(505, 10, 40, 25))
+        self.endLabel.setObjectName("endLabel")
+        self.endSpinBox = QtWidgets.QDoubleSpinBox(BatchCalculationsPage)
+        self.endSpinBox.setGeometry(QtCore.QRect(545, 10, 80, 25))
+        self.endSpinBox.setMaximum(100.0)
+        self.endSpinBox.setProperty("value", 100.0)
+        self.endSpinBox.setObjectName("endSpinBox")
+        self.stepLabel = QtWidgets.QLabel(BatchCalculationsPage)
+        self.stepLabel.setGeometry(QtCore.QRect(635, 10, 45, 25))
+        self.stepLabel.setObjectName("stepLabel")
+        self.stepSpinBox = QtWidgets.QDoubleSpinBox(BatchCalculationsPage)
+        self.stepSpinBox.setGeometry(QtCore.QRect(680, 10, 80, 25))
+        self.stepSpinBox.setMinimum(0.01)
+        self.stepSpinBox.setMaximum(100.0)
+        self.stepSpinBox.setProperty("value", 5.0)
+        self.stepSpinBox.setObjectName("stepSpinBox")
+        self.RangePushButton = QtWidgets.QPushButton(BatchCalculationsPage)
+        self.RangePushButton.setGeometry(QtCore.QRect(780, 10, 200, 25))
+        self.RangePushButton.setFocusPolicy(QtCore.Qt.NoFocus)
+        self.RangePushButton.setStyleSheet("QPushButton{background-color: #1D2D44;color: #F0EBD8;}\n"
+                                           "QPushButton:hover{background-color: #3E5C76;color: #F0EBD8;}\n"
+                                           "QPushButton:pressed{background-color: #748CAB;color: #F0EBD8;};")
+        self.RangePushButton.setObjectName("RangePushButton")
+        self.whereLabel = QtWidgets.QLabel(BatchCalculationsPage)
+        self.whereLabel.setGeometry(QtCore.QRect(10, 45, 80, 25))
+        self.whereLabel.setObjectName("whereLabel")
+        self.whereLineEdit = QtWidgets.QLineEdit(BatchCalculationsPage)
+        self.whereLineEdit.setGeometry(QtCore.QRect(90, 45, 670, 25))
+        self.whereLineEdit.setObjectName("whereLineEdit")
+        self.FilePushButton = QtWidgets.QPushButton(BatchCalculationsPage)
+        self.FilePushButton.setGeometry(QtCore.QRect(780, 45, 200, 25))
+        self.FilePushButton.setFocusPolicy(QtCore.Qt.NoFocus)
+        self.FilePushButton.setStyleSheet("QPushButton{background-color: #1D2D44;color: #F0EBD8;}\n"
+                                          "QPushButton:hover{background-color: #3E5C76;color: #F0EBD8;}\n"
+                                          "QPushButton:pressed{background-color: #748CAB;color: #F0EBD8;};")
+        self.FilePushButton.setObjectName("FilePushButton")
+        self.progressBar = QtWidgets.QProgressBar(BatchCalculationsPage)
+        self.progressBar.setGeometry(QtCore.QRect(10, 80, 425, 25))
+        self.progressBar.setProperty("value", 0)
+        self.progressBar.setAlignment(QtCore.Qt.AlignCenter)
+        self.progressBar.setObjectName("progressBar")
+        self.SavePushButton = QtWidgets.QPushButton(BatchCalculationsPage)
+        self.SavePushButton.setGeometry(QtCore.QRect(445, 80, 125, 25))
+        self.SavePushButton.setFocusPolicy(QtCore.Qt.NoFocus)
+        self.SavePushButton.setStyleSheet("QPushButton{background-color: #1D2D44;color: #F0EBD8;}\n"
+                                          "QPushButton:hover{background-color: #3E5C76;color: #F0EBD8;}\n"
+                                          "QPushButton:pressed{background-color: #748CAB;color: #F0EBD8;};")
+        self.SavePushButton.setObjectName("SavePushButton")
+        self.PausePushButton = QtWidgets.QPushButton(BatchCalculationsPage)
+        self.PausePushButton.setGeometry(QtCore.QRect(580, 80, 125, 25))
+        self.PausePushButton.setFocusPolicy(QtCore.Qt.NoFocus)
+        self.PausePushButton.setStyleSheet("QPushButton{background-color: #1D2D44;color: #F0EBD8;}\n"
+                                           "QPushButton:hover{background-color: #3E5C76;color: #F0EBD8;}\n"
+                                           "QPushButton:pressed{background-color: #748CAB;color: #F0EBD8;};")
+        self.PausePushButton.setCheckable(True)
+        self.PausePushButton.setObjectName("PausePushButton")
+        self.CancelPushButton = QtWidgets.QPushButton(BatchCalculationsPage)
+        self.CancelPushButton.setGeometry(QtCore.QRect(715, 80, 125, 25))
+        self.CancelPushButton.setFocusPolicy(QtCore.Qt.NoFocus)
+        self.CancelPushButton.setStyleSheet("QPushButton{background-color: #1D2D44;color: #F0EBD8;}\n"
+                                            "QPushButton:hover{background-color: #3E5C76;color: #F0EBD8;}\n"
+                                            "QPushButton:pressed{background-color: #748CAB;color: #F0EBD8;};")
+        self.CancelPushButton.setObjectName("CancelPushButton")
+        self.ClearAllPushButton = QtWidgets.QPushButton(BatchCalculationsPage)
+        self.ClearAllPushButton.setGeometry(QtCore.QRect(850, 80, 130, 25))
+        self.ClearAllPushButton.setFocusPolicy(QtCore.Qt.NoFocus)
+        self.ClearAllPushButton.setStyleSheet("QPushButton{background-color: #1D2D44;color: #F0EBD8;}\n"
+                                              "QPushButton:hover{background-color: #3E5C76;color: #F0EBD8;}\n"
+                                              "QPushButton:pressed{background-color: #748CAB;color: #F0EBD8;};")
+        self.ClearAllPushButton.setObjectName("ClearAllPushButton")
+        self.statusLabel = QtWidgets.QLabel(BatchCalculationsPage)
+        self.statusLabel.setGeometry(QtCore.QRect(10, 110, 970, 20))
+        self.statusLabel.setObjectName("statusLabel")
+        self.resultsTableView = QtWidgets.QTableView(BatchCalculationsPage)
+        self.resultsTableView.setGeometry(QtCore.QRect(10, 140, 970, 508))
+        self.resultsTableView.setFocusPolicy(QtCore.Qt.NoFocus)
+        self.resultsTableView.setEditTriggers(QtWidgets.QAbstractItemView.NoEditTriggers)
+        self.resultsTableView.setAlternatingRowColors(True)
+        self.resultsTableView.setSelectionMode(QtWidgets.QAbstractItemView.ExtendedSelection)
+        self.resultsTableView.setSelectionBehavior(QtWidgets.QAbstractItemView.SelectRows)
+        self.resultsTableView.setShowGrid(False)
+        self.resultsTableView.setWordWrap(False)
+        self.resultsTableView.horizontalHeader().setDefaultSectionSize(96)
+        self.resultsTableView.horizontalHeader().setMinimumSectionSize(15)
+        self.resultsTableView.horizontalHeader().setStretchLastSection(True)
+        self.resultsTableView.verticalHeader().setVisible(False)
+        self.resultsTableView.verticalHeader().setDefaultSectionSize(22)
+        self.resultsTableView.setObjectName("resultsTableView")
 
         self.retranslateUi(BatchCalculationsPage)
         QtCore.QMetaObject.connectSlotsByName(BatchCalculationsPage)
@@ -29,6 +137,18 @@ class Ui_BatchCalculationsPage(object):
     def retranslateUi(self, BatchCalculationsPage):
         _translate = QtCore.QCoreApplication.translate
         BatchCalculationsPage.setWindowTitle(_translate("BatchCalculationsPage", "Form"))
-
-
-from HEACalculator.ui import HEACalculator_rc
+        self.elementsLabel.setText(_translate("BatchCalculationsPage", "Elements"))
+        self.elementsLineEdit.setToolTip(_translate("BatchCalculationsPage", "Elements to screen, e.g. FeCoNiCr"))
+        self.startLabel.setText(_translate("BatchCalculationsPage", "Start"))
+        self.endLabel.setText(_translate("BatchCalculationsPage", "End"))
+        self.stepLabel.setText(_translate("BatchCalculationsPage", "Step"))
+        self.RangePushButton.setText(_translate("BatchCalculationsPage", "Screen Range"))
+        self.whereLabel.setText(_translate("BatchCalculationsPage", "Where"))
+        self.whereLineEdit.setToolTip(_translate("BatchCalculationsPage", "Condition the alloys should satisfy, e.g. omega_parameter >= 1.1 and atomic_size_difference < 6.6"))
+        self.FilePushButton.setText(_translate("BatchCalculationsPage", "Open File..."))
+        self.FilePushButton.setToolTip(_translate("BatchCalculationsPage", "Calculate the alloys listed in the formula column of a CSV file"))
+        self.SavePushButton.setText(_translate("BatchCalculationsPage", "Save"))
+        self.SavePushButton.setToolTip(_translate("BatchCalculationsPage", "Save the results shown as a CSV, Parquet or JSON Lines file"))
+        self.PausePushButton.setText(_translate("BatchCalculationsPage", "Pause"))
+        self.CancelPushButton.setText(_translate("BatchCalculationsPage", "Cancel"))
+        self.ClearAllPushButton.setText(_translate("BatchCalculationsPage", "Clear All"))
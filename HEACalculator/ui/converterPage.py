@@ -2,7 +2,7 @@
 
 # Form implementation generated from reading ui file 'converterPage.ui'
 #
-# Created by: PyQt5 UI code generator 5.15.1
+# Created by: PyQt5 UI code generator 5.15.0
 #
 # WARNING: Any manual changes made to this file will be lost when pyuic5 is
 # run again.  Do not edit this file unless you know what you are doing.
@@ -21,7 +21,54 @@ class Ui_ConverterPage(object):
         font.setBold(True)
         font.setWeight(75)
         ConverterPage.setFont(font)
-        ConverterPage.setStyleSheet("QWidget{background-color: #0D1321;};")
+        ConverterPage.setStyleSheet("QWidget{background-color: #0D1321;color: #F0EBD8;alternate-background-color: rgb(24,30,43);}\n"
+                                    "QLineEdit, QDoubleSpinBox{background-color: #1D2D44;border: none;}\n"
+                                    "QProgressBar{background-color: #1D2D44;border: none;}\n"
+                                    "QProgressBar::chunk{background-color: #3E5C76;}\n"
+                                    "QHeaderView::section{background-color: #1D2D44;color: #F0EBD8;border: none;}\n"
+                                    "QToolTip { color: #F0EBD8; background-color: rgb(34,45,67); border: none; }")
+        self.elementsLabel = QtWidgets.QLabel(ConverterPage)
+        self.elementsLabel.setGeometry(QtCore.QRect(10, 10, 80, 25))
+        self.elementsLabel.setObjectName("elementsLabel")
+        self.elementsLineEdit = QtWidgets.QLineEdit(ConverterPage)
+        self.elementsLineEdit.setGeometry(QtCore.QRect(90, 10, 390, 25))
+        self.elementsLineEdit.setObjectName("elementsLineEdit")
+        self.ElementsPushButton = QtWidgets.QPushButton(ConverterPage)
+        self.ElementsPushButton.setGeometry(QtCore.QRect(490, 10, 160, 25))
+        self.ElementsPushButton.setFocusPolicy(QtCore.Qt.NoFocus)
+        self.ElementsPushButton.setStyleSheet("QPushButton{background-color: #1D2D44;color: #F0EBD8;}\n"
+                                              "QPushButton:hover{background-color: #3E5C76;color: #F0EBD8;}\n"
+                                              "QPushButton:pressed{background-color: #748CAB;color: #F0EBD8;};")
+        self.ElementsPushButton.setObjectName("ElementsPushButton")
+        self.AddAlloyPushButton = QtWidgets.QPushButton(ConverterPage)
+        self.AddAlloyPushButton.setGeometry(QtCore.QRect(660, 10, 155, 25))
+        self.AddAlloyPushButton.setFocusPolicy(QtCore.Qt.NoFocus)
+        self.AddAlloyPushButton.setStyleSheet("QPushButton{background-color: #1D2D44;color: #F0EBD8;}\n"
+                                              "QPushButton:hover{background-color: #3E5C76;color: #F0EBD8;}\n"
+                                              "QPushButton:pressed{background-color: #748CAB;color: #F0EBD8;};")
+        self.AddAlloyPushButton.setObjectName("AddAlloyPushButton")
+        self.ClearAllPushButton = QtWidgets.QPushButton(ConverterPage)
+        self.ClearAllPushButton.setGeometry(QtCore.QRect(825, 10, 155, 25))
+        self.ClearAllPushButton.setFocusPolicy(QtCore.Qt.NoFocus)
+        self.ClearAllPushButton.setStyleSheet("QPushButton{background-color: #1D2D44;color: #F0EBD8;}\n"
+                                              "QPushButton:hover{background-color: #3E5C76;color: #F0EBD8;}\n"
+                                              "QPushButton:pressed{background-color: #748CAB;color: #F0EBD8;};")
+        self.ClearAllPushButton.setObjectName("ClearAllPushButton")
+        self.hintLabel = QtWidgets.QLabel(ConverterPage)
+        self.hintLabel.setGeometry(QtCore.QRect(10, 45, 970, 20))
+        self.hintLabel.setObjectName("hintLabel")
+        self.resultsTableView = QtWidgets.QTableView(ConverterPage)
+        self.resultsTableView.setGeometry(QtCore.QRect(10, 75, 970, 573))
+        self.resultsTableView.setEditTriggers(QtWidgets.QAbstractItemView.AnyKeyPressed|QtWidgets.QAbstractItemView.DoubleClicked|QtWidgets.QAbstractItemView.EditKeyPressed)
+        self.resultsTableView.setAlternatingRowColors(True)
+        self.resultsTableView.setSelectionMode(QtWidgets.QAbstractItemView.SingleSelection)
+        self.resultsTableView.setShowGrid(False)
+        self.resultsTableView.setWordWrap(False)
+        self.resultsTableView.horizontalHeader().setDefaultSectionSize(64)
+        self.resultsTableView.horizontalHeader().setMinimumSectionSize(15)
+        self.resultsTableView.verticalHeader().setVisible(False)
+        self.resultsTableView.verticalHeader().setDefaultSectionSize(22)
+        self.resultsTableView.setObjectName("resultsTableView")
 
         self.retranslateUi(ConverterPage)
         QtCore.QMetaObject.connectSlotsByName(ConverterPage)
@@ -29,6 +76,9 @@ class Ui_ConverterPage(object):
     def retranslateUi(self, ConverterPage):
         _translate = QtCore.QCoreApplication.translate
         ConverterPage.setWindowTitle(_translate("ConverterPage", "Form"))
-
-
-from HEACalculator.ui import HEACalculator_rc
+        self.elementsLabel.setText(_translate("ConverterPage", "Elements"))
+        self.elementsLineEdit.setToolTip(_translate("ConverterPage", "Elements of the alloys, e.g. AlTiVCrMn, or the at% of the first alloy, e.g. Al35Ti35V20Cr5Mn5"))
+        self.ElementsPushButton.setText(_translate("ConverterPage", "Set Elements"))
+        self.AddAlloyPushButton.setText(_translate("ConverterPage", "Add Alloy"))
+        self.ClearAllPushButton.setText(_translate("ConverterPage", "Clear All"))
+        self.hintLabel.setText(_translate("ConverterPage", "Edit an amount in any unit, the alloy is converted to the other units as you type"))
@@ -0,0 +1,443 @@
+#!/usr/bin/env python3
+
+# Copyright (C) 2022  Doguhan Sariturk
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+import numpy as np
+
+from PyQt5 import QtCore
+
+from HEACalculator.core.Converter import UNITS as AMOUNT_UNITS, BatchCalculator
+from HEACalculator.core.properties import PROPERTY_LABELS
+from HEACalculator.core.table import ResultTable
+
+__author__ = "Doguhan Sariturk"
+__email__ = "dogu.sariturk@gmail.com"
+
+UNITS = {
+        'density': 'g/cm^3',
+        'mixing_enthalpy': 'kJ/mol',
+        'mixing_entropy': 'J/K.mol',
+        'formation_enthalpy': 'meV/atom',
+        'min_formation_enthalpy': 'meV/atom',
+        'melting_temperature': 'K',
+}
+
+
+class ResultsModel(QtCore.QAbstractTableModel):
+    """Table of calculated properties, fed with the columnar batches of the screening functions.
+
+    The results are stored in a :class:`HEACalculator.core.table.ResultTable`,
+    and only the cells of the visible rows are formatted, when the view asks
+    for them. Each batch is inserted at once.
+
+    Parameters
+    ----------
+    elements : sequence of str, optional
+        Element symbols, one per column of the compositions. None if the batches hold the formulas of the alloys.
+
+    properties : sequence of str, optional
+        The properties to show. By default None, which implies to the default output.
+
+    precision : int, optional
+        Number of decimals of the numerical properties, by default 2
+
+    parent : QtCore.QObject, optional
+        Parent of the model
+
+    Attributes
+    ----------
+    table : HEACalculator.core.table.ResultTable
+        The results
+    """
+
+    def __init__(self, elements=None, properties=None, precision=2, parent=None):
+        super().__init__(parent)
+        self.table = ResultTable(elements, properties)
+        self._number_format = f'%.{int(precision)}f'
+
+    @property
+    def elements(self):
+        """list of str: Element symbols of the compositions, None if the model holds the formulas of the alloys"""
+        return self.table.elements
+
+    @property
+    def properties(self):
+        """tuple of str: The properties shown after the formula column"""
+        return self.table.properties
+
+    def reset(self, elements=None, properties=None):
+        """Removes every row, and changes the columns of the table
+
+        Parameters
+        ----------
+        elements : sequence of str, optional
+            Element symbols of the new batches, None if they hold the formulas of the alloys
+
+        properties : sequence of str, optional
+            The properties to show. By default None, which implies to the default output.
+        """
+        self.beginResetModel()
+        self.table = ResultTable(elements, properties)
+        self.endResetModel()
+
+    def append(self, compositions, columns):
+        """Appends a batch of results
+
+        Parameters
+        ----------
+        compositions : numpy.ndarray or sequence of str
+            (N, E) matrix of element amounts, or the formulas of the alloys if the model has no elements
+
+        columns : dict
+            Arrays of the properties, indexed by property name
+        """
+        count = len(compositions)
+        if not count:
+            return
+        first = len(self.table)
+        self.beginInsertRows(QtCore.QModelIndex(), first, first + count - 1)
+        self.table.append(compositions, columns)
+        self.endInsertRows()
+
+    def column_property(self, column):
+        """Returns the property shown in a column
+
+        Parameters
+        ----------
+        column : int
+            Column of the model
+
+        Returns
+        -------
+        str
+            Name of the property, None for the formula column
+        """
+        return self.properties[column - 1] if column else None
+
+    def rowCount(self, parent=QtCore.QModelIndex()):
+        return 0 if parent.isValid() else len(self.table)
+
+    def columnCount(self, parent=QtCore.QModelIndex()):
+        return 0 if parent.isValid() else len(self.properties) + 1
+
+    def headerData(self, section, orientation, role=QtCore.Qt.DisplayRole):
+        if orientation != QtCore.Qt.Horizontal:
+            return None
+        name = self.column_property(section)
+        if role == QtCore.Qt.DisplayRole:
+            return PROPERTY_LABELS[name] if name else 'Formula'
+        if role == QtCore.Qt.ToolTipRole and name in UNITS:
+            return UNITS[name]
+        return None
+
+    def data(self, index, role=QtCore.Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        if role == QtCore.Qt.TextAlignmentRole:
+            return QtCore.Qt.AlignCenter
+        if role != QtCore.Qt.DisplayRole:
+            return None
+        if not index.column():
+            return self.table.formula(index.row())
+        value = self.table.value(index.row(), self.column_property(index.column()))
+        return value if isinstance(value, str) else self._number_format % value
+
+
+class ResultsProxyModel(QtCore.QAbstractProxyModel):
+    """Sorted and filtered view of a :class:`ResultsModel`.
+
+    The rows are sorted and filtered with numpy, on the columns of the
+    results table, so no cell is formatted to sort or filter them. The rows
+    appended to the source model are filtered as they come, and moved to
+    their place if the view is sorted.
+
+    Parameters
+    ----------
+    parent : QtCore.QObject, optional
+        Parent of the model
+
+    Attributes
+    ----------
+    condition : HEACalculator.core.filters.Expression
+        Condition the shown alloys satisfy, None to show every alloy
+    """
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.condition = None
+        self._sort_column = -1
+        self._sort_order = QtCore.Qt.AscendingOrder
+        self._rows = np.empty(0, dtype=np.intp)
+        self._positions = None
+
+    def setSourceModel(self, model):
+        previous = self.sourceModel()
+        if previous is not None:
+            previous.modelAboutToBeReset.disconnect(self.beginResetModel)
+            previous.modelReset.disconnect(self._sourceReset)
+            previous.rowsInserted.disconnect(self._sourceRowsInserted)
+        self.beginResetModel()
+        super().setSourceModel(model)
+        model.modelAboutToBeReset.connect(self.beginResetModel)
+        model.modelReset.connect(self._sourceReset)
+        model.rowsInserted.connect(self._sourceRowsInserted)
+        self._setRows(self._select(None))
+        self.endResetModel()
+
+    def setCondition(self, condition):
+        """Shows only the alloys satisfying a condition
+
+        Parameters
+        ----------
+        condition : HEACalculator.core.filters.Expression
+            The condition, None to show every alloy
+
+        Raises
+        ------
+        ValueError
+            If the condition refers to a property which is not in the results
+        """
+        table = self.sourceModel().table
+        if condition is not None:
+            # Raises before the model is touched
+            table.mask(condition, np.empty(0, dtype=np.intp))
+        self.beginResetModel()
+        self.condition = condition
+        self._setRows(self._select(None))
+        self.endResetModel()
+
+    def sourceRows(self):
+        """Returns the rows of the source model, in the order they are shown
+
+        Returns
+        -------
+        numpy.ndarray
+            Indices of the rows of the results table. The array is replaced, never modified, when the view changes.
+        """
+        return self._rows
+
+    def sort(self, column, order=QtCore.Qt.AscendingOrder):
+        self._sort_column, self._sort_order = column, order
+        self._relayout(self._rows)
+
+    def _select(self, rows):
+        """Filters the given source rows, all of them if None, and sorts them"""
+        table = self.sourceModel().table
+        if rows is None:
+            rows = np.arange(len(table))
+        if self.condition is not None and len(rows):
+            try:
+                rows = rows[table.mask(self.condition, rows)]
+            except ValueError:
+                # The new results do not have the properties of the condition
+                self.condition = None
+        return self._sorted(rows)
+
+    def _sorted(self, rows):
+        if self._sort_column < 0:
+            return np.sort(rows)
+        model = self.sourceModel()
+        return model.table.order(model.column_property(self._sort_column), rows,
+                                 descending=self._sort_order == QtCore.Qt.DescendingOrder)
+
+    def _setRows(self, rows):
+        self._rows = rows
+        self._positions = None
+
+    def _relayout(self, rows):
+        """Replaces the rows by a permutation of them, keeping the selection"""
+        self.layoutAboutToBeChanged.emit()
+        persistent = self.persistentIndexList()
+        sources = [self.mapToSource(index) for index in persistent]
+        self._setRows(self._sorted(rows))
+        self.changePersistentIndexList(persistent, [self.mapFromSource(index) for index in sources])
+        self.layoutChanged.emit()
+
+    def _sourceReset(self):
+        self._setRows(self._select(None))
+        self.endResetModel()
+
+    def _sourceRowsInserted(self, parent, first, last):
+        rows = self._select(np.arange(first, last + 1))
+        if not len(rows):
+            return
+        count = len(self._rows)
+        self.beginInsertRows(QtCore.QModelIndex(), count, count + len(rows) - 1)
+        self._setRows(np.concatenate([self._rows, rows]))
+        self.endInsertRows()
+        if self._sort_column >= 0:
+            self._relayout(self._rows)
+
+    def index(self, row, column, parent=QtCore.QModelIndex()):
+        if parent.isValid() or not 0 <= row < len(self._rows) or not 0 <= column < self.columnCount():
+            return QtCore.QModelIndex()
+        return self.createIndex(row, column)
+
+    def parent(self, index=None):
+        return QtCore.QModelIndex()
+
+    def rowCount(self, parent=QtCore.QModelIndex()):
+        return 0 if parent.isValid() else len(self._rows)
+
+    def columnCount(self, parent=QtCore.QModelIndex()):
+        return 0 if parent.isValid() or self.sourceModel() is None else self.sourceModel().columnCount()
+
+    def mapToSource(self, index):
+        if not index.isValid():
+            return QtCore.QModelIndex()
+        return self.sourceModel().index(int(self._rows[index.row()]), index.column())
+
+    def mapFromSource(self, index):
+        if not index.isValid():
+            return QtCore.QModelIndex()
+        if self._positions is None:
+            self._positions = np.full(self.sourceModel().rowCount(), -1, dtype=np.intp)
+            self._positions[self._rows] = np.arange(len(self._rows))
+        row = self._positions[index.row()] if index.row() < len(self._positions) else -1
+        return self.index(int(row), index.column()) if row >= 0 else QtCore.QModelIndex()
+
+    def headerData(self, section, orientation, role=QtCore.Qt.DisplayRole):
+        if orientation == QtCore.Qt.Horizontal:
+            return self.sourceModel().headerData(section, orientation, role)
+        return None
+
+
+class ConverterModel(QtCore.QAbstractTableModel):
+    """Editable table of alloys in at%, wt% and vol%, converted as they are edited.
+
+    Each row is an alloy, with one column per element in each unit. Editing
+    an amount converts the alloy from the unit of the edited column to the
+    other units, and only that row is converted. The element properties are
+    looked up by the :class:`HEACalculator.core.Converter.BatchCalculator`
+    once, when the elements are set.
+
+    Parameters
+    ----------
+    elements : sequence of str, optional
+        Element symbols of the alloys
+
+    precision : int, optional
+        Number of decimals of the amounts, by default 2
+
+    parent : QtCore.QObject, optional
+        Parent of the model
+
+    Attributes
+    ----------
+    values : dict
+        (N, E) matrix of the amounts of the alloys in each unit, indexed by unit
+    """
+
+    def __init__(self, elements=(), precision=2, parent=None):
+        super().__init__(parent)
+        self._number_format = f'%.{int(precision)}f'
+        self._set_calculator(BatchCalculator(elements))
+
+    def _set_calculator(self, calculator):
+        self.calculator = calculator
+        self.values = {unit: np.empty((0, len(self.elements))) for unit in AMOUNT_UNITS}
+
+    @property
+    def elements(self):
+        """list of str: Element symbols of the alloys"""
+        return self.calculator.elements
+
+    def setElements(self, elements):
+        """Removes every alloy, and changes the elements of the table
+
+        Parameters
+        ----------
+        elements : sequence of str
+            Element symbols of the alloys
+
+        Raises
+        ------
+        KeyError
+            If one of the elements does not exist in the database, in which case the table is not changed
+        """
+        calculator = BatchCalculator(elements)
+        self.beginResetModel()
+        self._set_calculator(calculator)
+        self.endResetModel()
+
+    def appendRows(self, values, unit='at'):
+        """Appends alloys, converted to every unit at once
+
+        Parameters
+        ----------
+        values : array_like
+            (N, E) matrix of the amounts of the alloys
+
+        unit : str, optional
+            Unit of the amounts, by default ``'at'``
+        """
+        values = np.asarray(values, dtype=float).reshape(-1, len(self.elements))
+        if not len(values):
+            return
+        first = self.rowCount()
+        self.beginInsertRows(QtCore.QModelIndex(), first, first + len(values) - 1)
+        for target in AMOUNT_UNITS:
+            converted = values if target == unit else self.calculator.convert(values, unit, target)
+            self.values[target] = np.concatenate([self.values[target], converted])
+        self.endInsertRows()
+
+    def rowCount(self, parent=QtCore.QModelIndex()):
+        return 0 if parent.isValid() else len(self.values['at'])
+
+    def columnCount(self, parent=QtCore.QModelIndex()):
+        return 0 if parent.isValid() else len(AMOUNT_UNITS) * len(self.elements)
+
+    def _locate(self, column):
+        unit, element = divmod(column, len(self.elements))
+        return AMOUNT_UNITS[unit], element
+
+    def headerData(self, section, orientation, role=QtCore.Qt.DisplayRole):
+        if orientation != QtCore.Qt.Horizontal or role != QtCore.Qt.DisplayRole:
+            return None
+        unit, element = self._locate(section)
+        return f'{self.elements[element]} {unit}%'
+
+    def flags(self, index):
+        return super().flags(index) | QtCore.Qt.ItemIsEditable
+
+    def data(self, index, role=QtCore.Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        if role == QtCore.Qt.TextAlignmentRole:
+            return QtCore.Qt.AlignCenter
+        if role not in (QtCore.Qt.DisplayRole, QtCore.Qt.EditRole):
+            return None
+        unit, element = self._locate(index.column())
+        value = self.values[unit][index.row(), element]
+        return '' if np.isnan(value) else self._number_format % value
+
+    def setData(self, index, value, role=QtCore.Qt.EditRole):
+        if not index.isValid() or role != QtCore.Qt.EditRole:
+            return False
+        try:
+            value = float(value)
+        except (TypeError, ValueError):
+            return False
+        row = index.row()
+        unit, element = self._locate(index.column())
+        self.values[unit][row, element] = value
+        count = len(self.elements)
+        for idx, target in enumerate(AMOUNT_UNITS):
+            if target != unit:
+                self.values[target][row] = self.calculator.convert(self.values[unit][row], unit, target)
+                # The edited unit is left out, so that the editor of the cell is not reset while typing
+                self.dataChanged.emit(self.index(row, idx * count), self.index(row, (idx + 1) * count - 1))
+        return True
@@ -9,7 +9,6 @@
 
 
 from PyQt5 import Qt, QtCore, QtGui, QtWidgets
-from HEACalculator.ui import HEACalculator_rc
 
 class Ui_ParametersPage(object):
     def setupUi(self, ParametersPage):
@@ -3014,96 +3013,79 @@ class Ui_ParametersPage(object):
         self.tableWidget.horizontalHeader().setMinimumSectionSize(18)
         self.tableWidget.horizontalHeader().setStretchLastSection(True)
         self.tableWidget.verticalHeader().setVisible(False)
-        self.resultsTreeWidget = QtWidgets.QTreeWidget(ParametersPage)
-        self.resultsTreeWidget.setGeometry(QtCore.QRect(10, 310, 971, 333))
+        self.resultsTreeView = QtWidgets.QTreeView(ParametersPage)
+        self.resultsTreeView.setGeometry(QtCore.QRect(10, 310, 971, 333))
         sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Fixed, QtWidgets.QSizePolicy.Fixed)
         sizePolicy.setHorizontalStretch(0)
         sizePolicy.setVerticalStretch(0)
-        sizePolicy.setHeightForWidth(self.resultsTreeWidget.sizePolicy().hasHeightForWidth())
-        self.resultsTreeWidget.setSizePolicy(sizePolicy)
-        self.resultsTreeWidget.setMinimumSize(QtCore.QSize(100, 0))
-        self.resultsTreeWidget.setMaximumSize(QtCore.QSize(1000, 16777215))
+        sizePolicy.setHeightForWidth(self.resultsTreeView.sizePolicy().hasHeightForWidth())
+        self.resultsTreeView.setSizePolicy(sizePolicy)
+        self.resultsTreeView.setMinimumSize(QtCore.QSize(100, 0))
+        self.resultsTreeView.setMaximumSize(QtCore.QSize(1000, 16777215))
         font = QtGui.QFont()
         font.setPointSize(13)
         font.setBold(False)
         font.setWeight(50)
-        self.resultsTreeWidget.setFont(font)
-        self.resultsTreeWidget.setFocusPolicy(QtCore.Qt.NoFocus)
-        self.resultsTreeWidget.setStyleSheet("QTreeWidget {\n"
-                                             "    color: #F0EBD8;\n"
-                                             "}\n"
-                                             "\n"
-                                             "QTreeWidget::item:selected{\n"
-                                             "    background-color: #3E5C76;\n"
-                                             "    color: #F0EBD8;\n"
-                                             "}\n"
-                                             "\n"
-                                             "QHeaderView::section{\n"
-                                             "    color: #F0EBD8;\n"
-                                             "    background-color: #1D2D44;\n"
-                                             "    max-width: 30px;\n"
-                                             "    border: 0px solid;\n"
-                                             "    border-style: none;\n"
-                                             "    border-bottom: 0px solid;\n"
-                                             "    border-right: 1px solid rgb(53, 66, 87);\n"
-                                             "}\n"
-                                             "\n"
-                                             "QHeaderView::section:horizontal\n"
-                                             "{\n"
-                                             "    background-color: #1D2D44;\n"
-                                             "    border-bottom: 0px solid;\n"
-                                             "}\n"
-                                             "QHeaderView::section:vertical\n"
-                                             "{\n"
-                                             "    border: 0px solid rgb(44, 49, 60);\n"
-                                             "}\n"
-                                             "\n"
-                                             "QHeaderView::down-arrow {\n"
-                                             "     image: url(down_arrow_gray.png);\n"
-                                             "}\n"
-                                             "\n"
-                                             "QHeaderView::up-arrow {\n"
-                                             "}")
-        self.resultsTreeWidget.setFrameShape(QtWidgets.QFrame.NoFrame)
-        self.resultsTreeWidget.setSizeAdjustPolicy(QtWidgets.QAbstractScrollArea.AdjustIgnored)
-        self.resultsTreeWidget.setEditTriggers(QtWidgets.QAbstractItemView.NoEditTriggers)
-        self.resultsTreeWidget.setTabKeyNavigation(True)
-        self.resultsTreeWidget.setProperty("showDropIndicator", False)
-        self.resultsTreeWidget.setAlternatingRowColors(True)
-        self.resultsTreeWidget.setSelectionMode(QtWidgets.QAbstractItemView.ExtendedSelection)
-        self.resultsTreeWidget.setRootIsDecorated(False)
-        self.resultsTreeWidget.setUniformRowHeights(True)
-        self.resultsTreeWidget.setItemsExpandable(True)
-        self.resultsTreeWidget.setAnimated(True)
-        self.resultsTreeWidget.setAllColumnsShowFocus(False)
-        self.resultsTreeWidget.setWordWrap(True)
-        self.resultsTreeWidget.setHeaderHidden(False)
-        self.resultsTreeWidget.setExpandsOnDoubleClick(True)
-        self.resultsTreeWidget.setObjectName("resultsTreeWidget")
-        self.resultsTreeWidget.headerItem().setTextAlignment(0, QtCore.Qt.AlignCenter)
-        self.resultsTreeWidget.headerItem().setTextAlignment(1, QtCore.Qt.AlignCenter)
-        self.resultsTreeWidget.headerItem().setTextAlignment(2, QtCore.Qt.AlignCenter)
-        self.resultsTreeWidget.headerItem().setTextAlignment(3, QtCore.Qt.AlignCenter)
-        self.resultsTreeWidget.headerItem().setTextAlignment(4, QtCore.Qt.AlignCenter)
-        self.resultsTreeWidget.headerItem().setTextAlignment(5, QtCore.Qt.AlignCenter)
-        self.resultsTreeWidget.headerItem().setTextAlignment(6, QtCore.Qt.AlignCenter)
-        self.resultsTreeWidget.headerItem().setTextAlignment(7, QtCore.Qt.AlignCenter)
-        self.resultsTreeWidget.headerItem().setTextAlignment(8, QtCore.Qt.AlignCenter)
-        self.resultsTreeWidget.headerItem().setTextAlignment(9, QtCore.Qt.AlignCenter)
-        self.resultsTreeWidget.headerItem().setTextAlignment(10, QtCore.Qt.AlignCenter)
-        self.resultsTreeWidget.headerItem().setTextAlignment(11, QtCore.Qt.AlignCenter)
-        self.resultsTreeWidget.headerItem().setTextAlignment(12, QtCore.Qt.AlignCenter)
-        self.resultsTreeWidget.headerItem().setTextAlignment(13, QtCore.Qt.AlignCenter)
-        self.resultsTreeWidget.headerItem().setTextAlignment(14, QtCore.Qt.AlignCenter)
-        self.resultsTreeWidget.headerItem().setTextAlignment(15, QtCore.Qt.AlignCenter)
-        self.resultsTreeWidget.headerItem().setTextAlignment(16, QtCore.Qt.AlignCenter)
-        self.resultsTreeWidget.header().setVisible(True)
-        self.resultsTreeWidget.header().setCascadingSectionResizes(False)
-        self.resultsTreeWidget.header().setDefaultSectionSize(96)
-        self.resultsTreeWidget.header().setHighlightSections(True)
-        self.resultsTreeWidget.header().setMinimumSectionSize(15)
-        self.resultsTreeWidget.header().setSortIndicatorShown(True)
-        self.resultsTreeWidget.header().setStretchLastSection(True)
+        self.resultsTreeView.setFont(font)
+        self.resultsTreeView.setFocusPolicy(QtCore.Qt.NoFocus)
+        self.resultsTreeView.setStyleSheet("QTreeView {\n"
+                                           "    color: #F0EBD8;\n"
+                                           "}\n"
+                                           "\n"
+                                           "QTreeView::item:selected{\n"
+                                           "    background-color: #3E5C76;\n"
+                                           "    color: #F0EBD8;\n"
+                                           "}\n"
+                                           "\n"
+                                           "QHeaderView::section{\n"
+                                           "    color: #F0EBD8;\n"
+                                           "    background-color: #1D2D44;\n"
+                                           "    max-width: 30px;\n"
+                                           "    border: 0px solid;\n"
+                                           "    border-style: none;\n"
+                                           "    border-bottom: 0px solid;\n"
+                                           "    border-right: 1px solid rgb(53, 66, 87);\n"
+                                           "}\n"
+                                           "\n"
+                                           "QHeaderView::section:horizontal\n"
+                                           "{\n"
+                                           "    background-color: #1D2D44;\n"
+                                           "    border-bottom: 0px solid;\n"
+                                           "}\n"
+                                           "QHeaderView::section:vertical\n"
+                                           "{\n"
+                                           "    border: 0px solid rgb(44, 49, 60);\n"
+                                           "}\n"
+                                           "\n"
+                                           "QHeaderView::down-arrow {\n"
+                                           "     image: url(down_arrow_gray.png);\n"
+                                           "}\n"
+                                           "\n"
+                                           "QHeaderView::up-arrow {\n"
+                                           "}")
+        self.resultsTreeView.setFrameShape(QtWidgets.QFrame.NoFrame)
+        self.resultsTreeView.setSizeAdjustPolicy(QtWidgets.QAbstractScrollArea.AdjustIgnored)
+        self.resultsTreeView.setEditTriggers(QtWidgets.QAbstractItemView.NoEditTriggers)
+        self.resultsTreeView.setTabKeyNavigation(True)
+        self.resultsTreeView.setProperty("showDropIndicator", False)
+        self.resultsTreeView.setAlternatingRowColors(True)
+        self.resultsTreeView.setSelectionMode(QtWidgets.QAbstractItemView.ExtendedSelection)
+        self.resultsTreeView.setRootIsDecorated(False)
+        self.resultsTreeView.setUniformRowHeights(True)
+        self.resultsTreeView.setItemsExpandable(True)
+        self.resultsTreeView.setAnimated(True)
+        self.resultsTreeView.setAllColumnsShowFocus(False)
+        self.resultsTreeView.setWordWrap(True)
+        self.resultsTreeView.setHeaderHidden(False)
+        self.resultsTreeView.setExpandsOnDoubleClick(True)
+        self.resultsTreeView.setObjectName("resultsTreeView")
+        self.resultsTreeView.header().setVisible(True)
+        self.resultsTreeView.header().setCascadingSectionResizes(False)
+        self.resultsTreeView.header().setDefaultSectionSize(96)
+        self.resultsTreeView.header().setHighlightSections(True)
+        self.resultsTreeView.header().setMinimumSectionSize(15)
+        self.resultsTreeView.header().setSortIndicatorShown(True)
+        self.resultsTreeView.header().setStretchLastSection(True)
         self.ClearAllPushButton = QtWidgets.QPushButton(ParametersPage)
         self.ClearAllPushButton.setGeometry(QtCore.QRect(570, 264, 410, 25))
         sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Minimum, QtWidgets.QSizePolicy.Preferred)
@@ -3262,45 +3244,7 @@ class Ui_ParametersPage(object):
         item.setText(_translate("ParametersPage", "Element"))
         item = self.tableWidget.horizontalHeaderItem(1)
         item.setText(_translate("ParametersPage", "at%"))
-        self.resultsTreeWidget.setSortingEnabled(True)
-        header = self.resultsTreeWidget.header()
-        header.setSectionResizeMode(QtWidgets.QHeaderView.ResizeToContents)
-        header.setStretchLastSection(False)
-        header.setSectionResizeMode(5, QtWidgets.QHeaderView.Stretch)
-        self.resultsTreeWidget.headerItem().setText(0, _translate("ParametersPage", "Formula"))
-
-        self.resultsTreeWidget.headerItem().setText(1, _translate("ParametersPage", "Density"))
-        self.resultsTreeWidget.headerItem().setToolTip(1, _translate("ParametersPage",
-                                                                     "<html><head/><body><p>g/cm<span style=\" vertical-align:super;\">3</span></p></body></html>"))
-        self.resultsTreeWidget.headerItem().setText(2, _translate("ParametersPage", "δ"))
-        self.resultsTreeWidget.headerItem().setText(3, _translate("ParametersPage", "Ω"))
-        self.resultsTreeWidget.headerItem().setText(4, _translate("ParametersPage", "VEC"))
-
-        self.resultsTreeWidget.headerItem().setText(5, _translate("ParametersPage", "Mixing Enthalpy"))
-        self.resultsTreeWidget.headerItem().setToolTip(5, _translate("ParametersPage",
-                                                                     "<html><head/><body><p>kJ/mol</p></body></html>"))
-        self.resultsTreeWidget.headerItem().setText(6, _translate("ParametersPage", "Mixing Entropy"))
-        self.resultsTreeWidget.headerItem().setToolTip(6, _translate("ParametersPage",
-                                                                     "<html><head/><body><p>J/K.mol</p></body></html>"))
-
-        self.resultsTreeWidget.headerItem().setText(7, _translate("ParametersPage", "Formation Enthalpy"))
-        self.resultsTreeWidget.headerItem().setToolTip(7, _translate("ParametersPage",
-                                                                     "<html><head/><body><p>meV/atom</p></body></html>"))
-
-        self.resultsTreeWidget.headerItem().setText(8, _translate("ParametersPage", "Melting Temperature"))
-        self.resultsTreeWidget.headerItem().setToolTip(8, _translate("ParametersPage",
-                                                                     "<html><head/><body><p>K</p></body></html>"))
-
-
-        self.resultsTreeWidget.headerItem().setText(9, _translate("ParametersPage", "Crystal Structure"))
-        self.resultsTreeWidget.headerItem().setText(10, _translate("ParametersPage", "Model 1"))
-        self.resultsTreeWidget.headerItem().setText(11, _translate("ParametersPage", "Model 2"))
-        self.resultsTreeWidget.headerItem().setText(12, _translate("ParametersPage", "Model 3"))
-        self.resultsTreeWidget.headerItem().setText(13, _translate("ParametersPage", "Model 4"))
-        self.resultsTreeWidget.headerItem().setText(14, _translate("ParametersPage", "Model 5"))
-        self.resultsTreeWidget.headerItem().setText(15, _translate("ParametersPage", "Model 6"))
-        self.resultsTreeWidget.headerItem().setText(16, _translate("ParametersPage", "Model 7"))
-        self.resultsTreeWidget.headerItem().setText(17, _translate("ParametersPage", "Model 8"))
+        self.resultsTreeView.setSortingEnabled(True)
         self.ClearAllPushButton.setText(_translate("ParametersPage", "Clear All"))
         self.SavePushButton.setText(_translate("ParametersPage", "Save"))
         self.CalculatePushButton.setText(_translate("ParametersPage", "Calculate"))
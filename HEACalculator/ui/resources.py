@@ -0,0 +1,43 @@
+#!/usr/bin/env python3
+
+# Copyright (C) 2022  Doguhan Sariturk
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+import functools
+import os
+
+from PyQt5 import QtCore
+
+__author__ = "Doguhan Sariturk"
+__email__ = "dogu.sariturk@gmail.com"
+
+# Compiled from HEACalculator.qrc with ``rcc --binary HEACalculator.qrc -o HEACalculator.rcc``
+RESOURCE_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'HEACalculator.rcc')
+
+
+@functools.lru_cache(maxsize=None)
+def register_resources():
+    """Registers the icons and images of the user interface, once per process
+
+    The compiled resource file is memory-mapped by Qt instead of being loaded
+    from a Python module, so the resources cost nothing until the GUI is started.
+
+    Raises
+    ------
+    OSError
+        If the resource file cannot be registered
+    """
+    if not QtCore.QResource.registerResource(RESOURCE_FILE):
+        raise OSError(f'The resource file {RESOURCE_FILE} cannot be registered.')
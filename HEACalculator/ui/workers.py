@@ -0,0 +1,260 @@
+#!/usr/bin/env python3
+
+# Copyright (C) 2022  Doguhan Sariturk
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+import threading
+
+from PyQt5 import QtCore
+
+__author__ = "Doguhan Sariturk"
+__email__ = "dogu.sariturk@gmail.com"
+
+
+class WorkerSignals(QtCore.QObject):
+    """Signals of a :class:`Worker`, which cannot emit signals itself as it is not a QObject.
+
+    Every signal carries the request number of the worker, so the receiver can
+    ignore the signals of the requests it no longer waits for.
+    """
+
+    progress = QtCore.pyqtSignal(int, object)
+    result = QtCore.pyqtSignal(int, object)
+    error = QtCore.pyqtSignal(int, str)
+    finished = QtCore.pyqtSignal(int)
+
+
+class Worker(QtCore.QRunnable):
+    """Runs a function in a thread of a QThreadPool, and posts its result back through signals.
+
+    The signals are delivered to the thread of the receiver, so the widgets are
+    only ever updated from the UI thread. A cancelled worker does not emit its
+    result or error, but always emits :attr:`WorkerSignals.finished`, once it
+    is done or if it is cancelled before it starts.
+
+    Parameters
+    ----------
+    request : int
+        Number of the request the worker runs
+
+    function : callable
+        Function to run. It receives the worker as `worker` keyword argument if
+        `pass_worker` is True, to report its progress with :meth:`report` and
+        to call :meth:`checkpoint` between two steps, so that it can be paused and cancelled.
+
+    *args
+        Positional arguments of the function
+
+    pass_worker : bool, optional
+        Whether the worker is passed to the function, by default False
+
+    **kwargs
+        Keyword arguments of the function
+    """
+
+    def __init__(self, request, function, *args, pass_worker=False, **kwargs):
+        super().__init__()
+        # The worker is owned by Python, so it can be cancelled whether it is queued, running or done
+        self.setAutoDelete(False)
+
+        self.request = request
+        self.signals = WorkerSignals()
+        self._function = function
+        self._args = args
+        self._kwargs = dict(kwargs, worker=self) if pass_worker else kwargs
+        self._cancelled = threading.Event()
+        self._running = threading.Event()
+        self._running.set()
+
+    @property
+    def cancelled(self):
+        """bool: Whether the worker was cancelled"""
+        return self._cancelled.is_set()
+
+    @property
+    def paused(self):
+        """bool: Whether the worker is paused"""
+        return not self._running.is_set()
+
+    def cancel(self):
+        """Cancels the worker, which drops its result"""
+        self._cancelled.set()
+        self._running.set()
+
+    def pause(self):
+        """Pauses the worker at its next :meth:`checkpoint`"""
+        if not self.cancelled:
+            self._running.clear()
+
+    def resume(self):
+        """Resumes the paused worker"""
+        self._running.set()
+
+    def checkpoint(self):
+        """Blocks while the worker is paused, called by the function between two steps
+
+        Returns
+        -------
+        bool
+            False if the worker was cancelled, in which case the function should return
+        """
+        self._running.wait()
+        return not self.cancelled
+
+    def report(self, progress):
+        """Posts the progress of the function, unless the worker was cancelled
+
+        Parameters
+        ----------
+        progress : object
+            Progress, e.g. the results calculated since the last report
+        """
+        if not self.cancelled:
+            self.signals.progress.emit(self.request, progress)
+
+    def run(self):
+        try:
+            if self.cancelled:
+                return
+            try:
+                result = self._function(*self._args, **self._kwargs)
+            except Exception as e:
+                if not self.cancelled:
+                    self.signals.error.emit(self.request, e.args[0] if isinstance(e, KeyError) and e.args else str(e))
+                return
+            if not self.cancelled:
+                self.signals.result.emit(self.request, result)
+        finally:
+            self.signals.finished.emit(self.request)
+
+
+class WorkerPool(QtCore.QObject):
+    """Dispatches workers to a QThreadPool, and keeps track of the current request.
+
+    Starting a request makes the previous ones stale: they are cancelled, so
+    only the result of the latest request is delivered.
+
+    Parameters
+    ----------
+    parent : QtCore.QObject, optional
+        Parent of the pool
+
+    thread_pool : QtCore.QThreadPool, optional
+        Pool running the workers, by default the global instance
+
+    Attributes
+    ----------
+    busyChanged : QtCore.pyqtSignal
+        Emitted with True when a request starts, and with False once no request is pending
+    """
+
+    busyChanged = QtCore.pyqtSignal(bool)
+
+    def __init__(self, parent=None, thread_pool=None):
+        super().__init__(parent)
+        self.threadPool = thread_pool or QtCore.QThreadPool.globalInstance()
+        self.request = 0
+        self._workers = {}
+
+    @property
+    def busy(self):
+        """bool: Whether the current request is pending"""
+        worker = self._workers.get(self.request)
+        return worker is not None and not worker.cancelled
+
+    def start(self, function, *args, pass_worker=False, slots=None, **kwargs):
+        """Cancels the pending requests and runs a function as a new request
+
+        Parameters
+        ----------
+        function : callable
+            Function to run, see :class:`Worker`
+
+        *args
+            Positional arguments of the function
+
+        pass_worker : bool, optional
+            Whether the worker is passed to the function, by default False
+
+        slots : dict, optional
+            Slots connected to the signals of the worker, indexed by signal name, e.g. ``{'result': ...}``.
+            They are connected before the worker starts, as the signals emitted before a slot is
+            connected are lost.
+
+        **kwargs
+            Keyword arguments of the function
+
+        Returns
+        -------
+        Worker
+            The worker of the request
+        """
+        self.cancel()
+        self.request += 1
+        worker = Worker(self.request, function, *args, pass_worker=pass_worker, **kwargs)
+        worker.signals.finished.connect(self._finished)
+        for name, slot in (slots or {}).items():
+            getattr(worker.signals, name).connect(slot)
+        self._workers[worker.request] = worker
+        self.threadPool.start(worker)
+        self.busyChanged.emit(True)
+        return worker
+
+    def cancel(self):
+        """Cancels the pending requests"""
+        was_busy = self.busy
+        for request, worker in list(self._workers.items()):
+            worker.cancel()
+            if self.threadPool.tryTake(worker):
+                # The worker was still queued, so it never runs
+                del self._workers[request]
+        if was_busy:
+            self.busyChanged.emit(False)
+
+    @property
+    def paused(self):
+        """bool: Whether the current request is paused"""
+        return self.busy and self._workers[self.request].paused
+
+    def pause(self):
+        """Pauses the current request"""
+        if self.busy:
+            self._workers[self.request].pause()
+
+    def resume(self):
+        """Resumes the current request"""
+        if self.busy:
+            self._workers[self.request].resume()
+
+    def is_current(self, request):
+        """Returns whether the given request is the current one, and was not cancelled
+
+        Parameters
+        ----------
+        request : int
+            Number of the request
+
+        Returns
+        -------
+        bool
+            Whether the results of the request should be used
+        """
+        return request == self.request and self.busy
+
+    def _finished(self, request):
+        was_busy = self.busy
+        self._workers.pop(request, None)
+        if was_busy and not self.busy:
+            self.busyChanged.emit(False)
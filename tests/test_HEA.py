@@ -53,3 +53,38 @@ class TestHEACalculator(TestCase):
     #
     # def test_phi_parameter(self):
     #     self.assertEqual(self.res.phi_parameter)
+
+
+class TestLazyHEACalculator(TestCase):
+
+    def test_construction_is_lazy(self):
+        res = HEACalculator('FeCoCrNi')
+        self.assertFalse(res.is_calculated('mixing_enthalpy'))
+        self.assertFalse(res._batch.is_calculated('mixing_enthalpy'))
+
+    def test_only_dependencies_are_calculated(self):
+        res = HEACalculator('FeCoCrNi')
+        res.omega_parameter
+        for name in ['melting_temperature', 'mixing_entropy', 'mixing_enthalpy']:
+            self.assertTrue(res.is_calculated(name), name)
+        for name in ['formation_enthalpy', 'min_formation_enthalpy', 'density', 'gamma_parameter', 'model_6']:
+            self.assertFalse(res.is_calculated(name), name)
+
+    def test_missing_formation_pair_is_deferred(self):
+        res = HEACalculator('LiFe')
+        self.assertGreater(res.mixing_entropy, 0)
+        with self.assertRaises(KeyError):
+            res.min_formation_enthalpy
+
+    def test_selected_properties(self):
+        res = HEACalculator('FeCoCrNi', properties=('omega_parameter', 'atomic_size_difference'))
+        res.calculate()
+        self.assertEqual(res.get_list(), ['FeCoCrNi', '5.71', '1.18'])
+        self.assertFalse(res.is_calculated('formation_enthalpy'))
+        self.assertFalse(res.is_calculated('gamma_parameter'))
+
+    def test_from_composition(self):
+        res = HEACalculator.from_composition({'Fe': 20.0, 'Co': 30.0, 'Cr': 50.0})
+        self.assertIsNone(res._formula)
+        self.assertEqual(str(res), str(HEACalculator('Fe20.0Co30.0Cr50.0')))
+        self.assertEqual(res.formula, 'Fe20.0Co30.0Cr50.0')
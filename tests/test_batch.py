@@ -0,0 +1,86 @@
+import os
+import tempfile
+from unittest import TestCase
+
+import numpy as np
+
+from HEACalculator.core.Batch import HEABatch
+from HEACalculator.core.HEA import HEACalculator
+from HEACalculator.data import Database
+
+
+class TestHEABatch(TestCase):
+
+    elements = ['Fe', 'Co', 'Cr', 'Ni']
+    compositions = [[25, 25, 25, 25],
+                    [40, 30, 20, 10],
+                    [10, 10, 10, 70],
+                    [5, 5, 45, 45]]
+
+    def setUp(self):
+        self.res = HEABatch(self.elements, self.compositions)
+
+    def test_length(self):
+        self.assertEqual(len(self.res), 4)
+
+    def test_equiatomic(self):
+        self.assertEqual(self.res.mixing_enthalpy[0], -3.75)
+        self.assertEqual(self.res.melting_temperature[0], 1858)
+        self.assertEqual(self.res.microstructure[0], 'FCC')
+
+    def test_single_alloy_view(self):
+        for row, composition in enumerate(self.compositions):
+            formula = ''.join(f'{elm}{amount}' for elm, amount in zip(self.elements, composition))
+            single = HEACalculator(formula)
+            for name in ['mixing_enthalpy', 'formation_enthalpy', 'min_formation_enthalpy', 'density',
+                         'valance_electron_concentration', 'melting_temperature', 'atomic_size_difference',
+                         'mixing_entropy', 'gamma_parameter', 'omega_parameter', 'lambda_parameter',
+                         'microstructure', 'model_1', 'model_2', 'model_3', 'model_4', 'model_5', 'model_6',
+                         'model_7', 'model_8']:
+                self.assertEqual(getattr(single, name), getattr(self.res, name)[row], name)
+
+    def test_absent_element(self):
+        res = HEABatch(self.elements, [[50, 0, 0, 50]])
+        single = HEACalculator('FeNi')
+        self.assertAlmostEqual(res.mixing_entropy[0], single.mixing_entropy)
+        self.assertEqual(res.min_formation_enthalpy[0], single.min_formation_enthalpy)
+        self.assertAlmostEqual(res.gamma_parameter[0], single.gamma_parameter)
+
+    def test_disjoint_systems(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'pairs.csv')
+            with open(path, 'w') as file:
+                file.write('first,second,formation_enthalpy\nLi,Mg,-5\n')
+            database = Database.load(path)
+        res = HEABatch.from_formulas(['FeCo', 'LiMg'], database=database)
+        for row, formula in enumerate(['FeCo', 'LiMg']):
+            single = HEACalculator(formula, database=database)
+            self.assertEqual(res.formation_enthalpy[row], single.formation_enthalpy)
+            self.assertEqual(res.mixing_enthalpy[row], single.mixing_enthalpy)
+            self.assertEqual(res.min_formation_enthalpy[row], single.min_formation_enthalpy)
+        with self.assertRaises(KeyError):
+            HEABatch.from_formulas(['FeCo', 'LiFe'], database=database).formation_enthalpy
+
+    def test_shape_mismatch(self):
+        with self.assertRaises(ValueError):
+            HEABatch(self.elements, np.ones((2, 3)))
+
+    def test_selected_properties(self):
+        res = HEABatch(self.elements, self.compositions, properties=('model_1',))
+        self.assertEqual(list(res.get_columns()), ['model_1'])
+        self.assertTrue(res.is_calculated('omega_parameter'))
+        self.assertFalse(res.is_calculated('formation_enthalpy'))
+
+    def test_unknown_property(self):
+        with self.assertRaises(ValueError):
+            HEABatch(self.elements, self.compositions, properties=('omega',))
+
+    def test_subset_keeps_calculated_properties(self):
+        batch = HEABatch(['Fe', 'Co', 'Cr'], [[1, 1, 1], [1, 2, 0], [0, 1, 3]])
+        batch.omega_parameter
+        subset = batch.subset(np.array([True, False, True]))
+        self.assertEqual(len(subset), 2)
+        self.assertTrue(subset.is_calculated('omega_parameter'))
+        self.assertFalse(subset.is_calculated('density'))
+        self.assertTrue(np.array_equal(subset.omega_parameter, batch.omega_parameter[[0, 2]]))
+        self.assertTrue(np.allclose(subset.density, batch.density[[0, 2]]))
@@ -0,0 +1,152 @@
+import os
+import tempfile
+import threading
+from unittest import TestCase
+from unittest.mock import patch
+
+import numpy as np
+
+from HEACalculator.core import cache as result_cache
+from HEACalculator.core.Batch import HEABatch
+from HEACalculator.core.HEA import HEACalculator
+from HEACalculator.core.cache import PROPERTIES_KIND, MemoryCache, ResultCache, composition_keys
+
+
+class TestResultCache(TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.cache = ResultCache(os.path.join(self.directory.name, 'cache', 'results.sqlite'))
+
+    def tearDown(self):
+        self.cache.close()
+        self.directory.cleanup()
+
+    def test_composition_keys(self):
+        keys = composition_keys(['Fe', 'Co'], [[1, 1], [50, 50], [1, 3]])
+        self.assertEqual(keys[0], keys[1])
+        self.assertEqual(keys[0], composition_keys(['Co', 'Fe'], [[0.5, 0.5]])[0])
+        self.assertEqual(keys[2], 'Co:0.75,Fe:0.25')
+
+    def test_alloy(self):
+        expected = str(HEACalculator('FeCoCrNi'))
+        self.assertEqual(str(HEACalculator('FeCoCrNi', cache=self.cache)), expected)
+        alloy = HEACalculator('Fe25Co25Cr25Ni25', cache=self.cache)
+        self.assertTrue(alloy.is_calculated('omega_parameter'))
+        self.assertEqual((self.cache.hits, self.cache.misses), (1, 1))
+        self.assertEqual(str(HEACalculator('(FeCo)CrNi', cache=self.cache)).splitlines()[1:],
+                         expected.splitlines()[1:])
+
+    def test_batch(self):
+        compositions = [[1, 1, 1], [1, 2, 1], [2, 1, 1]]
+        self.cache.fill(HEABatch(['Fe', 'Co', 'Ni'], compositions[:2]))
+        batch = HEABatch(['Fe', 'Co', 'Ni'], compositions)
+        self.cache.fill(batch)
+        self.assertEqual((self.cache.hits, self.cache.misses), (2, 3))
+        expected = HEABatch(['Fe', 'Co', 'Ni'], compositions)
+        for name in ('omega_parameter', 'melting_temperature', 'model_7'):
+            self.assertTrue(batch.is_calculated(name))
+            self.assertTrue(np.array_equal(batch.__dict__[name], getattr(expected, name)))
+
+    def test_selected_properties(self):
+        keys = composition_keys(['Fe', 'Co'], [[1, 1], [1, 3]])
+        self.cache.fill(HEABatch(['Fe', 'Co'], [[1, 1]], properties=['omega_parameter']))
+        record = self.cache.get_many(PROPERTIES_KIND, keys[:1])[keys[0]]
+        self.assertIn('mixing_entropy', record)
+        self.assertNotIn('formation_enthalpy', record)
+
+        batch = HEABatch(['Fe', 'Co'], [[1, 1], [1, 3]], properties=['density'])
+        self.cache.fill(batch)
+        self.assertFalse(batch.is_calculated('model_7'))
+        records = self.cache.get_many(PROPERTIES_KIND, keys)
+        self.assertEqual(set(records[keys[0]]), set(record) | {'density'})
+        self.assertNotIn('omega_parameter', records[keys[1]])
+        self.assertTrue(np.array_equal(batch.density, HEABatch(['Fe', 'Co'], [[1, 1], [1, 3]]).density))
+
+    def test_shared_by_calculators_and_batches(self):
+        self.cache.fill(HEABatch(['Fe', 'Co', 'Ni'], [[1, 1, 1]]))
+        alloy = HEACalculator('NiCoFe', cache=self.cache)
+        self.assertEqual((self.cache.hits, self.cache.misses), (1, 1))
+        self.assertTrue(alloy.is_calculated('melting_temperature'))
+        self.assertEqual(str(alloy), str(HEACalculator('NiCoFe')))
+        self.assertEqual(alloy.get_list(), HEACalculator('NiCoFe').get_list())
+        self.assertIsInstance(alloy.melting_temperature, int)
+
+    def test_partial_alloy_record(self):
+        HEACalculator('FeCoNi', properties=['density'], cache=self.cache)
+        alloy = HEACalculator('FeCoNi', properties=['omega_parameter'], cache=self.cache)
+        self.assertEqual(alloy.omega_parameter, HEACalculator('FeCoNi').omega_parameter)
+        record = self.cache.get_many(PROPERTIES_KIND, composition_keys(['Fe', 'Co', 'Ni'], [[1, 1, 1]]))
+        self.assertTrue({'density', 'omega_parameter'} <= set(next(iter(record.values()))))
+
+    def test_fingerprint(self):
+        HEACalculator('FeCoNi', cache=self.cache)
+        with patch.object(result_cache, 'fingerprint', return_value='other'):
+            HEACalculator('FeCoNi', cache=self.cache)
+            self.assertEqual(self.cache.misses, 2)
+            self.assertEqual(self.cache.stats()['stale_entries'], 1)
+
+    def test_eviction_and_clear(self):
+        self.cache.max_size = 4000
+        for step in range(1, 11):
+            self.cache.fill(HEABatch(['Fe', 'Co'], [[step, 1]]))
+        stats = self.cache.stats()
+        self.assertLessEqual(stats['size'], 4000)
+        self.assertLess(stats['entries'], 10)
+        self.cache.fill(HEABatch(['Fe', 'Co'], [[10, 1]]))
+        self.assertEqual(self.cache.hits, 1)
+
+        self.cache.clear()
+        self.assertEqual(self.cache.stats()['entries'], 0)
+
+    def test_eviction_of_one_put(self):
+        self.cache.fill(HEABatch(['Fe', 'Co'], [[step, 1] for step in range(1, 101)]))
+        size = self.cache.stats()['size']
+        self.cache.evict(size // 2)
+        stats = self.cache.stats()
+        self.assertLessEqual(stats['size'], size // 2)
+        self.assertGreater(stats['size'], size // 2 - size // 10)
+        self.assertGreater(stats['entries'], 0)
+
+
+class TestMemoryCache(TestCase):
+
+    def setUp(self):
+        self.cache = MemoryCache(capacity=2)
+
+    def test_equivalent_formulas(self):
+        expected = HEACalculator('FeCoCrNi').get_list()[1:]
+        for formula in ('FeCoCrNi', 'Fe25Co25Cr25Ni25', '(FeCo)CrNi'):
+            self.assertEqual(HEACalculator(formula, cache=self.cache).get_list()[1:], expected)
+        self.assertEqual(self.cache.stats(), {'entries': 1, 'capacity': 2, 'hits': 2, 'misses': 1, 'evictions': 0})
+
+    def test_records_are_immutable(self):
+        HEACalculator('FeCoNi', cache=self.cache)
+        record = next(iter(self.cache.get_many(PROPERTIES_KIND, composition_keys(['Fe', 'Co', 'Ni'],
+                                                                                  [[1, 1, 1]])).values()))
+        with self.assertRaises(TypeError):
+            record['density'] = 0
+
+    def test_eviction(self):
+        for formula in ('FeCo', 'FeNi', 'FeCo', 'CoNi'):
+            HEACalculator(formula, cache=self.cache)
+        self.assertEqual((len(self.cache), self.cache.evictions), (2, 1))
+        HEACalculator('FeCo', cache=self.cache)
+        self.assertEqual(self.cache.hits, 2)
+
+        self.cache.resize(1)
+        self.assertEqual((len(self.cache), self.cache.evictions), (1, 2))
+        self.cache.clear()
+        self.assertEqual(self.cache.stats()['entries'], 0)
+
+    def test_threads(self):
+        formulas = ['FeCo', 'FeNi', 'CoNi', 'FeCoNi'] * 25
+        threads = [threading.Thread(target=lambda: [HEACalculator(formula, cache=self.cache) for formula in formulas])
+                   for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        stats = self.cache.stats()
+        self.assertEqual(stats['hits'] + stats['misses'], 400)
+        self.assertLessEqual(stats['entries'], 2)
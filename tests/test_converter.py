@@ -11,36 +11,53 @@ class TestConverterCalculator(TestCase):
 
     def test_at_to_wt(self):
         res = Converter.BatchCalculator(self.selected_elements)
-        a = res.AtToWt()
+        a = res.at_to_wt()
         b = [22.6290124, 40.14533628, 24.41364194, 6.22976438, 6.582245]
         self.assertIsNone(np.testing.assert_array_almost_equal(a, b))
 
     def test_at_to_vol(self):
         res = Converter.BatchCalculator(self.selected_elements)
-        a = res.AtToVol()
+        a = res.at_to_vol()
         b = [36.41660597, 38.60160233, 17.37592342, 3.76131516, 3.84455312]
         self.assertIsNone(np.testing.assert_array_almost_equal(a, b))
 
     def test_wt_to_at(self):
         res = Converter.BatchCalculator(self.selected_elements)
-        a = res.WtToAt()
+        a = res.wt_to_at()
         b = [49.73565038, 28.03485419, 15.05305795, 3.68693687, 3.48950061]
         self.assertIsNone(np.testing.assert_array_almost_equal(a, b))
 
     def test_wt_to_vol(self):
         res = Converter.BatchCalculator(self.selected_elements)
-        a = res.WtToVol()
+        a = res.wt_to_vol()
         b = [51.13348886, 30.55215096, 12.92256822, 2.74057456, 2.6512174]
         self.assertIsNone(np.testing.assert_array_almost_equal(a, b))
 
     def test_vol_to_at(self):
         res = Converter.BatchCalculator(self.selected_elements)
-        a = res.VolToAt()
+        a = res.vol_to_at()
         b = [33.12747199, 31.25233207, 22.67063951, 6.54563762, 6.40391881]
         self.assertIsNone(np.testing.assert_array_almost_equal(a, b))
 
     def test_vol_to_wt(self):
         res = Converter.BatchCalculator(self.selected_elements)
-        a = res.VolToWt()
+        a = res.vol_to_wt()
         b =[21.09668111, 35.30837845, 27.25804055, 8.03307574, 8.30382414]
         self.assertIsNone(np.testing.assert_array_almost_equal(a, b))
+
+    def test_rows(self):
+        values = np.array([list(self.selected_elements.values()), [20.0, 20.0, 20.0, 20.0, 20.0]])
+        res = Converter.BatchCalculator(self.selected_elements.keys(), values)
+        a = res.at_to_wt()
+        self.assertEqual(a.shape, (2, 5))
+        np.testing.assert_array_almost_equal(a[0], Converter.BatchCalculator(self.selected_elements).at_to_wt())
+        np.testing.assert_array_almost_equal(a.sum(axis=1), [100, 100])
+        np.testing.assert_array_almost_equal(res.convert(a, 'wt', 'at'), values)
+        np.testing.assert_array_almost_equal(res.convert(values[1], 'vol', 'vol'), values[1])
+
+    def test_unknown_unit(self):
+        res = Converter.BatchCalculator(self.selected_elements)
+        with self.assertRaises(ValueError):
+            res.convert(res.values, 'at', 'mol')
+        with self.assertRaises(KeyError):
+            Converter.BatchCalculator({'Xx': 100.0})
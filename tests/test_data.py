@@ -0,0 +1,151 @@
+import os
+import pickle
+import tempfile
+from unittest import TestCase
+
+import numpy as np
+
+from HEACalculator.core.Batch import HEABatch
+from HEACalculator.core.HEA import HEACalculator
+from HEACalculator.core.cache import MemoryCache
+from HEACalculator.data import (Database, Element, FormationEnthalpy, MixingEnthalpy, default_database, element_table,
+                                formation_enthalpy_matrix, mixing_enthalpy_matrix)
+from HEACalculator.data.Storage import element_data, load_database, pair_data, write_database
+
+
+class TestPairMatrix(TestCase):
+
+    elements = ['Fe', 'Co', 'Cr', 'Ni', 'Al']
+
+    def test_symmetric(self):
+        values = mixing_enthalpy_matrix.values
+        self.assertTrue(np.array_equal(values, values.T, equal_nan=True))
+        self.assertTrue(np.all(np.diag(values) == 0))
+
+    def test_take(self):
+        for matrix, lookup in [(mixing_enthalpy_matrix, MixingEnthalpy),
+                               (formation_enthalpy_matrix, FormationEnthalpy)]:
+            sub_matrix = matrix.take(self.elements)
+            for i, first in enumerate(self.elements):
+                for j, second in enumerate(self.elements):
+                    if i != j:
+                        self.assertEqual(sub_matrix[i, j], lookup((first, second)))
+
+    def test_missing_pair(self):
+        self.assertTrue(np.isnan(formation_enthalpy_matrix.take(['Li', 'Fe'], check=False)[0, 1]))
+        with self.assertRaises(KeyError):
+            formation_enthalpy_matrix.take(['Li', 'Fe'])
+
+    def test_unknown_element(self):
+        with self.assertRaises(KeyError):
+            mixing_enthalpy_matrix.take(['Fe', 'Xx'])
+
+
+class TestPropertyTable(TestCase):
+
+    def test_take(self):
+        properties = element_table.take(['Fe', 'Co', 'Cr'])
+        for idx, symbol in enumerate(['Fe', 'Co', 'Cr']):
+            for prop in element_table.properties:
+                self.assertEqual(properties[prop][idx], getattr(Element(symbol), prop))
+
+    def test_atomic_number(self):
+        self.assertTrue(np.array_equal(element_table.indices([26, 'Co']), element_table.indices(['Fe', 27])))
+
+    def test_read_only(self):
+        with self.assertRaises(ValueError):
+            element_table['atomic_weight'][0] = 0
+
+    def test_unknown_element(self):
+        with self.assertRaises(KeyError):
+            element_table.take(['Xx'])
+
+
+class TestStorage(TestCase):
+
+    def test_round_trip(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'database.npz')
+            write_database(path, element_data(), {name: pair_data(name)
+                                                  for name in ('mixing_enthalpy', 'formation_enthalpy')})
+            self.assertEqual(element_data(path), element_data())
+            self.assertEqual(pair_data('mixing_enthalpy', path), pair_data('mixing_enthalpy'))
+            self.assertEqual(pair_data('formation_enthalpy', path), pair_data('formation_enthalpy'))
+
+    def test_read_only(self):
+        with self.assertRaises(ValueError):
+            load_database()['mixing_enthalpy_values'][0] = 0
+
+    def test_lookups(self):
+        self.assertEqual(Element('Fe').atomic_weight, 55.845)
+        self.assertEqual(Element('Pm').atomic_volume, 'NaN')
+        self.assertEqual(MixingEnthalpy(('Fe', 'Co')), mixing_enthalpy_matrix.take(['Fe', 'Co'])[0, 1])
+        with self.assertRaises(KeyError):
+            FormationEnthalpy(('Li', 'Fe'))
+
+
+class TestDatabase(TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def write(self, name, text):
+        path = os.path.join(self.directory.name, name)
+        with open(path, 'w') as file:
+            file.write(text)
+        return path
+
+    def test_default(self):
+        database = Database.default()
+        self.assertEqual(database.fingerprint, default_database.fingerprint)
+        self.assertEqual(database.element_table['atomic_weight'].tolist(), element_table['atomic_weight'].tolist())
+        self.assertIs(HEABatch(['Fe', 'Co'], [[1, 1]]).database, default_database)
+
+    def test_pair_overlay(self):
+        path = self.write('pairs.csv', 'first,second,formation_enthalpy\nLi,Fe,-12.5\nCo, Li ,3\n')
+        database = Database.load(path)
+        batch = HEABatch(['Li', 'Fe', 'Co'], [[1, 1, 2]], database=database)
+        self.assertAlmostEqual(batch.formation_enthalpy[0], 4 * (0.25 * 0.25 * -12.5 + 0.25 * 0.5 * 3 + 0.25 * 0.5 * -60))
+        self.assertEqual(batch.mixing_enthalpy[0], HEABatch(['Li', 'Fe', 'Co'], [[1, 1, 2]]).mixing_enthalpy[0])
+        self.assertNotEqual(database.fingerprint, default_database.fingerprint)
+        with self.assertRaises(KeyError):
+            HEABatch(['Li', 'Fe', 'Co'], [[1, 1, 2]]).formation_enthalpy
+
+    def test_element_overlay(self):
+        path = self.write('elements.csv', 'symbol,atomic_radius\nFe,130\n')
+        alloy = HEACalculator('FeCo', database=Database.load(path))
+        self.assertEqual(alloy.database.element_table['atomic_radius'][alloy.database.element_table.indices(['Fe'])],
+                         [130])
+        self.assertNotEqual(alloy.atomic_size_difference, HEACalculator('FeCo').atomic_size_difference)
+        self.assertEqual(alloy.density, HEACalculator('FeCo').density)
+
+    def test_invalid_files(self):
+        invalid = ['symbol,atomic_radius\nXx,1\n',
+                   'symbol,hardness\nFe,1\n',
+                   'first,second,mixing_enthalpy\nFe,Fe,1\n',
+                   'first,second,mixing_enthalpy\nFe,Co,low\n',
+                   'first,second,mixing_enthalpy\nFe,Xx,1\n',
+                   'first,second\nFe,Co\n']
+        for number, text in enumerate(invalid):
+            with self.subTest(text=text), self.assertRaises(ValueError):
+                Database.load(self.write(f'{number}.csv', text))
+        with self.assertRaises(OSError):
+            Database.load(os.path.join(self.directory.name, 'missing.csv'))
+
+    def test_save_and_load(self):
+        database = Database.load(self.write('pairs.csv', 'first,second,formation_enthalpy\nLi,Fe,-12.5\n'))
+        path = os.path.join(self.directory.name, 'database.npz')
+        database.save(path)
+        self.assertEqual(Database.load(path).fingerprint, database.fingerprint)
+        self.assertEqual(pickle.loads(pickle.dumps(database)).fingerprint, database.fingerprint)
+
+    def test_cache(self):
+        database = Database.load(self.write('elements.csv', 'symbol,atomic_radius\nFe,130\n'))
+        cache = MemoryCache()
+        HEACalculator('FeCo', cache=cache)
+        alloy = HEACalculator('FeCo', cache=cache, database=database)
+        self.assertEqual((cache.hits, cache.misses), (0, 2))
+        self.assertEqual(alloy.atomic_size_difference, HEACalculator('FeCo', database=database).atomic_size_difference)
@@ -0,0 +1,44 @@
+from unittest import TestCase
+
+import numpy as np
+
+from HEACalculator.core.Batch import HEABatch
+from HEACalculator.core.filters import Expression
+from HEACalculator.core.lattice import CompositionLattice
+
+
+class TestExpression(TestCase):
+
+    def setUp(self):
+        self.batch = HEABatch(['Fe', 'Co', 'Cr', 'Ni', 'Mn'], CompositionLattice(5, 0, 100, 10).block(0, 200))
+
+    def test_mask(self):
+        expression = Expression("omega_parameter >= 1.1 and atomic_size_difference < 6.6 and model_6 == 'Solid Solution'")
+        expected = ((self.batch.omega_parameter >= 1.1) & (self.batch.atomic_size_difference < 6.6)
+                    & (self.batch.model_6 == 'Solid Solution'))
+        self.assertEqual(expression.names, ('omega_parameter', 'atomic_size_difference', 'model_6'))
+        self.assertTrue(np.array_equal(expression.mask(self.batch), expected))
+
+    def test_arithmetic_and_chained_comparison(self):
+        mask = Expression('not 2 < abs(mixing_enthalpy) * 2 <= 10 or density > 8').mask(self.batch)
+        enthalpy = np.abs(self.batch.mixing_enthalpy) * 2
+        expected = ~((2 < enthalpy) & (enthalpy <= 10)) | (self.batch.density > 8)
+        self.assertTrue(np.array_equal(mask, expected))
+
+    def test_only_referenced_properties_are_calculated(self):
+        batch = HEABatch(['Fe', 'Co'], [[50, 50], [20, 80]])
+        Expression('mixing_entropy > 5').mask(batch)
+        self.assertTrue(batch.is_calculated('mixing_entropy'))
+        self.assertFalse(batch.is_calculated('density'))
+
+    def test_invalid_expressions(self):
+        for source in ['omega_parameter >=', 'foo > 1', "__import__('os')", 'density.real > 1', 'density in (1, 2)']:
+            with self.assertRaises(ValueError, msg=source):
+                Expression(source)
+        with self.assertRaises(ValueError):
+            Expression('density * 2').mask(self.batch)
+        for source in ['omega_parameter + 1', 'abs(mixing_enthalpy)', "'Solid Solution'"]:
+            with self.assertRaises(ValueError, msg=source):
+                Expression(source, condition=True)
+        for source in ['density > 1', 'density > 1 or density < 8', 'not density > 1']:
+            Expression(source, condition=True)
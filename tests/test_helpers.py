@@ -0,0 +1,39 @@
+from unittest import TestCase
+
+import numpy as np
+
+from HEACalculator.core.Batch import HEABatch
+from HEACalculator.core.HEA import HEACalculator
+from HEACalculator.core.helpers import nested_formula_parser, parse_formula, parse_many
+
+
+class TestFormulaParsing(TestCase):
+
+    def test_parse_formula_is_memoized(self):
+        parse_formula.cache_clear()
+        self.assertEqual(parse_formula('Al0.5(CoCr)2Ni'), nested_formula_parser('Al0.5(CoCr)2Ni'))
+        alloy = parse_formula('Al0.5(CoCr)2Ni')
+        alloy['Fe'] = 1
+        self.assertNotIn('Fe', parse_formula('Al0.5(CoCr)2Ni'))
+        info = parse_formula.cache_info()
+        self.assertEqual((info.hits, info.misses), (2, 1))
+
+    def test_equivalent_spellings_share_an_entry(self):
+        parse_formula.cache_clear()
+        self.assertEqual(list(parse_formula('FeCo')), ['Fe', 'Co'])
+        self.assertEqual(list(parse_formula('CoFe')), ['Co', 'Fe'])
+        self.assertEqual(parse_formula('Fe1Co1'), {'Fe': 1, 'Co': 1})
+        self.assertEqual(parse_formula('Fe.5CoFe1.5'), nested_formula_parser('Fe.5CoFe1.5'))
+        info = parse_formula.cache_info()
+        self.assertEqual((info.hits, info.misses), (2, 2))
+
+    def test_parse_many(self):
+        elements, compositions = parse_many(['FeCo', 'Co2Ni', '', 'Fe0.5Cr'])
+        self.assertEqual(elements, ['Fe', 'Co', 'Ni', 'Cr'])
+        self.assertTrue(np.array_equal(compositions, [[1, 1, 0, 0], [0, 2, 1, 0], [0, 0, 0, 0], [0.5, 0, 0, 1]]))
+        self.assertEqual(parse_many([])[1].shape, (0, 0))
+
+    def test_batch_from_formulas(self):
+        batch = HEABatch.from_formulas(['FeCoCrNi', 'Al0.5CoCrCuFeNi'])
+        for idx, formula in enumerate(['FeCoCrNi', 'Al0.5CoCrCuFeNi']):
+            self.assertAlmostEqual(batch.omega_parameter[idx], HEACalculator(formula).omega_parameter)
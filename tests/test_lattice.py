@@ -0,0 +1,43 @@
+import math
+from itertools import combinations_with_replacement, permutations
+from unittest import TestCase
+
+import numpy as np
+
+from HEACalculator.core.lattice import CompositionLattice
+
+
+def brute_force(no_of_elements, start, end, step):
+    results = [i for i in combinations_with_replacement(np.arange(start, end, step), no_of_elements)
+               if sum(i) == 100 if min(i) != 0]
+    return {composition for result in results for composition in permutations(result)}
+
+
+class TestCompositionLattice(TestCase):
+
+    cases = [(3, 0, 100, 5), (4, 0, 100, 10), (4, 10, 40, 10), (5, 5, 50, 5), (2, 0, 100, 1), (3, 30, 40, 5)]
+
+    def test_matches_brute_force(self):
+        for case in self.cases:
+            lattice = CompositionLattice(*case)
+            compositions = list(lattice)
+            self.assertEqual(len(compositions), len(lattice), case)
+            self.assertEqual(set(compositions), brute_force(*case), case)
+
+    def test_lexicographic_order(self):
+        compositions = list(CompositionLattice(4, 0, 100, 10))
+        self.assertEqual(compositions, sorted(compositions))
+
+    def test_block_matches_iteration(self):
+        for case in self.cases:
+            lattice = CompositionLattice(*case)
+            expected = np.array(list(lattice)).reshape(-1, case[0])
+            self.assertTrue(np.array_equal(np.concatenate(list(lattice.chunks(7)) or [expected]), expected), case)
+            self.assertTrue(np.array_equal(lattice.block(3, 5), expected[3:8]), case)
+
+    def test_count_without_enumeration(self):
+        self.assertEqual(len(CompositionLattice(10, 0, 100, 0.5)), math.comb(199, 9))
+
+    def test_invalid_step(self):
+        with self.assertRaises(ValueError):
+            CompositionLattice(3, 0, 100, 0)
@@ -0,0 +1,43 @@
+import json
+import os
+import re
+import subprocess
+import sys
+from unittest import TestCase
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Upper bound of the cumulative import time of the command line entry point, in microseconds.
+# It is measured at about 0.25 s, most of which is numpy and typer.
+IMPORT_TIME_BUDGET = 400000
+
+GUI_MODULES = ('PyQt5', 'HEACalculator.gui', 'HEACalculator.ui', 'HEACalculator.HEACalculator_rc')
+
+
+def run_python(*args):
+    return subprocess.run([sys.executable, *args], cwd=ROOT, capture_output=True, text=True, check=True)
+
+
+class TestStartup(TestCase):
+
+    def test_gui_is_not_imported(self):
+        result = run_python('-c', 'import json, sys, HEACalculator.__main__; print(json.dumps(sorted(sys.modules)))')
+        modules = [name for name in json.loads(result.stdout) if name.startswith(GUI_MODULES)]
+        self.assertEqual(modules, [])
+
+    def test_database_is_not_loaded(self):
+        result = run_python('-c', 'import HEACalculator, HEACalculator.data as data; print("element_table" in vars(data))')
+        self.assertEqual(result.stdout.strip(), 'False')
+
+    def test_import_time_budget(self):
+        # The best of a few runs, so a busy machine does not fail the test
+        timings = []
+        for _ in range(3):
+            result = run_python('-X', 'importtime', '-c', 'import HEACalculator.__main__')
+            cumulative = re.search(r'\|\s*(\d+)\s*\|\s*HEACalculator\.__main__$', result.stderr, re.MULTILINE)
+            timings.append(int(cumulative.group(1)))
+        self.assertLess(min(timings), IMPORT_TIME_BUDGET)
+
+    def test_search_single(self):
+        result = run_python('-m', 'HEACalculator', 'search', 'single', 'FeCoCrNi')
+        self.assertIn('FeCoCrNi', result.stdout.splitlines()[0])
@@ -0,0 +1,60 @@
+from unittest import TestCase
+
+from HEACalculator.core.progress import ProgressMeter, format_duration
+
+
+class Clock:
+
+    def __init__(self):
+        self.now = 100.0
+
+    def __call__(self):
+        return self.now
+
+
+class TestProgressMeter(TestCase):
+
+    def setUp(self):
+        self.clock = Clock()
+        self.meter = ProgressMeter(1000, clock=self.clock)
+
+    def test_rate_and_remaining(self):
+        self.assertIsNone(self.meter.rate)
+        self.assertIsNone(self.meter.remaining)
+        self.clock.now += 2
+        self.meter.update(100)
+        self.assertEqual(self.meter.rate, 50)
+        self.assertEqual(self.meter.remaining, 18)
+        self.assertEqual(self.meter.fraction, 0.1)
+        self.assertEqual(str(self.meter), '100 / 1,000 alloys | 50 alloys/s | ETA 00:18')
+
+    def test_pause(self):
+        self.clock.now += 2
+        self.meter.pause()
+        self.clock.now += 60
+        self.assertEqual(self.meter.elapsed, 2)
+        self.assertTrue(str(self.meter).endswith('Paused'))
+        self.meter.resume()
+        self.clock.now += 2
+        self.meter.update(2000)
+        self.assertEqual(self.meter.done, 1000)
+        self.assertEqual(self.meter.elapsed, 4)
+        self.assertEqual(self.meter.remaining, 0)
+
+    def test_stop(self):
+        self.clock.now += 2
+        self.meter.update(100)
+        self.meter.stop()
+        self.meter.resume()
+        self.clock.now += 60
+        self.assertTrue(self.meter.stopped)
+        self.assertFalse(self.meter.paused)
+        self.assertEqual(self.meter.elapsed, 2)
+        self.assertEqual(str(self.meter), '100 / 1,000 alloys | 50 alloys/s')
+
+    def test_empty(self):
+        self.assertEqual(ProgressMeter(0).fraction, 1.0)
+
+    def test_format_duration(self):
+        self.assertEqual(format_duration(59.6), '01:00')
+        self.assertEqual(format_duration(3723), '1:02:03')
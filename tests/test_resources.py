@@ -0,0 +1,21 @@
+import os
+import struct
+from unittest import TestCase
+
+RESOURCE_FILE = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+                             'HEACalculator', 'ui', 'HEACalculator.rcc')
+
+
+class TestResources(TestCase):
+
+    def test_resource_file(self):
+        with open(RESOURCE_FILE, 'rb') as file:
+            content = file.read()
+        version, tree, data, names = struct.unpack('>4I', content[4:20])
+        self.assertEqual(content[:4], b'qres')
+        self.assertEqual(version, 2)
+        self.assertLess(data, names)
+        self.assertLess(names, tree)
+        self.assertLess(tree, len(content))
+        for name in ('icons', 'img', 'icon.ico', 'multiply.png', 'ic1.png'):
+            self.assertIn(name.encode('utf-16-be'), content[names:tree])
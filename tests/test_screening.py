@@ -0,0 +1,109 @@
+import io
+from unittest import TestCase
+from unittest.mock import patch
+
+from HEACalculator import HEACalculator
+from HEACalculator.core.Batch import HEABatch
+from HEACalculator.core.filters import Expression
+from HEACalculator.core.lattice import CompositionLattice
+from HEACalculator.core.screening import evaluate_formulas, read_formulas, screen, screen_formulas
+from HEACalculator.core.selection import TopSelection
+from HEACalculator.core.writers import CsvWriter
+
+
+class TestScreening(TestCase):
+
+    def setUp(self):
+        self.elements = ['Fe', 'Co', 'Cr', 'Ni']
+        self.lattice = CompositionLattice(len(self.elements), 0, 100, 10)
+
+    def csv_lines(self, properties=None, **kwargs):
+        stream = io.StringIO()
+        with CsvWriter(stream, self.elements, properties) as writer:
+            for compositions, columns in screen(self.elements, self.lattice, properties=properties,
+                                                output='columns', **kwargs):
+                writer.write(compositions, columns)
+        return stream.getvalue().splitlines()[1:]
+
+    def alloys(self):
+        return [HEACalculator(''.join(f'{k}{v}' for k, v in zip(self.elements, composition)))
+                for composition in self.lattice]
+
+    def test_csv_rows_match_single_alloy(self):
+        lines = self.csv_lines(chunk_size=16)
+        self.assertEqual(lines, [', '.join(res.get_list()) for res in self.alloys()])
+
+    def test_selected_properties(self):
+        lines = self.csv_lines(properties=['omega_parameter'])
+        self.assertEqual(lines[0], ', '.join(HEACalculator('Fe10.0Co10.0Cr10.0Ni70.0',
+                                                           properties=['omega_parameter']).get_list()))
+
+    def test_reports(self):
+        reports = [report for chunk in screen(self.elements, self.lattice, chunk_size=7) for report in chunk]
+        self.assertEqual(reports, [str(res) for res in self.alloys()])
+
+    def test_workers_keep_lattice_order(self):
+        self.assertEqual(self.csv_lines(chunk_size=5), self.csv_lines(workers=2, chunk_size=5))
+
+    def test_where(self):
+        lines = self.csv_lines(where=Expression("omega_parameter >= 5 and model_1 == 'Solid Solution'"), chunk_size=8)
+        expected = [', '.join(res.get_list()) for res in self.alloys()
+                    if res.omega_parameter >= 5 and res.model_1 == 'Solid Solution']
+        self.assertTrue(expected)
+        self.assertEqual(lines, expected)
+
+    def test_top_selection(self):
+        selection = TopSelection(Expression('omega_parameter'), 3)
+        lines = self.csv_lines(selection=selection, workers=2, chunk_size=10)
+        expected = sorted(self.alloys(), key=lambda res: -res.omega_parameter)[:3]
+        self.assertEqual(lines, [', '.join(res.get_list()) for res in expected])
+
+
+class TestFormulaScreening(TestCase):
+
+    formulas = ['FeCoCrNi', 'AlCoCrFeNi', 'CoCrFeNi', 'feco', 'FeCoCrNiMn', 'XxFe', 'Fe20Co20Cr20Ni40', '', 'LiFe']
+
+    def test_results_in_input_order(self):
+        (formulas, columns), errors = evaluate_formulas(self.formulas, properties=['omega_parameter', 'model_6'],
+                                                        output='columns')
+        valid = ['FeCoCrNi', 'AlCoCrFeNi', 'CoCrFeNi', 'FeCoCrNiMn', 'Fe20Co20Cr20Ni40']
+        self.assertEqual(formulas, valid)
+        self.assertEqual([idx for idx, _ in errors], [3, 5, 7, 8])
+        for idx, formula in enumerate(valid):
+            res = HEACalculator(formula)
+            self.assertEqual(columns['omega_parameter'][idx], res.omega_parameter)
+            self.assertEqual(columns['model_6'][idx], res.model_6)
+
+    def test_reports(self):
+        reports, _ = evaluate_formulas(['FeCoCrNi', 'XxFe', 'AlCoCrFeNi'])
+        self.assertEqual(reports, [str(HEACalculator('FeCoCrNi')), str(HEACalculator('AlCoCrFeNi'))])
+
+    def test_element_systems(self):
+        formulas = ['FeCoNi', 'Ni2CoFe', 'CoFe3Ni']
+        with patch('HEACalculator.core.screening.HEABatch', wraps=HEABatch) as batch:
+            (names, columns), errors = evaluate_formulas(formulas, output='columns')
+        self.assertEqual(batch.call_count, 1)
+        self.assertEqual((names, errors), (formulas, []))
+        for idx, formula in enumerate(formulas):
+            self.assertAlmostEqual(columns['omega_parameter'][idx], HEACalculator(formula).omega_parameter)
+
+    def test_report_errors(self):
+        formulas = ['FeCo', 'LiFe', 'Fe', 'FeNi']
+        reports, errors = evaluate_formulas(formulas)
+        (valid, _), column_errors = evaluate_formulas(formulas, output='columns')
+        self.assertEqual(errors, column_errors)
+        self.assertEqual([idx for idx, _ in errors], [1])
+        self.assertEqual([report.splitlines()[0].strip('=') for report in reports], valid)
+        self.assertEqual(reports[0], str(HEACalculator('FeCo')))
+
+    def test_stream(self):
+        stream = io.StringIO('id, formula\n' + ''.join(f'{idx}, {formula}\n' for idx, formula in enumerate(self.formulas)))
+        chunks = list(screen_formulas(read_formulas(stream), output='columns', workers=2, chunk_size=2))
+        self.assertEqual(len(chunks), 5)
+        self.assertEqual([idx for _, errors in chunks for idx, _ in errors], [3, 5, 7, 8])
+        self.assertEqual([formula for (formulas, _), _ in chunks for formula in formulas],
+                         evaluate_formulas(self.formulas, output='columns')[0][0])
+
+    def test_missing_column(self):
+        with self.assertRaises(ValueError):
+            read_formulas(io.StringIO('alloy\nFeCoCrNi\n'))
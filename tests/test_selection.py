@@ -0,0 +1,54 @@
+import copy
+from unittest import TestCase
+
+import numpy as np
+
+from HEACalculator.core.Batch import HEABatch
+from HEACalculator.core.filters import Expression
+from HEACalculator.core.lattice import CompositionLattice
+from HEACalculator.core.selection import ParetoSelection, TopSelection, parse_objective
+
+
+class TestSelection(TestCase):
+
+    def setUp(self):
+        self.elements = ['Fe', 'Co', 'Cr', 'Ni', 'Mn']
+        self.lattice = CompositionLattice(len(self.elements), 0, 100, 10)
+        self.batch = HEABatch(self.elements, self.lattice.block(0, len(self.lattice)))
+        self.ranks = np.arange(len(self.lattice))
+
+    def stream(self, selection, chunk_size):
+        template = copy.deepcopy(selection)
+        for offset in range(0, len(self.lattice), chunk_size):
+            part = copy.deepcopy(template)
+            index = self.ranks[offset:offset + chunk_size]
+            part.update(self.batch.subset(index), index)
+            selection.merge(part)
+        return selection
+
+    def test_parse_objective(self):
+        expression, maximize = parse_objective('abs(mixing_enthalpy):min')
+        self.assertEqual(expression.names, ('mixing_enthalpy',))
+        self.assertFalse(maximize)
+        self.assertTrue(parse_objective('omega_parameter')[1])
+        for text in ['model_1', 'microstructure:min']:
+            with self.assertRaises(ValueError, msg=text):
+                parse_objective(text)
+
+    def test_top(self):
+        selection = self.stream(TopSelection(Expression('omega_parameter'), 10), chunk_size=17)
+        expected = np.argsort(-self.batch.omega_parameter, kind='stable')[:10]
+        self.assertTrue(np.array_equal(selection.ranks, expected))
+
+    def test_pareto(self):
+        selection = self.stream(ParetoSelection([parse_objective('omega_parameter:max'),
+                                                 parse_objective('density:min')]), chunk_size=23)
+        scores = np.column_stack([-self.batch.omega_parameter, self.batch.density])
+        dominated = [np.any(np.all(scores <= score, axis=1) & np.any(scores < score, axis=1)) for score in scores]
+        expected = np.flatnonzero(~np.array(dominated))
+        self.assertTrue(np.array_equal(np.sort(selection.ranks), expected))
+
+    def test_result_does_not_depend_on_chunks(self):
+        objectives = [parse_objective('mixing_entropy:max'), parse_objective('atomic_size_difference:min')]
+        self.assertTrue(np.array_equal(self.stream(ParetoSelection(objectives), 7).ranks,
+                                       self.stream(ParetoSelection(objectives), 50).ranks))
@@ -0,0 +1,90 @@
+from unittest import TestCase
+
+import numpy as np
+
+from HEACalculator.core.filters import Expression
+from HEACalculator.core.kernels import INTERMETALLIC, SOLID_SOLUTION
+from HEACalculator.core.table import MIN_CAPACITY, ResultTable
+
+PROPERTIES = ['omega_parameter', 'model_1']
+
+
+def columns(omega, model_1):
+    return {'omega_parameter': np.array(omega, dtype=float), 'model_1': np.array(model_1)}
+
+
+class TestResultTable(TestCase):
+
+    def setUp(self):
+        self.table = ResultTable(['Fe', 'Co'], PROPERTIES)
+        self.table.append(np.array([[50.0, 50.0], [25.0, 75.0], [75.0, 25.0]]),
+                          columns([2.0, np.nan, 1.0], [INTERMETALLIC, SOLID_SOLUTION, SOLID_SOLUTION]))
+
+    def test_append(self):
+        self.assertEqual(len(self.table), 3)
+        self.assertEqual(self.table.formula(1), 'Fe25.0Co75.0')
+        self.assertEqual(self.table.value(0, 'omega_parameter'), 2.0)
+        self.assertEqual(self.table.value(0, 'model_1'), INTERMETALLIC)
+        self.assertEqual(self.table.column('model_1', np.array([1, 2])).tolist(), [SOLID_SOLUTION, SOLID_SOLUTION])
+
+    def test_growth(self):
+        compositions = np.full((MIN_CAPACITY, 2), 50.0)
+        self.table.append(compositions, columns(np.arange(MIN_CAPACITY), [SOLID_SOLUTION] * MIN_CAPACITY))
+        self.assertEqual(len(self.table), MIN_CAPACITY + 3)
+        self.assertEqual(self.table.value(2, 'omega_parameter'), 1.0)
+        self.assertEqual(self.table.value(MIN_CAPACITY + 2, 'omega_parameter'), MIN_CAPACITY - 1)
+        self.assertEqual(self.table.compositions.shape, (MIN_CAPACITY + 3, 2))
+
+    def test_contains(self):
+        self.assertIn('Fe50.0Co50.0', self.table)
+        self.assertNotIn('Fe10.0Co90.0', self.table)
+        self.table.append(np.array([[10.0, 90.0]]), columns([1.5], [SOLID_SOLUTION]))
+        self.assertIn('Fe10.0Co90.0', self.table)
+
+    def test_formulas(self):
+        table = ResultTable(None, PROPERTIES)
+        table.append(['FeCo', 'FeNi'], columns([1.0, 2.0], [SOLID_SOLUTION, INTERMETALLIC]))
+        self.assertIn('FeNi', table)
+        self.assertEqual(table.formula(1), 'FeNi')
+        self.assertEqual(table.order(descending=True).tolist(), [1, 0])
+
+    def test_order(self):
+        self.assertEqual(self.table.order('omega_parameter').tolist(), [2, 0, 1])
+        self.assertEqual(self.table.order('omega_parameter', descending=True).tolist(), [0, 2, 1])
+        self.assertEqual(self.table.order('model_1').tolist(), [1, 2, 0])
+        self.assertEqual(self.table.order().tolist(), [1, 0, 2])
+        self.assertEqual(self.table.order('omega_parameter', np.array([0, 1])).tolist(), [0, 1])
+
+    def test_mask(self):
+        expression = Expression(f"omega_parameter > 1.5 or model_1 == '{SOLID_SOLUTION}'")
+        self.assertEqual(self.table.mask(expression).tolist(), [True, True, True])
+        self.assertEqual(self.table.mask(Expression('omega_parameter > 1.5'), np.array([1, 0])).tolist(),
+                         [False, True])
+        with self.assertRaises(ValueError):
+            self.table.mask(Expression('density > 1'))
+
+    def test_take(self):
+        copy = self.table.take(np.array([2, 0]))
+        self.table.append(np.full((MIN_CAPACITY, 2), 50.0),
+                          columns(np.zeros(MIN_CAPACITY), [SOLID_SOLUTION] * MIN_CAPACITY))
+        self.assertEqual(len(copy), 2)
+        self.assertEqual(copy.formula(0), 'Fe75.0Co25.0')
+        self.assertEqual(copy.column('omega_parameter').tolist(), [1.0, 2.0])
+        copy.append(np.array([[10.0, 90.0]]), columns([3.0], [INTERMETALLIC]))
+        self.assertEqual(copy.value(2, 'model_1'), INTERMETALLIC)
+        table = ResultTable(None, PROPERTIES)
+        table.append(['FeCo', 'FeNi'], columns([1.0, 2.0], [SOLID_SOLUTION, INTERMETALLIC]))
+        copy = table.take()
+        table.append(['CoNi'], columns([3.0], [SOLID_SOLUTION]))
+        self.assertEqual([copy.formula(row) for row in range(len(copy))], ['FeCo', 'FeNi'])
+
+    def test_batches(self):
+        batches = list(self.table.batches(2))
+        self.assertEqual([len(compositions) for compositions, _ in batches], [2, 1])
+        self.assertEqual(batches[1][1]['model_1'].tolist(), [SOLID_SOLUTION])
+        batches = list(self.table.batches(2, np.array([2, 0])))
+        self.assertEqual(batches[0][0].tolist(), [[75.0, 25.0], [50.0, 50.0]])
+        self.assertEqual(batches[0][1]['omega_parameter'].tolist(), [1.0, 2.0])
+        table = ResultTable(None, PROPERTIES)
+        table.append(['FeCo', 'FeNi'], columns([1.0, 2.0], [SOLID_SOLUTION, INTERMETALLIC]))
+        self.assertEqual([compositions for compositions, _ in table.batches(5, np.array([1, 0]))], [['FeNi', 'FeCo']])
@@ -0,0 +1,113 @@
+import csv
+import importlib.util
+import io
+import json
+import os
+import tempfile
+from unittest import TestCase, skipUnless
+
+import numpy as np
+
+from HEACalculator.core.Batch import HEABatch
+from HEACalculator.core.HEA import HEACalculator
+from HEACalculator.core.lattice import CompositionLattice
+from HEACalculator.core.writers import CsvWriter, encode, open_writer
+
+HAS_PYARROW = importlib.util.find_spec('pyarrow') is not None
+
+
+class TestWriters(TestCase):
+
+    def setUp(self):
+        self.elements = ['Fe', 'Co', 'Cr', 'Ni']
+        self.batch = HEABatch(self.elements, CompositionLattice(4, 0, 100, 5).block(0, 1000))
+        self.directory = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def write(self, name, **kwargs):
+        path = os.path.join(self.directory.name, name)
+        with open_writer(path, self.elements, **kwargs) as writer:
+            for offset in range(0, len(self.batch), 300):
+                chunk = self.batch.subset(np.arange(offset, min(offset + 300, len(self.batch))))
+                writer.write(chunk.compositions, chunk.get_columns())
+        self.assertEqual(writer.rows, len(self.batch))
+        return path
+
+    def test_npz(self):
+        data = np.load(self.write('results.npz', row_group_size=500))
+        self.assertTrue(np.array_equal(data['Cr'], self.batch.compositions[:, 2]))
+        self.assertTrue(np.array_equal(data['omega_parameter'], self.batch.omega_parameter, equal_nan=True))
+        self.assertTrue(np.array_equal(data['model_6_categories'][data['model_6']], self.batch.model_6))
+
+    @skipUnless(HAS_PYARROW, 'pyarrow is not installed')
+    def test_parquet(self):
+        import pyarrow.parquet as pq
+
+        path = self.write('results.parquet', properties=['density', 'model_1'], row_group_size=400)
+        self.assertEqual(pq.ParquetFile(path).num_row_groups, 2)
+        table = pq.read_table(path)
+        self.assertEqual(table.column_names, self.elements + ['density', 'model_1'])
+        self.assertTrue(np.array_equal(table['density'].to_numpy(), self.batch.density))
+        self.assertEqual(table['model_1'].to_pylist(), self.batch.model_1.tolist())
+
+    @skipUnless(HAS_PYARROW, 'pyarrow is not installed')
+    def test_arrow(self):
+        import pyarrow as pa
+
+        table = pa.ipc.open_file(self.write('results.arrow')).read_all()
+        self.assertEqual(table.num_rows, len(self.batch))
+        self.assertEqual(table['microstructure'].to_pylist(), self.batch.microstructure.tolist())
+
+    def test_unsupported_format(self):
+        with self.assertRaises(ValueError):
+            open_writer('results.xlsx', self.elements)
+
+    def test_csv_matches_get_list(self):
+        stream = io.StringIO()
+        with CsvWriter(stream, self.elements) as writer:
+            writer.write(self.batch.compositions[:50], self.batch.subset(np.arange(50)).get_columns())
+        lines = stream.getvalue().splitlines()
+        self.assertTrue(lines[0].startswith('Formula, Density, Delta, Omega'))
+        for amounts, line in zip(self.batch.compositions[:50].tolist(), lines[1:]):
+            formula = ''.join(f'{k}{v}' for k, v in zip(self.elements, amounts))
+            self.assertEqual(line, ', '.join(HEACalculator(formula).get_list()))
+
+    def test_csv_quotes_formulas(self):
+        formulas = ['Fe50Co50', 'Fe,Co', 'Fe"Co']
+        batch = HEABatch(['Fe', 'Co'], [[50, 50]] * 3, properties=['density'])
+        stream = io.StringIO()
+        with CsvWriter(stream, None, batch.properties) as writer:
+            writer.write(formulas, batch.get_columns())
+        rows = list(csv.reader(io.StringIO(stream.getvalue())))
+        self.assertEqual([row[0] for row in rows[1:]], formulas)
+        self.assertEqual({len(row) for row in rows}, {2})
+
+    def test_encode(self):
+        labels = ('Solid Solution', 'Intermetallic')
+        self.assertEqual(encode(np.array(['Intermetallic', 'Solid Solution']), labels).tolist(), [1, 0])
+        with self.assertRaises(ValueError):
+            encode(np.array(['Solid Solution', 'Amorphous']), labels)
+
+    def test_jsonl(self):
+        batch = HEABatch(['Fe', 'Co'], [[50, 50], [1, 0]], properties=['mixing_enthalpy', 'omega_parameter', 'model_1'])
+        path = os.path.join(self.directory.name, 'results.jsonl')
+        with open_writer(path, batch.elements, batch.properties, precision=None) as writer:
+            writer.write(batch.compositions, batch.get_columns())
+        with open(path) as file:
+            rows = [json.loads(line) for line in file]
+        self.assertEqual(rows[0], {'formula': 'Fe50.0Co50.0', 'mixing_enthalpy': batch.mixing_enthalpy[0],
+                                   'omega_parameter': batch.omega_parameter[0], 'model_1': batch.model_1[0]})
+        self.assertIsNone(rows[1]['omega_parameter'])
+
+    def test_formula_column(self):
+        formulas = ['Fe50.0Co50.0', 'Fe20.0Co80.0']
+        batch = HEABatch(['Fe', 'Co'], [[50, 50], [20, 80]], properties=['density'])
+        path = os.path.join(self.directory.name, 'results.npz')
+        with open_writer(path, None, batch.properties) as writer:
+            writer.write(formulas[:1], batch.subset([0]).get_columns())
+            writer.write(formulas[1:], batch.subset([1]).get_columns())
+        data = np.load(path)
+        self.assertEqual(data['formula'].tolist(), formulas)
+        self.assertTrue(np.array_equal(data['density'], batch.density))